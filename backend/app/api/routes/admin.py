@@ -1,17 +1,32 @@
 """
 Admin dashboard API — secured by x-admin-secret header.
 GET /api/admin/stats  → full platform metrics
+GET /api/admin/workflows?cursor=…  → further pages of the workflow table
+POST /api/admin/bulk-analyze  → analyze many workflows via one Message Batch
+POST /api/admin/backfill-snapshots  → store report snapshots for analyses without one
+GET /api/admin/metrics  → stage timing histograms, token and cache counters
+GET /api/metrics  → Prometheus text exposition (request, Turso, LLM, cache, stage, loop lag)
+GET /api/admin/jobs  → scheduled jobs, the current leader and recent runs
 """
 import os
 from fastapi import APIRouter, Depends, HTTPException, Header
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
-from sqlalchemy import func, text
-from typing import Optional
+from sqlalchemy import func, select, text
+from typing import List, Optional
 from datetime import datetime, timedelta, timezone
 
+from app.core import metrics, timing
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.pagination import created_key, keyset_page
 from app.core.auth import require_admin as _require_admin
-from app.models.workflow import User, Workflow, Task, Analysis, AnalysisResult
+from app.core.share_cache import invalidate_share
+from app.services.analysis_snapshot import backfill_snapshots, save_snapshot
+from app.services.canvas_store import save_canvas
+from app.models.workflow import (User, Workflow, Task, Analysis, AnalysisResult, AnalysisSnapshot,
+                                 JobRun, SchedulerLease)
 
 router = APIRouter()
 
@@ -26,8 +41,6 @@ async def backfill_n8n_canvas(
     Regenerate and store the merged n8n canvas for a specific workflow
     using the new per-task N8nTemplateClient. Admin-only.
     """
-    import json as _json
-
     workflow = db.query(Workflow).filter(Workflow.id == workflow_id).first()
     if not workflow:
         raise HTTPException(status_code=404, detail="Workflow not found")
@@ -50,22 +63,20 @@ async def backfill_n8n_canvas(
     if not suggested:
         raise HTTPException(status_code=422, detail="No templates found for this workflow")
 
-    merged = client.build_merged_canvas(job_title=job_title, suggested_templates=suggested)
-    n8n_json_str = _json.dumps(merged)
+    canvas = client.merged_canvas_builder(job_title=job_title, suggested_templates=suggested)
 
     # Write directly via raw SQL (avoids session detachment issue)
-    from sqlalchemy import text as _text
-    db.execute(_text("UPDATE workflows SET n8n_workflow_json = :j WHERE id = :i"),
-               {"j": n8n_json_str, "i": workflow_id})
-    db.commit()
+    share_code = workflow.share_code
+    save_canvas(workflow_id, canvas.to_json(), db=db)
+    invalidate_share(share_code)
 
     return {
         "ok": True,
         "workflow_id": workflow_id,
         "job_title": job_title,
         "templates_used": len(suggested),
-        "node_count": len(merged.get("nodes", [])),
-        "canvas_name": merged.get("name"),
+        "node_count": len(canvas.nodes) + 1,  # + the canvas header note
+        "canvas_name": canvas.name,
         "templates": [{"task": t.get("task_name"), "template": t.get("name"), "reason": t.get("relevance_reason")} for t in suggested],
     }
 
@@ -120,10 +131,13 @@ async def backfill_confidence(
     # reload — which can 500 on the libSQL/Turso driver even though the write
     # already succeeded. Snapshot first, then commit.
     analysis_id = analysis.id
+    share_code = analysis.workflow.share_code
     n_results = len(results)
     confidence_values = [r.score_confidence for r in results]
 
     db.commit()
+    save_snapshot(db, analysis_id)
+    invalidate_share(share_code)
 
     return {
         "ok": True,
@@ -136,6 +150,88 @@ async def backfill_confidence(
     }
 
 
+@router.post("/admin/backfill-snapshots")
+def backfill_analysis_snapshots(db: Session = Depends(get_db), _=Depends(_require_admin), limit: int = 100):
+    """
+    Store report snapshots for analyses that have none — rows from before
+    snapshots existed, or whose workflow changed since. Until then
+    /api/results and /api/share serialize them live. Call repeatedly until
+    `remaining` is 0. Admin-only.
+    """
+    stored = backfill_snapshots(db, limit=min(limit, 1000))
+    remaining = (db.query(func.count(Analysis.id))
+                 .outerjoin(AnalysisSnapshot, AnalysisSnapshot.analysis_id == Analysis.id)
+                 .filter(AnalysisSnapshot.analysis_id.is_(None))
+                 .scalar())
+    return {"ok": True, "stored": stored, "remaining": remaining}
+
+
+class BulkAnalyzeRequest(BaseModel):
+    workflow_ids: List[int] = Field(..., min_length=1)
+    hourly_rate: float = Field(50.0, gt=0)
+
+
+@router.post("/admin/bulk-analyze", status_code=202)
+def bulk_analyze(body: BulkAnalyzeRequest, _=Depends(_require_admin)):
+    """
+    Analyze many existing, not-yet-analyzed workflows as one Anthropic
+    Message Batch (cheaper, higher throughput; finishes within minutes to
+    hours). Returns immediately — results are saved through the normal
+    analysis path as the batch completes, so /api/results and /api/share
+    start answering per workflow. Admin-only.
+    """
+    import threading
+    from app.api.routes.workflows import bulk_analyze_workflows
+
+    ids = list(dict.fromkeys(body.workflow_ids))
+
+    def _run():
+        try:
+            print(f"[ai_bulk] done: {bulk_analyze_workflows(ids, body.hourly_rate)}")
+        except Exception as exc:
+            print(f"[ai_bulk] bulk analysis failed: {exc}")
+
+    threading.Thread(target=_run, name="bulk-analyze", daemon=True).start()
+    return {"ok": True, "queued": len(ids), "workflow_ids": ids}
+
+
+@router.get("/admin/metrics")
+async def admin_metrics(_=Depends(_require_admin)):
+    """
+    Stage timing histograms (ms) for every span recorded since this process
+    started — analyze phases, LLM and Tavily calls, job-scan cache lookups —
+    plus token and cache hit/miss counters. Admin-only.
+    """
+    return timing.snapshot()
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics(_=Depends(_require_admin)):
+    """
+    Prometheus scrape target. Admin-only — configure the scrape job with an
+    `x-admin-secret` header (Prometheus `http_headers`).
+    """
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@router.get("/admin/jobs")
+def admin_jobs(db: Session = Depends(get_db), _=Depends(_require_admin), limit: int = 50):
+    """Scheduled jobs, who holds the scheduler lease, and the latest job_runs rows."""
+    from app.services import scheduled_jobs  # noqa: F401 — registers the jobs
+    from app.services.scheduler import JOBS, LEADER_LEASE
+    lease = db.query(SchedulerLease).filter(SchedulerLease.name == LEADER_LEASE).first()
+    runs = db.query(JobRun).order_by(JobRun.started_at.desc(), JobRun.id.desc()).limit(min(limit, 500)).all()
+    return {
+        "enabled": settings.SCHEDULER_ENABLED,
+        "leader": lease.holder if lease and lease.expires_at > datetime.now(timezone.utc).timestamp() else None,
+        "jobs": [{"name": j.name, "interval_seconds": j.interval_seconds, "timeout_seconds": j.timeout_seconds}
+                 for j in JOBS.values()],
+        "runs": [{"id": r.id, "job": r.job, "trigger": r.trigger, "status": r.status, "holder": r.holder,
+                  "started_at": r.started_at, "finished_at": r.finished_at,
+                  "duration_ms": r.duration_ms, "detail": r.detail} for r in runs],
+    }
+
+
 @router.post("/admin/reset-rate-limits")
 async def reset_rate_limits(
     db: Session = Depends(get_db),
@@ -198,57 +294,33 @@ def get_admin_stats(db: Session = Depends(get_db), _=Depends(_require_admin)):
     by_input_mode = {(r[0] or "unknown"): r[1] for r in mode_rows}
 
     # ── All users with their workflow counts ───────────────────────────────
-    users = db.query(User).order_by(User.created_at.desc()).all()
-    users_list = []
-    for u in users:
-        wf_count  = db.query(func.count(Workflow.id)).filter(Workflow.user_email == u.email).scalar() or 0
-        an_count  = (
-            db.query(func.count(Analysis.id))
-            .join(Workflow, Analysis.workflow_id == Workflow.id)
-            .filter(Workflow.user_email == u.email)
-            .scalar() or 0
-        )
-        users_list.append({
+    wf_counts = dict(
+        db.query(Workflow.user_email, func.count(Workflow.id))
+        .filter(Workflow.user_email != None)
+        .group_by(Workflow.user_email)
+        .all()
+    )
+    an_counts = dict(
+        db.query(Workflow.user_email, func.count(Analysis.id))
+        .join(Analysis, Analysis.workflow_id == Workflow.id)
+        .filter(Workflow.user_email != None)
+        .group_by(Workflow.user_email)
+        .all()
+    )
+    users = db.query(User.id, User.email, User.created_at).order_by(User.created_at.desc()).all()
+    users_list = [
+        {
             "id": u.id,
             "email": u.email,
             "created_at": u.created_at.isoformat() if u.created_at else None,
-            "workflows": wf_count,
-            "analyses": an_count,
-        })
+            "workflows": wf_counts.get(u.email, 0),
+            "analyses": an_counts.get(u.email, 0),
+        }
+        for u in users
+    ]
 
-    # ── All workflows with full details ────────────────────────────────────
-    workflows = (
-        db.query(Workflow)
-        .order_by(Workflow.created_at.desc())
-        .all()
-    )
-    workflows_list = []
-    for w in workflows:
-        analysis = db.query(Analysis).filter(Analysis.workflow_id == w.id).first()
-        task_count = db.query(func.count(Task.id)).filter(Task.workflow_id == w.id).scalar() or 0
-        # Sample task names
-        task_names = [t.name for t in db.query(Task.name).filter(Task.workflow_id == w.id).limit(5).all()]
-        workflows_list.append({
-            "id": w.id,
-            "name": w.name,
-            "user_email": w.user_email,
-            "analysis_context": w.analysis_context,
-            "input_mode": w.input_mode,
-            "industry": w.industry,
-            "team_size": w.team_size,
-            "created_at": w.created_at.isoformat() if w.created_at else None,
-            "task_count": task_count,
-            "task_names": task_names,
-            # Source text (document/voice uploads)
-            "source_text": w.source_text[:500] if w.source_text else None,
-            # Analysis results if available
-            "automation_score": round(analysis.automation_score, 1) if analysis else None,
-            "annual_savings": round(analysis.annual_savings, 0) if analysis and analysis.annual_savings else None,
-            "hours_saved": round(analysis.hours_saved, 1) if analysis and analysis.hours_saved else None,
-            "share_code": w.share_code,
-            "result_url": f"https://workscanai.vercel.app/dashboard/results/{w.id}" if analysis else None,
-            "share_url": f"https://workscanai.vercel.app/report/{w.share_code}" if w.share_code and analysis else None,
-        })
+    # ── Newest workflows (first page; /admin/workflows pages the rest) ─────
+    workflows_list, workflows_next_cursor = _admin_workflow_page(db, None, settings.WORKFLOW_PAGE_MAX)
 
     # ── Traffic / country analytics (first-party page_views) ───────────────
     from app.models.workflow import PageView
@@ -381,9 +453,90 @@ def get_admin_stats(db: Session = Depends(get_db), _=Depends(_require_admin)):
         "referral": referral,
         "users": users_list,
         "workflows": workflows_list,
+        "workflows_next_cursor": workflows_next_cursor,
     }
 
 
+@router.get("/admin/workflows")
+def get_admin_workflows(
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+    db: Session = Depends(get_db),
+    _=Depends(_require_admin),
+):
+    """Next page of the admin workflow table, after `cursor` from /admin/stats."""
+    limit = max(1, min(limit or settings.WORKFLOW_PAGE_MAX, settings.WORKFLOW_PAGE_MAX))
+    workflows_list, next_cursor = _admin_workflow_page(db, cursor, limit)
+    return {"workflows": workflows_list, "next_cursor": next_cursor}
+
+
+def _admin_workflow_page(db: Session, cursor: Optional[str], limit: int):
+    """One keyset page of workflows with their analysis headline numbers.
+
+    A single projection query joined to the analysis (plus one for sample
+    task names) — no full Workflow rows, and source_text is cut to its first
+    500 characters in SQL.
+    """
+    task_count = (
+        select(func.count(Task.id))
+        .where(Task.workflow_id == Workflow.id)
+        .correlate(Workflow)
+        .scalar_subquery()
+    )
+    q = (
+        db.query(
+            Workflow.id, Workflow.name, Workflow.user_email, Workflow.analysis_context,
+            Workflow.input_mode, Workflow.industry, Workflow.team_size, Workflow.share_code,
+            Workflow.created_at,
+            created_key(Workflow.created_at).label("created_key"),
+            func.substr(Workflow.source_text, 1, 500).label("source_text"),
+            task_count.label("task_count"),
+            Analysis.id.label("analysis_id"),
+            Analysis.automation_score, Analysis.annual_savings, Analysis.hours_saved,
+        )
+        .outerjoin(Analysis, Analysis.workflow_id == Workflow.id)
+    )
+    rows, next_cursor = keyset_page(q, Workflow.created_at, Workflow.id, cursor, limit)
+
+    task_names = {}
+    if rows:
+        for workflow_id, name in (
+            db.query(Task.workflow_id, Task.name)
+            .filter(Task.workflow_id.in_([w.id for w in rows]))
+            .order_by(Task.workflow_id, Task.id)
+            .all()
+        ):
+            names = task_names.setdefault(workflow_id, [])
+            if len(names) < 5:
+                names.append(name)
+
+    workflows_list = []
+    for w in rows:
+        analysed = w.analysis_id is not None
+        workflows_list.append({
+            "id": w.id,
+            "name": w.name,
+            "user_email": w.user_email,
+            "analysis_context": w.analysis_context,
+            "input_mode": w.input_mode,
+            "industry": w.industry,
+            "team_size": w.team_size,
+            "created_at": w.created_at.isoformat() if w.created_at else None,
+            "task_count": w.task_count,
+            "task_names": task_names.get(w.id, []),
+            # Source text (document/voice uploads)
+            "source_text": w.source_text or None,
+            # Analysis results if available
+            "automation_score": round(w.automation_score, 1) if analysed else None,
+            "annual_savings": round(w.annual_savings, 0) if analysed and w.annual_savings else None,
+            "hours_saved": round(w.hours_saved, 1) if analysed and w.hours_saved else None,
+            "share_code": w.share_code,
+            "result_url": f"https://workscanai.vercel.app/dashboard/results/{w.id}" if analysed else None,
+            "share_url": f"https://workscanai.vercel.app/report/{w.share_code}" if w.share_code and analysed else None,
+        })
+    return workflows_list, next_cursor
+
+
 @router.get("/admin/geo")
 def get_admin_geo(
     months: int = 0,
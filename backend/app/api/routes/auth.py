@@ -13,8 +13,8 @@ from datetime import datetime, timedelta, timezone
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
-import httpx
 
+from app.core import http_clients
 from app.core.database import get_db
 from app.models.workflow import User, MagicToken
 
@@ -121,16 +121,15 @@ async def _send_otp_email(email: str, otp_code: str, locale: str = "en"):
     </div>
     """
 
-    async with httpx.AsyncClient() as client:
-        resp = await client.post(
-            "https://api.resend.com/emails",
-            headers={"Authorization": f"Bearer {RESEND_API_KEY}", "Content-Type": "application/json"},
-            json={"from": FROM_EMAIL, "to": [send_to], "subject": L_subject, "html": html},
-            timeout=10,
-        )
-        if resp.status_code >= 400:
-            print(f"[auth] Resend error {resp.status_code}: {resp.text}")
-            raise HTTPException(status_code=500, detail="Failed to send verification email. Please try again in a moment.")
+    resp = await http_clients.get("resend").apost(
+        "https://api.resend.com/emails",
+        headers={"Authorization": f"Bearer {RESEND_API_KEY}", "Content-Type": "application/json"},
+        json={"from": FROM_EMAIL, "to": [send_to], "subject": L_subject, "html": html},
+        timeout=10,
+    )
+    if resp.status_code >= 400:
+        print(f"[auth] Resend error {resp.status_code}: {resp.text}")
+        raise HTTPException(status_code=500, detail="Failed to send verification email. Please try again in a moment.")
 
 
 @router.post("/auth/request")
@@ -1,25 +1,30 @@
 """
 Cron-triggered retention jobs (#9 — Quick Win of the Week T+3 digest).
 
-Hit once daily by the existing cron-job.org account, secured by the same
-x-admin-secret header used by the admin dashboard. Picks up report-gate leads
+Run daily by the in-process scheduler (app.services.scheduled_jobs); the
+endpoint below remains for manual runs, secured by the same x-admin-secret
+header used by the admin dashboard. Picks up report-gate leads
 captured ~3 days ago that haven't yet received a digest, finds the single
 highest-ROI quick win in their report, and emails it as a gentle nudge to act.
 This is the retention loop: turn a one-time report view into a second touch.
 """
+import asyncio
 import os
 from datetime import datetime, timedelta, timezone
 
 import httpx
-from fastapi import APIRouter, Depends, Header, HTTPException
-from sqlalchemy import and_
-from sqlalchemy.orm import Session
-from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session, joinedload
+from typing import Dict, List
 
 from app.core.database import get_db
+from app.core import http_clients
 from app.core.auth import require_admin as _require_admin
 from app.core.config import settings
+from app.core.posthog_client import capture_event
 from app.models.workflow import ReportLead, Workflow, Analysis, AnalysisResult
+from app.services import scheduler
 
 router = APIRouter()
 
@@ -73,106 +78,168 @@ def _digest_html(name: str, task_name: str, score, hours, rec: str, report_url:
     """
 
 
-async def _send_digest(email: str, name: str, task_name: str, score, hours,
-                       rec: str, report_url: str) -> bool:
-    if not RESEND_API_KEY:
-        print(f"[cron] (dev) would send quick-win digest to {email}: '{task_name}'")
+_RESEND_URL = "https://api.resend.com"
+
+
+async def _resend_post(path: str, payload) -> httpx.Response:
+    """POST to Resend over the shared pooled client (app.core.http_clients)."""
+    return await http_clients.get("resend").apost(
+        f"{_RESEND_URL}{path}", json=payload,
+        headers={"Authorization": f"Bearer {RESEND_API_KEY}", "Content-Type": "application/json"},
+    )
+
+
+def _digest_email(d: dict) -> dict:
+    return {
+        "from": FROM_EMAIL,
+        "to": [os.getenv("RESEND_TEST_EMAIL", "") or d["email"]],
+        "subject": f"Your quick win this week: {d['task']}",
+        "html": _digest_html(d["workflow"].name, d["task"], d["qw"].ai_readiness_score,
+                             d["qw"].estimated_hours_saved, d["qw"].recommendation, d["report_url"]),
+    }
+
+
+async def _send_one(email: dict) -> bool:
+    try:
+        resp = await _resend_post("/emails", email)
+    except httpx.HTTPError as e:
+        print(f"[cron] Resend digest error: {e}")
+        return False
+    if resp.status_code >= 400:
+        print(f"[cron] Resend digest error {resp.status_code}: {resp.text}")
         return False
-    send_to = os.getenv("RESEND_TEST_EMAIL", "") or email
-    async with httpx.AsyncClient() as client:
-        resp = await client.post(
-            "https://api.resend.com/emails",
-            headers={"Authorization": f"Bearer {RESEND_API_KEY}", "Content-Type": "application/json"},
-            json={
-                "from": FROM_EMAIL,
-                "to": [send_to],
-                "subject": f"Your quick win this week: {task_name}",
-                "html": _digest_html(name, task_name, score, hours, rec, report_url),
-            },
-            timeout=20,
-        )
-        if resp.status_code >= 400:
-            print(f"[cron] Resend digest error {resp.status_code}: {resp.text}")
-            return False
     return True
 
 
+async def _send_chunk(sem: asyncio.Semaphore, emails: List[dict]) -> List[bool]:
+    """One Resend batch call (all-or-nothing); if it's rejected, retry the chunk
+    one email at a time so a single bad address can't sink the rest."""
+    async with sem:
+        if len(emails) > 1:
+            try:
+                resp = await _resend_post("/emails/batch", emails)
+                if resp.status_code < 400:
+                    return [True] * len(emails)
+                print(f"[cron] Resend batch error {resp.status_code}: {resp.text[:300]} — sending individually")
+            except httpx.HTTPError as e:
+                print(f"[cron] Resend batch error: {e} — sending individually")
+        return [await _send_one(e) for e in emails]
+
+
+async def _send_digests(digests: List[dict]) -> List[bool]:
+    """Send every digest; returns per-digest success in input order."""
+    if not RESEND_API_KEY:
+        for d in digests:
+            print(f"[cron] (dev) would send quick-win digest to {d['email']}: '{d['task']}'")
+        return [False] * len(digests)
+    emails = [_digest_email(d) for d in digests]
+    size = max(1, min(settings.DIGEST_BATCH_SIZE, 100))   # Resend caps a batch at 100
+    sem = asyncio.Semaphore(max(1, settings.DIGEST_SEND_CONCURRENCY))
+    chunks = await asyncio.gather(*(
+        _send_chunk(sem, emails[i:i + size]) for i in range(0, len(emails), size)
+    ))
+    return [ok for chunk in chunks for ok in chunk]
+
+
+def _load_leads(db: Session, window_start: datetime, window_end: datetime) -> List[tuple]:
+    """Due leads with their workflow, analysis, results and tasks — one joined
+    query. A lead resolves to the workflow with its workflow_id, else to the
+    one with its share_code (the join can return both; the id match wins)."""
+    rows = (
+        db.query(ReportLead, Workflow)
+        .outerjoin(Workflow, or_(
+            Workflow.id == ReportLead.workflow_id,
+            and_(ReportLead.share_code.isnot(None), Workflow.share_code == ReportLead.share_code),
+        ))
+        .options(joinedload(Workflow.analysis)
+                 .joinedload(Analysis.results)
+                 .joinedload(AnalysisResult.task))
+        .filter(and_(
+            ReportLead.digest_sent_at.is_(None),
+            ReportLead.created_at >= window_start,
+            ReportLead.created_at < window_end,
+        ))
+        .order_by(ReportLead.created_at, ReportLead.id)
+        .all()
+    )
+    resolved: Dict[int, tuple] = {}
+    for lead, workflow in rows:
+        prev = resolved.get(lead.id)
+        if prev is None or (workflow is not None and workflow.id == lead.workflow_id):
+            resolved[lead.id] = (lead, workflow)
+    return list(resolved.values())
+
+
 @router.post("/cron/quick-win-digest")
 async def quick_win_digest(db: Session = Depends(get_db), _=Depends(_require_admin),
                            dry_run: bool = False):
+    """Run the quick-win digest now (the scheduler runs it daily on its own).
+
+    Shares the job's lease with the scheduler, so a ping that lands while a
+    run is in progress gets a 409 instead of a second run.
+    Pass ?dry_run=true to preview who would receive it without sending.
+    """
+    if dry_run:
+        return await run_quick_win_digest(db, dry_run=True)
+    with scheduler.exclusive("quick_win_digest") as acquired:
+        if not acquired:
+            raise HTTPException(status_code=409, detail="quick_win_digest is already running")
+        return await run_quick_win_digest(db)
+
+
+async def run_quick_win_digest(db: Session, dry_run: bool = False) -> dict:
     """Send the T+3 quick-win digest to leads captured ~3 days ago.
 
     Idempotent: only picks leads with digest_sent_at IS NULL in the 3–4 day
-    window, and stamps digest_sent_at after each send so re-runs never double-send.
-    Pass ?dry_run=true to preview who would receive it without sending.
+    window, and stamps digest_sent_at on every lead it attempted (one commit
+    after the sends) so re-runs never double-send.
     """
     now = datetime.now(timezone.utc)
     window_start = now - timedelta(days=4)
     window_end = now - timedelta(days=3)
 
-    leads = db.query(ReportLead).filter(and_(
-        ReportLead.digest_sent_at.is_(None),
-        ReportLead.created_at >= window_start,
-        ReportLead.created_at < window_end,
-    )).all()
+    leads = _load_leads(db, window_start, window_end)
 
-    sent, skipped, previews = 0, 0, []
+    skipped, digests = 0, []
     seen_emails = set()
 
-    for lead in leads:
+    for lead, workflow in leads:
         # De-dupe: one digest per email per run even if they gated multiple reports.
         if lead.email in seen_emails:
             skipped += 1
             continue
 
-        workflow = None
-        if lead.workflow_id:
-            workflow = db.query(Workflow).filter(Workflow.id == lead.workflow_id).first()
-        if not workflow and lead.share_code:
-            workflow = db.query(Workflow).filter(Workflow.share_code == lead.share_code).first()
-        if not workflow:
-            skipped += 1
-            continue
-
-        analysis = db.query(Analysis).filter(Analysis.workflow_id == workflow.id).first()
-        if not analysis:
-            skipped += 1
-            continue
-
-        qw = _pick_quick_win(analysis.results)
+        analysis = workflow.analysis if workflow else None
+        qw = _pick_quick_win(analysis.results) if analysis else None
         if not qw:
             skipped += 1
             continue
 
-        task_name = qw.task.name if qw.task else "your top automation opportunity"
-        report_url = f"{APP_URL}/report/{workflow.share_code}" if workflow.share_code else APP_URL
+        seen_emails.add(lead.email)
+        digests.append({
+            "lead": lead, "email": lead.email, "workflow": workflow, "qw": qw,
+            "task": qw.task.name if qw.task else "your top automation opportunity",
+            "report_url": f"{APP_URL}/report/{workflow.share_code}" if workflow.share_code else APP_URL,
+        })
 
-        if dry_run:
-            previews.append({"email": lead.email, "task": task_name,
-                             "score": qw.ai_readiness_score, "workflow": workflow.name})
-            seen_emails.add(lead.email)
-            continue
+    if dry_run:
+        previews = [{"email": d["email"], "task": d["task"],
+                     "score": d["qw"].ai_readiness_score, "workflow": d["workflow"].name}
+                    for d in digests]
+        return {"dry_run": True, "candidates": len(previews), "previews": previews}
 
-        ok = await _send_digest(
-            lead.email, workflow.name, task_name,
-            qw.ai_readiness_score, qw.estimated_hours_saved,
-            qw.recommendation, report_url,
-        )
-        lead.digest_sent_at = now  # stamp regardless so a cold Resend doesn't loop retries forever
-        db.commit()
-        seen_emails.add(lead.email)
+    results = await _send_digests(digests)
+
+    sent = 0
+    for d, ok in zip(digests, results):
+        d["lead"].digest_sent_at = now  # stamp regardless so a cold Resend doesn't loop retries forever
         if ok:
             sent += 1
-            try:
-                from app.core.posthog_client import capture_event
-                capture_event(lead.email, "quick_win_digest_sent",
-                              {"workflow_id": workflow.id, "task": task_name,
-                               "score": qw.ai_readiness_score})
-            except Exception as e:
-                print(f"[cron] posthog capture failed (non-fatal): {e}")
+            capture_event(d["email"], "quick_win_digest_sent",
+                          {"workflow_id": d["workflow"].id, "task": d["task"],
+                           "score": d["qw"].ai_readiness_score})
         else:
             skipped += 1
+    db.commit()
 
-    if dry_run:
-        return {"dry_run": True, "candidates": len(previews), "previews": previews}
     return {"sent": sent, "skipped": skipped, "considered": len(leads)}
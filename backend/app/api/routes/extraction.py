@@ -2,19 +2,23 @@
 Additional API routes for voice transcription, document extraction, task parsing, and LinkedIn extraction
 """
 from fastapi import APIRouter, File, UploadFile, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import List, Dict, Optional
 import os
-from anthropic import Anthropic
-import pypdf
 import docx
-import tempfile
 import base64
 import csv
 import json
 import io
 import re
 
+from app.core.config import settings
+from app.services.document_text import TextBuilder, image_text, pdf_text, save_upload
+from app.services.extract_cache import cache_key, extract_cache
+from app.services.llm_client import get_llm_client
+from app.services.task_parsing import parse_tasks
+
 router = APIRouter()
 
 
@@ -37,7 +41,8 @@ class ParsedTasksResponse(BaseModel):
     tasks: List[TaskExtract]
 
 
-# All supported image media types for Claude Vision
+# All supported image formats for Claude Vision (image_text re-encodes each
+# upload and picks the media type actually sent)
 IMAGE_MEDIA_TYPES = {
     'png': 'image/png',
     'jpg': 'image/jpeg',
@@ -66,8 +71,12 @@ TEXT_EXTENSIONS = {
 
 
 def extract_text_from_file(file_path: str, filename: str) -> str:
-    """Extract text from 20+ document and image formats"""
+    """Extract text from 20+ document and image formats.
+
+    Text goes through a bounded TextBuilder: readers stop once
+    EXTRACT_MAX_CHARS are collected (more than task parsing can use)."""
     ext = filename.lower().rsplit('.', 1)[-1] if '.' in filename else ''
+    out = TextBuilder()
 
     try:
         # ── Plain text variants ────────────────────────────────────────────
@@ -75,43 +84,37 @@ def extract_text_from_file(file_path: str, filename: str) -> str:
             if ext in ('csv', 'tsv'):
                 delimiter = '\t' if ext == 'tsv' else ','
                 with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                    reader = csv.reader(f, delimiter=delimiter)
-                    rows = list(reader)
-                lines = []
-                if rows:
-                    lines.append(' | '.join(str(c) for c in rows[0]))  # header
-                    for row in rows[1:]:
-                        lines.append(' | '.join(str(c) for c in row))
-                return '\n'.join(lines)
+                    for row in csv.reader(f, delimiter=delimiter):   # header first
+                        if not out.line(' | '.join(str(c) for c in row)):
+                            break
+                return out.text()
 
             if ext == 'json':
                 with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
                     data = json.load(f)
-                return json.dumps(data, indent=2, ensure_ascii=False)
+                out.add(json.dumps(data, indent=2, ensure_ascii=False))
+                return out.text()
 
             with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                return f.read()
+                out.add(f.read(out.max_chars + 1))
+            return out.text()
 
         # ── PDF ───────────────────────────────────────────────────────────
         elif ext == 'pdf':
-            text = ""
-            with open(file_path, 'rb') as f:
-                pdf_reader = pypdf.PdfReader(f)
-                for page in pdf_reader.pages:
-                    text += (page.extract_text() or '') + "\n"
-            return text.strip() or "[PDF had no extractable text — may be scanned]"
+            pdf_text(file_path, out)
+            return out.text() or "[PDF had no extractable text — may be scanned]"
 
         # ── Word documents ────────────────────────────────────────────────
         elif ext in ('doc', 'docx'):
             doc = docx.Document(file_path)
-            parts = []
             for para in doc.paragraphs:
-                if para.text.strip():
-                    parts.append(para.text)
+                if para.text.strip() and not out.line(para.text):
+                    return out.text()
             for table in doc.tables:
                 for row in table.rows:
-                    parts.append(' | '.join(c.text.strip() for c in row.cells if c.text.strip()))
-            return '\n'.join(parts)
+                    if not out.line(' | '.join(c.text.strip() for c in row.cells if c.text.strip())):
+                        return out.text()
+            return out.text()
 
         # ── ODT (LibreOffice) ─────────────────────────────────────────────
         elif ext == 'odt':
@@ -120,44 +123,50 @@ def extract_text_from_file(file_path: str, filename: str) -> str:
                 from odf.text import P
                 from odf.element import Element
                 doc = odf_load(file_path)
-                texts = []
                 for elem in doc.text.getElementsByType(P):
                     t = elem.plaintext() if hasattr(elem, 'plaintext') else str(elem)
-                    if t.strip():
-                        texts.append(t.strip())
-                return '\n'.join(texts) if texts else "[ODT: no text extracted]"
+                    if t.strip() and not out.line(t.strip()):
+                        break
+                return out.text() or "[ODT: no text extracted]"
             except ImportError:
                 # Fallback: read raw XML
                 import zipfile, re as _re
                 with zipfile.ZipFile(file_path) as z:
                     with z.open('content.xml') as f:
                         raw = f.read().decode('utf-8', errors='replace')
-                return _re.sub(r'<[^>]+>', ' ', raw)
+                out.add(_re.sub(r'<[^>]+>', ' ', raw))
+                return out.text()
 
         # ── Excel ─────────────────────────────────────────────────────────
         elif ext in ('xls', 'xlsx', 'xlsm', 'xlsb', 'ods'):
             try:
                 import openpyxl
                 wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
-                parts = []
-                for sheet_name in wb.sheetnames:
-                    ws = wb[sheet_name]
-                    parts.append(f"=== Sheet: {sheet_name} ===")
-                    for row in ws.iter_rows(values_only=True):
-                        if any(c is not None for c in row):
-                            parts.append(' | '.join(str(c) if c is not None else '' for c in row))
-                return '\n'.join(parts)
+                try:
+                    for sheet_name in wb.sheetnames:
+                        if not out.line(f"=== Sheet: {sheet_name} ==="):
+                            break
+                        rows = (r for r in wb[sheet_name].iter_rows(values_only=True)
+                                if any(c is not None for c in r))
+                        if not all(out.line(' | '.join(str(c) if c is not None else '' for c in r)) for r in rows):
+                            break
+                finally:
+                    wb.close()
+                return out.text()
             except Exception:
                 # Try xlrd for older xls
+                out = TextBuilder()
                 try:
                     import xlrd
-                    wb = xlrd.open_workbook(file_path)
-                    parts = []
+                    wb = xlrd.open_workbook(file_path, on_demand=True)
                     for sheet in wb.sheets():
-                        parts.append(f"=== Sheet: {sheet.name} ===")
-                        for rx in range(sheet.nrows):
-                            parts.append(' | '.join(str(sheet.cell_value(rx, cx)) for cx in range(sheet.ncols)))
-                    return '\n'.join(parts)
+                        if not out.line(f"=== Sheet: {sheet.name} ==="):
+                            break
+                        rows = (' | '.join(str(sheet.cell_value(rx, cx)) for cx in range(sheet.ncols))
+                                for rx in range(sheet.nrows))
+                        if not all(out.line(r) for r in rows):
+                            break
+                    return out.text()
                 except Exception as e:
                     raise ValueError(f"Could not read spreadsheet: {e}")
 
@@ -166,61 +175,46 @@ def extract_text_from_file(file_path: str, filename: str) -> str:
             try:
                 from pptx import Presentation
                 prs = Presentation(file_path)
-                parts = []
                 for i, slide in enumerate(prs.slides, 1):
-                    parts.append(f"=== Slide {i} ===")
-                    for shape in slide.shapes:
-                        if hasattr(shape, 'text') and shape.text.strip():
-                            parts.append(shape.text.strip())
-                return '\n'.join(parts)
+                    texts = [shape.text.strip() for shape in slide.shapes
+                             if hasattr(shape, 'text') and shape.text.strip()]
+                    if not all(out.line(t) for t in [f"=== Slide {i} ==="] + texts):
+                        break
+                return out.text()
             except ImportError:
                 raise ValueError("pptx support requires python-pptx — install it on the server")
 
         # ── Images — all formats via Claude Vision ────────────────────────
         elif ext in IMAGE_MEDIA_TYPES:
-            api_key = os.getenv("ANTHROPIC_API_KEY")
-            if not api_key:
+            try:
+                client = get_llm_client()
+            except ValueError:
                 raise ValueError("ANTHROPIC_API_KEY not configured for image OCR")
 
-            # For formats Claude Vision doesn't natively support, convert to PNG first
-            native_formats = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
-            if ext not in native_formats:
-                try:
-                    from PIL import Image as PILImage
-                    img = PILImage.open(file_path).convert('RGB')
-                    converted_path = file_path + '_converted.png'
-                    img.save(converted_path, 'PNG')
-                    read_path = converted_path
-                    media_type = 'image/png'
-                except ImportError:
-                    read_path = file_path
-                    media_type = IMAGE_MEDIA_TYPES.get(ext, 'image/png')
-            else:
-                read_path = file_path
-                media_type = IMAGE_MEDIA_TYPES[ext]
-
-            with open(read_path, 'rb') as f:
-                image_data = base64.b64encode(f.read()).decode('utf-8')
-
-            client = Anthropic(api_key=api_key)
-            message = client.messages.create(
-                model="claude-haiku-4-5-20251001",
-                max_tokens=2000,
-                messages=[{
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "image",
-                            "source": {"type": "base64", "media_type": media_type, "data": image_data}
-                        },
-                        {
-                            "type": "text",
-                            "text": "Extract ALL text from this image. Return ONLY the extracted text, preserving structure. If this is a workflow, task list, or process diagram, preserve all labels and steps."
-                        }
-                    ]
-                }]
-            )
-            return message.content[0].text
+            def _ocr(data: bytes, media_type: str) -> str:
+                message = client.messages.create(
+                    model=settings.IMAGE_OCR_MODEL,
+                    max_tokens=2000,
+                    messages=[{
+                        "role": "user",
+                        "content": [
+                            {
+                                "type": "image",
+                                "source": {"type": "base64", "media_type": media_type,
+                                           "data": base64.b64encode(data).decode('utf-8')}
+                            },
+                            {
+                                "type": "text",
+                                "text": "Extract ALL text from this image. Return ONLY the extracted text, preserving structure. If this is a workflow, task list, or process diagram, preserve all labels and steps."
+                            }
+                        ]
+                    }]
+                )
+                return message.content[0].text
+
+            # Downscaled / cropped / re-encoded first; TIFF/HEIC pages in parallel
+            image_text(file_path, out, _ocr)
+            return out.text()
 
         else:
             raise ValueError(f"Unsupported file type: .{ext}")
@@ -312,12 +306,11 @@ async def extract_linkedin_profile(request: LinkedInRequest):
     slug = _extract_slug(normalised_url)
     pasted = (request.pasted_text or '').strip()
 
-    api_key = os.getenv("ANTHROPIC_API_KEY")
-    if not api_key:
+    try:
+        client = get_llm_client()
+    except ValueError:
         raise HTTPException(status_code=500, detail="ANTHROPIC_API_KEY not configured")
 
-    client = Anthropic(api_key=api_key)
-
     if profile_type == 'personal':
         if pasted:
             context_block = f"LinkedIn profile URL: {normalised_url}\n\nProfile text provided by user:\n{pasted[:5000]}"
@@ -414,93 +407,45 @@ async def transcribe_audio(audio: UploadFile = File(...)):
 
 @router.post("/extract-tasks")
 async def extract_tasks_from_document(file: UploadFile = File(...)):
-    """Extract text from uploaded document — supports 20+ formats"""
+    """Extract text from uploaded document — supports 20+ formats.
+
+    `cached` is true when the same file was extracted before and the text
+    came from the extract cache."""
+    filename = file.filename or "upload"
     ext = (file.filename or '').rsplit('.', 1)[-1].lower()
     suffix = f".{ext}" if ext else ""
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = tmp.name
+    # Streamed to disk in chunks (never the whole upload in memory), capped at UPLOAD_MAX_BYTES
+    tmp_path, digest = await save_upload(file, suffix)
 
     try:
-        text = extract_text_from_file(tmp_path, file.filename or "upload")
-        return {"text": text}
+        key = cache_key(digest, filename)
+        text = await run_in_threadpool(extract_cache.get, key)
+        if text is not None:
+            return {"text": text, "cached": True}
+        # Parsing is CPU-bound (PDF pages fan out to a process pool) — keep it off the event loop
+        text = await run_in_threadpool(extract_text_from_file, tmp_path, filename)
+        await run_in_threadpool(extract_cache.put, key, text)
+        return {"text": text, "cached": False}
     finally:
         if os.path.exists(tmp_path):
             os.remove(tmp_path)
-        converted = tmp_path + '_converted.png'
-        if os.path.exists(converted):
-            os.remove(converted)
 
 
 @router.post("/parse-tasks", response_model=ParsedTasksResponse)
 async def parse_tasks_from_text(request: ParseTasksRequest):
-    """Use AI to parse tasks from free-form text with McKinsey-grade extraction"""
-
-    api_key = os.getenv("ANTHROPIC_API_KEY")
-    if not api_key:
-        raise HTTPException(status_code=500, detail="ANTHROPIC_API_KEY not configured")
+    """Use AI to parse tasks from free-form text with McKinsey-grade extraction.
 
-    client = Anthropic(api_key=api_key)
-
-    prompt = f"""You are a senior McKinsey consultant specializing in workflow analysis and AI automation strategy.
-
-USER INPUT:
-{request.text}
-
-Extract a structured, exhaustive task inventory from this input. Be a rigorous analyst:
-- Decompose vague activities into atomic, measurable tasks
-- Infer frequencies and time estimates from context clues
-- Distinguish operational tasks from strategic ones
-- Do not collapse distinct activities into one task
-
-Respond ONLY with this exact JSON (no markdown, no code fences, no commentary):
-{{
-  "workflow_name": "Concise professional name (3-6 words)",
-  "workflow_description": "One sharp sentence: who does what and why. Business-analyst tone.",
-  "tasks": [
-    {{
-      "name": "Action-verb task name (e.g. 'Reconcile monthly expense reports')",
-      "description": "What exactly happens, what inputs/outputs are involved, who is accountable",
-      "frequency": "daily|weekly|monthly",
-      "time_per_task": 30,
-      "category": "data_entry|communication|analysis|creative|administrative|general",
-      "complexity": "low|medium|high"
-    }}
-  ]
-}}"""
-
-    # Fixed max_tokens=3000 truncated Claude's JSON output mid-string for
-    # longer/denser inputs (e.g. a ~14KB multi-department briefing decomposes
-    # into 20+ tasks), which made json.loads() below throw a cryptic
-    # "Expecting value: line N column M" error — surfaced to users as a
-    # generic HTTP 500 that looked identical to (and was misdiagnosed as) a
-    # Render cold-start failure. Scale the budget with input size instead of
-    # using a flat cap, matching the pattern already used in ai_analyzer.py.
-    max_output_tokens = min(3000 + len(request.text) // 2, 8000)
+    Long texts are split into chunks parsed concurrently, and near-duplicate
+    tasks across chunks are merged (see app.services.task_parsing)."""
 
     try:
-        message = client.messages.create(
-            model="claude-haiku-4-5-20251001",
-            max_tokens=max_output_tokens,
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        if message.stop_reason == "max_tokens":
-            # Response was cut off mid-JSON even at the scaled budget — fail
-            # with an actionable message instead of a raw JSON parse error.
-            raise HTTPException(
-                status_code=422,
-                detail="This document has too many distinct tasks for a single pass. Try splitting it into smaller sections, or use Manual Entry.",
-            )
-
-        response_text = message.content[0].text.strip()
-        if response_text.startswith('```'):
-            lines = response_text.split('\n')
-            response_text = '\n'.join(lines[1:-1])
+        client = get_llm_client()
+    except ValueError:
+        raise HTTPException(status_code=500, detail="ANTHROPIC_API_KEY not configured")
 
-        parsed = json.loads(response_text)
+    try:
+        parsed = await parse_tasks(client, request.text)
         return ParsedTasksResponse(**parsed)
 
     except HTTPException:
@@ -8,6 +8,10 @@ Step 1: POST /api/job-scan/research
 Step 2: POST /api/job-scan/analyze
   → Takes task list, runs batch AI analysis + n8n generation + saves to DB (~30-40s)
   → Returns workflow_id, share_code, n8n workflow JSON
+
+Batch: POST /api/job-scan/batch
+  → Steps 1+2 for many roles in the background, bounded concurrency
+  → Returns batch_id; per-role events stream from /api/job-scan/batch/{id}/events
 """
 from fastapi import APIRouter, Depends, HTTPException, Header, Request
 import os
@@ -24,6 +28,8 @@ from app.core.config import settings
 from app.models.workflow import Workflow, Task, Analysis, AnalysisResult, User, _gen_share_code
 from app.services.job_scanner import JobScanner
 from app.services.ai_analyzer import AIAnalyzer
+from app.services.batch_scan import get_batch, start_batch
+from app.services.scan_cache import cached_analysis, cached_research
 
 router = APIRouter()
 
@@ -162,6 +168,18 @@ async def get_n8n_templates(request: TemplateRequest):
 # Step 1 — Research
 # ------------------------------------------------------------------
 
+def _research(job_title: str, industry: Optional[str], analysis_context: Optional[str]):
+    """(scan result, cache hit) — Tavily + Claude only when the role isn't cached."""
+    return cached_research(
+        job_title, industry, analysis_context,
+        lambda: JobScanner().scan_job(
+            job_title=job_title,
+            industry=industry,
+            analysis_context=analysis_context or "individual",
+        ),
+    )
+
+
 @router.post("/job-scan/research", response_model=ResearchResponse)
 async def job_scan_research(request: ResearchRequest, http_request: Request, db: Session = Depends(get_db)):
     """
@@ -175,12 +193,7 @@ async def job_scan_research(request: ResearchRequest, http_request: Request, db:
         raise HTTPException(status_code=429, detail=_RATE_LIMIT_DETAIL(DAILY_ANALYSIS_LIMIT))
 
     try:
-        scanner = JobScanner()
-        result = scanner.scan_job(
-            job_title=request.job_title,
-            industry=request.industry,
-            analysis_context=request.analysis_context or "individual",
-        )
+        result, _ = _research(request.job_title, request.industry, request.analysis_context)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Research failed: {str(e)}")
 
@@ -228,6 +241,21 @@ async def job_scan_analyze(
         if _get_email_daily_count(email_lc, db) >= DAILY_ANALYSIS_LIMIT:
             raise HTTPException(status_code=429, detail=_RATE_LIMIT_DETAIL(DAILY_ANALYSIS_LIMIT))
 
+    return _analyze_and_save(db, request, client_ip, x_user_email)
+
+
+def _analyze_and_save(
+    db: Session,
+    request: AnalyzeRequest,
+    client_ip: str,
+    x_user_email: Optional[str] = None,
+) -> AnalyzeResponse:
+    """Analyze one role's task list, save it and its n8n canvas, return the response.
+
+    Shared by /job-scan/analyze and each item of a batch.
+    """
+    tasks = request.tasks
+
     # --- Persist user ---
     if x_user_email:
         email = x_user_email.lower().strip()
@@ -283,7 +311,7 @@ async def job_scan_analyze(
         for t in tasks
     ]
 
-    batch_results = analyzer.analyze_tasks_batch(task_dicts)
+    batch_results, _ = cached_analysis(task_dicts, analyzer.analyze_tasks_batch, fallback=analyzer._defaults())
 
     tasks_analysis = []
     for task_obj, task_dict, result in zip(task_objs, task_dicts, batch_results):
@@ -307,6 +335,7 @@ async def job_scan_analyze(
     )
     db.add(analysis)
     db.flush()
+    analysis_id = analysis.id
 
     for ta in tasks_analysis:
         ar = AnalysisResult(
@@ -346,7 +375,7 @@ async def job_scan_analyze(
         from app.services.n8n_template_client import N8nTemplateClient
         from app.services.job_scanner import JobScanner
 
-        top_task_dicts = [t.dict() for t in tasks[:6]]
+        top_task_dicts = [t.model_dump() for t in tasks[:6]]
 
         # 1. Per-task community template curation
         api_key = os.getenv("ANTHROPIC_API_KEY", "")
@@ -369,29 +398,17 @@ async def job_scan_analyze(
 
         # 3. Persist merged canvas — direct connection bypasses session state
         import json as _json
-        from app.core.config import settings as _settings
-        _n8n_str = _json.dumps(n8n_workflow)
-        _wf_id = workflow.id
-        if _settings.TURSO_DATABASE_URL and _settings.TURSO_AUTH_TOKEN:
-            from app.core.turso_dbapi import connect as _tc
-            _conn = _tc(_settings.TURSO_DATABASE_URL, _settings.TURSO_AUTH_TOKEN)
-            try:
-                _cur = _conn.cursor()
-                _cur.execute("UPDATE workflows SET n8n_workflow_json = ? WHERE id = ?", (_n8n_str, _wf_id))
-                _conn.commit()
-            finally:
-                _conn.close()
-        else:
-            from app.core.database import engine as _engine
-            from sqlalchemy import text as _text
-            with _engine.connect() as _c:
-                _c.execute(_text("UPDATE workflows SET n8n_workflow_json = :j WHERE id = :i"), {"j": _n8n_str, "i": _wf_id})
-                _c.commit()
+        from app.services.canvas_store import save_canvas
+        save_canvas(workflow.id, _json.dumps(n8n_workflow))
     except Exception as exc:
         print(f"[n8n] workflow/template generation error: {exc}")
         n8n_workflow = {"name": f"{request.job_title} Workflow", "nodes": [], "connections": {}}
         suggested_templates = []
 
+    # Materialize the report response now that the canvas is stored
+    from app.services.analysis_snapshot import save_snapshot
+    save_snapshot(db, analysis_id)
+
     return AnalyzeResponse(
         workflow_id=workflow.id,
         share_code=workflow.share_code,
@@ -401,3 +418,179 @@ async def job_scan_analyze(
         suggested_templates=suggested_templates,
         message=f"Analysis complete — {len(tasks)} tasks saved.",
     )
+
+
+# ------------------------------------------------------------------
+# Batch — many roles per request (consultant engagements)
+# ------------------------------------------------------------------
+
+class BatchItem(BaseModel):
+    job_title: str = Field(..., min_length=2, max_length=100)
+    industry: Optional[str] = Field(None, max_length=100)
+    analysis_context: Optional[str] = "individual"
+    tasks: Optional[List[TaskItem]] = None   # known task list → research is skipped
+
+
+class BatchScanRequest(BaseModel):
+    items: List[BatchItem] = Field(..., min_length=1)
+    hourly_rate: Optional[float] = Field(75.0, gt=0)
+    combined_report: bool = False
+    locale: str = "en"  # combined report language: 'en' or 'de'
+
+
+def _run_batch_item(item: dict, hourly_rate: float, client_ip: str, email: Optional[str]) -> dict:
+    """Research (unless tasks were given) + analyze + save one batch role."""
+    from app.core import database
+
+    research_cached = None
+    tasks = item.get("tasks")
+    if not tasks:
+        result, research_cached = _research(item["job_title"], item.get("industry"), item.get("analysis_context"))
+        tasks = result.get("tasks", [])
+        if not tasks:
+            raise ValueError("Could not extract tasks for this job title")
+
+    request = AnalyzeRequest(
+        job_title=item["job_title"],
+        industry=item.get("industry"),
+        analysis_context=item.get("analysis_context") or "individual",
+        hourly_rate=hourly_rate,
+        tasks=[TaskItem(**t) for t in tasks],
+    )
+    db = database.SessionLocal()
+    try:
+        response = _analyze_and_save(db, request, client_ip, email)
+    finally:
+        db.close()
+    return {
+        "workflow_id": response.workflow_id,
+        "share_code": response.share_code,
+        "tasks_found": response.tasks_found,
+        "research_cached": research_cached,
+    }
+
+
+def _batch_report(locale: str):
+    """finish step: one combined PDF over every role the batch saved."""
+    def finish(batch, results: List[dict]) -> Optional[str]:
+        import tempfile
+        from app.core import database
+        from app.api.routes.reports import _load_combined_analyses
+        from app.services.report_generator import ReportGenerator
+
+        ids = [r["workflow_id"] for r in results]
+        db = database.SessionLocal()
+        try:
+            analyses = _load_combined_analyses(db, ids, cap=len(ids))
+        finally:
+            db.close()
+        if not analyses:
+            return None
+        output_path = os.path.join(tempfile.gettempdir(), f"workscan_batch_{batch.id}.pdf")
+        ReportGenerator.generate_combined_pdf_report(analyses, output_path,
+            loc=("de" if locale == "de" else "en"), workers=settings.REPORT_RENDER_WORKERS)
+        return output_path
+    return finish
+
+
+@router.post("/job-scan/batch", status_code=202)
+async def job_scan_batch(
+    request: BatchScanRequest,
+    http_request: Request,
+    db: Session = Depends(get_db),
+    x_user_email: Optional[str] = Header(None),
+):
+    """
+    Queue research + analysis for many roles at once. Returns a batch id
+    immediately; progress streams from /job-scan/batch/{id}/events and the
+    optional combined PDF is served from /job-scan/batch/{id}/report.
+    Each role counts against the shared 5/24h quota unless admin/owner.
+    """
+    cap = settings.BATCH_SCAN_MAX_ITEMS
+    if len(request.items) > cap:
+        raise HTTPException(status_code=422, detail=f"A batch can include at most {cap} roles ({len(request.items)} requested).")
+
+    client_ip = get_client_ip(http_request)
+    is_admin = is_admin_secret(http_request.headers.get("x-admin-secret"))
+    is_owner = is_owner_ip(client_ip)
+    email = x_user_email.lower().strip() if x_user_email else None
+    if not is_admin and not is_owner:
+        used = _get_ip_daily_count(client_ip, db)
+        if email:
+            used = max(used, _get_email_daily_count(email, db))
+        if used + len(request.items) > DAILY_ANALYSIS_LIMIT:
+            raise HTTPException(status_code=429, detail=_RATE_LIMIT_DETAIL(DAILY_ANALYSIS_LIMIT))
+
+    items = [i.model_dump() for i in request.items]
+    hourly_rate = request.hourly_rate or 75.0
+    batch = start_batch(
+        items,
+        lambda item: _run_batch_item(item, hourly_rate, client_ip, email),
+        finish=_batch_report(request.locale) if request.combined_report else None,
+    )
+    return {
+        "batch_id": batch.id,
+        "total": len(items),
+        "status_url": f"/api/job-scan/batch/{batch.id}",
+        "events_url": f"/api/job-scan/batch/{batch.id}/events",
+    }
+
+
+def _get_batch_or_404(batch_id: str):
+    batch = get_batch(batch_id)
+    if batch is None:
+        raise HTTPException(status_code=404, detail="Batch not found")
+    return batch
+
+
+@router.get("/job-scan/batch/{batch_id}")
+def job_scan_batch_status(batch_id: str):
+    """Current state of every role in a batch."""
+    return _get_batch_or_404(batch_id).summary()
+
+
+@router.get("/job-scan/batch/{batch_id}/events")
+async def job_scan_batch_events(batch_id: str, after: int = 0):
+    """SSE: replay the batch's events from `after`, then follow until it is done."""
+    import asyncio
+    import json as _json
+    from fastapi.responses import StreamingResponse
+
+    batch = _get_batch_or_404(batch_id)
+
+    async def event_stream():
+        seq = max(0, after)
+        while True:
+            events, finished = await asyncio.to_thread(batch.events_after, seq, 15.0)
+            if not events:
+                if finished:
+                    return
+                yield ': ping\n\n'
+                continue
+            for event in events:
+                yield f"data: {_json.dumps(event, default=str)}\n\n"
+            seq = events[-1]["seq"] + 1
+            if events[-1]["stage"] == "done":
+                return
+
+    return StreamingResponse(
+        event_stream(),
+        media_type='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache, no-transform',
+            'X-Accel-Buffering': 'no',
+            'Connection': 'keep-alive',
+        },
+    )
+
+
+@router.get("/job-scan/batch/{batch_id}/report")
+def job_scan_batch_report(batch_id: str):
+    """The combined PDF of a finished batch (when combined_report was requested)."""
+    from fastapi.responses import FileResponse
+
+    batch = _get_batch_or_404(batch_id)
+    if not batch.report_path or not os.path.exists(batch.report_path):
+        raise HTTPException(status_code=404, detail="No combined report for this batch (yet)")
+    return FileResponse(batch.report_path, media_type='application/pdf',
+                        filename="WorkScanAI_Batch_Report.pdf")
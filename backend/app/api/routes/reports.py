@@ -5,15 +5,16 @@ import base64
 import os
 import tempfile
 
-import httpx
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, undefer
 from typing import List, Optional
 from pydantic import BaseModel
 
+from app.core import http_clients
+from app.core.config import settings
 from app.core.database import get_db
-from app.models.workflow import Workflow, Analysis, ReportLead
+from app.models.workflow import Workflow, Analysis, AnalysisResult, ReportLead
 from app.services.report_generator import ReportGenerator
 
 router = APIRouter()
@@ -98,7 +99,7 @@ def _build_analysis_data(workflow: Workflow, analysis: Analysis,
 def generate_docx_report(workflow_id: int, prepared_for: Optional[str] = None,
                          prepared_by: Optional[str] = None, locale: str = "en",
                          db: Session = Depends(get_db)):
-    workflow = db.query(Workflow).filter(Workflow.id == workflow_id).first()
+    workflow = db.query(Workflow).options(undefer(Workflow.source_text)).filter(Workflow.id == workflow_id).first()
     if not workflow:
         raise HTTPException(status_code=404, detail="Workflow not found")
     analysis = db.query(Analysis).filter(Analysis.workflow_id == workflow_id).first()
@@ -121,7 +122,7 @@ def generate_docx_report(workflow_id: int, prepared_for: Optional[str] = None,
 def generate_pdf_report(workflow_id: int, prepared_for: Optional[str] = None,
                         prepared_by: Optional[str] = None, locale: str = "en",
                         db: Session = Depends(get_db)):
-    workflow = db.query(Workflow).filter(Workflow.id == workflow_id).first()
+    workflow = db.query(Workflow).options(undefer(Workflow.source_text)).filter(Workflow.id == workflow_id).first()
     if not workflow:
         raise HTTPException(status_code=404, detail="Workflow not found")
     analysis = db.query(Analysis).filter(Analysis.workflow_id == workflow_id).first()
@@ -147,23 +148,44 @@ class CombinedReportRequest(BaseModel):
     locale: str = "en"  # 'en' (default) or 'de'
 
 
+def _load_combined_analyses(db: Session, workflow_ids: List[int], cap: Optional[int] = None) -> List[dict]:
+    """Load every requested workflow with its analysis, results and tasks in ONE
+    query (previously two queries per id plus lazy loads per result row), and
+    return the report dicts in request order. Ids without an analysis are skipped.
+    `cap` overrides COMBINED_REPORT_MAX_WORKFLOWS (batch reports render off-request)."""
+    ids = list(dict.fromkeys(workflow_ids))
+    cap = cap or settings.COMBINED_REPORT_MAX_WORKFLOWS
+    if len(ids) > cap:
+        raise HTTPException(
+            status_code=422,
+            detail=f"A combined report can include at most {cap} workflows ({len(ids)} requested). "
+                   f"Split the selection into smaller reports.",
+        )
+    workflows = (
+        db.query(Workflow)
+        .filter(Workflow.id.in_(ids))
+        .options(undefer(Workflow.source_text),
+                 joinedload(Workflow.analysis)
+                 .joinedload(Analysis.results)
+                 .joinedload(AnalysisResult.task))
+        .all()
+    )
+    by_id = {w.id: w for w in workflows}
+    return [_build_analysis_data(by_id[wid], by_id[wid].analysis)
+            for wid in ids if wid in by_id and by_id[wid].analysis]
+
+
 @router.post("/reports/combined/docx")
 def generate_combined_docx(body: CombinedReportRequest, db: Session = Depends(get_db)):
     """Generate one DOCX containing all requested workflows."""
-    analyses = []
-    for wid in body.workflow_ids:
-        workflow = db.query(Workflow).filter(Workflow.id == wid).first()
-        analysis = db.query(Analysis).filter(Analysis.workflow_id == wid).first() if workflow else None
-        if workflow and analysis:
-            analyses.append(_build_analysis_data(workflow, analysis))
-
+    analyses = _load_combined_analyses(db, body.workflow_ids)
     if not analyses:
         raise HTTPException(status_code=404, detail="No analyzed workflows found for the given IDs")
 
     ids_str = "_".join(str(i) for i in body.workflow_ids[:5])
     output_path = os.path.join(tempfile.gettempdir(), f"workscan_combined_{ids_str}.docx")
     ReportGenerator.generate_combined_docx_report(analyses, output_path,
-        loc=("de" if body.locale == "de" else "en"))
+        loc=("de" if body.locale == "de" else "en"), workers=settings.REPORT_RENDER_WORKERS)
     return FileResponse(
         output_path,
         media_type='application/vnd.openxmlformats-officedocument.wordprocessingml.document',
@@ -174,20 +196,14 @@ def generate_combined_docx(body: CombinedReportRequest, db: Session = Depends(ge
 @router.post("/reports/combined/pdf")
 def generate_combined_pdf(body: CombinedReportRequest, db: Session = Depends(get_db)):
     """Generate one PDF containing all requested workflows."""
-    analyses = []
-    for wid in body.workflow_ids:
-        workflow = db.query(Workflow).filter(Workflow.id == wid).first()
-        analysis = db.query(Analysis).filter(Analysis.workflow_id == wid).first() if workflow else None
-        if workflow and analysis:
-            analyses.append(_build_analysis_data(workflow, analysis))
-
+    analyses = _load_combined_analyses(db, body.workflow_ids)
     if not analyses:
         raise HTTPException(status_code=404, detail="No analyzed workflows found for the given IDs")
 
     ids_str = "_".join(str(i) for i in body.workflow_ids[:5])
     output_path = os.path.join(tempfile.gettempdir(), f"workscan_combined_{ids_str}.pdf")
     ReportGenerator.generate_combined_pdf_report(analyses, output_path,
-        loc=("de" if body.locale == "de" else "en"))
+        loc=("de" if body.locale == "de" else "en"), workers=settings.REPORT_RENDER_WORKERS)
     return FileResponse(
         output_path,
         media_type='application/pdf',
@@ -274,25 +290,23 @@ async def _send_report_email(email: str, workflow_name: str, report_url: str,
         pdf_b64 = base64.b64encode(f.read()).decode("ascii")
     safe_name = workflow_name.replace(" ", "_")[:60]
 
-    async with httpx.AsyncClient() as client:
-        resp = await client.post(
-            "https://api.resend.com/emails",
-            headers={"Authorization": f"Bearer {RESEND_API_KEY}", "Content-Type": "application/json"},
-            json={
-                "from": FROM_EMAIL,
-                "to": [send_to],
-                "subject": (f"Ihr WorkScanAI-Bericht – {workflow_name}" if locale == "de" else f"Your WorkScanAI report — {workflow_name}"),
-                "html": _report_email_html(workflow_name, report_url, score, hours, savings, locale),
-                "attachments": [{
-                    "filename": f"WorkScanAI_Report_{safe_name}.pdf",
-                    "content": pdf_b64,
-                }],
-            },
-            timeout=20,
-        )
-        if resp.status_code >= 400:
-            print(f"[reports] Resend error {resp.status_code}: {resp.text}")
-            return False
+    resp = await http_clients.get("resend").apost(
+        "https://api.resend.com/emails",
+        headers={"Authorization": f"Bearer {RESEND_API_KEY}", "Content-Type": "application/json"},
+        json={
+            "from": FROM_EMAIL,
+            "to": [send_to],
+            "subject": (f"Ihr WorkScanAI-Bericht – {workflow_name}" if locale == "de" else f"Your WorkScanAI report — {workflow_name}"),
+            "html": _report_email_html(workflow_name, report_url, score, hours, savings, locale),
+            "attachments": [{
+                "filename": f"WorkScanAI_Report_{safe_name}.pdf",
+                "content": pdf_b64,
+            }],
+        },
+    )
+    if resp.status_code >= 400:
+        print(f"[reports] Resend error {resp.status_code}: {resp.text}")
+        return False
     return True
 
 
@@ -304,7 +318,8 @@ async def email_full_report(share_code: str, body: EmailReportRequest, db: Sessi
     if '@' not in email or '.' not in email.split('@')[-1]:
         raise HTTPException(status_code=422, detail="Please enter a valid email address.")
 
-    workflow = db.query(Workflow).filter(Workflow.share_code == share_code).first()
+    workflow = (db.query(Workflow).options(undefer(Workflow.source_text))
+                .filter(Workflow.share_code == share_code).first())
     if not workflow:
         raise HTTPException(status_code=404, detail="Report not found.")
     analysis = db.query(Analysis).filter(Analysis.workflow_id == workflow.id).first()
@@ -343,9 +358,9 @@ async def email_full_report(share_code: str, body: EmailReportRequest, db: Sessi
     try:
         from app.core.posthog_client import capture_event
         capture_event(
+            email,
             "report_email_captured",
-            distinct_id=email,
-            properties={
+            {
                 "share_code": share_code,
                 "workflow_id": workflow.id,
                 "audience": body.audience,
@@ -10,11 +10,11 @@ import hashlib
 import ipaddress
 from typing import Optional
 
-import httpx
 from fastapi import APIRouter, Depends, Request
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
+from app.core import http_clients
 from app.core.database import get_db
 from app.core.security import get_client_ip
 from app.models.workflow import PageView
@@ -49,7 +49,7 @@ def _resolve_geo(ip: str) -> dict:
     if not _is_public_ip(ip):
         return {}
     try:
-        r = httpx.get(f"https://ipapi.co/{ip}/json/", timeout=2.0)
+        r = http_clients.get("ipapi").get(f"https://ipapi.co/{ip}/json/")
         if r.status_code == 200:
             d = r.json()
             return {
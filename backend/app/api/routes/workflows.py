@@ -3,24 +3,30 @@ API routes for workflow management and analysis
 """
 import os
 from fastapi import APIRouter, Depends, HTTPException, Request, Header
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 import asyncio
+import gzip
 import json as _json_lib
-from sqlalchemy.orm import Session
-from sqlalchemy import func as sqlfunc
+from sqlalchemy.orm import Session, selectinload, undefer
+from sqlalchemy import func as sqlfunc, select
 from typing import List, Optional
 from datetime import datetime, timedelta, timezone
 
 from app.core.database import get_db
+from app.core.timing import Trace
 from app.core.config import settings
+from app.core.pagination import created_key, keyset_page
 from app.core.security import check_rate_limit, verify_recaptcha, is_owner_ip
 from app.core.auth import is_admin_secret
+from app.core.share_cache import share_cache, invalidate_share
 from app.models.workflow import Workflow, Task, Analysis, AnalysisResult, User, _gen_share_code
 from app.schemas.workflow import (
-    WorkflowCreate, WorkflowResponse,
-    AnalyzeRequest, AnalysisResponse, AnalysisResultResponse
+    WorkflowCreate, WorkflowResponse, WorkflowSummaryResponse,
+    AnalyzeRequest, AnalysisResponse, AnalysisReportResponse, AnalysisResultResponse
 )
 from app.services.ai_analyzer import AIAnalyzer
+from app.services.analysis_snapshot import get_snapshot, save_snapshot, serialize_analysis, snapshot_response
+from app.services.canvas_store import canvas_response, load_canvas, save_canvas
 from app.core.posthog_client import capture_event
 
 router = APIRouter()
@@ -123,7 +129,7 @@ def create_workflow(
 @router.get("/workflows/{workflow_id}", response_model=WorkflowResponse)
 def get_workflow(workflow_id: int, db: Session = Depends(get_db)):
     """Get a workflow by ID"""
-    workflow = db.query(Workflow).filter(Workflow.id == workflow_id).first()
+    workflow = db.query(Workflow).options(undefer(Workflow.source_text)).filter(Workflow.id == workflow_id).first()
     
     if not workflow:
         raise HTTPException(status_code=404, detail="Workflow not found")
@@ -131,16 +137,50 @@ def get_workflow(workflow_id: int, db: Session = Depends(get_db)):
     return workflow
 
 
-@router.get("/workflows", response_model=List[WorkflowResponse])
+@router.get("/workflows/{workflow_id}/n8n-canvas")
+def get_workflow_canvas(workflow_id: int, request: Request, db: Session = Depends(get_db)):
+    """Stream the stored n8n canvas JSON for a workflow."""
+    stored = load_canvas(db, Workflow.id == workflow_id)
+    if stored is None:
+        raise HTTPException(status_code=404, detail="Workflow not found")
+    if stored == (None, None):
+        raise HTTPException(status_code=404, detail="No n8n canvas for this workflow")
+    return canvas_response(request, *stored)
+
+
+@router.get("/workflows", response_model=List[WorkflowSummaryResponse])
 def list_workflows(
+    response: Response,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     x_user_email: Optional[str] = Header(None),
 ):
-    """List workflows — filtered by user email if provided"""
-    q = db.query(Workflow)
+    """List workflows newest first — filtered by user email if provided.
+
+    One keyset page of list columns per call; when more rows remain, the
+    cursor for the next page is sent in the X-Next-Cursor header.
+    """
+    limit = max(1, min(limit or settings.WORKFLOW_PAGE_SIZE, settings.WORKFLOW_PAGE_MAX))
+    task_count = (
+        select(sqlfunc.count(Task.id))
+        .where(Task.workflow_id == Workflow.id)
+        .correlate(Workflow)
+        .scalar_subquery()
+    )
+    q = db.query(
+        Workflow.id, Workflow.share_code, Workflow.name, Workflow.description,
+        Workflow.input_mode, Workflow.analysis_context, Workflow.team_size, Workflow.industry,
+        Workflow.created_at, Workflow.updated_at,
+        created_key(Workflow.created_at).label("created_key"),
+        task_count.label("task_count"),
+    )
     if x_user_email:
         q = q.filter(Workflow.user_email == x_user_email.lower().strip())
-    return q.order_by(Workflow.created_at.desc()).all()
+    rows, next_cursor = keyset_page(q, Workflow.created_at, Workflow.id, cursor, limit)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return rows
 
 
 def _get_ip_daily_analyses(ip: str, db: Session) -> int:
@@ -166,24 +206,9 @@ def _get_client_ip(request: Request) -> str:
     return request.client.host if request.client else "unknown"
 
 
-def _perform_analysis_sync(workflow_id, hourly_rate, db):
-    """
-    Run the analysis synchronously, yielding (stage_name, payload) tuples
-    at each milestone. The route wrapper turns these into either a single
-    JSON response or an SSE stream.
-    """
-    workflow = db.query(Workflow).filter(Workflow.id == workflow_id).first()
-    if not workflow:
-        yield ('error', {'status': 404, 'message': 'Workflow not found'})
-        return
-    if not workflow.tasks:
-        yield ('error', {'status': 400, 'message': 'Workflow has no tasks to analyze'})
-        return
-
-    yield ('analyzing', {'task_count': len(workflow.tasks)})
-
-    analyzer = AIAnalyzer()
-    task_dicts = [
+def _workflow_task_dicts(workflow):
+    """The per-task dicts AIAnalyzer is given for one workflow."""
+    return [
         {
             'name': task.name,
             'description': task.description,
@@ -197,7 +222,40 @@ def _perform_analysis_sync(workflow_id, hourly_rate, db):
         }
         for task in workflow.tasks
     ]
-    batch_results = analyzer.analyze_tasks_batch(task_dicts)
+
+
+def _perform_analysis_sync(workflow_id, hourly_rate, db, batch_results=None):
+    """
+    Run the analysis synchronously, yielding (stage_name, payload) tuples
+    at each milestone. The route wrapper turns these into either a single
+    JSON response or an SSE stream.
+
+    `batch_results` are per-task results already produced elsewhere (the
+    bulk Message Batches path); the LLM call is skipped and they are saved
+    exactly as a live analysis would be.
+
+    Each phase is a span on one timing Trace: every stage payload carries
+    the spans that finished since the previous stage as `timing`, and the
+    whole trace is logged when the analysis is done.
+    """
+    trace = Trace("analyze", workflow_id=workflow_id)
+    with trace.span("db.load"):
+        workflow = db.query(Workflow).filter(Workflow.id == workflow_id).first()
+        task_count = len(workflow.tasks) if workflow else 0
+    if not workflow:
+        yield ('error', {'status': 404, 'message': 'Workflow not found'})
+        return
+    if not task_count:
+        yield ('error', {'status': 400, 'message': 'Workflow has no tasks to analyze'})
+        return
+
+    yield ('analyzing', {'task_count': task_count, 'timing': trace.since_last()})
+
+    analyzer = AIAnalyzer()
+    task_dicts = _workflow_task_dicts(workflow)
+    if batch_results is None:
+        with trace.active():
+            batch_results = analyzer.analyze_tasks_batch(task_dicts)
 
     tasks_analysis = []
     for task, task_dict, analysis_result in zip(workflow.tasks, task_dicts, batch_results):
@@ -205,93 +263,87 @@ def _perform_analysis_sync(workflow_id, hourly_rate, db):
         analysis_result['task_obj'] = task
         tasks_analysis.append(analysis_result)
 
-    yield ('roi', {})
-
-    roi_metrics = analyzer.calculate_roi(tasks_analysis, hourly_rate)
-    analysis = Analysis(
-        workflow_id=workflow.id,
-        automation_score=roi_metrics['automation_score'],
-        hours_saved=roi_metrics['hours_saved'],
-        annual_savings=roi_metrics['annual_savings'],
-        readiness_score=roi_metrics.get('readiness_score'),
-        readiness_data_quality=roi_metrics.get('readiness_data_quality'),
-        readiness_process_docs=roi_metrics.get('readiness_process_docs'),
-        readiness_tool_maturity=roi_metrics.get('readiness_tool_maturity'),
-        readiness_team_skills=roi_metrics.get('readiness_team_skills'),
-    )
-    db.add(analysis)
-    db.flush()
-
-    for task_analysis in tasks_analysis:
-        result = AnalysisResult(
-            analysis_id=analysis.id,
-            task_id=task_analysis['task_obj'].id,
-            ai_readiness_score=task_analysis['ai_readiness_score'],
-            score_repeatability=task_analysis.get('score_repeatability'),
-            score_data_availability=task_analysis.get('score_data_availability'),
-            score_error_tolerance=task_analysis.get('score_error_tolerance'),
-            score_integration=task_analysis.get('score_integration'),
-            time_saved_percentage=task_analysis.get('time_saved_percentage'),
-            recommendation=task_analysis.get('recommendation'),
-            difficulty=task_analysis.get('difficulty'),
-            estimated_hours_saved=task_analysis.get('estimated_hours_saved'),
-            risk_level=task_analysis.get('risk_level'),
-            risk_flag=task_analysis.get('risk_flag'),
-            agent_phase=task_analysis.get('agent_phase'),
-            agent_label=task_analysis.get('agent_label'),
-            agent_milestone=task_analysis.get('agent_milestone'),
-            orchestration=task_analysis.get('orchestration'),
-            countdown_window=task_analysis.get('countdown_window'),
-            human_edge_score=task_analysis.get('human_edge_score'),
-            pivot_skills=task_analysis.get('pivot_skills'),
-            pivot_roles=task_analysis.get('pivot_roles'),
-            decision_layer=task_analysis.get('decision_layer'),
-            score_confidence=task_analysis.get('score_confidence'),
+    yield ('roi', {'timing': trace.since_last()})
+
+    with trace.span("roi"):
+        roi_metrics = analyzer.calculate_roi(tasks_analysis, hourly_rate)
+    with trace.span("persist"):
+        analysis = Analysis(
+            workflow_id=workflow.id,
+            automation_score=roi_metrics['automation_score'],
+            hours_saved=roi_metrics['hours_saved'],
+            annual_savings=roi_metrics['annual_savings'],
+            readiness_score=roi_metrics.get('readiness_score'),
+            readiness_data_quality=roi_metrics.get('readiness_data_quality'),
+            readiness_process_docs=roi_metrics.get('readiness_process_docs'),
+            readiness_tool_maturity=roi_metrics.get('readiness_tool_maturity'),
+            readiness_team_skills=roi_metrics.get('readiness_team_skills'),
         )
-        db.add(result)
-    db.commit()
-    db.refresh(analysis)
+        db.add(analysis)
+        db.flush()
+
+        for task_analysis in tasks_analysis:
+            result = AnalysisResult(
+                analysis_id=analysis.id,
+                task_id=task_analysis['task_obj'].id,
+                ai_readiness_score=task_analysis['ai_readiness_score'],
+                score_repeatability=task_analysis.get('score_repeatability'),
+                score_data_availability=task_analysis.get('score_data_availability'),
+                score_error_tolerance=task_analysis.get('score_error_tolerance'),
+                score_integration=task_analysis.get('score_integration'),
+                time_saved_percentage=task_analysis.get('time_saved_percentage'),
+                recommendation=task_analysis.get('recommendation'),
+                difficulty=task_analysis.get('difficulty'),
+                estimated_hours_saved=task_analysis.get('estimated_hours_saved'),
+                risk_level=task_analysis.get('risk_level'),
+                risk_flag=task_analysis.get('risk_flag'),
+                agent_phase=task_analysis.get('agent_phase'),
+                agent_label=task_analysis.get('agent_label'),
+                agent_milestone=task_analysis.get('agent_milestone'),
+                orchestration=task_analysis.get('orchestration'),
+                countdown_window=task_analysis.get('countdown_window'),
+                human_edge_score=task_analysis.get('human_edge_score'),
+                pivot_skills=task_analysis.get('pivot_skills'),
+                pivot_roles=task_analysis.get('pivot_roles'),
+                decision_layer=task_analysis.get('decision_layer'),
+                score_confidence=task_analysis.get('score_confidence'),
+            )
+            db.add(result)
+        db.commit()
+        db.refresh(analysis)
 
-    yield ('n8n', {})
+    yield ('n8n', {'timing': trace.since_last()})
 
     try:
         import os as _os
         from app.services.n8n_template_client import N8nTemplateClient
-        _api_key = _os.getenv("ANTHROPIC_API_KEY", "")
-        _client = N8nTemplateClient(anthropic_api_key=_api_key)
-        _top_tasks = task_dicts[:6]
-        _workflow_name = workflow.name or "Workflow Analysis"
-        _suggested = _client.get_curated_templates(job_title=_workflow_name, tasks=_top_tasks)
-        if _suggested:
-            _n8n = _client.build_merged_canvas(job_title=_workflow_name, suggested_templates=_suggested)
-        else:
-            from app.services.job_scanner import JobScanner as _JS
-            _n8n = _JS()._generate_n8n_workflow(_workflow_name, _top_tasks)
-        _n8n_str = _json_lib.dumps(_n8n)
-        from app.core.config import settings as _settings
-        if _settings.TURSO_DATABASE_URL and _settings.TURSO_AUTH_TOKEN:
-            from app.core.turso_dbapi import connect as _tc
-            _conn = _tc(_settings.TURSO_DATABASE_URL, _settings.TURSO_AUTH_TOKEN)
-            try:
-                _cur = _conn.cursor()
-                _cur.execute("UPDATE workflows SET n8n_workflow_json = ? WHERE id = ?", (_n8n_str, workflow.id))
-                _conn.commit()
-            finally:
-                _conn.close()
-        else:
-            from app.core.database import engine as _engine
-            from sqlalchemy import text as _text
-            with _engine.connect() as _c:
-                _c.execute(_text("UPDATE workflows SET n8n_workflow_json = :j WHERE id = :i"), {"j": _n8n_str, "i": workflow.id})
-                _c.commit()
+        with trace.span("canvas.generate"):
+            _api_key = _os.getenv("ANTHROPIC_API_KEY", "")
+            _client = N8nTemplateClient(anthropic_api_key=_api_key)
+            _top_tasks = task_dicts[:6]
+            _workflow_name = workflow.name or "Workflow Analysis"
+            _suggested = _client.get_curated_templates(job_title=_workflow_name, tasks=_top_tasks)
+            if _suggested:
+                _n8n_str = _client.merged_canvas_builder(job_title=_workflow_name, suggested_templates=_suggested).to_json()
+            else:
+                from app.services.job_scanner import JobScanner as _JS
+                _n8n_str = _json_lib.dumps(_JS()._generate_n8n_workflow(_workflow_name, _top_tasks))
+        with trace.span("canvas.update"):
+            save_canvas(workflow.id, _n8n_str)
     except Exception as _exc:
         print(f"[n8n] workflow generation error for regular analysis: {_exc}")
 
-    db.refresh(analysis)
-    _ = analysis.workflow
-    _ = analysis.results
-    for r in analysis.results:
-        _ = r.task
+    with trace.span("refresh"):
+        db.refresh(analysis)
+        _ = analysis.workflow
+        _ = analysis.results
+        for r in analysis.results:
+            _ = r.task
+    # A re-analysis rewrites what the public report shows. Materialize the
+    # final report now so reads just send bytes.
+    with trace.span("snapshot"):
+        save_snapshot(db, analysis.id)
+        invalidate_share(workflow.share_code)
 
     # Server-side analytics — must NEVER be able to break the analysis flow.
     # Guard attribute access (workflow can be None on refresh edge cases) and
@@ -310,7 +362,65 @@ def _perform_analysis_sync(workflow_id, hourly_rate, db):
     except Exception as _exc:
         print(f"[posthog] analysis_completed capture skipped: {_exc}")
 
-    yield ('done', {'analysis': analysis})
+    timing = trace.since_last()
+    total_ms = trace.finish(task_count=task_count)['total_ms']
+    yield ('done', {'analysis': analysis, 'timing': timing, 'total_ms': total_ms})
+
+
+def bulk_analyze_workflows(workflow_ids: List[int], hourly_rate: float, poll_interval: Optional[float] = None) -> dict:
+    """Analyze many workflows through one Message Batch, then save each one
+    through _perform_analysis_sync. For offline work (sample generation,
+    admin re-runs) where throughput matters more than latency.
+
+    Returns {workflow_id: analysis id, or a reason it was not analyzed}.
+    Workflows that already have an analysis are skipped.
+    """
+    from app.core import database
+
+    outcome = {}
+    db = database.SessionLocal()
+    try:
+        workflows = (
+            db.query(Workflow)
+            .options(selectinload(Workflow.tasks), selectinload(Workflow.analysis))
+            .filter(Workflow.id.in_(workflow_ids))
+            .all()
+        )
+        jobs = {}
+        for wf in workflows:
+            if wf.analysis is not None:
+                outcome[wf.id] = 'already analyzed'
+            elif not wf.tasks:
+                outcome[wf.id] = 'no tasks'
+            else:
+                jobs[f"wf-{wf.id}"] = _workflow_task_dicts(wf)
+        found = {wf.id for wf in workflows}
+        outcome.update({wid: 'not found' for wid in workflow_ids if wid not in found})
+    finally:
+        # The batch can take hours — don't hold a connection and an open
+        # transaction while it runs.
+        db.close()
+    if not jobs:
+        return outcome
+
+    results = AIAnalyzer().analyze_bulk(jobs, poll_interval=poll_interval)
+    db = database.SessionLocal()
+    try:
+        for custom_id, batch_results in results.items():
+            wid = int(custom_id[3:])
+            try:
+                for stage, payload in _perform_analysis_sync(wid, hourly_rate, db, batch_results=batch_results):
+                    if stage == 'error':
+                        outcome[wid] = payload.get('message', 'failed')
+                    elif stage == 'done':
+                        outcome[wid] = payload['analysis'].id
+            except Exception as exc:
+                db.rollback()
+                print(f"[ai_bulk] saving workflow {wid} failed: {exc}")
+                outcome[wid] = f"save failed: {exc}"
+    finally:
+        db.close()
+    return outcome
 
 
 @router.post("/analyze", response_model=AnalysisResponse)
@@ -381,9 +491,11 @@ async def analyze_workflow(
             try:
                 for stage, payload in _perform_analysis_sync(request.workflow_id, request.hourly_rate, db):
                     if stage == 'done':
-                        out = {'stage': 'done', 'workflow_id': request.workflow_id}
+                        out = {'stage': 'done', 'workflow_id': request.workflow_id,
+                               'timing': payload.get('timing'), 'total_ms': payload.get('total_ms')}
                     else:
-                        safe = {k: v for k, v in payload.items() if isinstance(v, (str, int, float, bool, type(None)))}
+                        safe = {k: v for k, v in payload.items()
+                                if k == 'timing' or isinstance(v, (str, int, float, bool, type(None)))}
                         out = {'stage': stage, **safe}
                     asyncio.run_coroutine_threadsafe(queue.put(out), loop)
             except Exception as exc:
@@ -416,9 +528,10 @@ async def analyze_workflow(
     )
 
 
-@router.get("/results/{workflow_id}", response_model=AnalysisResponse)
+@router.get("/results/{workflow_id}", response_model=AnalysisReportResponse)
 def get_analysis_results(
     workflow_id: int,
+    request: Request,
     db: Session = Depends(get_db),
     x_user_email: Optional[str] = Header(None),
 ):
@@ -445,39 +558,79 @@ def get_analysis_results(
         # For guest workflows: anyone with the workflow ID can view it
         # (share URLs use share_code which is a separate public endpoint)
 
-    # Eagerly load relationships
-    _ = analysis.results
-    for r in analysis.results:
-        _ = r.task
-
-    return analysis
+    packed = get_snapshot(db, analysis.id)
+    if packed:
+        return snapshot_response(request, packed)
+    return Response(content=serialize_analysis(db, analysis.id), media_type='application/json')
 
 
 # ── Public share-code endpoints (no auth required) ────────────────────────────
-
-@router.get("/share/{share_code}", response_model=AnalysisResponse)
-def get_analysis_by_share_code(share_code: str, db: Session = Depends(get_db)):
+# Both responses are cached in-process as rendered JSON (app.core.share_cache)
+# and sent with an ETag + Cache-Control, so preview bots and repeat visitors
+# neither hit Turso nor re-download an unchanged report.
+
+def _share_response(request: Request, body: bytes, etag: str) -> Response:
+    headers = {
+        'ETag': etag,
+        'Cache-Control': f'public, max-age={settings.SHARE_HTTP_MAX_AGE}, stale-while-revalidate=300',
+    }
+    if etag in (request.headers.get('if-none-match') or ''):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type='application/json', headers=headers)
+
+
+@router.get("/share/{share_code}", response_model=AnalysisReportResponse)
+def get_analysis_by_share_code(share_code: str, request: Request, db: Session = Depends(get_db)):
     """Fetch a workflow's analysis by its human-readable share code. Public — no auth."""
-    workflow = db.query(Workflow).filter(Workflow.share_code == share_code).first()
-    if not workflow:
+    cached = share_cache.get(('analysis', share_code))
+    if cached:
+        return _share_response(request, *cached)
+    return _share_response(request, *cache_shared_analysis(db, share_code))
+
+
+def cache_shared_analysis(db: Session, share_code: str) -> tuple:
+    """Render a shared report's analysis JSON into share_cache; (body, etag).
+    Also used by the scheduled cache warm-up. Raises 404s for unknown codes."""
+    workflow_id = db.query(Workflow.id).filter(Workflow.share_code == share_code).scalar()
+    if not workflow_id:
         raise HTTPException(status_code=404, detail="Report not found")
 
-    analysis = db.query(Analysis).filter(Analysis.workflow_id == workflow.id).first()
-    if not analysis:
+    analysis_id = db.query(Analysis.id).filter(Analysis.workflow_id == workflow_id).scalar()
+    if not analysis_id:
         raise HTTPException(status_code=404, detail="Analysis not yet available for this report")
 
-    _ = analysis.workflow
-    _ = analysis.results
-    for r in analysis.results:
-        _ = r.task
-
-    return analysis
+    # Precomputed snapshot; live serialization (fixed number of selectin
+    # queries) for analyses that have none yet.
+    packed = get_snapshot(db, analysis_id)
+    body = gzip.decompress(packed) if packed else serialize_analysis(db, analysis_id)
+    return body, share_cache.put(('analysis', share_code), body)
 
 
 @router.get("/share/{share_code}/workflow", response_model=WorkflowResponse)
-def get_workflow_by_share_code(share_code: str, db: Session = Depends(get_db)):
+def get_workflow_by_share_code(share_code: str, request: Request, db: Session = Depends(get_db)):
     """Fetch workflow metadata by share code. Public — no auth."""
-    workflow = db.query(Workflow).filter(Workflow.share_code == share_code).first()
+    cached = share_cache.get(('workflow', share_code))
+    if cached:
+        return _share_response(request, *cached)
+
+    workflow = (
+        db.query(Workflow)
+        .options(selectinload(Workflow.tasks), undefer(Workflow.source_text))
+        .filter(Workflow.share_code == share_code)
+        .first()
+    )
     if not workflow:
         raise HTTPException(status_code=404, detail="Report not found")
-    return workflow
+
+    body = WorkflowResponse.model_validate(workflow).model_dump_json().encode()
+    etag = share_cache.put(('workflow', share_code), body)
+    return _share_response(request, body, etag)
+
+
+@router.get("/share/{share_code}/n8n-canvas")
+def get_canvas_by_share_code(share_code: str, request: Request, db: Session = Depends(get_db)):
+    """Stream the n8n canvas of a shared report. Public — no auth."""
+    stored = load_canvas(db, Workflow.share_code == share_code)
+    if stored is None or stored == (None, None):
+        raise HTTPException(status_code=404, detail="Report not found")
+    return canvas_response(request, *stored)
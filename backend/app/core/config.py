@@ -24,6 +24,23 @@ class Settings(BaseSettings):
     
     # AI/LLM
     ANTHROPIC_API_KEY: str = ""
+    # Message Batches (bulk analysis) — status poll interval and give-up time
+    ANTHROPIC_BATCH_POLL_SECONDS: float = 30.0
+    ANTHROPIC_BATCH_TIMEOUT_SECONDS: float = 24 * 3600
+    # LLM backend — "anthropic", or "stub" for the offline deterministic client (load tests)
+    LLM_BACKEND: str = "anthropic"
+    LLM_STUB_LATENCY_MS: float = 400.0       # time to first token
+    LLM_STUB_TOKENS_PER_SECOND: float = 150.0  # output rate; 0 = instant
+    LLM_STUB_SEED: int = 0
+
+    # Stage timing — print each finished analysis trace as a "[timing] {json}" line
+    TIMING_LOG_TRACES: bool = True
+    # /api/metrics — how often the event-loop lag probe runs
+    METRICS_LOOP_LAG_INTERVAL_SECONDS: float = 1.0
+    # Turso SQL profiler — per-request statement log ("[sql] {json}", plus an
+    # X-SQL-Profile header when DEBUG) and the repeat count that flags an N+1
+    SQL_PROFILE: bool = False
+    SQL_PROFILE_N_PLUS_ONE_THRESHOLD: int = 5
     
     # CORS
     CORS_ORIGINS: str = "http://localhost:3000,http://127.0.0.1:3000,https://workscanai.vercel.app"
@@ -48,10 +65,94 @@ class Settings(BaseSettings):
     RESEND_API_KEY: str = ""
     FROM_EMAIL: str = "noreply@workscanai.com"
     APP_URL: str = "https://workscanai.vercel.app"
+    # Quick-win digest cron — emails per Resend batch call (max 100) and
+    # batch calls in flight at once
+    DIGEST_BATCH_SIZE: int = 100
+    DIGEST_SEND_CONCURRENCY: int = 4
+
+    # Combined reports — most workflow_ids accepted per request, and how many
+    # worker processes lay out workflow sections in parallel (1 = in-process)
+    COMBINED_REPORT_MAX_WORKFLOWS: int = 20
+    REPORT_RENDER_WORKERS: int = 1
+
+    # Document uploads (/api/extract-tasks): size cap, streaming chunk, the
+    # text budget kept for task parsing, and PDF page cap / parse workers
+    # (1 = in-process; PDFs shorter than PDF_PARALLEL_MIN_PAGES always are)
+    UPLOAD_MAX_BYTES: int = 25 * 1024 * 1024
+    UPLOAD_CHUNK_BYTES: int = 1024 * 1024
+    EXTRACT_MAX_CHARS: int = 60000
+    PDF_MAX_PAGES: int = 200
+    PDF_EXTRACT_WORKERS: int = 1
+    PDF_PARALLEL_MIN_PAGES: int = 16
+
+    # Image OCR (Claude Vision) — images are cropped to their text region,
+    # capped at IMAGE_OCR_MAX_EDGE px on the long edge and re-encoded (photos
+    # as JPEG at this quality); multi-page TIFF/HEIC page cap, OCR workers
+    # and the model that reads them
+    IMAGE_OCR_MAX_EDGE: int = 1568
+    IMAGE_OCR_JPEG_QUALITY: int = 85
+    IMAGE_OCR_CROP: bool = True
+    IMAGE_OCR_MAX_PAGES: int = 20
+    IMAGE_OCR_WORKERS: int = 4
+    IMAGE_OCR_MODEL: str = "claude-haiku-4-5-20251001"
+
+    # Task parsing (/api/parse-tasks) — texts longer than PARSE_CHUNK_CHARS
+    # are split and the chunks parsed concurrently (chunks under
+    # PARSE_MIN_CHUNK_CHARS are never split further); tasks whose names are
+    # at least PARSE_MERGE_SIMILARITY alike are merged. One request takes at
+    # most PARSE_MAX_CHARS (above EXTRACT_MAX_CHARS, so any /extract-tasks
+    # output fits) and PARSE_MAX_CALLS LLM calls, re-splits included
+    PARSE_CHUNK_CHARS: int = 8000
+    PARSE_MIN_CHUNK_CHARS: int = 1000
+    PARSE_MAX_CHARS: int = 64000
+    PARSE_MAX_CALLS: int = 32
+    PARSE_CHUNK_CONCURRENCY: int = 6
+    PARSE_MERGE_SIMILARITY: float = 0.8
+
+    # Extracted-text cache keyed by upload SHA-256 — directory (default: a
+    # folder in the system temp dir) and its LRU size bound (0 = off)
+    EXTRACT_CACHE_DIR: str = ""
+    EXTRACT_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+
+    # Public share-code endpoints — in-process response cache (entries / TTL)
+    # and the Cache-Control max-age sent to browsers and social preview bots
+    SHARE_CACHE_MAX_ENTRIES: int = 512
+    SHARE_CACHE_TTL_SECONDS: int = 600
+    SHARE_HTTP_MAX_AGE: int = 60
+
+    # Workflow list views (dashboard, admin) — default and maximum page size
+    WORKFLOW_PAGE_SIZE: int = 50
+    WORKFLOW_PAGE_MAX: int = 200
+
+    # Job-scanner research / analysis caches (entries / TTL) and batch scans:
+    # most roles per batch, roles processed concurrently, finished batches kept
+    SCAN_CACHE_MAX_ENTRIES: int = 256
+    SCAN_CACHE_TTL_SECONDS: int = 7 * 24 * 3600
+    BATCH_SCAN_MAX_ITEMS: int = 100
+    BATCH_SCAN_CONCURRENCY: int = 4
+    BATCH_SCAN_RETAIN: int = 32
+
+    # In-process scheduler (app.services.scheduler): tick, leader-lease TTL,
+    # ± interval jitter, job_runs retention; plus the jobs' own knobs
+    SCHEDULER_ENABLED: bool = True
+    SCHEDULER_TICK_SECONDS: float = 30.0
+    SCHEDULER_LEASE_SECONDS: float = 90.0
+    SCHEDULER_JITTER: float = 0.1
+    SCHEDULER_HISTORY_DAYS: int = 30
+    SHARE_WARMUP_TOP: int = 50
+    TEMP_FILE_MAX_AGE_SECONDS: int = 24 * 3600
 
     # PostHog server-side analytics
     POSTHOG_API_KEY: str = ""
     POSTHOG_HOST: str = ""
+    # Analytics dispatcher: bounded queue (oldest dropped on overflow), batch
+    # size and flush cadence, bounded exit flush; FILE_SINK = JSONL path that
+    # receives batches instead of PostHog (offline testing)
+    POSTHOG_QUEUE_MAX: int = 1000
+    POSTHOG_BATCH_SIZE: int = 100
+    POSTHOG_FLUSH_INTERVAL_SECONDS: float = 5.0
+    POSTHOG_SHUTDOWN_FLUSH_SECONDS: float = 2.0
+    POSTHOG_FILE_SINK: str = ""
 
     def require_production_secrets(self) -> list[str]:
         """Return the names of secrets that are REQUIRED in production but unset.
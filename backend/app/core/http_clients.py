@@ -0,0 +1,296 @@
+"""
+Shared, connection-pooled HTTP clients for outbound services.
+
+Each external service (Resend, Tavily, reCAPTCHA, ipapi) gets one pooled
+httpx.Client and one httpx.AsyncClient per event loop, created on first use
+and closed at app shutdown (or, for a loop of its own, by
+aclose_loop_clients() before the loop ends) — so a cold dyno pays DNS/TCP/TLS once per
+service instead of once per call. On top of the pool each service has:
+
+  - its own timeout
+  - retries with jittered exponential backoff, on connect failures always
+    and on read timeouts / retryable statuses only where a repeat is safe
+    (a Resend 500 may already have sent the email; a 429 has not)
+  - a circuit breaker: after `breaker_failures` consecutive failures calls
+    fail fast with CircuitOpen for `breaker_reset_seconds`, then one trial
+    call decides whether it closes again
+
+Per-service request/retry/failure counters, latency and breaker state are
+exported on /api/metrics.
+"""
+import asyncio
+import random
+import threading
+import time
+import weakref
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+from app.core import metrics
+
+
+class CircuitOpen(httpx.TransportError):
+    """The service's breaker is open — the call was not attempted."""
+
+
+class Service:
+    def __init__(self, name: str, timeout: float, retries: int = 0, retry_statuses: Tuple[int, ...] = (),
+                 retry_read_timeouts: bool = False, breaker_failures: int = 5,
+                 breaker_reset_seconds: float = 30.0, max_connections: int = 20):
+        self.name = name
+        self.timeout = timeout
+        self.retries = retries
+        self.retry_statuses = retry_statuses
+        self.retry_read_timeouts = retry_read_timeouts
+        self.breaker_failures = breaker_failures
+        self.breaker_reset_seconds = breaker_reset_seconds
+        self.max_connections = max_connections
+
+
+SERVICES: Dict[str, Service] = {
+    # Email sends are not idempotent: retry only what Resend never processed
+    "resend": Service("resend", timeout=20.0, retries=2, retry_statuses=(429,)),
+    "tavily": Service("tavily", timeout=15.0, retries=2, retry_statuses=(429, 500, 502, 503, 504),
+                      retry_read_timeouts=True),
+    "recaptcha": Service("recaptcha", timeout=5.0, retries=1, retry_statuses=(500, 502, 503, 504),
+                         retry_read_timeouts=True),
+    # Geo lookup is best-effort on the /track path: no retries, trip early
+    "ipapi": Service("ipapi", timeout=2.0, retries=0, breaker_failures=3, breaker_reset_seconds=120.0),
+}
+
+_BACKOFF_BASE_SECONDS = 0.2
+
+
+class _Breaker:
+    def __init__(self, failures: int, reset_seconds: float):
+        self.threshold = failures
+        self.reset_seconds = reset_seconds
+        self.consecutive = 0
+        self.opened_at: Optional[float] = None
+        self.trial_in_flight = False
+        self.times_opened = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        return "half_open" if time.monotonic() - self.opened_at >= self.reset_seconds else "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half_open" and not self.trial_in_flight:
+                self.trial_in_flight = True
+                return True
+            return False
+
+    def release(self) -> None:
+        """End a call without a verdict on the service."""
+        with self._lock:
+            self.trial_in_flight = False
+
+    def record(self, ok: bool) -> None:
+        with self._lock:
+            self.trial_in_flight = False
+            if ok:
+                self.consecutive, self.opened_at = 0, None
+                return
+            self.consecutive += 1
+            if self.opened_at is not None or self.consecutive >= self.threshold:
+                if self.opened_at is None:
+                    self.times_opened += 1
+                self.opened_at = time.monotonic()
+
+
+class ServiceClient:
+    """Pooled sync + async httpx clients for one Service, with retries and a breaker."""
+
+    def __init__(self, service: Service, transport: Optional[httpx.BaseTransport] = None):
+        self.service = service
+        self.transport = transport   # tests: an httpx.MockTransport
+        self.breaker = _Breaker(service.breaker_failures, service.breaker_reset_seconds)
+        self._sync: Optional[httpx.Client] = None
+        self._async: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = \
+            weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _kwargs(self) -> dict:
+        return {"timeout": self.service.timeout,
+                "limits": httpx.Limits(max_connections=self.service.max_connections)}
+
+    @property
+    def sync_client(self) -> httpx.Client:
+        with self._lock:
+            if self._sync is None:
+                self._sync = httpx.Client(transport=self.transport, **self._kwargs())
+            return self._sync
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        # an AsyncClient's connections belong to the loop that opened them
+        # (the scheduler runs coroutine jobs on loops of their own)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async.get(loop)
+            if client is None:
+                client = self._async[loop] = httpx.AsyncClient(transport=self.transport, **self._kwargs())
+            return client
+
+    # ── retry / breaker bookkeeping shared by both paths ────────────────────
+
+    def _check(self) -> None:
+        if not self.breaker.allow():
+            metrics.inc("http_client_requests_total", service=self.service.name, outcome="circuit_open")
+            raise CircuitOpen(f"{self.service.name}: circuit open")
+
+    def _retryable(self, attempt: int, resp: Optional[httpx.Response], exc: Optional[Exception]) -> bool:
+        if attempt >= self.service.retries:
+            return False
+        if exc is not None:
+            return isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)) or \
+                (self.service.retry_read_timeouts and isinstance(exc, httpx.ReadTimeout))
+        return resp.status_code in self.service.retry_statuses
+
+    def _finish(self, t0: float, resp: Optional[httpx.Response], exc: Optional[Exception]) -> None:
+        if resp is None and exc is None:
+            # raised something other than an httpx error (a bad URL, an
+            # unencodable body, cancellation): not the service's fault, but a
+            # half-open trial must still end
+            self.breaker.release()
+            return
+        ok = exc is None and resp.status_code < 500 and resp.status_code != 429
+        self.breaker.record(ok)
+        name = self.service.name
+        metrics.observe("http_client_request_duration_seconds", time.perf_counter() - t0, service=name)
+        outcome = "error" if exc is not None else ("ok" if resp.status_code < 400 else f"{resp.status_code // 100}xx")
+        metrics.inc("http_client_requests_total", service=name, outcome=outcome)
+
+    def _backoff(self, attempt: int) -> float:
+        metrics.inc("http_client_retries_total", service=self.service.name)
+        return _BACKOFF_BASE_SECONDS * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+    # ── public API ──────────────────────────────────────────────────────────
+
+    def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        attempt = 0
+        while True:
+            self._check()
+            resp, exc, t0 = None, None, time.perf_counter()
+            try:
+                resp = self.sync_client.request(method, url, **kwargs)
+            except httpx.HTTPError as e:
+                exc = e
+            finally:
+                self._finish(t0, resp, exc)
+            if not self._retryable(attempt, resp, exc):
+                if exc is not None:
+                    raise exc
+                return resp
+            time.sleep(self._backoff(attempt))
+            attempt += 1
+
+    async def arequest(self, method: str, url: str, **kwargs) -> httpx.Response:
+        attempt = 0
+        while True:
+            self._check()
+            resp, exc, t0 = None, None, time.perf_counter()
+            try:
+                resp = await self.async_client.request(method, url, **kwargs)
+            except httpx.HTTPError as e:
+                exc = e
+            finally:
+                self._finish(t0, resp, exc)
+            if not self._retryable(attempt, resp, exc):
+                if exc is not None:
+                    raise exc
+                return resp
+            await asyncio.sleep(self._backoff(attempt))
+            attempt += 1
+
+    def get(self, url: str, **kwargs) -> httpx.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> httpx.Response:
+        return self.request("POST", url, **kwargs)
+
+    async def aget(self, url: str, **kwargs) -> httpx.Response:
+        return await self.arequest("GET", url, **kwargs)
+
+    async def apost(self, url: str, **kwargs) -> httpx.Response:
+        return await self.arequest("POST", url, **kwargs)
+
+    def close(self) -> None:
+        """Close the sync client and drop the async ones (aclose_loop() closes those)."""
+        with self._lock:
+            sync, self._sync = self._sync, None
+            self._async = weakref.WeakKeyDictionary()
+        if sync is not None:
+            sync.close()
+
+    async def aclose_loop(self) -> None:
+        """Close the async client of the running loop, if it has one."""
+        with self._lock:
+            client = self._async.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    async def aclose(self) -> None:
+        """Close the async client of the running loop, then everything else."""
+        await self.aclose_loop()
+        self.close()
+
+
+_clients: Dict[str, ServiceClient] = {}
+_transports: Dict[str, httpx.BaseTransport] = {}
+_registry_lock = threading.Lock()
+
+
+def get(name: str) -> ServiceClient:
+    """The shared client for a service in SERVICES."""
+    with _registry_lock:
+        client = _clients.get(name)
+        if client is None:
+            client = _clients[name] = ServiceClient(SERVICES[name], _transports.get(name))
+        return client
+
+
+def set_transport(name: str, transport: Optional[httpx.BaseTransport]) -> None:
+    """Route a service through `transport` (tests); None restores the network."""
+    with _registry_lock:
+        if transport is None:
+            _transports.pop(name, None)
+        else:
+            _transports[name] = transport
+        client = _clients.pop(name, None)
+    if client is not None:
+        client.close()
+
+
+async def aclose_all() -> None:
+    """App shutdown: close every pooled client."""
+    with _registry_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
+async def aclose_loop_clients() -> None:
+    """Close every service's AsyncClient of the running loop — await it before
+    a loop of its own (asyncio.run) ends, or its connections are leaked."""
+    with _registry_lock:
+        clients = list(_clients.values())
+    for client in clients:
+        await client.aclose_loop()
+
+
+def stats() -> Dict[str, Dict]:
+    with _registry_lock:
+        clients = dict(_clients)
+    return {name: {"breaker": c.breaker.state, "consecutive_failures": c.breaker.consecutive,
+                   "times_opened": c.breaker.times_opened}
+            for name, c in clients.items()}
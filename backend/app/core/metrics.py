@@ -0,0 +1,226 @@
+"""
+Prometheus / OpenMetrics exposition for GET /api/metrics (admin-only).
+
+Instrumented at one point each, so every call site is covered without
+touching it:
+
+  - HTTP      MetricsMiddleware — latency per route template, in-flight
+  - Turso     turso_dbapi.Connection._post — round trips, statements, latency
+  - LLM       llm_client.get_llm_client()'s metered Messages — latency, tokens
+  - caches    the LRUCache hit/miss counters (share, research, analysis)
+              and the on-disk extract cache
+  - stages    every app.core.timing span, report renders included
+  - loop      event-loop lag, probed from a daemon thread
+  - analytics posthog_client's dispatcher — events sent, failed, dropped
+  - outbound  http_clients' pooled service clients — latency, retries, breakers
+
+Rendered by hand in the text format (no prometheus_client dependency);
+histograms share the timing module's buckets.
+"""
+import asyncio
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from app.core import timing
+from app.core.config import settings
+
+_PREFIX = "workscan_"
+
+# name → (type, help); every series rendered must be declared here
+FAMILIES: Dict[str, Tuple[str, str]] = {
+    "http_request_duration_seconds": ("histogram", "HTTP request latency by route template, method and status."),
+    "http_requests_in_flight": ("gauge", "HTTP requests currently being served."),
+    "turso_request_duration_seconds": ("histogram", "Turso pipeline round-trip latency."),
+    "turso_statements_total": ("counter", "SQL statements sent to Turso."),
+    "turso_errors_total": ("counter", "Turso round trips that failed."),
+    "llm_request_duration_seconds": ("histogram", "LLM Messages call latency by model and outcome."),
+    "llm_tokens_total": ("counter", "LLM tokens by model and direction."),
+    "cache_hits_total": ("counter", "In-process cache hits."),
+    "cache_misses_total": ("counter", "In-process cache misses."),
+    "cache_entries": ("gauge", "Entries currently held by an in-process cache."),
+    "cache_hit_ratio": ("gauge", "Cache hits over lookups since process start."),
+    "stage_duration_seconds": ("histogram", "Timing spans: analyze stages, external calls, report renders."),
+    "event_loop_lag_seconds": ("histogram", "Delay before a callback scheduled on the event loop ran."),
+    "analytics_events_total": ("counter", "PostHog events by outcome: sent, failed or dropped on queue overflow."),
+    "http_client_request_duration_seconds": ("histogram", "Outbound HTTP attempt latency by service."),
+    "http_client_requests_total": ("counter", "Outbound HTTP attempts by service and outcome."),
+    "http_client_retries_total": ("counter", "Outbound HTTP retries by service."),
+    "http_client_circuit_state": ("gauge", "Circuit breaker per service: 0 closed, 1 half-open, 2 open."),
+    "http_client_circuit_opened_total": ("counter", "Times a service's circuit breaker opened."),
+}
+
+_Labels = Tuple[Tuple[str, str], ...]
+_histograms: Dict[Tuple[str, _Labels], timing.Histogram] = {}
+_values: Dict[Tuple[str, _Labels], float] = {}
+_lock = threading.Lock()
+
+
+def _key(name: str, labels: Dict[str, str]) -> Tuple[str, _Labels]:
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def observe(name: str, seconds: float, **labels) -> None:
+    key = _key(name, labels)
+    with _lock:
+        hist = _histograms.get(key)
+        if hist is None:
+            hist = _histograms[key] = timing.Histogram()
+        hist.observe(seconds * 1000)
+
+
+def inc(name: str, value: float = 1, **labels) -> None:
+    key = _key(name, labels)
+    with _lock:
+        _values[key] = _values.get(key, 0) + value
+
+
+def reset() -> None:
+    with _lock:
+        _histograms.clear()
+        _values.clear()
+
+
+# ---------------------------------------------------------------------------
+# RENDERING
+# ---------------------------------------------------------------------------
+
+def _fmt_labels(labels: _Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    escaped = (v.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"') for _, v in pairs)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + "}"
+
+
+def _fmt_num(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _histogram_lines(name: str, labels: _Labels, counts: List[int], count: int, sum_ms: float) -> List[str]:
+    lines, cumulative = [], 0
+    for bound, n in zip(timing.BUCKETS_MS, counts):
+        cumulative += n
+        lines.append(f"{name}_bucket{_fmt_labels(labels, ('le', _fmt_num(bound / 1000)))} {cumulative}")
+    lines.append(f"{name}_bucket{_fmt_labels(labels, ('le', '+Inf'))} {count}")
+    lines.append(f"{name}_sum{_fmt_labels(labels)} {_fmt_num(round(sum_ms / 1000, 6))}")
+    lines.append(f"{name}_count{_fmt_labels(labels)} {count}")
+    return lines
+
+
+def _cache_values() -> Dict[Tuple[str, _Labels], float]:
+    from app.core.share_cache import share_cache
+    from app.services.extract_cache import extract_cache
+    from app.services.scan_cache import analysis_cache, research_cache
+    out = {}
+    for cache_name, cache in (("share", share_cache), ("research", research_cache), ("analysis", analysis_cache),
+                              ("extract", extract_cache)):
+        stats, labels = cache.stats(), (("cache", cache_name),)
+        out[("cache_hits_total", labels)] = stats["hits"]
+        out[("cache_misses_total", labels)] = stats["misses"]
+        out[("cache_entries", labels)] = stats["entries"]
+        out[("cache_hit_ratio", labels)] = stats["hit_ratio"]
+    return out
+
+
+def _http_client_values() -> Dict[Tuple[str, _Labels], float]:
+    from app.core import http_clients
+    states = {"closed": 0, "half_open": 1, "open": 2}
+    out = {}
+    for service, s in http_clients.stats().items():
+        labels = (("service", service),)
+        out[("http_client_circuit_state", labels)] = states[s["breaker"]]
+        out[("http_client_circuit_opened_total", labels)] = s["times_opened"]
+    return out
+
+
+def render() -> str:
+    """The whole registry in Prometheus text format 0.0.4."""
+    with _lock:
+        hists = {k: (list(h.counts), h.count, h.sum_ms) for k, h in _histograms.items()}
+        values = dict(_values)
+    values[("http_requests_in_flight", ())] = MetricsMiddleware.in_flight
+    values.update(_cache_values())
+    values.update(_http_client_values())
+    for stage, h in timing.snapshot()["histograms"].items():
+        hists[("stage_duration_seconds", (("stage", stage),))] = (h["buckets"], h["count"], h["sum_ms"])
+
+    lines = []
+    for family, (kind, help_text) in FAMILIES.items():
+        name = _PREFIX + family
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+        if kind == "histogram":
+            for (fam, labels), (counts, count, sum_ms) in sorted(hists.items()):
+                if fam == family:
+                    lines += _histogram_lines(name, labels, counts, count, sum_ms)
+        else:
+            for (fam, labels), value in sorted(values.items()):
+                if fam == family:
+                    lines.append(f"{name}{_fmt_labels(labels)} {_fmt_num(value)}")
+    return "\n".join(lines) + "\n"
+
+
+# ---------------------------------------------------------------------------
+# HTTP MIDDLEWARE + EVENT-LOOP LAG
+# ---------------------------------------------------------------------------
+
+class MetricsMiddleware:
+    """Pure ASGI, so streamed (SSE) responses are timed to their last byte."""
+
+    in_flight = 0
+
+    def __init__(self, app):
+        self.app = app
+        self._loop = None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            watch_event_loop(loop)
+
+        status = {"code": 500}
+
+        async def _send(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        MetricsMiddleware.in_flight += 1
+        t0 = time.perf_counter()
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            MetricsMiddleware.in_flight -= 1
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            observe("http_request_duration_seconds", time.perf_counter() - t0,
+                    method=scope["method"], route=route, status=status["code"])
+
+
+def watch_event_loop(loop: asyncio.AbstractEventLoop, interval: Optional[float] = None) -> threading.Thread:
+    """Every `interval` s, schedule a no-op on `loop` and record how late it ran; stops when the loop closes."""
+    interval = settings.METRICS_LOOP_LAG_INTERVAL_SECONDS if interval is None else interval
+
+    def _probe():
+        while not loop.is_closed():
+            ran = threading.Event()
+            scheduled = time.perf_counter()
+
+            def _callback():
+                observe("event_loop_lag_seconds", time.perf_counter() - scheduled)
+                ran.set()
+            try:
+                loop.call_soon_threadsafe(_callback)
+            except RuntimeError:   # closed between the check and the call
+                return
+            # one probe in flight: a blocked loop yields one long sample, not a backlog
+            while not ran.wait(interval):
+                if loop.is_closed():
+                    return
+            time.sleep(interval)
+
+    thread = threading.Thread(target=_probe, name="loop-lag-probe", daemon=True)
+    thread.start()
+    return thread
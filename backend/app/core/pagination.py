@@ -0,0 +1,64 @@
+"""
+Keyset (cursor) pagination for newest-first list views.
+
+Pages are ordered by (created_at DESC, id DESC) and the cursor is the
+(created_at, id) of the last row of the previous page, so fetching page N
+costs the same as page 1 — no OFFSET scan over everything before it.
+
+created_at is compared as the text SQLite/Turso actually stored: rows
+written by server_default (CURRENT_TIMESTAMP) have no fractional seconds
+while rows written through the ORM do, so binding a Python datetime would
+make ties within one second compare unequal. The cursor therefore carries
+the stored string verbatim. Rows with a NULL created_at sort last (SQLite
+puts NULLs last in DESC order) and are paged by id alone.
+"""
+import base64
+from typing import List, Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import String, and_, cast, or_
+
+
+def created_key(column):
+    """The stored text of a created_at column — select it labelled 'created_key'."""
+    return cast(column, String)
+
+
+def encode_cursor(created: Optional[str], row_id: int) -> str:
+    raw = f"{created or ''}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[str], int]:
+    """(created_at text or None, id) from an opaque cursor; 400 if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        created, _, row_id = raw.rpartition("|")
+        return (created or None), int(row_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def keyset_page(query, created_col, id_col, cursor: Optional[str], limit: int) -> Tuple[List, Optional[str]]:
+    """Run one newest-first page of `query`.
+
+    `query` must select `created_key(created_col).label("created_key")` and
+    the id as `id`. Returns (rows, next cursor or None on the last page).
+    """
+    key = created_key(created_col)
+    if cursor:
+        created, row_id = decode_cursor(cursor)
+        if created is None:
+            query = query.filter(created_col.is_(None), id_col < row_id)
+        else:
+            query = query.filter(or_(
+                key < created,
+                and_(key == created, id_col < row_id),
+                created_col.is_(None),
+            ))
+    rows = query.order_by(created_col.desc(), id_col.desc()).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(last.created_key, last.id)
@@ -1,31 +1,153 @@
 """
-Server-side PostHog client singleton.
-Capture events with capture_event(); it no-ops if POSTHOG_API_KEY is unset.
+Server-side PostHog analytics.
+
+capture_event() only appends to a bounded in-memory queue and returns — no
+network I/O and no SDK flushing on the request path. A daemon thread drains
+the queue every POSTHOG_FLUSH_INTERVAL_SECONDS (or as soon as a full batch
+is waiting) and sends it in one call to PostHog's /batch/ endpoint. When the
+queue is full the OLDEST event is dropped and counted, so a PostHog outage
+costs analytics, never memory or latency.
+
+POSTHOG_FILE_SINK=<path> appends each batch to a JSONL file instead of
+sending it (offline testing; works without an API key). With neither a key
+nor a sink configured capture_event() is a no-op.
 """
-import os
-from posthog import Posthog
+import atexit
+import json
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
 
-_api_key = os.getenv("POSTHOG_API_KEY", "")
-_host = os.getenv("POSTHOG_HOST", "")
+from posthog.request import batch_post
 
-if _api_key and _host:
-    # posthog 7.x: first positional arg is the project API key (was `api_key=`
-    # in <3.x). Keep host keyword. Wrapped so a bad key/host can't crash boot.
-    try:
-        _client: Posthog | None = Posthog(_api_key, host=_host)
-    except Exception as exc:
-        print(f"[posthog] init error, analytics disabled: {exc}")
-        _client = None
-else:
-    _client = None
+from app.core import metrics
+from app.core.config import settings
+
+
+class _Dispatcher:
+    def __init__(self, api_key: str, host: str, file_sink: str, max_queue: int,
+                 batch_size: int, flush_interval: float):
+        self.api_key = api_key
+        self.host = host
+        self.file_sink = file_sink
+        self.batch_size = max(batch_size, 1)
+        self.flush_interval = flush_interval
+        self._queue: deque = deque(maxlen=max(max_queue, 1))
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._idle = threading.Condition(self._lock)
+        self._in_flight = 0
+        self._thread: Optional[threading.Thread] = None
+        self.sent = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def enqueue(self, message: dict) -> None:
+        with self._lock:
+            if len(self._queue) == self._queue.maxlen:
+                self.dropped += 1   # deque(maxlen) evicts the oldest on append
+                metrics.inc("analytics_events_total", outcome="dropped")
+            self._queue.append(message)
+            full = len(self._queue) >= self.batch_size
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="posthog-dispatcher", daemon=True)
+                self._thread.start()
+        if full:
+            self._wake.set()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self._drain()
+
+    def _drain(self) -> None:
+        while True:
+            with self._lock:
+                batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+                if not batch:
+                    self._idle.notify_all()
+                    return
+                self._in_flight += len(batch)
+            try:
+                self._send(batch)
+                outcome = "sent"
+            except Exception as exc:
+                print(f"[posthog] batch of {len(batch)} failed, dropped: {exc}")
+                outcome = "failed"
+            with self._lock:
+                self._in_flight -= len(batch)
+                if outcome == "sent":
+                    self.sent += len(batch)
+                else:
+                    self.failed += len(batch)
+            metrics.inc("analytics_events_total", len(batch), outcome=outcome)
+
+    def _send(self, batch: List[dict]) -> None:
+        if self.file_sink:
+            with open(self.file_sink, "a", encoding="utf-8") as fh:
+                fh.writelines(json.dumps(m, default=str) + "\n" for m in batch)
+        else:
+            batch_post(self.api_key, host=self.host, batch=batch)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wake the thread and wait until the queue is empty; False on timeout."""
+        with self._lock:
+            if not self._queue and not self._in_flight:
+                return True
+            if self._thread is None:
+                return False
+        self._wake.set()
+        with self._lock:
+            return self._idle.wait_for(lambda: not self._queue and not self._in_flight, timeout)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"queued": len(self._queue), "sent": self.sent,
+                    "dropped": self.dropped, "failed": self.failed}
+
+
+def _build() -> Optional[_Dispatcher]:
+    if not settings.POSTHOG_FILE_SINK and not (settings.POSTHOG_API_KEY and settings.POSTHOG_HOST):
+        return None
+    return _Dispatcher(
+        api_key=settings.POSTHOG_API_KEY,
+        host=settings.POSTHOG_HOST,
+        file_sink=settings.POSTHOG_FILE_SINK,
+        max_queue=settings.POSTHOG_QUEUE_MAX,
+        batch_size=settings.POSTHOG_BATCH_SIZE,
+        flush_interval=settings.POSTHOG_FLUSH_INTERVAL_SECONDS,
+    )
+
+
+_dispatcher = _build()
 
 
 def capture_event(distinct_id: str, event: str, properties: dict | None = None) -> None:
-    """Send a server-side event to PostHog.  Never raises — swallows all errors."""
-    if _client is None:
+    """Queue a server-side event for PostHog.  Never raises, never blocks on I/O."""
+    if _dispatcher is None:
         return
     try:
-        # posthog 7.x: event is positional; distinct_id + properties are keywords.
-        _client.capture(event, distinct_id=distinct_id, properties=properties or {})
+        _dispatcher.enqueue({
+            "type": "capture",
+            "event": event,
+            "distinct_id": distinct_id,
+            "properties": {**(properties or {}), "$lib": "workscanai-backend"},
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        })
     except Exception as exc:
         print(f"[posthog] capture error: {exc}")
+
+
+def flush(timeout: float = 5.0) -> bool:
+    """Send everything queued so far (tests, shutdown)."""
+    return _dispatcher.flush(timeout) if _dispatcher is not None else True
+
+
+def stats() -> Dict[str, int]:
+    return _dispatcher.stats() if _dispatcher is not None else {"queued": 0, "sent": 0, "dropped": 0, "failed": 0}
+
+
+# Best effort on a clean shutdown, bounded so a PostHog outage can't hang exit
+atexit.register(lambda: flush(settings.POSTHOG_SHUTDOWN_FLUSH_SECONDS))
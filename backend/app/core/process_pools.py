@@ -0,0 +1,55 @@
+"""
+Shared worker-process pools for CPU-bound request work.
+
+Report rendering (REPORT_RENDER_WORKERS) and PDF parsing
+(PDF_EXTRACT_WORKERS) farm pieces of a request out to worker processes.
+Pools are kept per (kind, worker count), created on first use and reused
+across requests, so each worker pays its module imports once. They use the
+"spawn" start method: a forked child would inherit the server's threads,
+DB connections and held locks.
+
+Requests run in a threadpool, so the registry is locked. A pool whose
+worker crashed is broken for good — callers discard() it and the next
+get_pool() starts a fresh one. shutdown_all() runs from the app lifespan.
+"""
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Tuple
+
+_pools: Dict[Tuple[str, int], ProcessPoolExecutor] = {}
+_lock = threading.Lock()
+
+
+def get_pool(kind: str, workers: int) -> ProcessPoolExecutor:
+    """The shared `workers`-process pool for `kind` ("reports", "pdf", …)."""
+    with _lock:
+        pool = _pools.get((kind, workers))
+        if pool is None:
+            pool = _pools[(kind, workers)] = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        return pool
+
+
+def discard(pool: ProcessPoolExecutor) -> None:
+    """Forget a broken pool so the next get_pool() replaces it."""
+    with _lock:
+        for key, registered in list(_pools.items()):
+            if registered is pool:
+                del _pools[key]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def active() -> Dict[Tuple[str, int], ProcessPoolExecutor]:
+    """{(kind, workers): pool} of the pools currently running."""
+    with _lock:
+        return dict(_pools)
+
+
+def shutdown_all() -> None:
+    """Stop every worker process."""
+    with _lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=True, cancel_futures=True)
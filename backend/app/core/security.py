@@ -5,7 +5,7 @@ Limits each IP to MAX_ANALYSES_PER_HOUR analyze calls per rolling hour.
 import time
 from collections import defaultdict
 from fastapi import Request, HTTPException
-import httpx
+from app.core import http_clients
 from app.core.config import settings
 
 # ── Rate limit config (read from Settings / .env) ─────────────────────────────
@@ -114,12 +114,10 @@ async def verify_recaptcha(token: str) -> None:
         # Not configured — skip (dev mode)
         return
 
-    async with httpx.AsyncClient() as client:
-        resp = await client.post(
-            RECAPTCHA_VERIFY_URL,
-            data={"secret": RECAPTCHA_SECRET, "response": token},
-            timeout=5.0,
-        )
+    resp = await http_clients.get("recaptcha").apost(
+        RECAPTCHA_VERIFY_URL,
+        data={"secret": RECAPTCHA_SECRET, "response": token},
+    )
 
     result = resp.json()
 
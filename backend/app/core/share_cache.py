@@ -0,0 +1,88 @@
+"""
+In-process LRU for the public share-code endpoints.
+
+Shared reports are the viral surface: one /report/{code} link posted on social
+gets fetched by every preview bot, OG-image renderer and visitor, and each of
+those used to walk Turso for the analysis, its results and every task. The
+rendered JSON body is cached here per (kind, share_code) together with its
+ETag, so repeat hits are served from memory and conditional requests become
+304s.
+
+Entries expire after SHARE_CACHE_TTL_SECONDS as a safety net, but anything
+that rewrites a report (re-analysis, admin backfills) calls
+invalidate_share(code) so the next read is fresh.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from app.core.config import settings
+
+
+class LRUCache:
+    """Thread-safe LRU of key -> (body bytes, etag) with a per-entry TTL."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[tuple, Tuple[float, bytes, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> Optional[Tuple[bytes, str]]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1], entry[2]
+
+    def __contains__(self, key: tuple) -> bool:
+        """Fresh entry present? (no LRU bump, not counted as a hit or miss)"""
+        with self._lock:
+            entry = self._data.get(key)
+            return entry is not None and entry[0] >= time.monotonic()
+
+    def put(self, key: tuple, body: bytes) -> str:
+        """Store body under key and return its ETag."""
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if self.max_entries <= 0:
+            return etag
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl_seconds, body, etag)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+        return etag
+
+    def invalidate(self, *keys: tuple) -> None:
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            size = len(self._data)
+        total = self.hits + self.misses
+        return {"entries": size, "hits": self.hits, "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 3) if total else 0.0}
+
+
+share_cache = LRUCache(settings.SHARE_CACHE_MAX_ENTRIES, settings.SHARE_CACHE_TTL_SECONDS)
+
+
+def invalidate_share(share_code: Optional[str]) -> None:
+    """Drop every cached view of one shared report."""
+    if share_code:
+        share_cache.invalidate(("analysis", share_code), ("workflow", share_code))
@@ -0,0 +1,153 @@
+"""
+Opt-in SQL statement profiler for the Turso shim (SQL_PROFILE=true).
+
+Slow pages are usually too many round trips rather than slow SQL, so each
+request gets a Profile (a contextvar, set by SQLProfileMiddleware) that
+turso_dbapi.Connection._post appends to: one record per statement with its
+normalized text, parameter count, round-trip wall time and payload bytes.
+Sync routes run in the threadpool with a copy of the context, so their
+statements land on the same Profile.
+
+When the request ends the summary is printed as one `[sql] {json}` line;
+with DEBUG on it is also sent as an `X-SQL-Profile` response header. A
+normalized statement that runs more than SQL_PROFILE_N_PLUS_ONE_THRESHOLD
+times in one request is flagged as a likely N+1.
+
+Outside HTTP (cron jobs, scripts) wrap the work in `profile("name")`.
+"""
+import json
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional
+
+from app.core.config import settings
+
+_current: ContextVar[Optional["Profile"]] = ContextVar("sql_profile", default=None)
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_SPACE = re.compile(r"\s+")
+
+
+def normalize(sql: str) -> str:
+    """Literals → ?, IN/VALUES lists → (?...), whitespace collapsed — one key per query shape."""
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _IN_LIST.sub("(?...)", sql)
+    return _SPACE.sub(" ", sql).strip()
+
+
+class Profile:
+    """Statements run while this profile is active, in execution order."""
+
+    def __init__(self, name: str, scope: Optional[dict] = None):
+        self.name = name
+        self._scope = scope
+        self.statements: List[Dict] = []
+        self.round_trips = 0
+        self.db_ms = 0.0
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self._started = time.perf_counter()
+
+    @property
+    def route(self) -> Optional[str]:
+        """Route template of the request ("GET /api/share/{share_code}"), once the router has matched it."""
+        route = getattr((self._scope or {}).get("route"), "path", None)
+        return f"{self._scope['method']} {route}" if route else None
+
+    def record(self, op: str, stmts: List[tuple], ms: float, bytes_out: int, bytes_in: int) -> None:
+        """One pipeline round trip carrying `stmts` as (sql, params) pairs."""
+        self.round_trips += 1
+        self.db_ms += ms
+        self.bytes_out += bytes_out
+        self.bytes_in += bytes_in
+        for sql, params in stmts:
+            self.statements.append({
+                "sql": normalize(sql),
+                "params": len(params) if params else 0,
+                "op": op,
+                "ms": round(ms, 1),
+                "bytes": bytes_out // max(len(stmts), 1),
+                "route": self.route or self.name,
+            })
+
+    def n_plus_one(self, threshold: Optional[int] = None) -> List[Dict]:
+        """Normalized statements that ran more than `threshold` times, most repeated first."""
+        threshold = settings.SQL_PROFILE_N_PLUS_ONE_THRESHOLD if threshold is None else threshold
+        counts = Counter(s["sql"] for s in self.statements)
+        return [{"sql": sql, "count": n} for sql, n in counts.most_common() if n > threshold]
+
+    def summary(self) -> Dict:
+        return {
+            "profile": self.name,
+            "route": self.route,
+            "statements": len(self.statements),
+            "round_trips": self.round_trips,
+            "db_ms": round(self.db_ms, 1),
+            "wall_ms": round((time.perf_counter() - self._started) * 1000, 1),
+            "bytes_out": self.bytes_out,
+            "bytes_in": self.bytes_in,
+            "n_plus_one": self.n_plus_one(),
+        }
+
+    def header(self) -> str:
+        """Compact form for the X-SQL-Profile response header."""
+        s = self.summary()
+        value = f"statements={s['statements']}; round_trips={s['round_trips']}; db_ms={s['db_ms']}"
+        if s["n_plus_one"]:
+            value += f"; n_plus_one={s['n_plus_one'][0]['count']}x"
+        return value
+
+
+def current() -> Optional[Profile]:
+    return _current.get()
+
+
+@contextmanager
+def profile(name: str) -> Iterator[Profile]:
+    """Profile the statements run in this block and log the summary at the end."""
+    p = Profile(name)
+    token = _current.set(p)
+    try:
+        yield p
+    finally:
+        _current.reset(token)
+        _log(p)
+
+
+def _log(p: Profile) -> None:
+    summary = p.summary()
+    print(f"[sql] {json.dumps(summary)}")
+    for flagged in summary["n_plus_one"]:
+        print(f"[sql] N+1 suspected on {p.route or p.name}: {flagged['count']}x {flagged['sql'][:200]}")
+
+
+class SQLProfileMiddleware:
+    """Pure ASGI; a no-op unless SQL_PROFILE is set."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.SQL_PROFILE:
+            return await self.app(scope, receive, send)
+
+        p = Profile(f"{scope['method']} {scope['path']}", scope)
+
+        async def _send(message):
+            if message["type"] == "http.response.start" and settings.DEBUG:
+                # statements so far — a streamed response keeps querying after this
+                message["headers"] = list(message.get("headers", [])) + [(b"x-sql-profile", p.header().encode())]
+            await send(message)
+
+        token = _current.set(p)
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            _current.reset(token)
+            _log(p)
@@ -0,0 +1,201 @@
+"""
+Lightweight stage timing — spans, per-trace summaries and process-wide
+histograms.
+
+A Trace covers one pipeline run (an analysis). Code inside it wraps each
+phase in `trace.span("persist")`; anything deeper in the call stack — the
+LLM call in AIAnalyzer, the parse step, a cache lookup — uses the module
+level `span(...)` / `note(...)`, which attach to whichever trace is active
+in the current context and are a plain histogram observation otherwise.
+
+Every finished span feeds a fixed-bucket histogram keyed by span name
+(exposed by GET /api/admin/metrics). A finished trace is printed as one
+`[timing] {...}` JSON line, and `trace.since_last()` hands the spans that
+completed since the previous call to the SSE stream as stage metadata.
+"""
+import functools
+import json
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from app.core.config import settings
+
+# Upper bounds in ms; the last bucket is everything slower
+BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+_current: ContextVar[Optional[Tuple[Optional["Trace"], dict]]] = ContextVar("timing_span", default=None)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram in ms (not thread-safe; callers hold a lock)."""
+
+    __slots__ = ("counts", "count", "sum_ms", "max_ms")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.counts[bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.sum_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th observation (max_ms for the overflow bucket)."""
+        target, seen = q * self.count, 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if n and seen >= target:
+                return float(BUCKETS_MS[i]) if i < len(BUCKETS_MS) else self.max_ms
+        return 0.0
+
+
+_histograms: Dict[str, Histogram] = {}
+_counters: Dict[str, int] = {}
+_lock = threading.Lock()
+
+
+def observe(name: str, ms: float, **counters: int) -> None:
+    """Add one duration to `name`'s histogram, plus optional `name.<counter>` totals (tokens, cache hits)."""
+    with _lock:
+        hist = _histograms.get(name)
+        if hist is None:
+            hist = _histograms[name] = Histogram()
+        hist.observe(ms)
+        for key, value in counters.items():
+            _counters[f"{name}.{key}"] = _counters.get(f"{name}.{key}", 0) + value
+
+
+def snapshot() -> Dict:
+    """Histograms and counters as JSON-safe dicts."""
+    with _lock:
+        return {
+            "buckets_ms": list(BUCKETS_MS),
+            "histograms": {
+                name: {
+                    "count": h.count,
+                    "sum_ms": round(h.sum_ms, 1),
+                    "mean_ms": round(h.sum_ms / h.count, 1) if h.count else 0.0,
+                    "max_ms": round(h.max_ms, 1),
+                    "p50_ms": h.quantile(0.50),
+                    "p95_ms": h.quantile(0.95),
+                    "p99_ms": h.quantile(0.99),
+                    "buckets": list(h.counts),
+                }
+                for name, h in sorted(_histograms.items())
+            },
+            "counters": dict(sorted(_counters.items())),
+        }
+
+
+def reset() -> None:
+    with _lock:
+        _histograms.clear()
+        _counters.clear()
+
+
+def _finish_span(s: dict, t0: float) -> None:
+    s["ms"] = round((time.perf_counter() - t0) * 1000, 1)
+    counters = {k: v for k, v in s.items() if k in ("input_tokens", "output_tokens") and isinstance(v, int)}
+    if "cache" in s:
+        counters["cache_" + s["cache"]] = 1
+    observe(s["name"], s["ms"], **counters)
+
+
+class Trace:
+    """Spans of one pipeline run, in completion order."""
+
+    def __init__(self, name: str, **attrs):
+        self.name = name
+        self.attrs = attrs
+        self.spans: List[dict] = []
+        self._started = time.perf_counter()
+        self._reported = 0
+
+    @contextmanager
+    def span(self, name: str, **attrs) -> Iterator[dict]:
+        s = {"name": name, **attrs}
+        token = _current.set((self, s))
+        t0 = time.perf_counter()
+        try:
+            yield s
+        except BaseException as exc:
+            s["error"] = type(exc).__name__
+            raise
+        finally:
+            _current.reset(token)
+            _finish_span(s, t0)
+            self.spans.append(s)
+
+    @contextmanager
+    def active(self) -> Iterator["Trace"]:
+        """Make this the trace module-level span()/note() attach to, without a span of its own."""
+        token = _current.set((self, {}))
+        try:
+            yield self
+        finally:
+            _current.reset(token)
+
+    def since_last(self) -> Dict[str, float]:
+        """{span name: ms} for spans finished since the previous call — the SSE stage metadata."""
+        new = self.spans[self._reported:]
+        self._reported = len(self.spans)
+        out: Dict[str, float] = {}
+        for s in new:
+            out[s["name"]] = round(out.get(s["name"], 0.0) + s["ms"], 1)
+        return out
+
+    def finish(self, **attrs) -> Dict:
+        """Record the total, log the trace as one JSON line and return it."""
+        total = round((time.perf_counter() - self._started) * 1000, 1)
+        observe(f"{self.name}.total", total)
+        record = {"trace": self.name, **self.attrs, **attrs, "total_ms": total, "spans": self.spans}
+        if settings.TIMING_LOG_TRACES:
+            print(f"[timing] {json.dumps(record, default=str)}")
+        return record
+
+
+@contextmanager
+def span(name: str, **attrs) -> Iterator[dict]:
+    """A span on the active trace, or a bare histogram observation when there is none."""
+    cur = _current.get()
+    if cur is not None and cur[0] is not None:
+        with cur[0].span(name, **attrs) as s:
+            yield s
+        return
+    s = {"name": name, **attrs}
+    token = _current.set((None, s))
+    t0 = time.perf_counter()
+    try:
+        yield s
+    except BaseException as exc:
+        s["error"] = type(exc).__name__
+        raise
+    finally:
+        _current.reset(token)
+        _finish_span(s, t0)
+
+
+def note(**attrs) -> None:
+    """Attach attributes (token counts, cache hit/miss) to the innermost active span."""
+    cur = _current.get()
+    if cur is not None:
+        cur[1].update(attrs)
+
+
+def timed(name: str):
+    """Decorator form of span() — e.g. each ReportGenerator render."""
+    def wrap(fn):
+        @functools.wraps(fn)
+        def inner(*args, **kwargs):
+            with span(name):
+                return fn(*args, **kwargs)
+        return inner
+    return wrap
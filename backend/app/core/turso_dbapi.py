@@ -7,10 +7,15 @@ Transaction model: we buffer all statements between BEGIN and COMMIT/ROLLBACK
 and send them as a single atomic pipeline batch to Turso.
 """
 from __future__ import annotations
+import base64
+import json
 import re
+import time
 from typing import Any, List, Optional
 import httpx
 
+from app.core import metrics, sql_profile
+
 apilevel = "2.0"
 threadsafety = 1
 paramstyle = "qmark"
@@ -30,6 +35,7 @@ def _to_args(params) -> list:
       integers → {"type": "integer", "value": "123"}   (value as string)
       floats   → {"type": "float",   "value": 73.9}    (value as JSON number, NOT string)
       text     → {"type": "text",    "value": "hello"}
+      bytes    → {"type": "blob",    "base64": "aGVsbG8"}  (unpadded base64)
       null     → {"type": "null"}
     """
     if not params:
@@ -45,6 +51,8 @@ def _to_args(params) -> list:
         if isinstance(v, float):
             # Turso requires float value as a JSON number, not a string
             return {"type": "float", "value": float(v)}
+        if isinstance(v, (bytes, bytearray, memoryview)):
+            return {"type": "blob", "base64": base64.b64encode(bytes(v)).decode("ascii").rstrip("=")}
         return {"type": "text", "value": str(v)}
     return [_val(v) for v in params]
 
@@ -55,6 +63,9 @@ def _from_cell(cell: Any) -> Any:
         return None
     if isinstance(cell, dict):
         t = cell.get("type", "text")
+        if t == "blob":
+            b64 = cell.get("base64") or ""
+            return base64.b64decode(b64 + "=" * (-len(b64) % 4))
         v = cell.get("value")
         if t == "null" or v is None:
             return None
@@ -203,6 +214,30 @@ class Connection:
 
     # ── HTTP helpers ────────────────────────────────────────────────────────
 
+    def _post(self, payload: dict, op: str, stmts: list) -> httpx.Response:
+        """One pipeline round trip, counted and timed for /api/metrics and the
+        per-request SQL profile (when one is active)."""
+        profile = sql_profile.current()
+        body = json.dumps(payload) if profile is not None else None
+        t0 = time.perf_counter()
+        try:
+            if body is None:
+                resp = self._client.post(f"{self._url}/v2/pipeline", json=payload)
+            else:
+                resp = self._client.post(f"{self._url}/v2/pipeline", content=body)
+        except httpx.HTTPError:
+            metrics.inc("turso_errors_total", op=op)
+            raise
+        finally:
+            elapsed = time.perf_counter() - t0
+            metrics.observe("turso_request_duration_seconds", elapsed, op=op)
+        metrics.inc("turso_statements_total", len(stmts), op=op)
+        if resp.status_code >= 400:
+            metrics.inc("turso_errors_total", op=op)
+        if profile is not None:
+            profile.record(op, stmts, elapsed * 1000, len(body), len(resp.content))
+        return resp
+
     def _send_one(self, sql: str, params=None) -> dict:
         """Send a single SQL statement via Turso pipeline API."""
         payload = {
@@ -211,7 +246,7 @@ class Connection:
                 {"type": "close"},
             ]
         }
-        resp = self._client.post(f"{self._url}/v2/pipeline", json=payload)
+        resp = self._post(payload, "execute", [(sql, params)])
         try:
             resp.raise_for_status()
         except httpx.HTTPStatusError as e:
@@ -236,7 +271,7 @@ class Connection:
         requests.append({"type": "close"})
 
         payload = {"requests": requests}
-        resp = self._client.post(f"{self._url}/v2/pipeline", json=payload)
+        resp = self._post(payload, "batch", stmts)
         try:
             resp.raise_for_status()
         except httpx.HTTPStatusError as e:
@@ -1,10 +1,13 @@
 # FastAPI main application
 
 import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from app.core.database import engine, Base
+from app.core.metrics import MetricsMiddleware
+from app.core.sql_profile import SQLProfileMiddleware
 from app.api.routes import workflows, extraction, reports, auth, admin, job_scan, track, cron
 from mangum import Mangum
 from sqlalchemy import text
@@ -56,6 +59,11 @@ try:
             "ALTER TABLE analysis_results ADD COLUMN score_confidence VARCHAR(10)",
             # #9 quick-win T+3 digest — when the retention email was sent
             "ALTER TABLE report_leads ADD COLUMN digest_sent_at DATETIME",
+            # n8n canvases moved to the content-addressed n8n_canvases table
+            "ALTER TABLE workflows ADD COLUMN n8n_canvas_hash VARCHAR(64)",
+            "CREATE INDEX IF NOT EXISTS ix_workflows_n8n_canvas_hash ON workflows (n8n_canvas_hash)",
+            # keyset pagination of workflow lists (newest first, per user)
+            "CREATE INDEX IF NOT EXISTS ix_workflows_user_created ON workflows (user_email, created_at, id)",
         ]:
             try:
                 conn.execute(text(ddl))
@@ -71,13 +79,35 @@ try:
                 for row in rows:
                     code = _gen_share_code()
                     _conn.execute(_t("UPDATE workflows SET share_code=:c WHERE id=:i"), {"c": code, "i": row[0]})
+                # their report snapshots still carry share_code null
+                from app.services.analysis_snapshot import drop_snapshots
+                drop_snapshots(_conn, [row[0] for row in rows])
                 _conn.commit()
         except Exception as _e:
             print(f"Warning: share_code backfill failed: {_e}")
 except Exception as e:
     print(f"Warning: Could not create DB tables at startup: {e}")
 
-app = FastAPI(title="WorkScanAI API", version="1.0.0")
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    from app.core import http_clients, process_pools
+    from app.core.config import settings as _s
+    from app.services import scheduler
+    # Scheduled jobs (digest, cache warm-up, cleanup) — one leader across
+    # instances via a DB lease. Not started under Mangum (lifespan off):
+    # serverless has no long-lived process to run them.
+    if _s.SCHEDULER_ENABLED:
+        scheduler.start()
+    yield
+    scheduler.stop()
+    # Pooled outbound clients (Resend, Tavily, reCAPTCHA, ipapi) are created
+    # on first use; close them with the app
+    await http_clients.aclose_all()
+    # Report section and PDF parse worker processes (REPORT_RENDER_WORKERS /
+    # PDF_EXTRACT_WORKERS > 1)
+    process_pools.shutdown_all()
+
+app = FastAPI(title="WorkScanAI API", version="1.0.0", lifespan=lifespan)
 
 # Fail-loud config validation. In production, a missing required secret (e.g.
 # ADMIN_SECRET, ANTHROPIC_API_KEY) means broken auth or a dead feature — surface
@@ -135,8 +165,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
     allow_headers=["*"],
-    expose_headers=["content-disposition"],
+    expose_headers=["content-disposition", "x-next-cursor", "x-sql-profile"],
 )
+# Per-request Turso statement profile — a no-op unless SQL_PROFILE is set
+app.add_middleware(SQLProfileMiddleware)
+# Request latency / in-flight for /api/metrics (outermost, so CORS preflights count too)
+app.add_middleware(MetricsMiddleware)
 
 @app.get("/")
 async def root():
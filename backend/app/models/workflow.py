@@ -1,9 +1,10 @@
 # SQLAlchemy database models
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Float, Text, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Float, Text, Boolean, LargeBinary
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 from app.core.database import Base
+import gzip
 import secrets
 
 
@@ -41,7 +42,9 @@ class Workflow(Base):
     share_code = Column(String(16), unique=True, nullable=True, index=True)  # e.g. '4m5gd9'
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
-    source_text = Column(Text, nullable=True)
+    # Full uploaded document / voice transcript — can be tens of KB, so only
+    # detail endpoints and reports load it (undefer(Workflow.source_text))
+    source_text = deferred(Column(Text, nullable=True))
     input_mode = Column(String(50), nullable=True)
     analysis_context = Column(String(50), nullable=True)   # 'individual' | 'team' | 'company'
     team_size = Column(String(50), nullable=True)
@@ -49,13 +52,25 @@ class Workflow(Base):
     user_email = Column(String(255), ForeignKey("users.email"), nullable=True, index=True)
     client_ip = Column(String(45), nullable=True, index=True)   # IPv4/IPv6 for rate limiting
     referred_by_code = Column(String(16), nullable=True, index=True)  # share_code of the report that referred this analysis (k-factor)
-    n8n_workflow_json = Column(Text, nullable=True)              # stored n8n workflow JSON string
+    # Generated n8n canvas, stored compressed in n8n_canvases (see N8nCanvas).
+    # The old inline TEXT column only holds canvases written before that table
+    # existed; it is deferred so workflow queries never load it.
+    n8n_canvas_hash = Column(String(64), ForeignKey("n8n_canvases.content_hash"), nullable=True, index=True)
+    n8n_workflow_json_legacy = deferred(Column("n8n_workflow_json", Text, nullable=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     user = relationship("User", back_populates="workflows")
     tasks = relationship("Task", back_populates="workflow", cascade="all, delete-orphan")
     analysis = relationship("Analysis", back_populates="workflow", uselist=False)
+    n8n_canvas = relationship("N8nCanvas")
+
+    @property
+    def n8n_workflow_json(self):
+        """The stored n8n canvas JSON string, or None."""
+        if self.n8n_canvas_hash:
+            return self.n8n_canvas.text() if self.n8n_canvas else None
+        return self.n8n_workflow_json_legacy
 
 
 class Task(Base):
@@ -135,6 +150,23 @@ class AnalysisResult(Base):
     task = relationship("Task", back_populates="analysis_result")
 
 
+class AnalysisSnapshot(Base):
+    """The finished AnalysisReportResponse, serialized once and gzip-compressed.
+
+    An analysis never changes after _perform_analysis_sync commits (short of the
+    admin backfills, which rebuild it), so /api/results and /api/share serve
+    these bytes instead of rebuilding Pydantic models from ORM rows per read.
+    Deleted when the workflow row changes (app.services.analysis_snapshot).
+    Kept in a side table so the blob never rides along with Analysis queries.
+    """
+    __tablename__ = "analysis_snapshots"
+
+    analysis_id = Column(Integer, ForeignKey("analyses.id"), primary_key=True)
+    encoding = Column(String(16), nullable=False, default="gzip")
+    body = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
 class ReportLead(Base):
     """Email leads captured from the report email-gate (#2).
 
@@ -175,3 +207,52 @@ class PageView(Base):
     referrer = Column(String(500), nullable=True)        # where the visit came from
     ip_hash = Column(String(64), nullable=True, index=True)  # salted hash for unique counts
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+
+
+class N8nCanvas(Base):
+    """A generated n8n canvas, gzip-compressed and keyed by the SHA-256 of its JSON.
+
+    Canvases run to tens of KB of mostly repeated sticky notes and JS bodies,
+    and regenerating one for unchanged input gives the same bytes, so each
+    distinct canvas is stored once and workflows point at it by hash.
+    """
+    __tablename__ = "n8n_canvases"
+
+    content_hash = Column(String(64), primary_key=True)
+    encoding = Column(String(16), nullable=False, default="gzip")
+    body = Column(LargeBinary, nullable=False)
+    raw_size = Column(Integer, nullable=False)   # bytes of uncompressed JSON
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def text(self) -> str:
+        return gzip.decompress(self.body).decode("utf-8")
+
+
+class SchedulerLease(Base):
+    """A named lease row for app.services.scheduler.
+
+    "scheduler" elects the one process that runs scheduled jobs;
+    "job:<name>" keeps a job from overlapping itself (a scheduled run and a
+    manual /api/cron call). A lease is free once expires_at (unix seconds)
+    has passed.
+    """
+    __tablename__ = "scheduler_leases"
+
+    name = Column(String(100), primary_key=True)
+    holder = Column(String(255), nullable=False)
+    expires_at = Column(Float, nullable=False)
+
+
+class JobRun(Base):
+    """Run history of scheduled / manually triggered jobs (GET /api/admin/jobs)."""
+    __tablename__ = "job_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job = Column(String(100), nullable=False, index=True)
+    trigger = Column(String(20), nullable=False, default="schedule")   # 'schedule' | 'http'
+    holder = Column(String(255), nullable=True)
+    status = Column(String(20), nullable=False, default="running")     # running | ok | error | timeout
+    started_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    duration_ms = Column(Float, nullable=True)
+    detail = Column(Text, nullable=True)   # job result summary or the error
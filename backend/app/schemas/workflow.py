@@ -35,6 +35,24 @@ class WorkflowCreate(BaseModel):
     tasks: List[TaskCreate] = Field(default_factory=list)
 
 
+class WorkflowSummaryResponse(BaseModel):
+    """One row of a workflow list — a column projection, no source text, tasks or canvas."""
+    id: int
+    share_code: Optional[str] = None
+    name: str
+    description: Optional[str] = None
+    input_mode: Optional[str] = None
+    analysis_context: Optional[str] = None
+    team_size: Optional[str] = None
+    industry: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    task_count: int = 0
+
+    class Config:
+        from_attributes = True
+
+
 class WorkflowResponse(BaseModel):
     id: int
     share_code: Optional[str] = None
@@ -55,6 +73,26 @@ class WorkflowResponse(BaseModel):
         from_attributes = True
 
 
+class WorkflowReportResponse(BaseModel):
+    """The workflow inside a stored report — no source text, and no n8n canvas
+    (served by the /n8n-canvas endpoints)."""
+    id: int
+    share_code: Optional[str] = None
+    name: str
+    description: Optional[str]
+    input_mode: Optional[str] = None
+    analysis_context: Optional[str] = None
+    team_size: Optional[str] = None
+    industry: Optional[str] = None
+    referred_by_code: Optional[str] = None
+    created_at: datetime
+    updated_at: Optional[datetime]
+    tasks: List[TaskResponse] = []
+
+    class Config:
+        from_attributes = True
+
+
 # Analysis Schemas
 class AnalysisResultResponse(BaseModel):
     id: int
@@ -110,6 +148,11 @@ class AnalysisResponse(BaseModel):
         from_attributes = True
 
 
+class AnalysisReportResponse(AnalysisResponse):
+    """What /api/results and /api/share send (see app.services.analysis_snapshot)."""
+    workflow: Optional[WorkflowReportResponse] = None
+
+
 class AnalyzeRequest(BaseModel):
     workflow_id: int
     hourly_rate: Optional[float] = 50.0  # Default $50/hour
@@ -3,19 +3,19 @@ Context-aware for Individual / Team / Company.
 Incorporates decision-layer analysis for strategic tasks (backlog prioritization,
 stakeholder alignment, trade-off resolution) per n8n PM feedback.
 """
-import os
 import json
 import re
-from anthropic import Anthropic
-from typing import List, Dict
+import time
+from typing import List, Dict, Optional
+
+from app.core import timing
+from app.core.config import settings
+from app.services.llm_client import get_llm_client
 
 
 class AIAnalyzer:
     def __init__(self):
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if not api_key:
-            raise ValueError("ANTHROPIC_API_KEY not found in environment")
-        self.client = Anthropic(api_key=api_key)
+        self.client = get_llm_client()
 
     # ------------------------------------------------------------------
     # PUBLIC API
@@ -26,6 +26,68 @@ class AIAnalyzer:
         if not tasks:
             return []
 
+        try:
+            params = self._request_params(tasks)
+            with timing.span("llm", model=params["model"], tasks=len(tasks)):
+                message = self.client.messages.create(**params, timeout=90.0)
+            raw = message.content[0].text
+            with timing.span("parse"):
+                return self._parse_batch_response(raw, len(tasks))
+        except Exception as e:
+            print(f"Batch AI analysis error: {e}")
+            return [self._defaults() for _ in tasks]
+
+    def analyze_bulk(
+        self,
+        jobs: Dict[str, List[Dict]],
+        poll_interval: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, List[Dict]]:
+        """Analyze many task lists as ONE Message Batch job — throughput over latency.
+
+        `jobs` maps a custom id (``[a-zA-Z0-9_-]{1,64}``) to the task list that
+        analyze_tasks_batch would get; the same prompt is sent for each. Polls
+        until the batch has ended, then returns {custom id: per-task results}.
+        Requests that errored or expired get the default results, exactly like
+        a failed synchronous call. Raises TimeoutError if the batch outlives
+        `timeout` (it is cancelled first).
+        """
+        jobs = {k: v for k, v in jobs.items() if v}
+        if not jobs:
+            return {}
+        poll_interval = settings.ANTHROPIC_BATCH_POLL_SECONDS if poll_interval is None else poll_interval
+        timeout = settings.ANTHROPIC_BATCH_TIMEOUT_SECONDS if timeout is None else timeout
+
+        batches = self.client.messages.batches
+        batch = batches.create(requests=[
+            {"custom_id": custom_id, "params": self._request_params(tasks)}
+            for custom_id, tasks in jobs.items()
+        ])
+        print(f"[ai_bulk] submitted batch {batch.id} with {len(jobs)} analyses")
+        deadline = time.monotonic() + timeout
+        while batch.processing_status != "ended":
+            if time.monotonic() > deadline:
+                batches.cancel(batch.id)
+                raise TimeoutError(f"Message batch {batch.id} still {batch.processing_status} after {timeout:.0f}s")
+            time.sleep(poll_interval)
+            batch = batches.retrieve(batch.id)
+
+        results = {custom_id: [self._defaults() for _ in tasks] for custom_id, tasks in jobs.items()}
+        failed = 0
+        for entry in batches.results(batch.id):
+            tasks = jobs.get(entry.custom_id)
+            if tasks is None:
+                continue
+            if entry.result.type == "succeeded":
+                results[entry.custom_id] = self._parse_batch_response(entry.result.message.content[0].text, len(tasks))
+            else:
+                failed += 1
+                print(f"[ai_bulk] {entry.custom_id}: {entry.result.type}")
+        print(f"[ai_bulk] batch {batch.id} ended — {len(jobs) - failed} ok, {failed} failed")
+        return results
+
+    def _request_params(self, tasks: List[Dict]) -> Dict:
+        """Messages API params for one task list — shared by the sync and bulk paths."""
         context = tasks[0].get('analysis_context', 'individual')
         industry = tasks[0].get('industry', '') or 'General'
 
@@ -128,18 +190,11 @@ class AIAnalyzer:
             f"COMPOSITE_SCORE 70 — be honest about the decision layer."
         )
 
-        try:
-            message = self.client.messages.create(
-                model="claude-haiku-4-5-20251001",
-                max_tokens=min(700 * n + 600, 8000),
-                messages=[{"role": "user", "content": prompt}],
-                timeout=90.0,
-            )
-            raw = message.content[0].text
-            return self._parse_batch_response(raw, n)
-        except Exception as e:
-            print(f"Batch AI analysis error: {e}")
-            return [self._defaults() for _ in tasks]
+        return {
+            "model": "claude-haiku-4-5-20251001",
+            "max_tokens": min(700 * n + 600, 8000),
+            "messages": [{"role": "user", "content": prompt}],
+        }
 
     def analyze_task(self, task: Dict) -> Dict:
         """Single-task shim - delegates to batch."""
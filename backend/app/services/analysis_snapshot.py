@@ -0,0 +1,110 @@
+"""
+Precomputed analysis report snapshots.
+
+An analysis is immutable once _perform_analysis_sync (or the job scanner) has
+committed it, yet every read of /api/results/{id} and /api/share/{code} used
+to walk the analysis, its results, each task and the workflow, then rebuild
+the Pydantic models. Instead the report (AnalysisReportResponse: no source
+text, and no n8n canvas — that has its own endpoints) is serialized once,
+gzip-compressed and stored in `analysis_snapshots`; readers send those bytes
+as-is (Content-Encoding: gzip when the client accepts it, which every
+browser does).
+
+Snapshots are written only on the write paths — analysis, job scan, admin
+backfills. Reads never write: an analysis without a snapshot (legacy rows,
+or one whose workflow row changed since) is serialized live until
+backfill_snapshots() builds it.
+"""
+import gzip
+from typing import Iterable, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+from sqlalchemy import text
+from sqlalchemy.orm import Session, selectinload
+
+from app.models.workflow import Analysis, AnalysisResult, AnalysisSnapshot, Workflow
+from app.schemas.workflow import AnalysisReportResponse
+
+SNAPSHOT_ENCODING = "gzip"
+
+
+def serialize_analysis(db: Session, analysis_id: int) -> Optional[bytes]:
+    """Live-serialize one analysis to report JSON in a fixed number of queries."""
+    analysis = (
+        db.query(Analysis)
+        .options(selectinload(Analysis.workflow).selectinload(Workflow.tasks),
+                 selectinload(Analysis.results).selectinload(AnalysisResult.task))
+        # objects already in this session may predate the commit being snapshotted
+        .execution_options(populate_existing=True)
+        .filter(Analysis.id == analysis_id)
+        .first()
+    )
+    if analysis is None:
+        return None
+    return AnalysisReportResponse.model_validate(analysis).model_dump_json().encode()
+
+
+def save_snapshot(db: Session, analysis_id: int) -> Optional[bytes]:
+    """(Re)build and store the snapshot; returns the compressed bytes.
+
+    Never raises — a missing snapshot only means readers serialize live.
+    """
+    try:
+        body = serialize_analysis(db, analysis_id)
+        if body is None:
+            return None
+        packed = gzip.compress(body, compresslevel=6)
+        snap = db.get(AnalysisSnapshot, analysis_id)
+        if snap is None:
+            db.add(AnalysisSnapshot(analysis_id=analysis_id, encoding=SNAPSHOT_ENCODING, body=packed))
+        else:
+            snap.encoding, snap.body = SNAPSHOT_ENCODING, packed
+        db.commit()
+        return packed
+    except Exception as e:
+        db.rollback()
+        print(f"[snapshot] could not store snapshot for analysis {analysis_id}: {e}")
+        return None
+
+
+def get_snapshot(db: Session, analysis_id: int) -> Optional[bytes]:
+    """Compressed snapshot for an analysis, or None — callers then serialize live."""
+    row = (
+        db.query(AnalysisSnapshot.encoding, AnalysisSnapshot.body)
+        .filter(AnalysisSnapshot.analysis_id == analysis_id)
+        .first()
+    )
+    if row and row[0] == SNAPSHOT_ENCODING and row[1]:
+        return bytes(row[1])
+    return None
+
+
+def drop_snapshots(conn, workflow_ids: Iterable[int]) -> None:
+    """Delete the snapshots of these workflows' analyses after a change to the
+    workflow rows. `conn` is a Session or Connection; the caller commits."""
+    for workflow_id in workflow_ids:
+        conn.execute(text("DELETE FROM analysis_snapshots WHERE analysis_id IN "
+                          "(SELECT id FROM analyses WHERE workflow_id = :w)"), {"w": workflow_id})
+
+
+def backfill_snapshots(db: Session, limit: int = 100) -> int:
+    """Build snapshots for up to `limit` analyses that have none; returns how many were stored."""
+    missing = [
+        analysis_id for (analysis_id,) in
+        db.query(Analysis.id)
+        .outerjoin(AnalysisSnapshot, AnalysisSnapshot.analysis_id == Analysis.id)
+        .filter(AnalysisSnapshot.analysis_id.is_(None))
+        .order_by(Analysis.id)
+        .limit(limit)
+    ]
+    return sum(save_snapshot(db, analysis_id) is not None for analysis_id in missing)
+
+
+def snapshot_response(request: Request, packed: bytes, headers: Optional[dict] = None) -> Response:
+    """Send a compressed snapshot, decompressing only for clients without gzip."""
+    headers = {**(headers or {}), 'Vary': 'Accept-Encoding'}
+    if 'gzip' in (request.headers.get('accept-encoding') or ''):
+        headers['Content-Encoding'] = 'gzip'
+        return Response(content=packed, media_type='application/json', headers=headers)
+    return Response(content=gzip.decompress(packed), media_type='application/json', headers=headers)
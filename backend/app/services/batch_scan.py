@@ -0,0 +1,133 @@
+"""
+Background batches for the job scanner — one request, many roles.
+
+A consultant engagement covers 30-80 roles. Instead of one research/analyze
+round trip pair per role from a client script, a batch is registered here
+and its items run on a bounded thread pool (BATCH_SCAN_CONCURRENCY at a
+time). Every state change is appended to the batch's event log, which the
+SSE endpoint replays and then follows, so a client that connects late (or
+reconnects) still sees every completion. When all items are done an
+optional `finish` step (the combined PDF) runs over the successful results.
+
+Batches live in this process only, the newest BATCH_SCAN_RETAIN of them.
+"""
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+
+class Batch:
+    """One batch: per-item state plus an append-only event log."""
+
+    def __init__(self, items: List[Dict]):
+        self.id = secrets.token_urlsafe(9)
+        self.created_at = time.time()
+        self.status = "running"
+        self.items = [{"index": i, "job_title": it.get("job_title"), "status": "queued"}
+                      for i, it in enumerate(items)]
+        self.report_path: Optional[str] = None
+        self._events: List[Dict] = []
+        self._cond = threading.Condition()
+
+    def emit(self, stage: str, **fields) -> None:
+        with self._cond:
+            self._events.append({"seq": len(self._events), "stage": stage, **fields})
+            self._cond.notify_all()
+
+    def events_after(self, seq: int, timeout: float) -> Tuple[List[Dict], bool]:
+        """(events with seq >= `seq`, batch finished), waiting up to `timeout` for new ones."""
+        with self._cond:
+            if len(self._events) <= seq and self.status == "running":
+                self._cond.wait(timeout)
+            return self._events[seq:], self.status != "running"
+
+    def summary(self) -> Dict:
+        counts: Dict[str, int] = {}
+        for item in self.items:
+            counts[item["status"]] = counts.get(item["status"], 0) + 1
+        return {
+            "batch_id": self.id,
+            "status": self.status,
+            "total": len(self.items),
+            "counts": counts,
+            "items": self.items,
+            "report_ready": self.report_path is not None,
+        }
+
+    def _finish(self) -> None:
+        with self._cond:
+            self.status = "done"
+            self._events.append({"seq": len(self._events), "stage": "done", **self.summary()})
+            self._cond.notify_all()
+
+
+_batches: "OrderedDict[str, Batch]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def start_batch(items: List[Dict], run_item: Callable[[Dict], Dict],
+                finish: Optional[Callable[[Batch, List[Dict]], Optional[str]]] = None,
+                concurrency: Optional[int] = None) -> Batch:
+    """Register a batch and start working through it in the background.
+
+    `run_item(item)` returns the JSON-safe result for one item or raises;
+    `finish(batch, results)` gets the successful results in item order and
+    may return a report file path.
+    """
+    batch = Batch(items)
+    with _lock:
+        _batches[batch.id] = batch
+        while len(_batches) > settings.BATCH_SCAN_RETAIN:
+            oldest = next((k for k, b in _batches.items() if b.status != "running"), None)
+            if oldest is None:
+                break
+            del _batches[oldest]
+    workers = max(1, min(concurrency or settings.BATCH_SCAN_CONCURRENCY, len(items)))
+    threading.Thread(target=_drive, args=(batch, items, run_item, finish, workers),
+                     name=f"batch-{batch.id}", daemon=True).start()
+    return batch
+
+
+def get_batch(batch_id: str) -> Optional[Batch]:
+    with _lock:
+        return _batches.get(batch_id)
+
+
+def _run_one(batch: Batch, index: int, item: Dict, run_item: Callable[[Dict], Any]) -> Optional[Dict]:
+    state = batch.items[index]
+    state["status"] = "running"
+    batch.emit("item_started", index=index, job_title=state["job_title"])
+    started = time.perf_counter()
+    try:
+        result = run_item(item)
+    except Exception as exc:
+        print(f"[batch] {batch.id} item {index} failed: {exc}")
+        state.update(status="error", error=str(exc))
+        batch.emit("item_error", index=index, job_title=state["job_title"], message=str(exc))
+        return None
+    state.update(status="done", result=result)
+    batch.emit("item_done", index=index, job_title=state["job_title"],
+               seconds=round(time.perf_counter() - started, 2), **result)
+    return result
+
+
+def _drive(batch: Batch, items: List[Dict], run_item, finish, workers: int) -> None:
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"batch-{batch.id}") as pool:
+            results = list(pool.map(lambda p: _run_one(batch, p[0], p[1], run_item), enumerate(items)))
+        done = [r for r in results if r is not None]
+        if finish and done:
+            try:
+                batch.report_path = finish(batch, done)
+                if batch.report_path:
+                    batch.emit("report", report_url=f"/api/job-scan/batch/{batch.id}/report")
+            except Exception as exc:
+                print(f"[batch] {batch.id} report failed: {exc}")
+                batch.emit("report_error", message=str(exc))
+    finally:
+        batch._finish()
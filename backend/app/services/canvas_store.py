@@ -0,0 +1,118 @@
+"""
+Content-addressed storage for generated n8n canvases.
+
+A merged canvas is tens of KB of JSON that used to sit inline in
+workflows.n8n_workflow_json and ride along with every workflow query. It is
+now gzip-compressed (roughly 3-4x smaller) into n8n_canvases under the
+SHA-256 of its JSON, and the workflow row only keeps the hash. Canvas node
+IDs are derived from the canvas input (see n8n_template_client._row_seed),
+so re-analysing an unchanged workflow, admin backfills and popular
+job-scanner titles all point at one stored copy.
+
+The canvas is written on a side connection right after the analysis commit,
+exactly like the old inline UPDATE, so it works the same on Turso and on
+the local SQLite engine.
+"""
+import gzip
+import hashlib
+import zlib
+from typing import Iterator, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.workflow import N8nCanvas, Workflow
+
+CANVAS_ENCODING = "gzip"
+_STREAM_CHUNK = 64 * 1024
+
+
+def pack_canvas(canvas_json: str) -> Tuple[str, bytes, int]:
+    """(content hash, gzip body, raw size) for a canvas JSON string."""
+    raw = canvas_json.encode("utf-8")
+    return hashlib.sha256(raw).hexdigest(), gzip.compress(raw, compresslevel=6), len(raw)
+
+
+def save_canvas(workflow_id: int, canvas_json: str, db: Optional[Session] = None) -> str:
+    """Store a canvas (once per distinct content) and point the workflow at it.
+
+    Writes on a side connection unless a session is given. Returns the
+    content hash. Raises on DB errors — callers already wrap the whole n8n
+    step and log failures.
+    """
+    content_hash, body, raw_size = pack_canvas(canvas_json)
+    params = {"h": content_hash, "e": CANVAS_ENCODING, "b": body, "s": raw_size, "i": workflow_id}
+    if db is None and settings.TURSO_DATABASE_URL and settings.TURSO_AUTH_TOKEN:
+        from app.core.turso_dbapi import connect
+        conn = connect(settings.TURSO_DATABASE_URL, settings.TURSO_AUTH_TOKEN)
+        try:
+            cur = conn.cursor()
+            cur.execute("INSERT OR IGNORE INTO n8n_canvases (content_hash, encoding, body, raw_size) "
+                        "VALUES (?, ?, ?, ?)", (content_hash, CANVAS_ENCODING, body, raw_size))
+            cur.execute("UPDATE workflows SET n8n_canvas_hash = ?, n8n_workflow_json = NULL WHERE id = ?",
+                        (content_hash, workflow_id))
+            conn.commit()
+        finally:
+            conn.close()
+    elif db is not None:
+        _write(db, params)
+        db.commit()
+    else:
+        from app.core.database import engine
+        with engine.connect() as conn:
+            _write(conn, params)
+            conn.commit()
+    return content_hash
+
+
+def _write(conn, params: dict) -> None:
+    conn.execute(text("INSERT OR IGNORE INTO n8n_canvases (content_hash, encoding, body, raw_size) "
+                      "VALUES (:h, :e, :b, :s)"), params)
+    conn.execute(text("UPDATE workflows SET n8n_canvas_hash = :h, n8n_workflow_json = NULL WHERE id = :i"),
+                 params)
+
+
+def load_canvas(db: Session, *criteria) -> Optional[Tuple[Optional[bytes], Optional[str]]]:
+    """(gzip body, legacy JSON text) for the workflow matching `criteria`.
+
+    Exactly one of the two is set when the workflow has a canvas; None when
+    no workflow matches. Reads only the columns it needs — never the row.
+    """
+    row = (
+        db.query(Workflow.id, N8nCanvas.encoding, N8nCanvas.body)
+        .outerjoin(N8nCanvas, N8nCanvas.content_hash == Workflow.n8n_canvas_hash)
+        .filter(*criteria)
+        .first()
+    )
+    if row is None:
+        return None
+    if row.body is not None and row.encoding == CANVAS_ENCODING:
+        return bytes(row.body), None
+    legacy = db.query(Workflow.n8n_workflow_json_legacy).filter(Workflow.id == row.id).scalar()
+    return None, legacy
+
+
+def iter_decompressed(body: bytes, chunk_size: int = _STREAM_CHUNK) -> Iterator[bytes]:
+    """Inflate a gzip body in bounded chunks."""
+    inflater = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    for i in range(0, len(body), chunk_size):
+        out = inflater.decompress(body[i:i + chunk_size])
+        if out:
+            yield out
+    tail = inflater.flush()
+    if tail:
+        yield tail
+
+
+def canvas_response(request: Request, body: Optional[bytes], legacy: Optional[str]) -> Response:
+    """Send a stored canvas: gzip bytes as-is when accepted, else streamed inflated."""
+    headers = {"Vary": "Accept-Encoding"}
+    if body is None:
+        return Response(content=legacy or "", media_type="application/json", headers=headers)
+    if "gzip" in (request.headers.get("accept-encoding") or ""):
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=body, media_type="application/json", headers=headers)
+    return StreamingResponse(iter_decompressed(body), media_type="application/json", headers=headers)
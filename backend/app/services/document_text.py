@@ -0,0 +1,277 @@
+"""
+Bounded text extraction for uploaded documents (POST /api/extract-tasks).
+
+Task parsing only needs the first EXTRACT_MAX_CHARS or so of a document, so
+extraction is built around a TextBuilder that collects pieces in a list
+(no quadratic `text +=`) and reports when it is full, letting every reader
+stop early instead of walking the rest of a 900-page PDF or a 50-sheet
+workbook.
+
+  - save_upload     streams an UploadFile to a temp file in chunks, with a
+                    hard UPLOAD_MAX_BYTES cap (413 past it), hashing it on the
+                    way for the extract cache
+  - pdf_text        parses up to PDF_MAX_PAGES pages; long PDFs are split
+                    into page ranges parsed in a process pool, collected in
+                    order until the builder is full
+  - image_text      prepares images for Vision OCR (EXIF rotation, crop to
+                    the text region, long edge capped at IMAGE_OCR_MAX_EDGE,
+                    re-encoded as PNG or JPEG, whichever suits the content);
+                    pages of a multi-page TIFF/HEIC are OCR'd concurrently
+"""
+import hashlib
+import io
+import os
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+import pypdf
+from fastapi import HTTPException, UploadFile
+
+from app.core import process_pools, timing
+from app.core.config import settings
+
+
+class TextBuilder:
+    """Append-only text with a character budget; add() says whether more is wanted."""
+
+    def __init__(self, max_chars: Optional[int] = None):
+        self.max_chars = settings.EXTRACT_MAX_CHARS if max_chars is None else max_chars
+        self.truncated = False
+        self._parts: List[str] = []
+        self._size = 0
+
+    @property
+    def full(self) -> bool:
+        return self._size >= self.max_chars
+
+    def add(self, piece: str) -> bool:
+        if self.full:
+            self.truncated = self.truncated or bool(piece)
+            return False
+        room = self.max_chars - self._size
+        if len(piece) > room:
+            piece, self.truncated = piece[:room], True
+        self._parts.append(piece)
+        self._size += len(piece)
+        return not self.full
+
+    def line(self, piece: str) -> bool:
+        return self.add(piece + "\n")
+
+    def text(self) -> str:
+        text = "".join(self._parts).strip()
+        if self.truncated:
+            text += f"\n\n[Document truncated after {self.max_chars:,} characters]"
+        return text
+
+
+async def save_upload(upload: UploadFile, suffix: str = "",
+                      max_bytes: Optional[int] = None) -> Tuple[str, str]:
+    """Stream `upload` to a temp file chunk by chunk; returns (path, SHA-256 hex). 413 past `max_bytes`."""
+    max_bytes = settings.UPLOAD_MAX_BYTES if max_bytes is None else max_bytes
+    too_large = HTTPException(status_code=413, detail=f"File too large — the limit is {max_bytes // (1024 * 1024)} MB.")
+    if upload.size is not None and upload.size > max_bytes:
+        raise too_large
+    written, digest = 0, hashlib.sha256()
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        try:
+            while chunk := await upload.read(settings.UPLOAD_CHUNK_BYTES):
+                written += len(chunk)
+                if written > max_bytes:
+                    raise too_large
+                digest.update(chunk)
+                tmp.write(chunk)
+        except BaseException:
+            tmp.close()
+            os.remove(tmp.name)
+            raise
+    return tmp.name, digest.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# PDF
+# ---------------------------------------------------------------------------
+
+def _pdf_range_text(path: str, start: int, stop: int, max_chars: int) -> List[str]:
+    """Text of pages [start, stop), stopping once `max_chars` are collected (runs in a worker)."""
+    reader = pypdf.PdfReader(path)
+    out, size = [], 0
+    for i in range(start, stop):
+        text = reader.pages[i].extract_text() or ""
+        out.append(text)
+        size += len(text)
+        if size >= max_chars:
+            break
+    return out
+
+
+def pdf_text(path: str, builder: TextBuilder, max_pages: Optional[int] = None,
+             workers: Optional[int] = None) -> TextBuilder:
+    """Add the text of the first `max_pages` pages of a PDF to `builder`, in page order."""
+    from concurrent.futures.process import BrokenProcessPool
+
+    max_pages = settings.PDF_MAX_PAGES if max_pages is None else max_pages
+    workers = settings.PDF_EXTRACT_WORKERS if workers is None else workers
+    total = len(pypdf.PdfReader(path).pages)
+    n_pages = min(total, max_pages)
+    builder.truncated = builder.truncated or n_pages < total
+    workers = min(workers, os.cpu_count() or 1)
+    if workers <= 1 or n_pages < settings.PDF_PARALLEL_MIN_PAGES:
+        for text in _pdf_range_text(path, 0, n_pages, builder.max_chars):
+            if not builder.line(text):
+                break
+        return builder
+
+    # Contiguous page ranges, several per worker, so that stopping early
+    # (builder full) leaves most of a long document unparsed
+    step = max(1, -(-n_pages // (workers * 4)))
+    pool = process_pools.get_pool("pdf", workers)
+    futures: List[Future] = [pool.submit(_pdf_range_text, path, start, min(start + step, n_pages), builder.max_chars)
+                             for start in range(0, n_pages, step)]
+    try:
+        for i, future in enumerate(futures):
+            try:
+                pages = future.result()
+            except BrokenProcessPool as e:
+                print(f"[extract] PDF pool broken, parsing in-process: {e}")
+                process_pools.discard(pool)
+                for text in _pdf_range_text(path, i * step, n_pages, builder.max_chars):
+                    if not builder.line(text):
+                        break
+                break
+            if not all(builder.line(text) for text in pages):
+                break
+    finally:
+        for future in futures:
+            future.cancel()
+    return builder
+
+
+# ---------------------------------------------------------------------------
+# IMAGES (Vision OCR)
+# ---------------------------------------------------------------------------
+
+# Formats Claude Vision takes as they are
+_VISION_NATIVE = {"JPEG": "image/jpeg", "PNG": "image/png", "GIF": "image/gif", "WEBP": "image/webp"}
+_MULTI_PAGE = {"TIFF", "HEIF", "HEIC"}
+_heif_ready: Optional[bool] = None
+
+
+def _open_image(path: str):
+    """PIL image for `path`; HEIC/HEIF decoding needs the optional pillow-heif plugin."""
+    global _heif_ready
+    from PIL import Image
+    if _heif_ready is None:
+        try:
+            import pillow_heif
+            pillow_heif.register_heif_opener()
+            _heif_ready = True
+        except ImportError:
+            _heif_ready = False
+    return Image.open(path)
+
+
+def _content_box(img, margin: float = 0.02) -> Optional[Tuple[int, int, int, int]]:
+    """Bounding box of whatever stands out from the background (text, strokes),
+    or None when that is (nearly) the whole image. Computed on a small copy, so
+    it costs the same for a 12 MP photo as for a screenshot."""
+    from PIL import ImageChops, ImageFilter, ImageOps, ImageStat
+
+    small = img.convert("L")
+    small.thumbnail((256, 256))
+    small = ImageOps.autocontrast(small).filter(ImageFilter.MedianFilter(3))   # drop sensor speckle
+    background = int(ImageStat.Stat(small).median[0])
+    mask = ImageChops.difference(small, small.point(lambda _: background)).point(lambda p: 255 if p > 64 else 0)
+    box = mask.getbbox()
+    if box is None:
+        return None
+    sx, sy = img.width / small.width, img.height / small.height
+    mx, my = margin * img.width, margin * img.height
+    box = (max(0, int(box[0] * sx - mx)), max(0, int(box[1] * sy - my)),
+           min(img.width, int(box[2] * sx + mx)), min(img.height, int(box[3] * sy + my)))
+    if (box[2] - box[0]) * (box[3] - box[1]) > 0.9 * img.width * img.height:
+        return None
+    return box
+
+
+def _flatten(img):
+    """RGB (or L) on white — JPEG has no alpha and palette images don't resize well."""
+    from PIL import Image
+    if img.mode in ("RGB", "L"):
+        return img
+    if img.mode in ("RGBA", "LA", "P", "PA"):
+        rgba = img.convert("RGBA")
+        flat = Image.new("RGB", rgba.size, "white")
+        flat.paste(rgba, mask=rgba.getchannel("A"))
+        return flat
+    return img.convert("RGB")
+
+
+def prepare_image(img, max_edge: Optional[int] = None, crop: Optional[bool] = None) -> Tuple[bytes, str]:
+    """(encoded bytes, media type) of one image page, ready for Vision OCR.
+
+    Screenshots and diagrams (few colours) become PNG, which keeps text edges
+    sharp; photos become JPEG at IMAGE_OCR_JPEG_QUALITY."""
+    from PIL import Image, ImageOps
+
+    max_edge = settings.IMAGE_OCR_MAX_EDGE if max_edge is None else max_edge
+    crop = settings.IMAGE_OCR_CROP if crop is None else crop
+    img = _flatten(ImageOps.exif_transpose(img))
+    if crop:
+        box = _content_box(img)
+        if box is not None:
+            img = img.crop(box)
+    if max(img.size) > max_edge:
+        img.thumbnail((max_edge, max_edge), Image.LANCZOS)
+    buf = io.BytesIO()
+    if img.getcolors(256) is not None:
+        img.save(buf, "PNG")
+        return buf.getvalue(), "image/png"
+    img.save(buf, "JPEG", quality=settings.IMAGE_OCR_JPEG_QUALITY, optimize=True)
+    return buf.getvalue(), "image/jpeg"
+
+
+def image_text(path: str, builder: TextBuilder, ocr: Callable[[bytes, str], str],
+               max_pages: Optional[int] = None, workers: Optional[int] = None) -> TextBuilder:
+    """OCR an image file with `ocr(data, media_type)` and add the text to `builder`.
+
+    Multi-page TIFF/HEIC pages (up to `max_pages`) are prepared and OCR'd on a
+    thread pool — latency is that of the slowest page — and added in order."""
+    max_pages = settings.IMAGE_OCR_MAX_PAGES if max_pages is None else max_pages
+    workers = settings.IMAGE_OCR_WORKERS if workers is None else workers
+    original = os.path.getsize(path)
+    with _open_image(path) as img:
+        fmt = img.format
+        total = getattr(img, "n_frames", 1) if fmt in _MULTI_PAGE else 1
+        pages = []
+        for i in range(min(total, max_pages)):
+            img.seek(i)
+            pages.append(img.copy())
+        builder.truncated = builder.truncated or total > max_pages
+
+    def _page(page) -> str:
+        with timing.span("image.prepare"):
+            data, media_type = prepare_image(page)
+        # A small native image that needed no resizing/cropping is often
+        # smaller as uploaded than re-encoded
+        if len(pages) == 1 and fmt in _VISION_NATIVE and len(data) >= original and \
+                max(page.size) <= settings.IMAGE_OCR_MAX_EDGE:
+            with open(path, "rb") as fh:
+                data, media_type = fh.read(), _VISION_NATIVE[fmt]
+        print(f"[extract] image {page.width}x{page.height} {original // 1024}KB → "
+              f"{media_type} {len(data) // 1024}KB")
+        return ocr(data, media_type)
+
+    if len(pages) == 1:
+        builder.add(_page(pages[0]))
+        return builder
+    pool = ThreadPoolExecutor(max_workers=max(1, min(workers, len(pages))), thread_name_prefix="ocr")
+    futures = [pool.submit(_page, page) for page in pages]
+    try:
+        for i, future in enumerate(futures, 1):
+            if not (builder.line(f"=== Page {i} ===") and builder.line(future.result().strip())):
+                break
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)   # builder full: skip the pages not yet sent
+    return builder
@@ -0,0 +1,142 @@
+"""
+On-disk cache of extracted document text, keyed by upload content.
+
+Users re-upload the same job descriptions, decks and screenshots, and each
+repeat used to re-parse the PDF or re-run Vision OCR. save_upload() hashes
+the upload (SHA-256) while streaming it to disk; the extracted text is
+stored under that digest — plus the extension, the extraction limits and
+the OCR settings, which change what gets extracted — so a repeat upload
+skips extraction entirely, whatever its filename. Bump EXTRACTOR_VERSION
+when an extractor changes its output for the same settings.
+
+Entries are plain UTF-8 files in EXTRACT_CACHE_DIR, shared by every worker
+on the host. A hit touches the file's mtime; when a write takes the
+directory past EXTRACT_CACHE_MAX_BYTES the least recently used files are
+removed first. EXTRACT_CACHE_MAX_BYTES=0 turns the cache off.
+"""
+import hashlib
+import os
+import tempfile
+import threading
+from typing import List, Optional, Tuple
+
+from app.core.config import settings
+
+_SUFFIX = ".txt"
+EXTRACTOR_VERSION = 1
+
+
+class DiskLRU:
+    """Size-bounded LRU of key -> text, one file per entry, recency by mtime."""
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + _SUFFIX)
+
+    def get(self, key: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                text = fh.read()
+            os.utime(path)   # mark as recently used
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        """Store `text` (atomically — readers never see a partial file), then evict."""
+        if not self.enabled:
+            return
+        data = text.encode("utf-8")
+        if len(data) > self.max_bytes:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".part")
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    fh.write(data)
+                os.replace(tmp, self._path(key))
+            except BaseException:
+                os.remove(tmp)
+                raise
+            self._evict()
+        except OSError as exc:   # a full or read-only disk costs the cache, not the upload
+            print(f"[extract-cache] write failed: {exc}")
+
+    def _entries(self) -> List[Tuple[int, str, int]]:
+        """(mtime_ns, path, size) of every entry, least recently used first."""
+        out = []
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.endswith(_SUFFIX):
+                        try:
+                            st = entry.stat()
+                        except FileNotFoundError:   # evicted by another worker
+                            continue
+                        out.append((st.st_mtime_ns, entry.path, st.st_size))
+        except FileNotFoundError:
+            return []
+        out.sort()
+        return out
+
+    def _evict(self) -> None:
+        with self._lock:
+            entries = self._entries()
+            total = sum(size for _, _, size in entries)
+            for _, path, size in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            for _, path, _ in self._entries():
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+    def stats(self) -> dict:
+        entries = self._entries()
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {"entries": len(entries), "bytes": sum(size for _, _, size in entries),
+                "hits": hits, "misses": misses,
+                "hit_ratio": round(hits / total, 3) if total else 0.0}
+
+
+def cache_key(digest: str, filename: str) -> str:
+    """Key for the text of an upload with SHA-256 `digest`, under the current extraction settings."""
+    ext = filename.lower().rsplit(".", 1)[-1] if "." in filename else ""
+    raw = ":".join(str(part) for part in (
+        EXTRACTOR_VERSION, digest, ext, settings.EXTRACT_MAX_CHARS, settings.PDF_MAX_PAGES,
+        settings.IMAGE_OCR_MODEL, settings.IMAGE_OCR_MAX_EDGE, settings.IMAGE_OCR_JPEG_QUALITY,
+        settings.IMAGE_OCR_CROP, settings.IMAGE_OCR_MAX_PAGES))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+extract_cache = DiskLRU(settings.EXTRACT_CACHE_DIR or os.path.join(tempfile.gettempdir(), "workscanai-extract-cache"),
+                        settings.EXTRACT_CACHE_MAX_BYTES)
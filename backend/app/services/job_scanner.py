@@ -7,18 +7,16 @@ locally-assembled fallback workflow from category templates.
 import os
 import json
 import re
-from anthropic import Anthropic
 from typing import List, Dict, Optional
 
+from app.core import http_clients, timing
+from app.services.llm_client import get_llm_client
 from app.services.n8n_template_client import N8nTemplateClient
 
 
 class JobScanner:
     def __init__(self):
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if not api_key:
-            raise ValueError("ANTHROPIC_API_KEY not found in environment")
-        self.client = Anthropic(api_key=api_key)
+        self.client = get_llm_client()
         self.tavily_api_key = os.getenv("TAVILY_API_KEY")
 
     # ------------------------------------------------------------------
@@ -83,22 +81,21 @@ class JobScanner:
             return f"No web search available. Use training knowledge for: {job_title}"
 
         try:
-            import httpx
             query = f"{job_title} daily tasks responsibilities workflow"
             if industry:
                 query += f" {industry} industry"
 
-            response = httpx.post(
-                "https://api.tavily.com/search",
-                json={
-                    "api_key": self.tavily_api_key,
-                    "query": query,
-                    "search_depth": "basic",
-                    "max_results": 5,
-                    "include_answer": True,
-                },
-                timeout=15.0,
-            )
+            with timing.span("tavily"):
+                response = http_clients.get("tavily").post(
+                    "https://api.tavily.com/search",
+                    json={
+                        "api_key": self.tavily_api_key,
+                        "query": query,
+                        "search_depth": "basic",
+                        "max_results": 5,
+                        "include_answer": True,
+                    },
+                )
             data = response.json()
 
             # Combine answer + top result snippets
@@ -145,12 +142,13 @@ class JobScanner:
         )
 
         try:
-            message = self.client.messages.create(
-                model="claude-haiku-4-5-20251001",
-                max_tokens=2000,
-                messages=[{"role": "user", "content": prompt}],
-                timeout=30.0,
-            )
+            with timing.span("llm.extract", model="claude-haiku-4-5-20251001"):
+                message = self.client.messages.create(
+                    model="claude-haiku-4-5-20251001",
+                    max_tokens=2000,
+                    messages=[{"role": "user", "content": prompt}],
+                    timeout=30.0,
+                )
             raw = message.content[0].text
             return self._parse_tasks(raw)
         except Exception as e:
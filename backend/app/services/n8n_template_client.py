@@ -27,8 +27,13 @@ ARCHITECTURE (final, after research):
 """
 
 from __future__ import annotations
+import hashlib
+import json
+import os
+import re
 import uuid
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 _COL_W    = 1000  # horizontal gap between task columns
 _Y_START  = 380   # y where node chains begin (below top sticky)
@@ -1461,140 +1466,391 @@ _ALIASES: Dict[str, str] = {
 }
 
 
+# ---------------------------------------------------------------------------
+# CATEGORY RESOLUTION — keyword indexes compiled once at import time
+# ---------------------------------------------------------------------------
+
+class _TermIndex:
+    """
+    Finds every term of a fixed vocabulary in a text with one regex pass.
+
+    All terms are alternatives of a single pattern, tried longest-first
+    inside a lookahead so that a match is attempted at every position and
+    overlapping terms are all found ("compliancecommerce" holds both
+    "compliance" and "ecommerce"); the matched text is mapped back to its
+    term. The longest match at a position hides the terms it contains
+    ("email campaign" contains "email" and "campaign"); those are recorded
+    through a precomputed implied-term table.
+
+    word_start=True anchors terms at the start of a word and lets them run on
+    as stems ("anomal" matches "anomalies", "doc" matches "documents");
+    two-letter terms must then be whole words (or plurals) so "pr" matches
+    "PRs" but not "product". A space in a term matches a space, hyphen, slash or underscore
+    ("drop off" matches "drop-offs").
+    """
+
+    _SEP = str.maketrans("-/_\t\n\r", "      ")
+
+    def __init__(self, terms, word_start: bool):
+        self.terms = tuple(terms)
+        pats = [self._pattern(t, word_start) for t in self.terms]
+        longest_first = sorted(range(len(pats)), key=lambda i: -len(self.terms[i]))
+        self._re = re.compile("(?=(" + "|".join(pats[i] for i in longest_first) + "))")
+        self._lookup = {t.translate(self._SEP): i for i, t in enumerate(self.terms)}
+        compiled = [re.compile(p) for p in pats]
+        # the trailing "x" keeps a whole-word term from matching at the very
+        # end of a stem ("log" must not be implied by "access log" in "access logs")
+        self._implied = tuple(
+            frozenset({i} | {j for j, cp in enumerate(compiled) if cp.search(term + "x")})
+            for i, term in enumerate(self.terms)
+        )
+
+    @staticmethod
+    def _pattern(term: str, word_start: bool) -> str:
+        pat = r"[\s/_-]".join(re.escape(w) for w in term.split(" "))
+        if word_start:
+            pat = r"\b" + pat + (r"(?=s?\b)" if len(term) <= 2 else "")
+        return pat
+
+    def find(self, text: str) -> set:
+        """Indexes (into self.terms) of every term occurring in `text`."""
+        hits: set = set()
+        for match in self._re.findall(text):
+            hits |= self._implied[self._lookup[match.translate(self._SEP)]]
+        return hits
+
+
+_CATEGORY_INDEX: Dict[str, str] = {**_ALIASES, **{key: key for key in _BUILDERS}}
+_BUILDER_KEYS = tuple(_BUILDERS)
+_KEY_TERMS = _TermIndex(_BUILDER_KEYS, word_start=False)
+# every substring of every key -> position of the first key containing it
+_KEY_SUBSTRINGS: Dict[str, int] = {}
+for _pos, _key in enumerate(_BUILDER_KEYS):
+    for _i in range(len(_key)):
+        for _j in range(_i + 1, len(_key) + 1):
+            _KEY_SUBSTRINGS.setdefault(_key[_i:_j], _pos)
+
+
 def _resolve_category(category: str) -> str:
     """Normalize a category string to a known key."""
-    c = (category or "general").lower().strip().replace(" ", "_").replace("-", "_")
-    if c in _BUILDERS:
-        return c
-    if c in _ALIASES:
-        return _ALIASES[c]
-    # Fuzzy: check if any known key is a substring
-    for key in _BUILDERS:
-        if key in c or c in key:
-            return key
+    # blank input is "general" (the old scan matched "" inside the first key)
+    c = (category or "").lower().strip().replace(" ", "_").replace("-", "_") or "general"
+    hit = _CATEGORY_INDEX.get(c)
+    if hit:
+        return hit
+    # Fuzzy: the first known key that contains, or is contained in, the value
+    positions = _KEY_TERMS.find(c)
+    if c in _KEY_SUBSTRINGS:
+        positions.add(_KEY_SUBSTRINGS[c])
+    return _BUILDER_KEYS[min(positions)] if positions else "general"
+
+
+# Free-text category guess — rules are checked in order and the first one
+# with a hit wins (the order of the original if-chain). A str alternative is
+# one keyword; a tuple needs all of them — the old `a or b and c` lines,
+# written out the way Python grouped them.
+_GUESS_RULES: Tuple[Tuple[str, tuple], ...] = (
+    ("management",          ("jira", "backlog", "sprint")),
+    ("devops",              (("github", "pr"), ("github", "build"))),
+    ("design",              ("figma", "design comment")),
+    ("sales",               ("hubspot", "deal", "crm")),
+    ("customer_support",    ("ticket", "support", "triage")),
+    ("recruiting",          ("applicant", "recruit", "candidate")),
+    ("onboarding",          ("onboard", "new hire")),
+    ("finance",             ("expense", "anomal", "budget")),
+    ("legal",               ("contract", ("expir", "legal"))),
+    ("compliance",          ("compliance", ("deadline", "regul"))),
+    ("product",             ("feedback", ("notion", "product"))),
+    ("product_analytics",   ("funnel", "drop off", "retention")),
+    ("marketing",           ("campaign", "roi", "marketing")),
+    ("email_marketing",     ("open rate", "email campaign")),
+    ("pr_comms",            ("mention", "brand", "sentiment")),
+    ("seo",                 ("rank", "seo", "search console")),
+    ("social_media",        ("social", "engagement", "instagram")),
+    ("content",             ("content", "post", "publish")),
+    ("account_management",  ("at risk account", "csm", "renewal")),
+    ("sales_ops",           ("quota", "attainment", "forecast")),
+    ("data_engineering",    (("pipeline", "etl"), "data job")),
+    ("cloud_infra",         ("cloud cost", "aws", "spike")),
+    ("security",            ("security", "login", "access log")),
+    ("ecommerce",           ("order", "ecommerce", "sku")),
+    ("logistics",           ("shipment", "logistics", "delivery")),
+    ("procurement",         ("purchase order", "vendor", "procurement")),
+    ("investor_relations",  ("investor", "fundrais", "board")),
+    ("executive",           ("executive brief", "daily brief")),
+    ("academic",            ("paper", "grant", "academic")),
+    ("healthcare_admin",    ("appointment", "patient", "clinic")),
+    ("communication",       ("gmail", "email", "inbox")),
+    ("scheduling",          ("calendar", "meeting", "schedule")),
+    ("data_entry",          ("webhook", "form", "entry")),
+    ("research",            ("research", "fetch", "rss")),
+    ("analysis",            ("analys", "kpi", "metric")),
+    ("reporting",           ("report", "sheet", "summary")),
+    ("documentation",       ("notion", "doc", "stale")),
+)
+
+
+def _compile_guess_rules(rules):
+    terms: Dict[str, int] = {}
+    compiled = []
+    for cat, alternatives in rules:
+        alts = []
+        for alt in alternatives:
+            words = (alt,) if isinstance(alt, str) else alt
+            alts.append(frozenset(terms.setdefault(w, len(terms)) for w in words))
+        compiled.append((cat, tuple(alts)))
+    return _TermIndex(terms, word_start=True), tuple(compiled)
+
+
+_GUESS_TERMS, _GUESS_COMPILED = _compile_guess_rules(_GUESS_RULES)
+
+
+@lru_cache(maxsize=2048)
+def _guess_cat(text: str) -> str:
+    """Infer category from description text when not explicitly stored."""
+    hits = _GUESS_TERMS.find((text or "").lower())
+    if hits:
+        for cat, alternatives in _GUESS_COMPILED:
+            for needed in alternatives:
+                if needed <= hits:
+                    return cat
     return "general"
 
 
 # ---------------------------------------------------------------------------
-# CANVAS BUILDER
+# COMPILED TEMPLATES — every builder runs once at import time
 # ---------------------------------------------------------------------------
+# For a given category the node chain is identical for every task except the
+# task name and the node / assignment IDs. Each builder is therefore run once
+# with a placeholder task name, and the IDs it generated are swapped for
+# numbered placeholders: the template is plain JSON-shaped data. A task is
+# instantiated by one recursive copy that fills the placeholders in, so every
+# instance — connections included — is fully its own and free to mutate.
 
-def _merge_connections(conn_list: List[dict]) -> dict:
-    merged: dict = {}
-    for conns in conn_list:
-        for src, data in conns.items():
-            if src not in merged:
-                merged[src] = {"main": [[]]}
-            for edge in data.get("main", [[]])[0]:
-                merged[src]["main"][0].append(edge)
-    return merged
+_NAME_SLOT = "@@WSAI_NAME@@"
+_SLOT_RE = re.compile(r"@@WSAI_(NAME|ID_\d+)@@")
+_UUID_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}")
 
 
-def build_canvas(job_title: str, tasks: List[dict]) -> dict:
+class _Template(NamedTuple):
+    nodes: List[dict]     # with placeholders — never handed out, only copied via _fill
+    connections: dict
+    n_ids: int
+
+
+def _compile_template(builder) -> _Template:
+    """Run `builder` once and turn its output into a placeholder template."""
+    nodes, conns = builder(_NAME_SLOT, 0)
+    slots: Dict[str, int] = {}
+
+    def mark(v):
+        if isinstance(v, str):
+            return _UUID_RE.sub(lambda m: f"@@WSAI_ID_{slots.setdefault(m.group(), len(slots))}@@", v)
+        if isinstance(v, dict):
+            return {k: mark(x) for k, x in v.items()}
+        if isinstance(v, list):
+            return [mark(x) for x in v]
+        return v
+
+    return _Template(mark(nodes), mark(conns), len(slots))
+
+
+def _fill(v, name: str, ids: List[str]):
+    """Deep copy of template data `v` with the placeholders filled in."""
+    if isinstance(v, str):
+        if "@@WSAI_" not in v:
+            return v
+        return _SLOT_RE.sub(lambda m: name if m.group(1) == "NAME" else ids[int(m.group(1)[3:])], v)
+    if isinstance(v, dict):
+        return {k: _fill(x, name, ids) for k, x in v.items()}
+    if isinstance(v, list):
+        return [_fill(x, name, ids) for x in v]
+    return v
+
+
+_TEMPLATES: Dict[str, _Template] = {cat: _compile_template(b) for cat, b in _BUILDERS.items()}
+
+
+def _bulk_uuid4(n: int, seed: Optional[str] = None) -> List[str]:
+    """n version-4-shaped UUID strings from a single read (uuid4() reads once per ID).
+
+    With a seed the IDs are derived from it instead of os.urandom, so the
+    same canvas input always yields the same canvas — identical canvases
+    then deduplicate in storage (see app.services.canvas_store).
     """
-    Build one merged importable n8n workflow for all tasks.
+    h = hashlib.shake_128(seed.encode()).hexdigest(16 * n) if seed is not None else os.urandom(16 * n).hex()
+    return [f"{h[i:i+8]}-{h[i+8:i+12]}-4{h[i+13:i+16]}-{'89ab'[int(h[i+16], 16) & 3]}{h[i+17:i+20]}-{h[i+20:i+32]}"
+            for i in range(0, 32 * n, 32)]
+
+
+def _row_seed(job_title: str, idx: int, task_name: str, cat: str) -> str:
+    """ID seed for one canvas row — shared by suggestions and canvas rows."""
+    return f"{job_title}\x1f{idx}\x1f{task_name}\x1f{cat}"
+
+
+def _instantiate(cat: str, task_name: str, x0: int = 0,
+                 seed: Optional[str] = None) -> Tuple[List[dict], dict]:
+    """(nodes, connections) for one task — same output as the category's builder."""
+    tpl = _TEMPLATES.get(cat) or _TEMPLATES["general"]
+    ids = _bulk_uuid4(tpl.n_ids, seed)
+    nodes = _fill(tpl.nodes, task_name, ids)
+    if x0:
+        for node in nodes:
+            node["position"][0] += x0
+    return nodes, _fill(tpl.connections, task_name, ids)
+
+
+# ---------------------------------------------------------------------------
+# CANVAS BUILDER
+# ---------------------------------------------------------------------------
+
+class CanvasBuilder:
+    """
+    Builds one merged importable n8n workflow, one task row at a time.
     Each task gets its own horizontal row with a sticky note header.
     Rows are stacked vertically so they never overlap.
-    Returns a complete importable n8n workflow JSON dict.
+
+    Working node names are prefixed with T{n}: when the node is created:
+    n8n connections are keyed by node name, so duplicate names across rows
+    cause cross-wiring. Edges are written straight into the final
+    `connections` adjacency, since prefixed names never collide across rows.
     """
-    all_nodes: List[dict] = []
-    all_conns: List[dict] = []
-    num = len(tasks)
+
     # Layout constants for vertical stacking
-    _HEADER_H   = 220   # top canvas header sticky height
-    _HEADER_GAP = 80    # gap below header before first task
-    _TASK_STICKY_H = 180  # per-task sticky note height (4 lines + padding)
-    _TASK_NODE_H   = 200  # vertical space occupied by the node row
-    _TASK_GAP      = 120  # gap between task blocks (generous isolation)
-    _ROW_H = _TASK_STICKY_H + 30 + _TASK_NODE_H + _TASK_GAP  # total height per task row
+    HEADER_H   = 220   # top canvas header sticky height
+    HEADER_GAP = 80    # gap below header before first task
+    TASK_STICKY_H = 180  # per-task sticky note height (4 lines + padding)
+    TASK_NODE_H   = 200  # vertical space occupied by the node row
+    TASK_GAP      = 120  # gap between task blocks (generous isolation)
+    ROW_H = TASK_STICKY_H + 30 + TASK_NODE_H + TASK_GAP  # total height per task row
     CANVAS_W = 1800     # fixed canvas width (wide enough for any node chain)
     COLORS = [3, 4, 5, 6, 2, 1]
 
-    # Top canvas header sticky note
-    all_nodes.append(_sticky(
-        _uid(),
-        f"\U0001f916 WorkScanAI \u2014 {job_title}",
-        0, 0,
-        f"# \U0001f916 WorkScanAI Automation Canvas\n"
-        f"**Role:** {job_title} | **{num} automation workflows** below\n\n"
-        f"**Setup:** Add credentials in each node (Slack, Gmail, Google Sheets, Jira, GitHub, HubSpot).\n"
-        f"Set n8n variables: `SPREADSHEET_ID`, `JIRA_PROJECT`, `REPORT_EMAIL`, `GITHUB_OWNER`, `GITHUB_REPO`.\n"
-        f"Each row is independent \u2014 activate the ones matching your stack.",
-        color=7, w=CANVAS_W, h=_HEADER_H
-    ))
-
-    for idx, task in enumerate(tasks):
-        name  = task.get("name", f"Task {idx+1}")
-        cat   = _resolve_category(task.get("category", "general"))
-        freq  = task.get("frequency", "weekly")
-        color = COLORS[idx % len(COLORS)]
-        tools = _TOOLS.get(cat, "Schedule + HTTP + Slack")
-        builder = _BUILDERS.get(cat, _wf_general)
-
-        # y origin for this task row
-        y_row = _HEADER_H + _HEADER_GAP + idx * _ROW_H
-
+    def __init__(self, job_title: str):
+        self.job_title = job_title
+        self.nodes: List[dict] = []        # every node except the canvas header
+        self.connections: dict = {}
+        self.categories: Dict[str, None] = {}  # ordered set
+        self.rows = 0
+        self._header_id = _bulk_uuid4(1, f"{job_title}\x1fheader")[0]
+
+    def _start_row(self, name: str, cat: str, freq: str) -> Tuple[str, int, str]:
+        """Append the row's sticky note; return (name prefix, y of its working nodes, ID seed)."""
+        idx = self.rows
+        self.rows += 1
+        self.categories[cat] = None
+        y_row = self.HEADER_H + self.HEADER_GAP + idx * self.ROW_H
+        seed = _row_seed(self.job_title, idx, name, cat)
         # Per-task sticky note header (full width, above nodes)
-        all_nodes.append(_sticky(
-            _uid(),
+        self.nodes.append(_sticky(
+            _bulk_uuid4(1, seed + "\x1fsticky")[0],
             f"\U0001f4cc Task {idx+1}: {name[:50]}",
             0, y_row,
             f"## Task {idx+1}: {name}\n"
             f"**Category:** {cat} | **Frequency:** {freq}\n"
-            f"**Nodes:** {tools}\n"
+            f"**Nodes:** {_TOOLS.get(cat, 'Schedule + HTTP + Slack')}\n"
             f"Connect credentials then toggle Active \u2192",
-            color=color, w=CANVAS_W, h=_TASK_STICKY_H
+            color=self.COLORS[idx % len(self.COLORS)], w=self.CANVAS_W, h=self.TASK_STICKY_H
         ))
-
-        # Build nodes with x0=0 (builder places nodes relative to x0, y=_Y_START)
-        task_nodes, task_conns = builder(name, 0)
-
-        # Shift all non-sticky nodes to sit below this row's sticky note
-        y_nodes = y_row + _TASK_STICKY_H + 30
-        for node in task_nodes:
-            if "stickyNote" not in node["type"]:
-                node["position"][1] = y_nodes
-
-        # ── PREFIX all working node names with T{n}: so names are unique ──
-        # n8n connections are keyed by node name, so duplicate names across
-        # columns cause cross-wiring. Prefixing isolates each column cleanly.
-        prefix = f"T{idx+1}"
-        name_map: dict = {}
-        for node in task_nodes:
+        return f"T{idx+1}: ", y_row + self.TASK_STICKY_H + 30, seed
+
+    def add_task(self, name: str, category: str = "general", frequency: str = "weekly") -> None:
+        """Add a row built from the category's compiled template."""
+        cat = _resolve_category(category)
+        prefix, y, seed = self._start_row(name, cat, frequency)
+        nodes, conns = _instantiate(cat, name, seed=seed)
+        # fresh copies: rename and move in place
+        for node in nodes:
             if "stickyNote" not in node["type"]:
-                old = node["name"]
-                new = f"{prefix}: {old}"
-                name_map[old] = new
-                node["name"] = new
-
-        # Remap connection keys and target node references
-        prefixed_conns: dict = {}
-        for src, data in task_conns.items():
-            new_src = name_map.get(src, src)
-            new_targets = [
-                {**edge, "node": name_map.get(edge["node"], edge["node"])}
+                node["name"] = prefix + node["name"]
+                node["position"][1] = y
+        self.nodes.extend(nodes)
+        for src, data in conns.items():
+            for outputs in data["main"]:
+                for edge in outputs:
+                    edge["node"] = prefix + edge["node"]
+            self.connections[prefix + src] = data
+
+    def add_chain(self, name: str, cat: str, freq: str, nodes: List[dict], conns: dict) -> None:
+        """Add a row from an already-built chain (e.g. a suggestion's workflow_json).
+
+        The input is left untouched — it may be shared with the
+        suggested_templates payload — so each placed node is a copy.
+        """
+        prefix, y, _ = self._start_row(name, cat, freq)
+        names: Dict[str, str] = {}
+        for node in nodes:
+            if "stickyNote" in node["type"]:
+                self.nodes.append(node)
+                continue
+            names[node["name"]] = new = prefix + node["name"]
+            self.nodes.append({**node, "name": new, "position": [node["position"][0], y]})
+        for src, data in conns.items():
+            self.connections[names.get(src, src)] = {"main": [[
+                {**edge, "node": names.get(edge["node"], edge["node"])}
                 for edge in data["main"][0]
-            ]
-            prefixed_conns[new_src] = {"main": [new_targets]}
-        # ───────────────────────────────────────────────────────────────────
-
-        all_nodes.extend(task_nodes)
-        all_conns.append(prefixed_conns)
-
-    return {
-        "name": f"{job_title} \u2014 WorkScanAI Automation Canvas",
-        "nodes": all_nodes,
-        "connections": _merge_connections(all_conns),
-        "active": False,
-        "settings": {"executionOrder": "v1", "saveManualExecutions": True},
-        "meta": {
-            "generatedBy": "WorkScanAI",
-            "jobTitle": job_title,
-            "taskCount": num,
-            "categories": list({_resolve_category(t.get("category","general")) for t in tasks}),
-            "note": "Purpose-built automations. Each row = one task workflow. Add credentials to activate.",
-        },
-    }
+            ]]}
+
+    def _header(self) -> dict:
+        # Top canvas header sticky note
+        return _sticky(
+            self._header_id,
+            f"\U0001f916 WorkScanAI \u2014 {self.job_title}",
+            0, 0,
+            f"# \U0001f916 WorkScanAI Automation Canvas\n"
+            f"**Role:** {self.job_title} | **{self.rows} automation workflows** below\n\n"
+            f"**Setup:** Add credentials in each node (Slack, Gmail, Google Sheets, Jira, GitHub, HubSpot).\n"
+            f"Set n8n variables: `SPREADSHEET_ID`, `JIRA_PROJECT`, `REPORT_EMAIL`, `GITHUB_OWNER`, `GITHUB_REPO`.\n"
+            f"Each row is independent \u2014 activate the ones matching your stack.",
+            color=7, w=self.CANVAS_W, h=self.HEADER_H
+        )
+
+    @property
+    def name(self) -> str:
+        return f"{self.job_title} \u2014 WorkScanAI Automation Canvas"
+
+    def _envelope(self) -> dict:
+        return {
+            "name": self.name,
+            "nodes": None,
+            "connections": None,
+            "active": False,
+            "settings": {"executionOrder": "v1", "saveManualExecutions": True},
+            "meta": {
+                "generatedBy": "WorkScanAI",
+                "jobTitle": self.job_title,
+                "taskCount": self.rows,
+                "categories": list(self.categories),
+                "note": "Purpose-built automations. Each row = one task workflow. Add credentials to activate.",
+            },
+        }
+
+    def to_dict(self) -> dict:
+        """The complete importable n8n workflow JSON dict (shares this builder's nodes)."""
+        canvas = self._envelope()
+        canvas["nodes"] = [self._header(), *self.nodes]
+        canvas["connections"] = self.connections
+        return canvas
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+
+def build_canvas(job_title: str, tasks: List[dict]) -> dict:
+    """
+    Build one merged importable n8n workflow for all tasks.
+    Returns a complete importable n8n workflow JSON dict.
+    """
+    return canvas_builder(job_title, tasks).to_dict()
+
+
+def canvas_builder(job_title: str, tasks: List[dict]) -> CanvasBuilder:
+    """CanvasBuilder with one row per task, ready for to_dict() / to_json()."""
+    canvas = CanvasBuilder(job_title)
+    for idx, task in enumerate(tasks):
+        canvas.add_task(task.get("name", f"Task {idx+1}"),
+                        task.get("category", "general"), task.get("frequency", "weekly"))
+    return canvas
 
 
 # ---------------------------------------------------------------------------
@@ -1660,8 +1916,7 @@ class N8nTemplateClient:
         for idx, task in enumerate(tasks[:6]):
             name    = task.get("name", f"Task {idx+1}")
             cat     = _resolve_category(task.get("category", "general"))
-            builder = _BUILDERS.get(cat, _wf_general)
-            task_nodes, task_conns = builder(name, 0)
+            task_nodes, task_conns = _instantiate(cat, name, seed=_row_seed(job_title, idx, name, cat))
             reason  = _REASONS.get(cat, _REASONS["general"])
             tools   = _TOOLS.get(cat, "Schedule + HTTP + Slack")
             preview = [n["type"].split(".")[-1] for n in task_nodes if "stickyNote" not in n["type"]]
@@ -1676,57 +1931,29 @@ class N8nTemplateClient:
                 "workflow_json":    {"nodes": task_nodes, "connections": task_conns,
                                      "active": False, "settings": {"executionOrder": "v1"}},
                 "task_name":        name,
+                "category":         cat,
             })
         return suggested
 
     def build_merged_canvas(self, job_title: str, suggested_templates: List[dict]) -> dict:
-        """Merge suggested_templates into one importable n8n canvas."""
-        tasks = [{"name":     t.get("task_name", t.get("name", "")),
-                  "category": _guess_cat(t.get("relevance_reason","") + " " + t.get("description","")),
-                  "frequency":"weekly"}
-                 for t in suggested_templates]
-        return build_canvas(job_title, tasks)
-
-
-def _guess_cat(text: str) -> str:
-    """Infer category from description text when not explicitly stored."""
-    t = text.lower()
-    if "jira" in t or "backlog" in t or "sprint" in t:              return "management"
-    if "github" in t and ("pr" in t or "build" in t):               return "devops"
-    if "figma" in t or "design comment" in t:                       return "design"
-    if "hubspot" in t or "deal" in t or "crm" in t:                 return "sales"
-    if "ticket" in t or "support" in t or "triage" in t:            return "customer_support"
-    if "applicant" in t or "recruit" in t or "candidate" in t:      return "recruiting"
-    if "onboard" in t or "new hire" in t:                           return "onboarding"
-    if "expense" in t or "anomal" in t or "budget" in t:            return "finance"
-    if "contract" in t or "expir" in t and "legal" in t:            return "legal"
-    if "compliance" in t or "deadline" in t and "regul" in t:       return "compliance"
-    if "feedback" in t or "notion" in t and "product" in t:         return "product"
-    if "funnel" in t or "drop.off" in t or "retention" in t:        return "product_analytics"
-    if "campaign" in t or "roi" in t or "marketing" in t:           return "marketing"
-    if "open rate" in t or "email campaign" in t:                   return "email_marketing"
-    if "mention" in t or "brand" in t or "sentiment" in t:          return "pr_comms"
-    if "rank" in t or "seo" in t or "search console" in t:          return "seo"
-    if "social" in t or "engagement" in t or "instagram" in t:      return "social_media"
-    if "content" in t or "post" in t or "publish" in t:             return "content"
-    if "at.risk account" in t or "csm" in t or "renewal" in t:      return "account_management"
-    if "quota" in t or "attainment" in t or "forecast" in t:        return "sales_ops"
-    if "pipeline" in t and "etl" in t or "data job" in t:           return "data_engineering"
-    if "cloud cost" in t or "aws" in t or "spike" in t:             return "cloud_infra"
-    if "security" in t or "login" in t or "access log" in t:        return "security"
-    if "order" in t or "ecommerce" in t or "sku" in t:              return "ecommerce"
-    if "shipment" in t or "logistics" in t or "delivery" in t:      return "logistics"
-    if "purchase order" in t or "vendor" in t or "procurement" in t: return "procurement"
-    if "investor" in t or "fundrais" in t or "board" in t:          return "investor_relations"
-    if "executive brief" in t or "daily brief" in t:                return "executive"
-    if "paper" in t or "grant" in t or "academic" in t:             return "academic"
-    if "appointment" in t or "patient" in t or "clinic" in t:       return "healthcare_admin"
-    if "gmail" in t or "email" in t or "inbox" in t:                return "communication"
-    if "calendar" in t or "meeting" in t or "schedule" in t:        return "scheduling"
-    if "webhook" in t or "form" in t or "entry" in t:               return "data_entry"
-    if "research" in t or "fetch" in t or "rss" in t:               return "research"
-    if "analys" in t or "kpi" in t or "metric" in t:                return "analysis"
-    if "report" in t or "sheet" in t or "summary" in t:             return "reporting"
-    if "notion" in t or "doc" in t or "stale" in t:                 return "documentation"
-    return "general"
+        """Merge suggested_templates into one importable n8n canvas.
+
+        Suggestions from get_curated_templates already carry their category and
+        built nodes, so they are laid out as-is; older dicts without them fall
+        back to guessing the category from the description.
+        """
+        return self.merged_canvas_builder(job_title, suggested_templates).to_dict()
+
+    def merged_canvas_builder(self, job_title: str, suggested_templates: List[dict]) -> CanvasBuilder:
+        """Same canvas as build_merged_canvas, as a CanvasBuilder."""
+        canvas = CanvasBuilder(job_title)
+        for t in suggested_templates:
+            name = t.get("task_name", t.get("name", ""))
+            cat  = t.get("category") or _guess_cat(t.get("relevance_reason","") + " " + t.get("description",""))
+            wf   = t.get("workflow_json") or {}
+            if wf.get("nodes") and "category" in t:
+                canvas.add_chain(name, cat, "weekly", wf["nodes"], wf.get("connections", {}))
+            else:
+                canvas.add_task(name, cat)
+        return canvas
 
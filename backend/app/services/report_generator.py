@@ -26,8 +26,11 @@ from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from reportlab.pdfgen import canvas as rl_canvas
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List
 
+from app.core import timing
+
 BLUE        = colors.HexColor('#0071e3')
 BLUE_LIGHT  = colors.HexColor('#e8f1fc')
 GRAY_900    = colors.HexColor('#1d1d1f')
@@ -155,6 +158,80 @@ def split_rec(text):
     return text, None
 
 
+# ── PDF style registry ──────────────────────────────────────────────────────
+# getSampleStyleSheet() plus every ParagraphStyle / TableStyle used to be rebuilt
+# on each render — and inside the per-task loops, once per task. Styles are never
+# mutated after a flowable takes them, so they are built once per process and
+# shared: the same name and attributes → the same style object.
+_BASE_STYLES = getSampleStyleSheet()
+_PARA_STYLES: Dict[tuple, ParagraphStyle] = {}
+_TABLE_STYLES: Dict[tuple, TableStyle] = {}
+
+
+def _freeze(v):
+    """Make a style value hashable (TableStyle commands nest lists)."""
+    if isinstance(v, (list, tuple)):
+        return tuple(_freeze(x) for x in v)
+    return v
+
+
+def pdf_style(name, parent='Normal', **kw):
+    """Shared ParagraphStyle for this name and these attributes (built on first use)."""
+    key = (name, parent, tuple(sorted((k, _freeze(v)) for k, v in kw.items())))
+    st = _PARA_STYLES.get(key)
+    if st is None:
+        st = _PARA_STYLES.setdefault(key, ParagraphStyle(name, parent=_BASE_STYLES[parent], **kw))
+    return st
+
+
+def pdf_table_style(cmds):
+    """Shared TableStyle for this command list (built on first use)."""
+    key = _freeze(cmds)
+    ts = _TABLE_STYLES.get(key)
+    if ts is None:
+        ts = _TABLE_STYLES.setdefault(key, TableStyle(cmds))
+    return ts
+
+
+@lru_cache(maxsize=None)
+def pdf_stylesheet():
+    """The named paragraph styles every PDF section uses (built once)."""
+    return {
+        'section_title': pdf_style('st', fontSize=18, leading=22, textColor=GRAY_900,
+                                   spaceBefore=18, spaceAfter=8, fontName='Helvetica-Bold'),
+        'label':  pdf_style('lb', fontSize=9, leading=12, textColor=GRAY_600,
+                            fontName='Helvetica-Bold', spaceAfter=2),
+        'body':   pdf_style('bo', fontSize=10, leading=15, textColor=GRAY_900,
+                            fontName='Helvetica', spaceAfter=6),
+        'rec':    pdf_style('rc', fontSize=10, leading=15, textColor=GRAY_900,
+                            fontName='Helvetica', leftIndent=10, spaceAfter=8),
+        'cover_sub':  pdf_style('cs', fontSize=13, leading=18, textColor=GRAY_600,
+                                spaceAfter=4, fontName='Helvetica'),
+        'cover_meta': pdf_style('cm', fontSize=10, leading=14, textColor=GRAY_600,
+                                fontName='Helvetica'),
+    }
+
+
+# ── PDF flowable factory ────────────────────────────────────────────────────
+# Flowables carry per-render layout state so they can't be shared, but the
+# recurring ones are built here from the shared styles above.
+
+def pdf_para(text, name='p', parent='Normal', **kw):
+    return Paragraph(text, pdf_style(name, parent, **kw))
+
+
+def pdf_section_header(title, W, space_after=10):
+    """Section title + hairline rule, as a list ready to extend a story with."""
+    return [Paragraph(title, pdf_stylesheet()['section_title']),
+            HRFlowable(width=W, thickness=0.5, color=GRAY_200, spaceAfter=space_after)]
+
+
+def pdf_color_bar(W, color, height=4):
+    """Thin full-width colour band used at the top of covers and sections."""
+    return Table([['']], colWidths=[W], rowHeights=[height],
+                 style=pdf_table_style([('BACKGROUND', (0, 0), (-1, -1), color)]))
+
+
 class NumberedCanvas(rl_canvas.Canvas):
     def __init__(self, *args, **kwargs):
         rl_canvas.Canvas.__init__(self, *args, **kwargs)
@@ -173,17 +250,20 @@ class NumberedCanvas(rl_canvas.Canvas):
         rl_canvas.Canvas.save(self)
 
     def draw_page_footer(self, page_count):
-        self.saveState()
-        w, h = A4
-        self.setStrokeColor(GRAY_200); self.setLineWidth(0.5)
-        self.line(18*mm, 16*mm, w - 18*mm, 16*mm)
-        self.setFont('Helvetica', 8); self.setFillColor(GRAY_600)
-        self.drawString(18*mm, 11*mm, _tr(_ACTIVE_LOCALE, 'WorkScanAI — AI-Powered Workflow Analysis',
-                                          'WorkScanAI — KI-gestützte Workflow-Analyse'))
-        self.drawRightString(w - 18*mm, 11*mm,
-            _tr(_ACTIVE_LOCALE, f'Page {self._pageNumber} of {page_count}',
-                f'Seite {self._pageNumber} von {page_count}'))
-        self.restoreState()
+        _draw_page_footer(self, self._pageNumber, page_count, _ACTIVE_LOCALE)
+
+
+def _draw_page_footer(c, page_no, page_count, loc='en'):
+    c.saveState()
+    w, h = A4
+    c.setStrokeColor(GRAY_200); c.setLineWidth(0.5)
+    c.line(18*mm, 16*mm, w - 18*mm, 16*mm)
+    c.setFont('Helvetica', 8); c.setFillColor(GRAY_600)
+    c.drawString(18*mm, 11*mm, _tr(loc, 'WorkScanAI — AI-Powered Workflow Analysis',
+                                   'WorkScanAI — KI-gestützte Workflow-Analyse'))
+    c.drawRightString(w - 18*mm, 11*mm,
+        _tr(loc, f'Page {page_no} of {page_count}', f'Seite {page_no} von {page_count}'))
+    c.restoreState()
 
 
 class ReportGenerator:
@@ -219,7 +299,7 @@ class ReportGenerator:
                     style_fn(f'tb{idx}', fontSize=16, fontName='Helvetica-Bold',
                              textColor=tc, alignment=TA_CENTER, leading=20)),
             ]], colWidths=[num_col, name_col, score_col],
-            style=TableStyle([('BACKGROUND',(0,0),(-1,-1),tc_light),
+            style=pdf_table_style([('BACKGROUND',(0,0),(-1,-1),tc_light),
                 ('TOPPADDING',(0,0),(-1,-1),10),('BOTTOMPADDING',(0,0),(-1,-1),10),
                 ('LEFTPADDING',(0,0),(0,-1),6),('LEFTPADDING',(1,0),(1,-1),8),
                 ('RIGHTPADDING',(2,0),(2,-1),10),
@@ -241,7 +321,7 @@ class ReportGenerator:
             block.append(Table(
                 [[Paragraph(f'<b>{k}</b>', ST['label']), Paragraph(v, ST['body'])] for k, v in details],
                 colWidths=[42*mm, W-42*mm],
-                style=TableStyle([('TOPPADDING',(0,0),(-1,-1),5),('BOTTOMPADDING',(0,0),(-1,-1),5),
+                style=pdf_table_style([('TOPPADDING',(0,0),(-1,-1),5),('BOTTOMPADDING',(0,0),(-1,-1),5),
                     ('LEFTPADDING',(0,0),(-1,-1),10),('RIGHTPADDING',(0,0),(-1,-1),10),
                     ('VALIGN',(0,0),(-1,-1),'TOP'),
                     ('ROWBACKGROUNDS',(0,0),(-1,-1),[WHITE, GRAY_100]),
@@ -256,7 +336,7 @@ class ReportGenerator:
                     Paragraph(rec_html, style_fn(f'rec{idx}', fontSize=11, fontName='Helvetica',
                         textColor=GRAY_900, leading=16, spaceAfter=0)),
                 ]], colWidths=[42*mm, W-42*mm],
-                style=TableStyle([('BACKGROUND',(0,0),(-1,-1),BLUE_LIGHT),
+                style=pdf_table_style([('BACKGROUND',(0,0),(-1,-1),BLUE_LIGHT),
                     ('TOPPADDING',(0,0),(-1,-1),10),('BOTTOMPADDING',(0,0),(-1,-1),10),
                     ('LEFTPADDING',(0,0),(-1,-1),10),('VALIGN',(0,0),(-1,-1),'TOP'),
                     ('LINEBEFORE',(0,0),(0,-1),3,BLUE)])))
@@ -272,7 +352,7 @@ class ReportGenerator:
                         fontName='Helvetica-Bold', textColor=GRAY_900, alignment=TA_RIGHT)),
                 ] for lbl2, val in sub_vals]
                 block.append(Table(sub_cells, colWidths=[W*0.55, W*0.45],
-                    style=TableStyle([('TOPPADDING',(0,0),(-1,-1),3),('BOTTOMPADDING',(0,0),(-1,-1),3),
+                    style=pdf_table_style([('TOPPADDING',(0,0),(-1,-1),3),('BOTTOMPADDING',(0,0),(-1,-1),3),
                         ('LEFTPADDING',(0,0),(-1,-1),10),('RIGHTPADDING',(0,0),(-1,-1),10),
                         ('BACKGROUND',(0,0),(-1,-1),GRAY_100),('LINEBELOW',(0,0),(-1,-1),0.3,GRAY_200)])))
 
@@ -296,7 +376,7 @@ class ReportGenerator:
                     Paragraph(f'<b>{_tr(loc,"Risk","Risiko")}</b>', style_fn(f'rk{idx}', fontSize=9, fontName='Helvetica-Bold', textColor=rc_fg, leading=12)),
                     Paragraph(risk_flag, style_fn(f'rf{idx}', fontSize=9, fontName='Helvetica', textColor=GRAY_900, leading=13)),
                 ]], colWidths=[18*mm, W-18*mm],
-                style=TableStyle([('BACKGROUND',(0,0),(-1,-1),rc_bg),
+                style=pdf_table_style([('BACKGROUND',(0,0),(-1,-1),rc_bg),
                     ('TOPPADDING',(0,0),(-1,-1),6),('BOTTOMPADDING',(0,0),(-1,-1),6),
                     ('LEFTPADDING',(0,0),(-1,-1),10),('VALIGN',(0,0),(-1,-1),'MIDDLE'),
                     ('LINEBEFORE',(0,0),(0,-1),3,rc_fg)])))
@@ -329,7 +409,7 @@ class ReportGenerator:
                         Paragraph(orch_display, style_fn(f'aov{idx}', fontSize=9, fontName='Helvetica', textColor=GRAY_900, leading=13)),
                     ])
                 block.append(Table(agent_rows, colWidths=[28*mm, W-28*mm],
-                    style=TableStyle([('BACKGROUND',(0,0),(-1,-1),BLUE_LIGHT),
+                    style=pdf_table_style([('BACKGROUND',(0,0),(-1,-1),BLUE_LIGHT),
                         ('TOPPADDING',(0,0),(-1,-1),5),('BOTTOMPADDING',(0,0),(-1,-1),5),
                         ('LEFTPADDING',(0,0),(-1,-1),10),('VALIGN',(0,0),(-1,-1),'TOP'),
                         ('LINEBEFORE',(0,0),(0,-1),3,ph_color),('LINEBELOW',(0,0),(-1,-1),0.3,GRAY_200)])))
@@ -353,8 +433,7 @@ class ReportGenerator:
         # ── INDIVIDUAL ────────────────────────────────────────────────────
         if context == 'individual':
             story.append(PageBreak())
-            story.append(Paragraph(_tr(loc,'Career Future Analysis','Analyse Ihrer beruflichen Zukunft'), ST['section_title']))
-            story.append(HRFlowable(width=W, thickness=0.5, color=GRAY_200, spaceAfter=10))
+            story.extend(pdf_section_header(_tr(loc,'Career Future Analysis','Analyse Ihrer beruflichen Zukunft'), W))
 
             # B1 — Countdown Clock
             countdown_tasks = [r for r in sorted_results if r.get('countdown_window')]
@@ -380,7 +459,7 @@ class ReportGenerator:
                         Paragraph(f'{he:.0f}/100' if he else '—', style_fn(f'cwh{cw}', fontSize=9, fontName='Helvetica', textColor=GRAY_600)),
                     ])
                 story.append(Table(cw_rows, colWidths=[W*0.45, W*0.35, W*0.20],
-                    style=TableStyle([('BACKGROUND',(0,0),(-1,0),GRAY_100),
+                    style=pdf_table_style([('BACKGROUND',(0,0),(-1,0),GRAY_100),
                         ('ROWBACKGROUNDS',(0,1),(-1,-1),[WHITE,GRAY_100]),
                         ('TOPPADDING',(0,0),(-1,-1),6),('BOTTOMPADDING',(0,0),(-1,-1),6),
                         ('LEFTPADDING',(0,0),(-1,-1),10),('LINEBELOW',(0,0),(-1,-1),0.3,GRAY_200)])))
@@ -403,7 +482,7 @@ class ReportGenerator:
                  Paragraph(f'<font color="#ff9f0a"><b>{avg_human_edge:.0f}%</b></font>', style_fn('hiv', fontSize=11, fontName='Helvetica-Bold'))],
             ]
             story.append(Table(he_rows, colWidths=[W*0.6, W*0.4],
-                style=TableStyle([('BACKGROUND',(0,0),(-1,0),GRAY_100),
+                style=pdf_table_style([('BACKGROUND',(0,0),(-1,0),GRAY_100),
                     ('ROWBACKGROUNDS',(0,1),(-1,-1),[WHITE,GRAY_100]),
                     ('TOPPADDING',(0,0),(-1,-1),7),('BOTTOMPADDING',(0,0),(-1,-1),7),
                     ('LEFTPADDING',(0,0),(-1,-1),10),('LINEBELOW',(0,0),(-1,-1),0.3,GRAY_200)])))
@@ -462,7 +541,7 @@ class ReportGenerator:
                         Paragraph(pdist, style_fn(f'prd2{pdist[:6]}', fontSize=9, fontName='Helvetica', textColor=GRAY_600)),
                     ])
                 story.append(Table(role_rows, colWidths=[W*0.45, W*0.25, W*0.30],
-                    style=TableStyle([('BACKGROUND',(0,0),(-1,0),GRAY_100),
+                    style=pdf_table_style([('BACKGROUND',(0,0),(-1,0),GRAY_100),
                         ('ROWBACKGROUNDS',(0,1),(-1,-1),[WHITE,GRAY_100]),
                         ('TOPPADDING',(0,0),(-1,-1),5),('BOTTOMPADDING',(0,0),(-1,-1),5),
                         ('LEFTPADDING',(0,0),(-1,-1),10),('LINEBELOW',(0,0),(-1,-1),0.3,GRAY_200)])))
@@ -479,8 +558,7 @@ class ReportGenerator:
         # ── TEAM ──────────────────────────────────────────────────────────
         elif context == 'team':
             story.append(PageBreak())
-            story.append(Paragraph(_tr(loc,'Team Automation Strategy','Team-Automatisierungsstrategie'), ST['section_title']))
-            story.append(HRFlowable(width=W, thickness=0.5, color=GRAY_200, spaceAfter=10))
+            story.extend(pdf_section_header(_tr(loc,'Team Automation Strategy','Team-Automatisierungsstrategie'), W))
 
             # C1 — Velocity Impact
             story.append(Paragraph(_tr(loc,'Team Velocity Impact','Auswirkung auf die Team-Geschwindigkeit'), style_fn('tv_ttl', fontSize=13,
@@ -501,7 +579,7 @@ class ReportGenerator:
                     Paragraph(note, style_fn(f'vn{metric[:6]}', fontSize=9, fontName='Helvetica', textColor=GRAY_600)),
                 ])
             story.append(Table(vel_rows, colWidths=[W*0.3, W*0.2, W*0.5],
-                style=TableStyle([('BACKGROUND',(0,0),(-1,0),GRAY_100),
+                style=pdf_table_style([('BACKGROUND',(0,0),(-1,0),GRAY_100),
                     ('ROWBACKGROUNDS',(0,1),(-1,-1),[WHITE,GRAY_100]),
                     ('TOPPADDING',(0,0),(-1,-1),7),('BOTTOMPADDING',(0,0),(-1,-1),7),
                     ('LEFTPADDING',(0,0),(-1,-1),10),('LINEBELOW',(0,0),(-1,-1),0.3,GRAY_200)])))
@@ -522,7 +600,7 @@ class ReportGenerator:
                     Paragraph(f'<b>{ph_hrs:.0f}h/yr</b>  ·  {len(ph_tasks)} {_tr(loc,"tasks","Aufgaben")}',
                         style_fn(f'pv{ph_name[:6]}', fontSize=10, fontName='Helvetica', textColor=GRAY_900, alignment=TA_RIGHT)),
                 ]], colWidths=[W*0.65, W*0.35],
-                style=TableStyle([('BACKGROUND',(0,0),(-1,-1),ph_bg),
+                style=pdf_table_style([('BACKGROUND',(0,0),(-1,-1),ph_bg),
                     ('TOPPADDING',(0,0),(-1,-1),8),('BOTTOMPADDING',(0,0),(-1,-1),8),
                     ('LEFTPADDING',(0,0),(-1,-1),12),('RIGHTPADDING',(-1,0),(-1,-1),12),
                     ('VALIGN',(0,0),(-1,-1),'MIDDLE'),('LINEBELOW',(0,0),(-1,-1),1,ph_col)])))
@@ -546,7 +624,7 @@ class ReportGenerator:
                         Paragraph(f'{r.get("estimated_hours_saved",0):.0f}h', style_fn(f'sph{i}', fontSize=9, fontName='Helvetica', textColor=GRAY_900)),
                     ])
                 story.append(Table(sp_rows, colWidths=[10*mm, W-10*mm-25*mm-30*mm, 25*mm, 30*mm],
-                    style=TableStyle([('BACKGROUND',(0,0),(-1,0),GRAY_100),
+                    style=pdf_table_style([('BACKGROUND',(0,0),(-1,0),GRAY_100),
                         ('ROWBACKGROUNDS',(0,1),(-1,-1),[WHITE,GRAY_100]),
                         ('TOPPADDING',(0,0),(-1,-1),6),('BOTTOMPADDING',(0,0),(-1,-1),6),
                         ('LEFTPADDING',(0,0),(-1,-1),10),('LINEBELOW',(0,0),(-1,-1),0.3,GRAY_200)])))
@@ -557,8 +635,7 @@ class ReportGenerator:
         # ── COMPANY ───────────────────────────────────────────────────────
         elif context == 'company':
             story.append(PageBreak())
-            story.append(Paragraph(_tr(loc,'Strategic Business Analysis','Strategische Unternehmensanalyse'), ST['section_title']))
-            story.append(HRFlowable(width=W, thickness=0.5, color=GRAY_200, spaceAfter=10))
+            story.extend(pdf_section_header(_tr(loc,'Strategic Business Analysis','Strategische Unternehmensanalyse'), W))
 
             # D1 — Automation ROI Gap (sourced: Bain leaders vs laggards)
             story.append(Paragraph(_tr(loc,'The Leader\u2013Laggard Gap','Die Kluft zwischen Vorreitern und Nachzüglern'), style_fn('cg_ttl', fontSize=13,
@@ -578,7 +655,7 @@ class ReportGenerator:
                     Paragraph(note, style_fn(f'cn{label[:6]}', fontSize=9, fontName='Helvetica', textColor=GRAY_600)),
                 ])
             story.append(Table(comp_rows, colWidths=[W*0.32, W*0.18, W*0.50],
-                style=TableStyle([('ROWBACKGROUNDS',(0,0),(-1,-1),[GREEN_LIGHT,colors.HexColor('#e8f1fc'),AMBER_LIGHT]),
+                style=pdf_table_style([('ROWBACKGROUNDS',(0,0),(-1,-1),[GREEN_LIGHT,colors.HexColor('#e8f1fc'),AMBER_LIGHT]),
                     ('TOPPADDING',(0,0),(-1,-1),8),('BOTTOMPADDING',(0,0),(-1,-1),8),
                     ('LEFTPADDING',(0,0),(-1,-1),10),('LINEBELOW',(0,0),(-1,-1),0.3,GRAY_200)])))
             story.append(Paragraph(
@@ -611,7 +688,7 @@ class ReportGenerator:
                     Paragraph(n, style_fn(f'hn{m[:6]}', fontSize=9, fontName='Helvetica', textColor=GRAY_600)),
                 ])
             story.append(Table(hc_rows, colWidths=[W*0.3, W*0.2, W*0.5],
-                style=TableStyle([('BACKGROUND',(0,0),(-1,0),GRAY_100),
+                style=pdf_table_style([('BACKGROUND',(0,0),(-1,0),GRAY_100),
                     ('ROWBACKGROUNDS',(0,1),(-1,-1),[WHITE,GRAY_100]),
                     ('TOPPADDING',(0,0),(-1,-1),7),('BOTTOMPADDING',(0,0),(-1,-1),7),
                     ('LEFTPADDING',(0,0),(-1,-1),10),('LINEBELOW',(0,0),(-1,-1),0.3,GRAY_200)])))
@@ -644,7 +721,7 @@ class ReportGenerator:
                     Paragraph(bm_note, style_fn(f'bmn{bm_label[:6]}', fontSize=9, fontName='Helvetica', textColor=GRAY_600)),
                 ])
             story.append(Table(bm_rows, colWidths=[W*0.35, W*0.2, W*0.45],
-                style=TableStyle([('BACKGROUND',(0,0),(-1,0),GRAY_100),
+                style=pdf_table_style([('BACKGROUND',(0,0),(-1,0),GRAY_100),
                     ('ROWBACKGROUNDS',(0,1),(-1,-1),[WHITE,GRAY_100]),
                     ('TOPPADDING',(0,0),(-1,-1),7),('BOTTOMPADDING',(0,0),(-1,-1),7),
                     ('LEFTPADDING',(0,0),(-1,-1),10),('LINEBELOW',(0,0),(-1,-1),0.3,GRAY_200)])))
@@ -682,7 +759,7 @@ class ReportGenerator:
                     Paragraph(v, style_fn(f'bv{k[:6]}', fontSize=9, fontName='Helvetica', textColor=WHITE)),
                 ])
             story.append(Table(board_rows, colWidths=[W*0.38, W*0.62],
-                style=TableStyle([('BACKGROUND',(0,0),(-1,-1),colors.HexColor('#1d1d1f')),
+                style=pdf_table_style([('BACKGROUND',(0,0),(-1,-1),colors.HexColor('#1d1d1f')),
                     ('TOPPADDING',(0,0),(-1,-1),7),('BOTTOMPADDING',(0,0),(-1,-1),7),
                     ('LEFTPADDING',(0,0),(-1,-1),12),('RIGHTPADDING',(0,0),(-1,-1),12),
                     ('LINEBELOW',(0,0),(-1,-1),0.3,colors.HexColor('#3a3a3c')),
@@ -693,6 +770,7 @@ class ReportGenerator:
     # ─────────────────────────────────────────────────────────────────────────
 
     @staticmethod
+    @timing.timed("report.pdf")
     def generate_pdf_report(analysis_data: Dict, output_path: str, loc: str = 'en'):
         global _ACTIVE_LOCALE
         _ACTIVE_LOCALE = loc  # picked up by NumberedCanvas footer
@@ -700,23 +778,9 @@ class ReportGenerator:
             leftMargin=18*mm, rightMargin=18*mm, topMargin=20*mm, bottomMargin=24*mm)
         W = A4[0] - 36*mm
         story = []
-        s = getSampleStyleSheet()
-
-        def style(name, parent='Normal', **kw):
-            return ParagraphStyle(name, parent=s[parent], **kw)
-
-        ST = {
-            'section_title': style('st', fontSize=18, leading=22, textColor=GRAY_900,
-                                    spaceBefore=18, spaceAfter=8, fontName='Helvetica-Bold'),
-            'label':  style('lb', fontSize=9, leading=12, textColor=GRAY_600,
-                             fontName='Helvetica-Bold', spaceAfter=2),
-            'body':   style('bo', fontSize=10, leading=15, textColor=GRAY_900,
-                             fontName='Helvetica', spaceAfter=6),
-            'cover_sub':  style('cs', fontSize=13, leading=18, textColor=GRAY_600,
-                                 spaceAfter=4, fontName='Helvetica'),
-            'cover_meta': style('cm', fontSize=10, leading=14, textColor=GRAY_600,
-                                 fontName='Helvetica'),
-        }
+        s = _BASE_STYLES
+        style = pdf_style
+        ST = pdf_stylesheet()
 
         workflow = analysis_data['workflow']
         score    = analysis_data['automation_score']
@@ -730,8 +794,7 @@ class ReportGenerator:
         sc, sc_light = score_color(score)
 
         # ── Cover ─────────────────────────────────────────────────────────
-        story.append(Table([['']],colWidths=[W],rowHeights=[4],
-            style=TableStyle([('BACKGROUND',(0,0),(-1,-1),BLUE)])))
+        story.append(pdf_color_bar(W, BLUE))
         story.append(Spacer(1, 16*mm))
         story.append(Paragraph('WorkScanAI', style('brand', fontSize=11, textColor=BLUE,
             fontName='Helvetica-Bold', spaceAfter=10)))
@@ -769,7 +832,7 @@ class ReportGenerator:
                 style('src_lbl', fontSize=9, leading=12, textColor=BLUE, fontName='Helvetica-Bold', spaceAfter=4)))
             story.append(Table([[Paragraph(display_text,
                 style('src', fontSize=8, leading=12, textColor=GRAY_600, fontName='Helvetica'))]],
-                colWidths=[W], style=TableStyle([('BACKGROUND',(0,0),(-1,-1),GRAY_100),
+                colWidths=[W], style=pdf_table_style([('BACKGROUND',(0,0),(-1,-1),GRAY_100),
                     ('TOPPADDING',(0,0),(-1,-1),8),('BOTTOMPADDING',(0,0),(-1,-1),8),
                     ('LEFTPADDING',(0,0),(-1,-1),14),('RIGHTPADDING',(0,0),(-1,-1),14),
                     ('LINEBEFORE',(0,0),(0,-1),3,BLUE)])))
@@ -793,7 +856,7 @@ class ReportGenerator:
                     Paragraph(_pb_e, style('pb', fontSize=11, leading=15,
                         textColor=GRAY_900, fontName='Helvetica-Bold'))])
             story.append(Table(_ap_rows, colWidths=[W*0.28, W*0.72],
-                style=TableStyle([('TOPPADDING',(0,0),(-1,-1),2),('BOTTOMPADDING',(0,0),(-1,-1),2),
+                style=pdf_table_style([('TOPPADDING',(0,0),(-1,-1),2),('BOTTOMPADDING',(0,0),(-1,-1),2),
                     ('LEFTPADDING',(0,0),(-1,-1),0),('VALIGN',(0,0),(-1,-1),'MIDDLE')])))
             story.append(Spacer(1, 4*mm))
         story.append(Paragraph(
@@ -815,7 +878,7 @@ class ReportGenerator:
                    [Paragraph(_tr(loc, 'workflow tasks', 'Workflow-Aufgaben'), style('tl', fontSize=10, textColor=GRAY_600, fontName='Helvetica', spaceBefore=0)),'']],
                   colWidths=[W*0.25, W*0.05]),
         ]], colWidths=[W*0.28, W*0.42, W*0.30],
-        style=TableStyle([('BACKGROUND',(0,0),(-1,-1),sc_light),
+        style=pdf_table_style([('BACKGROUND',(0,0),(-1,-1),sc_light),
             ('TOPPADDING',(0,0),(-1,-1),20),('BOTTOMPADDING',(0,0),(-1,-1),20),
             ('LEFTPADDING',(0,0),(0,-1),20),('LEFTPADDING',(1,0),(1,-1),10),
             ('VALIGN',(0,0),(-1,-1),'MIDDLE'),('LINEAFTER',(0,0),(0,-1),1,sc)]))
@@ -826,7 +889,7 @@ class ReportGenerator:
             Paragraph(f'<font color="#ff9f0a"><b>{len(med)} {_tr(loc, "MEDIUM", "MITTEL")}</b></font> {_tr(loc, "potential", "Potenzial")}', ST['body']),
             Paragraph(f'<font color="#ff3b30"><b>{len(low)} {_tr(loc, "LOW", "NIEDRIG")}</b></font> {_tr(loc, "potential", "Potenzial")}', ST['body']),
         ]], colWidths=[W/3,W/3,W/3],
-        style=TableStyle([('BACKGROUND',(0,0),(-1,-1),GRAY_100),
+        style=pdf_table_style([('BACKGROUND',(0,0),(-1,-1),GRAY_100),
             ('TOPPADDING',(0,0),(-1,-1),10),('BOTTOMPADDING',(0,0),(-1,-1),10),
             ('LEFTPADDING',(0,0),(-1,-1),14),('VALIGN',(0,0),(-1,-1),'MIDDLE'),
             ('LINEAFTER',(0,0),(1,-1),0.5,GRAY_200)])))
@@ -840,8 +903,7 @@ class ReportGenerator:
                      (_tr(loc,'Error Tolerance','Fehlertoleranz'),analysis_data.get('readiness_team_skills'))]
         rd_vals = [(l,v) for l,v in rd_labels if v is not None]
         if rs is not None or rd_vals:
-            story.append(Paragraph(_tr(loc,'AI Readiness Assessment','KI-Reifegrad-Bewertung'), ST['section_title']))
-            story.append(HRFlowable(width=W, thickness=0.5, color=GRAY_200, spaceAfter=8))
+            story.extend(pdf_section_header(_tr(loc,'AI Readiness Assessment','KI-Reifegrad-Bewertung'), W, space_after=8))
             if rs is not None:
                 rs_color, rs_bg = score_color(rs)
                 story.append(Table([[
@@ -855,7 +917,7 @@ class ReportGenerator:
                         'Datenqualität, Prozessdokumentation, Tool-Reife und Team-Kompetenzen.'),
                         style('rsd', fontSize=9, fontName='Helvetica', textColor=GRAY_600, leading=14)),
                 ]], colWidths=[W*0.3, W*0.7],
-                style=TableStyle([('BACKGROUND',(0,0),(-1,-1),rs_bg),
+                style=pdf_table_style([('BACKGROUND',(0,0),(-1,-1),rs_bg),
                     ('TOPPADDING',(0,0),(-1,-1),14),('BOTTOMPADDING',(0,0),(-1,-1),14),
                     ('LEFTPADDING',(0,0),(-1,-1),14),('VALIGN',(0,0),(-1,-1),'MIDDLE'),
                     ('LINEAFTER',(0,0),(0,-1),1,rs_color)])))
@@ -869,7 +931,7 @@ class ReportGenerator:
                         Paragraph(f'<b>{val:.0f}</b>', style(f'rdv{lbl2}', fontSize=10,
                         fontName='Helvetica-Bold', textColor=rc2))])
                 story.append(Table(rd_rows, colWidths=[W*0.5, W*0.5],
-                    style=TableStyle([('TOPPADDING',(0,0),(-1,-1),6),('BOTTOMPADDING',(0,0),(-1,-1),6),
+                    style=pdf_table_style([('TOPPADDING',(0,0),(-1,-1),6),('BOTTOMPADDING',(0,0),(-1,-1),6),
                         ('LEFTPADDING',(0,0),(-1,-1),14),
                         ('ROWBACKGROUNDS',(0,0),(-1,-1),[WHITE,GRAY_100]),
                         ('LINEBELOW',(0,0),(-1,-1),0.3,GRAY_200)])))
@@ -880,21 +942,15 @@ class ReportGenerator:
         _task_hd = _tr(loc, 'Detailed Task Analysis', 'Detaillierte Aufgabenanalyse')
         # Keep section heading with first task block to avoid orphan header
         if task_blocks:
-            story.append(KeepTogether([
-                Paragraph(_task_hd, ST['section_title']),
-                HRFlowable(width=W, thickness=0.5, color=GRAY_200, spaceAfter=10),
-                task_blocks[0],
-            ]))
+            story.append(KeepTogether(pdf_section_header(_task_hd, W) + [task_blocks[0]]))
             for blk in task_blocks[1:]:
                 story.append(blk)
         else:
-            story.append(Paragraph(_task_hd, ST['section_title']))
-            story.append(HRFlowable(width=W, thickness=0.5, color=GRAY_200, spaceAfter=10))
+            story.extend(pdf_section_header(_task_hd, W))
 
         # ── Implementation Roadmap ────────────────────────────────────────
         story.append(PageBreak())
-        story.append(Paragraph(_tr(loc, 'Implementation Roadmap', 'Umsetzungs-Roadmap'), ST['section_title']))
-        story.append(HRFlowable(width=W, thickness=0.5, color=GRAY_200, spaceAfter=10))
+        story.extend(pdf_section_header(_tr(loc, 'Implementation Roadmap', 'Umsetzungs-Roadmap'), W))
         phases = [
             (_tr(loc,'Phase 1 — Quick Wins','Phase 1 – Schnelle Erfolge'),_tr(loc,'0–3 months','0–3 Monate'),_tr(loc,'High score + easy setup = immediate ROI.','Hoher Score + einfache Einrichtung = sofortiger ROI.'),
              GREEN,GREEN_LIGHT,[r for r in sorted_results if r['ai_readiness_score']>=70 and r.get('difficulty','').lower()=='easy']),
@@ -911,7 +967,7 @@ class ReportGenerator:
                 Paragraph(timeline, style(f'pt{title}', fontSize=10, textColor=GRAY_600,
                     fontName='Helvetica', alignment=TA_RIGHT)),
             ]], colWidths=[W*0.65, W*0.35],
-            style=TableStyle([('BACKGROUND',(0,0),(-1,-1),col_light),
+            style=pdf_table_style([('BACKGROUND',(0,0),(-1,-1),col_light),
                 ('TOPPADDING',(0,0),(-1,-1),10),('BOTTOMPADDING',(0,0),(-1,-1),10),
                 ('LEFTPADDING',(0,0),(0,-1),12),('RIGHTPADDING',(-1,0),(-1,-1),12),
                 ('VALIGN',(0,0),(-1,-1),'MIDDLE'),('LINEBELOW',(0,0),(-1,-1),1.5,col)])))
@@ -927,7 +983,7 @@ class ReportGenerator:
                             style(f'ri{r["task"]["name"][:8]}', fontSize=10, fontName='Helvetica',
                                 textColor=GRAY_900, leading=14)),
                     ]], colWidths=[8*mm, W-8*mm],
-                    style=TableStyle([('TOPPADDING',(0,0),(-1,-1),5),('BOTTOMPADDING',(0,0),(-1,-1),5),
+                    style=pdf_table_style([('TOPPADDING',(0,0),(-1,-1),5),('BOTTOMPADDING',(0,0),(-1,-1),5),
                         ('LEFTPADDING',(0,0),(-1,-1),12),('LINEBELOW',(0,0),(-1,-1),0.3,GRAY_200)])))
             else:
                 pb.append(Paragraph(_tr(loc,'No tasks in this phase.','Keine Aufgaben in dieser Phase.'), style(f'np{title}', fontSize=9,
@@ -940,8 +996,7 @@ class ReportGenerator:
 
         # ── Conclusion ────────────────────────────────────────────────────
         story.append(PageBreak())
-        story.append(Paragraph(_tr(loc, 'Conclusion', 'Fazit'), ST['section_title']))
-        story.append(HRFlowable(width=W, thickness=0.5, color=GRAY_200, spaceAfter=10))
+        story.extend(pdf_section_header(_tr(loc, 'Conclusion', 'Fazit'), W))
         story.append(Paragraph(
             (f'Diese Analyse hat Automatisierungspotenziale über <b>{len(results)} Aufgaben</b> '
              f'in <b>{workflow["name"]}</b> identifiziert. Die Umsetzung der Empfehlungen könnte '
@@ -969,7 +1024,7 @@ class ReportGenerator:
                 Paragraph('>', style(f'ai{item[:10]}', fontSize=11, textColor=BLUE, fontName='Helvetica-Bold')),
                 Paragraph(item, ST['body']),
             ]], colWidths=[8*mm, W-8*mm],
-            style=TableStyle([('TOPPADDING',(0,0),(-1,-1),4),('BOTTOMPADDING',(0,0),(-1,-1),4),
+            style=pdf_table_style([('TOPPADDING',(0,0),(-1,-1),4),('BOTTOMPADDING',(0,0),(-1,-1),4),
                 ('LEFTPADDING',(0,0),(0,-1),0),('VALIGN',(0,0),(-1,-1),'TOP')])))
 
         # ── Legal / accuracy disclaimer — very bottom of the report ──
@@ -981,7 +1036,7 @@ class ReportGenerator:
             style('disclaimer', fontSize=8, textColor=GRAY_600, fontName='Helvetica',
                   leading=11, alignment=1))
         ]], colWidths=[W],
-        style=TableStyle([('TOPPADDING',(0,0),(-1,-1),8),('BOTTOMPADDING',(0,0),(-1,-1),0),
+        style=pdf_table_style([('TOPPADDING',(0,0),(-1,-1),8),('BOTTOMPADDING',(0,0),(-1,-1),0),
             ('LEFTPADDING',(0,0),(-1,-1),0),('RIGHTPADDING',(0,0),(-1,-1),0),
             ('LINEABOVE',(0,0),(-1,0),0.5,GRAY_200)])))
 
@@ -994,6 +1049,7 @@ class ReportGenerator:
     # ─────────────────────────────────────────────────────────────────────────
 
     @staticmethod
+    @timing.timed("report.docx")
     def generate_docx_report(analysis_data: Dict, output_path: str, loc: str = 'en'):
         if Document is None:
             raise ImportError("python-docx not installed")
@@ -1417,36 +1473,17 @@ class ReportGenerator:
     # ─────────────────────────────────────────────────────────────────────────
 
     @staticmethod
-    def generate_combined_pdf_report(analyses_list: List[Dict], output_path: str, loc: str = 'en'):
-        """One PDF — master cover + each workflow as a full section."""
-        global _ACTIVE_LOCALE; _ACTIVE_LOCALE = loc
-        import tempfile, os
-        from reportlab.platypus import SimpleDocTemplate
-
-        doc = SimpleDocTemplate(output_path, pagesize=A4,
-            leftMargin=18*mm, rightMargin=18*mm, topMargin=20*mm, bottomMargin=24*mm)
-        W = A4[0] - 36*mm
+    def _pdf_combined_cover(analyses_list: List[Dict], W, loc: str = 'en') -> list:
+        """Master cover + workflow index for the combined PDF."""
+        style = pdf_style
+        ST = pdf_stylesheet()
         story = []
-        s = getSampleStyleSheet()
-
-        def style(name, parent='Normal', **kw):
-            return ParagraphStyle(name, parent=s[parent], **kw)
-
-        ST = {
-            'section_title': style('st2',fontSize=18,leading=22,textColor=GRAY_900,
-                                    spaceBefore=18,spaceAfter=8,fontName='Helvetica-Bold'),
-            'label': style('lb2',fontSize=9,leading=12,textColor=GRAY_600,fontName='Helvetica-Bold',spaceAfter=2),
-            'body':  style('bo2',fontSize=10,leading=15,textColor=GRAY_900,fontName='Helvetica',spaceAfter=6),
-            'rec':   style('rc2',fontSize=10,leading=15,textColor=GRAY_900,fontName='Helvetica',leftIndent=10,spaceAfter=8),
-        }
 
         total_savings = sum(a['annual_savings'] for a in analyses_list)
         total_hours   = sum(a['hours_saved']    for a in analyses_list)
         total_tasks   = sum(len(a['results'])   for a in analyses_list)
 
-        # Master cover
-        story.append(Table([['']],colWidths=[W],rowHeights=[4],
-            style=TableStyle([('BACKGROUND',(0,0),(-1,-1),BLUE)])))
+        story.append(pdf_color_bar(W, BLUE))
         story.append(Spacer(1,16*mm))
         story.append(Paragraph('WorkScanAI',style('brand2',fontSize=11,textColor=BLUE,fontName='Helvetica-Bold',spaceAfter=10)))
         story.append(Paragraph(_tr(loc,'Combined Workflow Automation\nAnalysis Report','Kombinierter Workflow-\nAutomatisierungsbericht'),
@@ -1469,7 +1506,7 @@ class ReportGenerator:
                    [Paragraph(_tr(loc,'analyzed','analysiert'),style('tl2',fontSize=10,textColor=GRAY_600,fontName='Helvetica')),'']],
                   colWidths=[W*0.25,W*0.05]),
         ]],colWidths=[W*0.27,W*0.44,W*0.29],
-        style=TableStyle([('BACKGROUND',(0,0),(-1,-1),BLUE_LIGHT),
+        style=pdf_table_style([('BACKGROUND',(0,0),(-1,-1),BLUE_LIGHT),
             ('TOPPADDING',(0,0),(-1,-1),16),('BOTTOMPADDING',(0,0),(-1,-1),16),
             ('LEFTPADDING',(0,0),(0,-1),20),('LEFTPADDING',(1,0),(1,-1),10),
             ('VALIGN',(0,0),(-1,-1),'MIDDLE'),('LINEAFTER',(0,0),(0,-1),1,BLUE)])))
@@ -1487,58 +1524,66 @@ class ReportGenerator:
                 Paragraph(f"\u20ac{a['annual_savings']:,.0f}",style(f'iv{i}',fontSize=10,fontName='Helvetica',textColor=GRAY_900)),
             ])
         story.append(Table(idx_rows,colWidths=[10*mm,W-10*mm-30*mm-40*mm,30*mm,40*mm],
-            style=TableStyle([('BACKGROUND',(0,0),(-1,0),GRAY_100),
+            style=pdf_table_style([('BACKGROUND',(0,0),(-1,0),GRAY_100),
                 ('ROWBACKGROUNDS',(0,1),(-1,-1),[WHITE,GRAY_100]),
                 ('TOPPADDING',(0,0),(-1,-1),7),('BOTTOMPADDING',(0,0),(-1,-1),7),
                 ('LEFTPADDING',(0,0),(-1,-1),10),('LINEBELOW',(0,0),(-1,-1),0.3,GRAY_200)])))
-        story.append(PageBreak())
+        return story
 
-        # Per-workflow: full sections
-        for w_idx, analysis_data in enumerate(analyses_list):
-            wf = analysis_data['workflow']
-            sc, sc_light = score_color(analysis_data['automation_score'])
-            story.append(Table([['']],colWidths=[W],rowHeights=[3],
-                style=TableStyle([('BACKGROUND',(0,0),(-1,-1),sc)])))
-            story.append(Spacer(1,10*mm))
-            story.append(Paragraph(_tr(loc,f'Workflow {w_idx+1} of {len(analyses_list)}',f'Workflow {w_idx+1} von {len(analyses_list)}'),
-                style(f'wl{w_idx}',fontSize=10,textColor=GRAY_600,fontName='Helvetica',spaceAfter=6)))
-            story.append(Paragraph(wf['name'],
-                style(f'wt{w_idx}',fontSize=24,leading=28,textColor=GRAY_900,fontName='Helvetica-Bold',spaceAfter=8)))
-
-            # Mini KPIs
-            sc2,sc2_light=score_color(analysis_data['automation_score'])
-            story.append(Table([[
-                Paragraph(f'<b>{analysis_data["automation_score"]:.0f}%</b><br/><font size="9" color="#6e6e73">Score</font>',
-                    style(f'ws{w_idx}',fontSize=20,fontName='Helvetica-Bold',textColor=sc2,alignment=TA_CENTER,leading=26)),
-                Paragraph(f'<b>\u20ac{analysis_data["annual_savings"]:,.0f}</b><br/><font size="9" color="#6e6e73">{_tr(loc,"Savings","Einsparung")}</font>',
-                    style(f'wv{w_idx}',fontSize=16,fontName='Helvetica-Bold',textColor=GRAY_900,alignment=TA_CENTER,leading=22)),
-                Paragraph(f'<b>{analysis_data["hours_saved"]:.0f}h</b><br/><font size="9" color="#6e6e73">{_tr(loc,"Hrs/yr","Std./J.")}</font>',
-                    style(f'wh{w_idx}',fontSize=16,fontName='Helvetica-Bold',textColor=GRAY_900,alignment=TA_CENTER,leading=22)),
-                Paragraph(f'<b>{len(analysis_data["results"])}</b><br/><font size="9" color="#6e6e73">{_tr(loc,"Tasks","Aufgaben")}</font>',
-                    style(f'wc{w_idx}',fontSize=16,fontName='Helvetica-Bold',textColor=GRAY_900,alignment=TA_CENTER,leading=22)),
-            ]],colWidths=[W/4]*4,
-            style=TableStyle([('BACKGROUND',(0,0),(-1,-1),sc2_light),
-                ('TOPPADDING',(0,0),(-1,-1),12),('BOTTOMPADDING',(0,0),(-1,-1),12),
-                ('VALIGN',(0,0),(-1,-1),'MIDDLE'),('LINEAFTER',(0,0),(2,-1),0.5,sc2)])))
-            story.append(Spacer(1,8*mm))
-
-            # Full task blocks with all features
-            story.append(Paragraph(_tr(loc,'Task Analysis','Aufgabenanalyse'),ST['section_title']))
-            story.append(HRFlowable(width=W,thickness=0.5,color=GRAY_200,spaceAfter=8))
-            sorted_wf = sorted(analysis_data['results'], key=lambda x: x['ai_readiness_score'], reverse=True)
-            for blk in ReportGenerator._pdf_task_blocks(sorted_wf, analysis_data, W, s, ST, style, loc):
-                story.append(blk)
+    @staticmethod
+    def _pdf_workflow_section(analysis_data: Dict, w_idx: int, n_total: int, W, loc: str = 'en') -> list:
+        """One workflow of the combined PDF — header, mini KPIs, task blocks, context sections."""
+        s = _BASE_STYLES
+        style = pdf_style
+        ST = pdf_stylesheet()
+        story = []
 
-            # Context sections
-            ReportGenerator._pdf_context_sections(story, analysis_data, W, style, ST, loc)
+        wf = analysis_data['workflow']
+        sc, sc_light = score_color(analysis_data['automation_score'])
+        story.append(pdf_color_bar(W, sc, height=3))
+        story.append(Spacer(1,10*mm))
+        story.append(Paragraph(_tr(loc,f'Workflow {w_idx+1} of {n_total}',f'Workflow {w_idx+1} von {n_total}'),
+            style(f'wl{w_idx}',fontSize=10,textColor=GRAY_600,fontName='Helvetica',spaceAfter=6)))
+        story.append(Paragraph(wf['name'],
+            style(f'wt{w_idx}',fontSize=24,leading=28,textColor=GRAY_900,fontName='Helvetica-Bold',spaceAfter=8)))
 
-            if w_idx < len(analyses_list) - 1:
-                story.append(PageBreak())
+        # Mini KPIs
+        sc2,sc2_light=score_color(analysis_data['automation_score'])
+        story.append(Table([[
+            Paragraph(f'<b>{analysis_data["automation_score"]:.0f}%</b><br/><font size="9" color="#6e6e73">Score</font>',
+                style(f'ws{w_idx}',fontSize=20,fontName='Helvetica-Bold',textColor=sc2,alignment=TA_CENTER,leading=26)),
+            Paragraph(f'<b>\u20ac{analysis_data["annual_savings"]:,.0f}</b><br/><font size="9" color="#6e6e73">{_tr(loc,"Savings","Einsparung")}</font>',
+                style(f'wv{w_idx}',fontSize=16,fontName='Helvetica-Bold',textColor=GRAY_900,alignment=TA_CENTER,leading=22)),
+            Paragraph(f'<b>{analysis_data["hours_saved"]:.0f}h</b><br/><font size="9" color="#6e6e73">{_tr(loc,"Hrs/yr","Std./J.")}</font>',
+                style(f'wh{w_idx}',fontSize=16,fontName='Helvetica-Bold',textColor=GRAY_900,alignment=TA_CENTER,leading=22)),
+            Paragraph(f'<b>{len(analysis_data["results"])}</b><br/><font size="9" color="#6e6e73">{_tr(loc,"Tasks","Aufgaben")}</font>',
+                style(f'wc{w_idx}',fontSize=16,fontName='Helvetica-Bold',textColor=GRAY_900,alignment=TA_CENTER,leading=22)),
+        ]],colWidths=[W/4]*4,
+        style=pdf_table_style([('BACKGROUND',(0,0),(-1,-1),sc2_light),
+            ('TOPPADDING',(0,0),(-1,-1),12),('BOTTOMPADDING',(0,0),(-1,-1),12),
+            ('VALIGN',(0,0),(-1,-1),'MIDDLE'),('LINEAFTER',(0,0),(2,-1),0.5,sc2)])))
+        story.append(Spacer(1,8*mm))
+
+        # Full task blocks with all features
+        story.extend(pdf_section_header(_tr(loc,'Task Analysis','Aufgabenanalyse'), W, space_after=8))
+        sorted_wf = sorted(analysis_data['results'], key=lambda x: x['ai_readiness_score'], reverse=True)
+        for blk in ReportGenerator._pdf_task_blocks(sorted_wf, analysis_data, W, s, ST, style, loc):
+            story.append(blk)
+
+        # Context sections
+        ReportGenerator._pdf_context_sections(story, analysis_data, W, style, ST, loc)
+        return story
 
-        # Combined conclusion
-        story.append(PageBreak())
-        story.append(Paragraph(_tr(loc,'Combined Summary','Kombinierte Zusammenfassung'),ST['section_title']))
-        story.append(HRFlowable(width=W,thickness=0.5,color=GRAY_200,spaceAfter=10))
+    @staticmethod
+    def _pdf_combined_summary(analyses_list: List[Dict], W, loc: str = 'en') -> list:
+        """Closing summary + disclaimer for the combined PDF."""
+        style = pdf_style
+        story = []
+        total_savings = sum(a['annual_savings'] for a in analyses_list)
+        total_hours   = sum(a['hours_saved']    for a in analyses_list)
+        total_tasks   = sum(len(a['results'])   for a in analyses_list)
+
+        story.extend(pdf_section_header(_tr(loc,'Combined Summary','Kombinierte Zusammenfassung'), W))
         story.append(Paragraph(
             _tr(loc,
             f'This combined report covers <b>{len(analyses_list)} workflows</b> with <b>{total_tasks} total tasks</b>. Implementing all recommendations could save <b>{total_hours:.0f} hours annually</b>, worth approximately <b>\u20ac{total_savings:,.0f}</b>.',
@@ -1548,23 +1593,44 @@ class ReportGenerator:
         # ── Legal / accuracy disclaimer — very bottom of the combined report ──
         story.append(Spacer(1, 10*mm))
         story.append(Table([[Paragraph(
-            _tr(loc,'WorkScanAI estimates are for general guidance only and do not constitute investment, employment, financial, legal, or business advice \u2014 verify independently before acting.','WorkScanAI-Schätzungen dienen ausschließlich der allgemeinen Orientierung und stellen keine Anlage-, Beschäftigungs-, Finanz-, Rechts- oder Geschäftsberatung dar \u2014 bitte vor dem Handeln unabhängig prüfen.'),
+            _tr(loc,'WorkScanAI estimates are for general guidance only and do not constitute investment, employment, financial, legal, or business advice — verify independently before acting.','WorkScanAI-Schätzungen dienen ausschließlich der allgemeinen Orientierung und stellen keine Anlage-, Beschäftigungs-, Finanz-, Rechts- oder Geschäftsberatung dar — bitte vor dem Handeln unabhängig prüfen.'),
             style('disclaimer_c', fontSize=8, textColor=GRAY_600, fontName='Helvetica',
                   leading=11, alignment=TA_CENTER))
         ]], colWidths=[W],
-        style=TableStyle([('TOPPADDING',(0,0),(-1,-1),8),('BOTTOMPADDING',(0,0),(-1,-1),0),
+        style=pdf_table_style([('TOPPADDING',(0,0),(-1,-1),8),('BOTTOMPADDING',(0,0),(-1,-1),0),
             ('LEFTPADDING',(0,0),(-1,-1),0),('RIGHTPADDING',(0,0),(-1,-1),0),
             ('LINEABOVE',(0,0),(-1,0),0.5,GRAY_200)])))
+        return story
 
-        doc.build(story, canvasmaker=NumberedCanvas)
+    @staticmethod
+    @timing.timed("report.combined_pdf")
+    def generate_combined_pdf_report(analyses_list: List[Dict], output_path: str, loc: str = 'en',
+                                     workers: int = 1):
+        """One PDF — master cover + each workflow as a full section.
+
+        Every workflow section starts on a fresh page, so each one is laid out
+        as its own document (in up to `workers` processes), then the parts are
+        concatenated and the "Page X of Y" footer is stamped across the whole file.
+        """
+        W = A4[0] - 36*mm
+        sections = _map_sections(_render_combined_pdf_section,
+                                 [(a, i, len(analyses_list), loc) for i, a in enumerate(analyses_list)],
+                                 workers)
+        parts = ([_render_pdf_story(ReportGenerator._pdf_combined_cover(analyses_list, W, loc))]
+                 + sections
+                 + [_render_pdf_story(ReportGenerator._pdf_combined_summary(analyses_list, W, loc))])
+        _merge_pdf_parts(parts, output_path, loc)
         return output_path
 
     @staticmethod
-    def generate_combined_docx_report(analyses_list: List[Dict], output_path: str, loc: str = 'en'):
+    @timing.timed("report.combined_docx")
+    def generate_combined_docx_report(analyses_list: List[Dict], output_path: str, loc: str = 'en',
+                                      workers: int = 1):
         """One DOCX — for each workflow, generate a full DOCX and merge paragraphs."""
         if Document is None:
             raise ImportError("python-docx not installed")
-        import tempfile, os
+        import io
+        from copy import deepcopy
 
         combined = Document()
         for sec in combined.sections:
@@ -1587,23 +1653,90 @@ class ReportGenerator:
         p=combined.add_paragraph(); add_run(p,_tr(loc,f"Generated {datetime.now().strftime('%B %d, %Y')}",f"Erstellt am {datetime.now().strftime('%d.%m.%Y')}"),size=9,color='6e6e73')
         p.paragraph_format.space_after=Pt(14)
 
-        # Write each workflow as its own DOCX, then copy elements
-        for w_idx, analysis_data in enumerate(analyses_list):
-            tmp_path = os.path.join(tempfile.gettempdir(), f'_wf_tmp_{w_idx}.docx')
-            ReportGenerator.generate_docx_report(analysis_data, tmp_path, loc)
-            src = Document(tmp_path)
+        # Each workflow is rendered as its own DOCX (in parallel), then its
+        # body elements are copied in order
+        sections = _map_sections(_render_combined_docx_section,
+                                 [(a, loc) for a in analyses_list], workers)
+        for w_idx, docx_bytes in enumerate(sections):
+            src = Document(io.BytesIO(docx_bytes))
 
             # Divider
             p=combined.add_paragraph(); p.paragraph_format.page_break_before=True
             add_run(p,_tr(loc,f'WORKFLOW {w_idx+1} OF {len(analyses_list)}',f'WORKFLOW {w_idx+1} VON {len(analyses_list)}'),bold=True,size=9,color='6e6e73')
 
             # Copy all body elements
-            from docx.oxml import OxmlElement as OE
-            from copy import deepcopy
             for element in src.element.body:
                 combined.element.body.append(deepcopy(element))
 
-            os.remove(tmp_path)
-
         combined.save(output_path)
         return output_path
+
+
+# ── Combined-report section workers ──────────────────────────────────────────
+# Module-level so they pickle into the process pool. Each returns the rendered
+# file as bytes; the parent process stitches the parts together in order.
+
+def _new_pdf_doc(target):
+    return SimpleDocTemplate(target, pagesize=A4,
+        leftMargin=18*mm, rightMargin=18*mm, topMargin=20*mm, bottomMargin=24*mm)
+
+
+def _render_pdf_story(story: list) -> bytes:
+    """Lay out a story on the report page template, without the page footer."""
+    import io
+    buf = io.BytesIO()
+    _new_pdf_doc(buf).build(story)
+    return buf.getvalue()
+
+
+def _render_combined_pdf_section(analysis_data: Dict, w_idx: int, n_total: int, loc: str) -> bytes:
+    W = A4[0] - 36*mm
+    return _render_pdf_story(ReportGenerator._pdf_workflow_section(analysis_data, w_idx, n_total, W, loc))
+
+
+def _render_combined_docx_section(analysis_data: Dict, loc: str) -> bytes:
+    import io
+    buf = io.BytesIO()
+    ReportGenerator.generate_docx_report(analysis_data, buf, loc)
+    return buf.getvalue()
+
+
+def _merge_pdf_parts(parts: List[bytes], output_path: str, loc: str = 'en'):
+    """Concatenate rendered PDF parts and stamp the shared footer on every page."""
+    import io
+    from pypdf import PdfReader, PdfWriter
+
+    writer = PdfWriter()
+    for part in parts:
+        writer.append(PdfReader(io.BytesIO(part)))
+
+    n_pages = len(writer.pages)
+    overlay_buf = io.BytesIO()
+    overlay = rl_canvas.Canvas(overlay_buf, pagesize=A4)
+    for page_no in range(1, n_pages + 1):
+        _draw_page_footer(overlay, page_no, n_pages, loc)
+        overlay.showPage()
+    overlay.save()
+    for page, footer in zip(writer.pages, PdfReader(overlay_buf).pages):
+        page.merge_page(footer)
+
+    with open(output_path, 'wb') as f:
+        writer.write(f)
+
+
+def _map_sections(fn, arg_tuples: List[tuple], workers: int = 1) -> list:
+    """Run fn(*args) for each tuple, in order — in a process pool when it pays off."""
+    import os
+    workers = min(workers, os.cpu_count() or 1, len(arg_tuples))
+    if workers <= 1:
+        return [fn(*args) for args in arg_tuples]
+    from concurrent.futures.process import BrokenProcessPool
+    from app.core import process_pools
+
+    pool = process_pools.get_pool("reports", workers)
+    try:
+        return list(pool.map(fn, *zip(*arg_tuples)))
+    except BrokenProcessPool as e:
+        print(f"[reports] section pool broken, rendering in-process: {e}")
+        process_pools.discard(pool)
+        return [fn(*args) for args in arg_tuples]
@@ -0,0 +1,89 @@
+"""
+Process-wide caches for the job-scanner pipeline.
+
+Research (Tavily search + Claude task extraction) depends only on the job
+title, industry and analysis context, and a batch analysis only on the task
+list it is given. Consultants re-run the same roles across engagements and
+batches, so both results are kept in TTL'd LRUs and the LLM round trips are
+skipped on a hit. Values are stored as JSON bytes, so every caller gets a
+fresh copy it is free to mutate. Concurrent misses on one key (the same role
+twice in a batch) wait for the first caller instead of repeating its call.
+"""
+import hashlib
+import json
+import re
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.core import timing
+from app.core.config import settings
+from app.core.share_cache import LRUCache
+
+research_cache = LRUCache(settings.SCAN_CACHE_MAX_ENTRIES, settings.SCAN_CACHE_TTL_SECONDS)
+analysis_cache = LRUCache(settings.SCAN_CACHE_MAX_ENTRIES, settings.SCAN_CACHE_TTL_SECONDS)
+
+_SPACES = re.compile(r"\s+")
+_inflight: Dict[tuple, threading.Lock] = {}
+_inflight_guard = threading.Lock()
+
+
+def _cached(cache: LRUCache, key: tuple, compute: Callable[[], object],
+            cacheable: Callable[[object], bool], encode: Callable[[object], object]):
+    """(value, cache hit), computing at most once per key at a time."""
+    hit = cache.get(key)
+    if hit is not None:
+        return json.loads(hit[0]), True
+    with _inflight_guard:
+        lock = _inflight.setdefault(key, threading.Lock())
+    with lock:
+        try:
+            hit = cache.get(key)
+            if hit is not None:
+                return json.loads(hit[0]), True
+            value = compute()
+            if cacheable(value):
+                cache.put(key, json.dumps(encode(value), default=str).encode())
+            return value, False
+        finally:
+            with _inflight_guard:
+                if _inflight.get(key) is lock:
+                    del _inflight[key]
+
+
+def _norm(value: Optional[str]) -> str:
+    return _SPACES.sub(" ", (value or "").strip().lower())
+
+
+def research_key(job_title: str, industry: Optional[str], analysis_context: Optional[str]) -> tuple:
+    return ("research", _norm(job_title), _norm(industry), _norm(analysis_context) or "individual")
+
+
+def cached_research(job_title: str, industry: Optional[str], analysis_context: Optional[str],
+                    research: Callable[[], Dict]) -> Tuple[Dict, bool]:
+    """(scan result, cache hit) — `research` runs only on a miss.
+
+    Only results with tasks are cached, so a failed extraction is retried.
+    """
+    with timing.span("job_scan.research") as sp:
+        value, hit = _cached(research_cache, research_key(job_title, industry, analysis_context), research,
+                             lambda r: bool(r.get("tasks")),
+                             lambda r: {"tasks": r["tasks"], "search_used": r.get("search_used", False)})
+        sp["cache"] = "hit" if hit else "miss"
+    return value, hit
+
+
+def cached_analysis(task_dicts: List[Dict], analyze: Callable[[List[Dict]], List[Dict]],
+                    fallback: Optional[Dict] = None) -> Tuple[List[Dict], bool]:
+    """(per-task analysis results, cache hit) for one task list.
+
+    Results containing `fallback` (the analyzer's error placeholder) are
+    not cached.
+    """
+    raw = json.dumps(task_dicts, sort_keys=True, default=str).encode()
+    with timing.span("job_scan.analysis") as sp:
+        value, hit = _cached(analysis_cache, ("analysis", hashlib.sha256(raw).hexdigest()),
+                             lambda: analyze(task_dicts),
+                             lambda r: bool(r) and len(r) == len(task_dicts) and fallback not in r,
+                             lambda r: r)
+        sp["cache"] = "hit" if hit else "miss"
+    return value, hit
@@ -0,0 +1,87 @@
+"""
+Jobs run by app.services.scheduler — imported by scheduler.start().
+
+  quick_win_digest     daily    T+3 quick-win digest emails (was an external cron ping)
+  share_cache_warmup   10 min   pre-render the most viewed shared reports into share_cache
+  temp_file_cleanup    hourly   delete stale workscan_* report files, prune old job_runs
+
+The Render keep-alive ping stays external: a process can't stop itself
+being spun down.
+"""
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+from fastapi import HTTPException
+from sqlalchemy import func
+
+from app.core import database
+from app.core.config import settings
+from app.core.share_cache import share_cache
+from app.models.workflow import JobRun, PageView
+from app.services.scheduler import job
+
+
+@job("quick_win_digest", interval_seconds=24 * 3600, timeout_seconds=15 * 60)
+async def quick_win_digest():
+    from app.api.routes.cron import run_quick_win_digest
+    db = database.SessionLocal()
+    try:
+        return await run_quick_win_digest(db)
+    finally:
+        db.close()
+
+
+@job("share_cache_warmup", interval_seconds=10 * 60, timeout_seconds=120)
+def share_cache_warmup():
+    from app.api.routes.workflows import cache_shared_analysis
+    since = datetime.now(timezone.utc) - timedelta(hours=24)
+    db = database.SessionLocal()
+    try:
+        rows = (
+            db.query(PageView.path, func.count(PageView.id).label("views"))
+            .filter(PageView.path.like("/report/%"), PageView.created_at >= since)
+            .group_by(PageView.path)
+            .order_by(func.count(PageView.id).desc())
+            .limit(settings.SHARE_WARMUP_TOP)
+            .all()
+        )
+        warmed = 0
+        for path, _ in rows:
+            code = path[len("/report/"):].split("/")[0].split("?")[0]
+            if not code or ("analysis", code) in share_cache:
+                continue
+            try:
+                cache_shared_analysis(db, code)
+                warmed += 1
+            except HTTPException:
+                pass   # unknown code or not analyzed yet
+    finally:
+        db.close()
+    return {"candidates": len(rows), "warmed": warmed}
+
+
+@job("temp_file_cleanup", interval_seconds=3600, timeout_seconds=60)
+def temp_file_cleanup():
+    cutoff = time.time() - settings.TEMP_FILE_MAX_AGE_SECONDS
+    tmp = tempfile.gettempdir()
+    removed = 0
+    for entry in os.scandir(tmp):
+        try:
+            if entry.name.startswith("workscan_") and entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+                removed += 1
+        except OSError:
+            pass   # raced with another remover / in use
+    db = database.SessionLocal()
+    try:
+        pruned = (
+            db.query(JobRun)
+            .filter(JobRun.started_at < datetime.now(timezone.utc) - timedelta(days=settings.SCHEDULER_HISTORY_DAYS))
+            .delete(synchronize_session=False)
+        )
+        db.commit()
+    finally:
+        db.close()
+    return {"files_removed": removed, "runs_pruned": pruned}
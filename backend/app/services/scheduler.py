@@ -0,0 +1,288 @@
+"""
+In-process job scheduler with leader election through a DB lease row.
+
+Replaces external pingers hitting admin endpoints: every web process runs a
+Scheduler thread, but only the one holding the "scheduler" lease (renewed
+every tick, free once it lapses) starts jobs. A job is due when its last run
+in job_runs started more than `interval` ago — so schedules survive restarts
+and spin-downs — with a per-cycle jitter so instances don't fire in lockstep.
+
+Each run executes on a small thread pool, off the request path, and is
+recorded in job_runs (running → ok | error | timeout). A run that outlives
+its timeout is recorded as timed out; coroutine jobs are cancelled, sync
+jobs keep their worker until they return, and the job is not started again
+until they do. The per-job "job:<name>" lease keeps a scheduled run and a
+manual trigger (exclusive()) from overlapping.
+
+Jobs are registered with @job(...) in app.services.scheduled_jobs.
+"""
+import asyncio
+import os
+import random
+import secrets
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout, wait as wait_futures
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterator, List, Optional
+
+from sqlalchemy import func, text
+
+from app.core import database, http_clients
+from app.core.config import settings
+from app.models.workflow import JobRun
+
+HOLDER = f"{socket.gethostname()}:{os.getpid()}:{secrets.token_hex(3)}"
+LEADER_LEASE = "scheduler"
+
+
+class Job:
+    """A registered job: `fn` is a plain function or a coroutine function, no arguments."""
+
+    def __init__(self, name: str, fn: Callable, interval_seconds: float, timeout_seconds: float):
+        self.name = name
+        self.fn = fn
+        self.interval_seconds = interval_seconds
+        self.timeout_seconds = timeout_seconds
+
+    def __call__(self):
+        if asyncio.iscoroutinefunction(self.fn):
+            return asyncio.run(self._run_async())
+        return self.fn()
+
+    async def _run_async(self):
+        try:
+            return await asyncio.wait_for(self.fn(), self.timeout_seconds)
+        finally:
+            # the pooled clients this loop opened go with it
+            await http_clients.aclose_loop_clients()
+
+
+JOBS: Dict[str, Job] = {}
+
+
+def job(name: str, interval_seconds: float, timeout_seconds: float):
+    """Register the decorated function as a scheduled job."""
+    def register(fn):
+        JOBS[name] = Job(name, fn, interval_seconds, timeout_seconds)
+        return fn
+    return register
+
+
+# ---------------------------------------------------------------------------
+# LEASES + RUN HISTORY
+# ---------------------------------------------------------------------------
+
+def acquire_lease(name: str, holder: str, ttl_seconds: float) -> bool:
+    """Take or renew `name` for `ttl_seconds`; True if `holder` now owns it.
+
+    One atomic upsert that only overwrites a lease we already hold or one
+    that has lapsed, then a read of who holds it — safe against concurrent
+    callers on SQLite and over the Turso pipeline alike."""
+    now = time.time()
+    with database.engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO scheduler_leases (name, holder, expires_at) VALUES (:n, :h, :e) "
+            "ON CONFLICT(name) DO UPDATE SET holder = excluded.holder, expires_at = excluded.expires_at "
+            "WHERE scheduler_leases.holder = excluded.holder OR scheduler_leases.expires_at < :now"
+        ), {"n": name, "h": holder, "e": now + ttl_seconds, "now": now})
+    with database.engine.connect() as conn:
+        current = conn.execute(text("SELECT holder FROM scheduler_leases WHERE name = :n"), {"n": name}).scalar()
+    return current == holder
+
+
+def release_lease(name: str, holder: str) -> None:
+    with database.engine.begin() as conn:
+        conn.execute(text("UPDATE scheduler_leases SET expires_at = 0 WHERE name = :n AND holder = :h"),
+                     {"n": name, "h": holder})
+
+
+def _begin_run(name: str, trigger: str, holder: str) -> int:
+    db = database.SessionLocal()
+    try:
+        run = JobRun(job=name, trigger=trigger, holder=holder, status="running",
+                     started_at=datetime.now(timezone.utc))
+        db.add(run)
+        db.commit()
+        return run.id
+    finally:
+        db.close()
+
+
+def _end_run(run_id: int, status: str, started: float, detail: Optional[str]) -> None:
+    db = database.SessionLocal()
+    try:
+        run = db.query(JobRun).filter(JobRun.id == run_id).first()
+        if run is not None:
+            run.status = status
+            run.finished_at = datetime.now(timezone.utc)
+            run.duration_ms = round((time.perf_counter() - started) * 1000, 1)
+            run.detail = (detail or "")[:2000] or None
+            db.commit()
+    finally:
+        db.close()
+    print(f"[scheduler] {status} run #{run_id} in {(time.perf_counter() - started):.1f}s")
+
+
+def last_started() -> Dict[str, datetime]:
+    """{job name: start of its most recent run}."""
+    db = database.SessionLocal()
+    try:
+        rows = db.query(JobRun.job, func.max(JobRun.started_at)).group_by(JobRun.job).all()
+    finally:
+        db.close()
+    out = {}
+    for name, started in rows:
+        if started is not None:
+            out[name] = started if started.tzinfo else started.replace(tzinfo=timezone.utc)
+    return out
+
+
+@contextmanager
+def exclusive(name: str, trigger: str = "http") -> Iterator[bool]:
+    """Run a job body outside the scheduler (e.g. a manual /api/cron call) under
+    its "job:<name>" lease and with a job_runs row. Yields False, without
+    recording anything, when a run is already in progress."""
+    jobdef = JOBS.get(name)
+    ttl = jobdef.timeout_seconds + 60 if jobdef else 3600
+    holder = f"{HOLDER}:{secrets.token_hex(2)}"
+    if not acquire_lease(f"job:{name}", holder, ttl):
+        yield False
+        return
+    run_id, started = _begin_run(name, trigger, holder), time.perf_counter()
+    try:
+        yield True
+    except BaseException as exc:
+        _end_run(run_id, "error", started, repr(exc))
+        raise
+    else:
+        _end_run(run_id, "ok", started, None)
+    finally:
+        release_lease(f"job:{name}", holder)
+
+
+# ---------------------------------------------------------------------------
+# SCHEDULER
+# ---------------------------------------------------------------------------
+
+class Scheduler:
+    def __init__(self, jobs: Optional[Dict[str, Job]] = None, tick_seconds: Optional[float] = None,
+                 lease_seconds: Optional[float] = None, jitter: Optional[float] = None, holder: str = HOLDER):
+        self.jobs = JOBS if jobs is None else jobs
+        self.tick_seconds = settings.SCHEDULER_TICK_SECONDS if tick_seconds is None else tick_seconds
+        self.lease_seconds = settings.SCHEDULER_LEASE_SECONDS if lease_seconds is None else lease_seconds
+        self.jitter = settings.SCHEDULER_JITTER if jitter is None else jitter
+        self.holder = holder
+        self.is_leader = False
+        self._running: Dict[str, int] = {}   # job name → run id
+        self._jitter: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._pool = ThreadPoolExecutor(max_workers=max(len(self.jobs), 1), thread_name_prefix="job")
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._loop, name="scheduler", daemon=True)
+        self._thread.start()
+        print(f"[scheduler] started as {self.holder} with jobs: {', '.join(sorted(self.jobs))}")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        if self.is_leader:
+            try:
+                release_lease(LEADER_LEASE, self.holder)
+            except Exception as exc:
+                print(f"[scheduler] lease release failed: {exc}")
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.tick()
+            except Exception as exc:   # DB unreachable etc. — try again next tick
+                print(f"[scheduler] tick failed: {exc}")
+            self._stop.wait(self.tick_seconds)
+
+    def tick(self) -> List[str]:
+        """Renew/claim leadership and start every due job; returns the names started."""
+        was_leader = self.is_leader
+        self.is_leader = acquire_lease(LEADER_LEASE, self.holder, self.lease_seconds)
+        if self.is_leader != was_leader:
+            print(f"[scheduler] {self.holder} {'is now' if self.is_leader else 'is no longer'} the leader")
+        if not self.is_leader:
+            return []
+        now = datetime.now(timezone.utc)
+        last = last_started()
+        started = []
+        for name, jobdef in self.jobs.items():
+            with self._lock:
+                if name in self._running:
+                    continue
+            factor = self._jitter.setdefault(name, 1 + random.uniform(-self.jitter, self.jitter))
+            prev = last.get(name)
+            if prev is not None and (now - prev).total_seconds() < jobdef.interval_seconds * factor:
+                continue
+            if self._start(jobdef):
+                started.append(name)
+        return started
+
+    def _start(self, jobdef: Job) -> bool:
+        lease = f"job:{jobdef.name}"
+        if not acquire_lease(lease, self.holder, jobdef.timeout_seconds + self.lease_seconds):
+            return False   # a manual run holds it
+        run_id = _begin_run(jobdef.name, "schedule", self.holder)
+        with self._lock:
+            self._running[jobdef.name] = run_id
+        self._jitter.pop(jobdef.name, None)
+        future = self._pool.submit(jobdef)
+        threading.Thread(target=self._supervise, args=(jobdef, run_id, future, time.perf_counter()),
+                         name=f"supervise-{jobdef.name}", daemon=True).start()
+        return True
+
+    def _supervise(self, jobdef: Job, run_id: int, future, started: float) -> None:
+        lease = f"job:{jobdef.name}"
+        try:
+            result = future.result(timeout=jobdef.timeout_seconds)
+            _end_run(run_id, "ok", started, None if result is None else str(result))
+        except (FutureTimeout, asyncio.TimeoutError):
+            _end_run(run_id, "timeout", started, f"exceeded {jobdef.timeout_seconds:g}s")
+        except Exception as exc:
+            _end_run(run_id, "error", started, repr(exc))
+        # A sync job that timed out cannot be stopped and keeps running in
+        # its thread: hold its lease until it ends so a manual run can't overlap
+        while not future.done():
+            try:
+                acquire_lease(lease, self.holder, self.lease_seconds)
+            except Exception as exc:
+                print(f"[scheduler] lease renewal failed: {exc}")
+            wait_futures([future], timeout=self.lease_seconds / 2)
+        with self._lock:
+            self._running.pop(jobdef.name, None)
+        try:
+            release_lease(lease, self.holder)
+        except Exception as exc:
+            print(f"[scheduler] lease release failed: {exc}")
+
+
+_scheduler: Optional[Scheduler] = None
+
+
+def start() -> Scheduler:
+    """Start this process's scheduler with the jobs from app.services.scheduled_jobs."""
+    global _scheduler
+    import app.services.scheduled_jobs  # noqa: F401 — registers the jobs
+    if _scheduler is None:
+        _scheduler = Scheduler()
+        _scheduler.start()
+    return _scheduler
+
+
+def stop() -> None:
+    global _scheduler
+    if _scheduler is not None:
+        _scheduler.stop()
+        _scheduler = None
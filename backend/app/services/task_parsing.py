@@ -0,0 +1,227 @@
+"""
+Free-text → task inventory for POST /api/parse-tasks, map-reduce style.
+
+One prompt per document capped out at max_tokens on long briefings (the 422
+"too many distinct tasks" path). Texts longer than PARSE_CHUNK_CHARS are now
+split on structural boundaries — section headings and the "=== Page/Sheet/
+Slide ===" markers document extraction emits, then paragraphs, lines and
+sentences — and the chunks are parsed concurrently, so latency is that of
+the slowest chunk. A chunk whose reply still hits max_tokens is split again.
+The endpoint is public and each chunk is a paid call, so a request is capped
+at PARSE_MAX_CHARS characters (413) and PARSE_MAX_CALLS calls (422).
+
+The per-chunk task lists are merged locally, without another LLM call:
+tasks whose names are near-duplicates (both token overlap and character-
+level similarity ≥ PARSE_MERGE_SIMILARITY, same numbers) collapse into the
+first one, keeping the fuller description. The workflow name and description come from the
+first chunk, which is where documents usually say what they are about.
+"""
+import asyncio
+import json
+import re
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional
+
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.config import settings
+
+# Coarsest first; all zero-width, so chunks keep the original text exactly
+_BOUNDARIES = (
+    re.compile(r"(?=\n#{1,6} |\n=== )"),
+    re.compile(r"(?<=\n\n)"),
+    re.compile(r"(?<=\n)"),
+    re.compile(r"(?<=[.!?;] )"),
+)
+_WORD = re.compile(r"[a-z0-9]+")
+_STOPWORDS = {"a", "an", "and", "the", "of", "for", "to", "in", "on", "with", "by", "from", "all", "any"}
+
+
+def _pieces(text: str, max_chars: int, level: int = 0) -> List[str]:
+    if len(text) <= max_chars:
+        return [text]
+    if level == len(_BOUNDARIES):
+        return [text[i:i + max_chars] for i in range(0, len(text), max_chars)]
+    out: List[str] = []
+    for part in _BOUNDARIES[level].split(text):
+        out.extend(_pieces(part, max_chars, level + 1))
+    return out
+
+
+def split_text(text: str, max_chars: Optional[int] = None) -> List[str]:
+    """Chunks of at most `max_chars`, cut at the coarsest boundary that fits."""
+    max_chars = settings.PARSE_CHUNK_CHARS if max_chars is None else max_chars
+    chunks, current = [], ""
+    for piece in _pieces(text, max_chars):
+        if current and len(current) + len(piece) > max_chars:
+            chunks.append(current)
+            current = ""
+        current += piece
+    chunks.append(current)
+    return [c.strip() for c in chunks if c.strip()]
+
+
+# ---------------------------------------------------------------------------
+# MAP — one LLM call per chunk
+# ---------------------------------------------------------------------------
+
+def _prompt(text: str, part: Optional[str]) -> str:
+    scope = (f"\nThe input is {part} of a longer document — extract only the tasks described in this part.\n"
+             if part else "")
+    return f"""You are a senior McKinsey consultant specializing in workflow analysis and AI automation strategy.
+{scope}
+USER INPUT:
+{text}
+
+Extract a structured, exhaustive task inventory from this input. Be a rigorous analyst:
+- Decompose vague activities into atomic, measurable tasks
+- Infer frequencies and time estimates from context clues
+- Distinguish operational tasks from strategic ones
+- Do not collapse distinct activities into one task
+
+Respond ONLY with this exact JSON (no markdown, no code fences, no commentary):
+{{
+  "workflow_name": "Concise professional name (3-6 words)",
+  "workflow_description": "One sharp sentence: who does what and why. Business-analyst tone.",
+  "tasks": [
+    {{
+      "name": "Action-verb task name (e.g. 'Reconcile monthly expense reports')",
+      "description": "What exactly happens, what inputs/outputs are involved, who is accountable",
+      "frequency": "daily|weekly|monthly",
+      "time_per_task": 30,
+      "category": "data_entry|communication|analysis|creative|administrative|general",
+      "complexity": "low|medium|high"
+    }}
+  ]
+}}"""
+
+
+class _TooDense(Exception):
+    """The reply hit max_tokens."""
+
+
+_TOO_DENSE = ("This document has too many distinct tasks for a single pass. "
+              "Try splitting it into smaller sections, or use Manual Entry.")
+
+
+class _CallBudget:
+    """LLM calls left for one request — re-splits included."""
+
+    def __init__(self, calls: int):
+        self.left = calls
+
+    def take(self) -> None:
+        if self.left <= 0:
+            raise HTTPException(status_code=422, detail=_TOO_DENSE)
+        self.left -= 1
+
+
+def _call(client, text: str, part: Optional[str]) -> Dict:
+    # Fixed max_tokens=3000 truncated Claude's JSON output mid-string for
+    # longer/denser inputs (e.g. a ~14KB multi-department briefing decomposes
+    # into 20+ tasks), which made json.loads() below throw a cryptic
+    # "Expecting value: line N column M" error — surfaced to users as a
+    # generic HTTP 500 that looked identical to (and was misdiagnosed as) a
+    # Render cold-start failure. Scale the budget with input size instead of
+    # using a flat cap, matching the pattern already used in ai_analyzer.py.
+    message = client.messages.create(
+        model="claude-haiku-4-5-20251001",
+        max_tokens=min(3000 + len(text) // 2, 8000),
+        messages=[{"role": "user", "content": _prompt(text, part)}]
+    )
+    if message.stop_reason == "max_tokens":
+        raise _TooDense()
+
+    response_text = message.content[0].text.strip()
+    if response_text.startswith('```'):
+        lines = response_text.split('\n')
+        response_text = '\n'.join(lines[1:-1])
+    return json.loads(response_text)
+
+
+async def _parse_chunk(client, sem: asyncio.Semaphore, budget: _CallBudget,
+                       text: str, part: Optional[str]) -> List[Dict]:
+    """Parsed replies for `text`: one, or several if it had to be split further."""
+    budget.take()
+    try:
+        async with sem:
+            return [await run_in_threadpool(_call, client, text, part)]
+    except _TooDense:
+        halves = split_text(text, len(text) // 2 + 1)
+        if len(text) < settings.PARSE_MIN_CHUNK_CHARS or len(halves) < 2:
+            # Cut off mid-JSON even at the scaled budget — fail with an
+            # actionable message instead of a raw JSON parse error.
+            raise HTTPException(status_code=422, detail=_TOO_DENSE)
+        print(f"[parse-tasks] {len(text)}-char chunk hit max_tokens, splitting in {len(halves)}")
+        nested = await asyncio.gather(*(_parse_chunk(client, sem, budget, h, part or "a part") for h in halves))
+        return [reply for replies in nested for reply in replies]
+
+
+# ---------------------------------------------------------------------------
+# REDUCE — local near-duplicate merge
+# ---------------------------------------------------------------------------
+
+def _tokens(name: str) -> List[str]:
+    words = [w for w in _WORD.findall(name.lower()) if w not in _STOPWORDS]
+    return [w[:-1] if len(w) > 3 and w.endswith("s") and not w.endswith("ss") else w for w in words]
+
+
+def _numbers(words: List[str]) -> List[str]:
+    return [w for w in words if any(ch.isdigit() for ch in w)]
+
+
+def _similar(a: List[str], b: List[str], threshold: float) -> bool:
+    """Same words (mostly) in the same order — and the same numbers: "Q1"/"Q2" or
+    "site 3"/"site 4" name different tasks however alike they read."""
+    sa, sb = set(a), set(b)
+    if not sa or not sb or _numbers(a) != _numbers(b):
+        return False
+    if len(sa & sb) / len(sa | sb) < threshold:
+        return False
+    m = SequenceMatcher(None, " ".join(a), " ".join(b), autojunk=False)
+    return m.real_quick_ratio() >= threshold and m.quick_ratio() >= threshold and m.ratio() >= threshold
+
+
+def merge_tasks(tasks: List[Dict], threshold: Optional[float] = None) -> List[Dict]:
+    """Tasks in order with near-duplicate names folded into their first occurrence."""
+    threshold = settings.PARSE_MERGE_SIMILARITY if threshold is None else threshold
+    kept: List[Dict] = []
+    keys: List[List[str]] = []
+    for task in tasks:
+        key = _tokens(str(task.get("name", "")))
+        for i, other in enumerate(keys):
+            if _similar(key, other, threshold):
+                if len(str(task.get("description", ""))) > len(str(kept[i].get("description", ""))):
+                    kept[i] = {**kept[i], "description": task["description"]}
+                break
+        else:
+            kept.append(task)
+            keys.append(key)
+    return kept
+
+
+async def parse_tasks(client, text: str) -> Dict:
+    """{workflow_name, workflow_description, tasks} for free-form `text`.
+
+    Every chunk is a paid LLM call, so input is capped: 413 past
+    PARSE_MAX_CHARS, 422 once the chunks and re-splits of dense ones would
+    take more than PARSE_MAX_CALLS calls in all."""
+    if len(text) > settings.PARSE_MAX_CHARS:
+        raise HTTPException(status_code=413, detail=f"Text too long — the limit is {settings.PARSE_MAX_CHARS:,} "
+                                                     "characters. Split it into smaller sections.")
+    chunks = split_text(text) or [text]
+    if len(chunks) > settings.PARSE_MAX_CALLS:
+        raise HTTPException(status_code=422, detail=_TOO_DENSE)   # before any call is made
+    sem = asyncio.Semaphore(settings.PARSE_CHUNK_CONCURRENCY)
+    budget = _CallBudget(settings.PARSE_MAX_CALLS)
+    parts = [None] if len(chunks) == 1 else [f"part {i} of {len(chunks)}" for i in range(1, len(chunks) + 1)]
+    replies = [reply for replies in await asyncio.gather(*(_parse_chunk(client, sem, budget, c, p)
+                                                           for c, p in zip(chunks, parts)))
+               for reply in replies]
+    tasks = [task for reply in replies for task in reply.get("tasks", [])]
+    merged = merge_tasks(tasks) if len(replies) > 1 else tasks
+    if len(replies) > 1:
+        print(f"[parse-tasks] {len(text)} chars in {len(chunks)} chunks ({len(replies)} calls): "
+              f"{len(tasks)} tasks, {len(merged)} after merging")
+    return {**replies[0], "tasks": merged}
@@ -0,0 +1,83 @@
+"""
+Category resolver benchmark — throughput and accuracy of the n8n category lookups.
+
+Feeds every task name in scripts/list_jobs.py's JOB_PROFILES plus every
+suggestion reason text through _guess_cat (cold: the compiled keyword index
+itself, warm: through its lru_cache) and every stored / alias / free-form
+category string through _resolve_category. Accuracy is the share of task
+names whose guessed category matches the category the profile assigns.
+
+Run:
+    cd backend
+    python -m benchmarks.bench_category_resolver
+    python -m benchmarks.bench_category_resolver --rounds 500 --json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.n8n_template_client import (
+    N8nTemplateClient, _ALIASES, _BUILDERS, _guess_cat, _resolve_category,
+)
+from benchmarks.fixtures import load_job_profiles
+
+
+def _reason_texts() -> list:
+    client = N8nTemplateClient()
+    cats = list(_BUILDERS)
+    texts = []
+    for i in range(0, len(cats), 6):
+        tasks = [{"name": c, "category": c} for c in cats[i:i + 6]]
+        texts += [s["relevance_reason"] + " " + s["description"]
+                  for s in client.get_curated_templates("Benchmark", tasks)]
+    return texts
+
+
+def _per_second(fn, items: list, rounds: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        for item in items:
+            fn(item)
+    return round(rounds * len(items) / (time.perf_counter() - t0))
+
+
+def run(rounds: int = 200) -> dict:
+    pairs = [pair for _, tasks in load_job_profiles() for pair in tasks]
+    names = [name for name, _ in pairs]
+    texts = names + _reason_texts()
+    categories = ([c for _, c in pairs] + list(_ALIASES)
+                  + [c.replace("_", " ").title() + " work" for c in _BUILDERS])
+
+    cold = _guess_cat.__wrapped__
+    hits = sum(cold(name) == cat for name, cat in pairs)
+    _guess_cat.cache_clear()
+    return {
+        "texts": len(texts),
+        "rounds": rounds,
+        "guess_cold_per_s": _per_second(cold, texts, rounds),
+        "guess_cached_per_s": _per_second(_guess_cat, texts, rounds),
+        "resolve_per_s": _per_second(_resolve_category, categories, rounds),
+        "guess_accuracy": round(hits / len(pairs), 3),
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--rounds", type=int, default=200)
+    ap.add_argument("--json", action="store_true", help="print the result as JSON only")
+    args = ap.parse_args()
+
+    result = run(args.rounds)
+    if args.json:
+        print(json.dumps(result))
+        return
+    for k, v in result.items():
+        print(f"{k:>20}: {v}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+PDF render benchmark — the baseline for report performance work.
+
+Renders one synthetic 30-task report N times (default 100) through
+ReportGenerator.generate_pdf_report and prints ms per render, ms per page
+and allocation figures (tracemalloc peak + allocated block count per render).
+
+Run:
+    cd backend
+    python -m benchmarks.bench_pdf_render              # 30 tasks x 100 renders
+    python -m benchmarks.bench_pdf_render --tasks 50 --iterations 20 --locale de
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pypdf
+
+from app.services.report_generator import ReportGenerator
+from benchmarks.fixtures import make_analysis_data
+
+
+def run(tasks: int = 30, iterations: int = 100, context: str = "individual",
+        locale: str = "en", alloc_samples: int = 5) -> dict:
+    data = make_analysis_data(tasks, context)
+    out = os.path.join(tempfile.gettempdir(), f"bench_pdf_{os.getpid()}.pdf")
+
+    # Warm-up render: imports, font metrics and any process-level caches.
+    ReportGenerator.generate_pdf_report(data, out, loc=locale)
+    with open(out, "rb") as f:
+        pages = len(pypdf.PdfReader(f).pages)
+
+    gc.collect()
+    t0 = time.perf_counter()
+    for _ in range(iterations):
+        ReportGenerator.generate_pdf_report(data, out, loc=locale)
+    elapsed_ms = (time.perf_counter() - t0) * 1000
+
+    # Allocation pass — separate from timing because tracemalloc is slow.
+    peaks, blocks = [], []
+    tracemalloc.start()
+    for _ in range(alloc_samples):
+        gc.collect()
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        ReportGenerator.generate_pdf_report(data, out, loc=locale)
+        after = tracemalloc.take_snapshot()
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        blocks.append(sum(s.count_diff for s in after.compare_to(before, "filename") if s.count_diff > 0))
+    tracemalloc.stop()
+    os.remove(out)
+
+    per_render = elapsed_ms / iterations
+    return {
+        "tasks": tasks,
+        "iterations": iterations,
+        "context": context,
+        "locale": locale,
+        "pages": pages,
+        "ms_per_render": round(per_render, 2),
+        "ms_per_page": round(per_render / pages, 3),
+        "peak_kib_per_render": round(sum(peaks) / len(peaks) / 1024, 1) if peaks else None,
+        "retained_blocks_per_render": int(sum(blocks) / len(blocks)) if blocks else None,
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--tasks", type=int, default=30)
+    ap.add_argument("--iterations", type=int, default=100)
+    ap.add_argument("--context", default="individual", choices=["individual", "team", "company"])
+    ap.add_argument("--locale", default="en", choices=["en", "de"])
+    ap.add_argument("--alloc-samples", type=int, default=5,
+                    help="renders traced with tracemalloc (0 skips the allocation pass)")
+    ap.add_argument("--json", action="store_true", help="print the result as JSON only")
+    args = ap.parse_args()
+
+    result = run(args.tasks, args.iterations, args.context, args.locale, args.alloc_samples)
+    if args.json:
+        print(json.dumps(result))
+        return
+    for k, v in result.items():
+        print(f"{k:>28}: {v}")
+
+
+if __name__ == "__main__":
+    main()
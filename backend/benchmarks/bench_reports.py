@@ -0,0 +1,166 @@
+"""
+Report generation benchmark suite — every generator across the
+size × context × locale matrix, with a JSON baseline and a compare mode.
+
+Each case renders synthetic fixtures (benchmarks/fixtures.py) through
+generate_pdf_report / generate_docx_report / generate_combined_pdf_report /
+generate_combined_docx_report and records median wall time, peak RSS and
+output size. Every case runs in a fresh worker process so peak RSS belongs to
+that case alone and not to whatever rendered before it.
+
+Run:
+    cd backend
+    python -m benchmarks.bench_reports --save benchmarks/baseline.json
+    python -m benchmarks.bench_reports --compare benchmarks/baseline.json --threshold 15
+    python -m benchmarks.bench_reports --tasks 5 20 --kinds pdf --locales en   # subset
+
+Compare mode exits with status 1 when any case regresses by more than
+--threshold percent on wall time, peak RSS or output size.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SIZES = [5, 20, 50, 100]
+CONTEXTS = ["individual", "team", "company"]
+LOCALES = ["en", "de"]
+KINDS = ["pdf", "docx", "combined_pdf", "combined_docx"]
+METRICS = ["wall_ms", "peak_rss_kib", "output_bytes"]
+
+
+def case_key(kind: str, tasks: int, context: str, locale: str) -> str:
+    return f"{kind}/{tasks}/{context}/{locale}"
+
+
+def _peak_rss_kib():
+    """Peak RSS of this process, or None where `resource` is missing (Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // (1024 if sys.platform == "darwin" else 1)
+
+
+def _run_case(kind: str, tasks: int, context: str, locale: str, repeat: int) -> dict:
+    """Worker body — imported and executed inside a fresh process."""
+    from app.services.report_generator import ReportGenerator
+    from benchmarks.fixtures import make_analysis_data, make_analyses_list
+
+    if kind.startswith("combined_"):
+        data = make_analyses_list(tasks, context)
+    else:
+        data = make_analysis_data(tasks, context)
+    render = {
+        "pdf": ReportGenerator.generate_pdf_report,
+        "docx": ReportGenerator.generate_docx_report,
+        "combined_pdf": ReportGenerator.generate_combined_pdf_report,
+        "combined_docx": ReportGenerator.generate_combined_docx_report,
+    }[kind]
+    ext = "pdf" if kind.endswith("pdf") else "docx"
+    out = os.path.join(tempfile.gettempdir(), f"bench_{os.getpid()}.{ext}")
+
+    render(data, out, loc=locale)  # warm-up: lazy imports, font metrics
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        render(data, out, loc=locale)
+        times.append((time.perf_counter() - t0) * 1000)
+    size = os.path.getsize(out)
+    os.remove(out)
+    return {
+        "wall_ms": round(statistics.median(times), 2),
+        "peak_rss_kib": _peak_rss_kib(),
+        "output_bytes": size,
+    }
+
+
+def _format_case(key: str, case: dict) -> str:
+    """One progress line; peak RSS reads "n/a" where it is not measured (Windows)."""
+    rss = case["peak_rss_kib"]
+    rss = "n/a" if rss is None else f"{rss / 1024:.1f}"
+    return (f"  {key:<36} {case['wall_ms']:>9.1f} ms {rss:>7} MiB "
+            f"{case['output_bytes'] / 1024:>8.1f} KiB")
+
+
+def run_matrix(sizes, contexts, locales, kinds, repeat: int = 3, log=print) -> dict:
+    cases = {}
+    for kind in kinds:
+        for tasks in sizes:
+            for context in contexts:
+                for locale in locales:
+                    key = case_key(kind, tasks, context, locale)
+                    with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as pool:
+                        cases[key] = pool.submit(_run_case, kind, tasks, context, locale, repeat).result()
+                    log(_format_case(key, cases[key]))
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "repeat": repeat,
+        "cases": cases,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold_pct: float) -> list:
+    """Return one dict per (case, metric) that grew by more than threshold_pct."""
+    regressions = []
+    for key, cur in current["cases"].items():
+        base = baseline.get("cases", {}).get(key)
+        if not base:
+            continue
+        for metric in METRICS:
+            old, new = base.get(metric), cur.get(metric)
+            if not old or new is None:
+                continue
+            delta = (new - old) / old * 100
+            if delta > threshold_pct:
+                regressions.append({"case": key, "metric": metric, "baseline": old,
+                                    "current": new, "delta_pct": round(delta, 1)})
+    return regressions
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--tasks", type=int, nargs="+", default=SIZES)
+    ap.add_argument("--contexts", nargs="+", default=CONTEXTS, choices=CONTEXTS)
+    ap.add_argument("--locales", nargs="+", default=LOCALES, choices=LOCALES)
+    ap.add_argument("--kinds", nargs="+", default=KINDS, choices=KINDS)
+    ap.add_argument("--repeat", type=int, default=3, help="renders per case; the median is kept")
+    ap.add_argument("--save", metavar="PATH", help="write the results as a JSON baseline")
+    ap.add_argument("--compare", metavar="PATH", help="compare against a saved JSON baseline")
+    ap.add_argument("--threshold", type=float, default=10.0,
+                    help="percent growth that counts as a regression (default 10)")
+    args = ap.parse_args()
+
+    result = run_matrix(args.tasks, args.contexts, args.locales, args.kinds, args.repeat)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(result, f, indent=2)
+        print(f"[bench] baseline written to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(result, baseline, args.threshold)
+        if not regressions:
+            print(f"[bench] no regressions over {args.threshold}% against {args.compare}")
+            return
+        print(f"[bench] {len(regressions)} regression(s) over {args.threshold}%:")
+        for r in regressions:
+            print(f"  {r['case']:<36} {r['metric']:<13} {r['baseline']} → {r['current']} (+{r['delta_pct']}%)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
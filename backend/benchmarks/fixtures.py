@@ -0,0 +1,118 @@
+"""
+Synthetic report fixtures — `analysis_data` dicts shaped exactly like the
+output of `app.api.routes.reports._build_analysis_data`, so the report
+generator can be exercised without a DB, an API key or a real analysis.
+
+Deterministic: the same (n_tasks, context, seed) always yields the same dict,
+which keeps benchmark runs comparable across commits.
+"""
+import json
+import random
+
+_VERBS = ["Reconcile", "Draft", "Review", "Update", "Triage", "Compile",
+          "Schedule", "Analyse", "Prepare", "Monitor", "Validate", "Summarise"]
+_OBJECTS = ["monthly expense reports", "client onboarding emails", "sales pipeline in CRM",
+            "weekly KPI dashboard", "support ticket queue", "vendor invoices",
+            "team standup notes", "compliance checklist", "social media calendar",
+            "contract renewal tracker", "board meeting deck", "inventory spreadsheet"]
+_CATEGORIES = ["data_entry", "communication", "analysis", "creative", "admin", "general"]
+_FREQUENCIES = ["daily", "weekly", "monthly"]
+_DIFFICULTIES = ["easy", "medium", "hard"]
+_RISK = ["safe", "caution", "warning"]
+_WINDOWS = ["now", "12-24", "24-48", "48+"]
+_REC = ("Option 1 — Zapier (€20/mo): pulls the source rows, normalises them and posts a "
+        "summary to Slack; setup 3h, payback 2w. Option 2 — n8n self-hosted (free): same "
+        "pipeline with an LLM step for anomaly notes; setup 6h, payback 4w.")
+_SKILLS = ["AI prompt engineering", "Stakeholder management", "Data storytelling",
+           "Process design", "Change management", "Vendor negotiation"]
+_ROLES = [{"role": "AI Operations Manager", "risk": "low", "pivot_distance": "easy", "automation_score_pct": 38},
+          {"role": "Strategy Consultant", "risk": "low", "pivot_distance": "medium", "automation_score_pct": 42},
+          {"role": "Product Manager", "risk": "medium", "pivot_distance": "medium", "automation_score_pct": 52}]
+
+
+def make_analysis_data(n_tasks: int = 30, context: str = "individual", seed: int = 0) -> dict:
+    """Return one synthetic analysis dict with `n_tasks` fully-populated results."""
+    rng = random.Random(f"{n_tasks}:{context}:{seed}")
+    results = []
+    for i in range(n_tasks):
+        subs = [rng.uniform(20, 95) for _ in range(4)]
+        score = round(subs[0] * 0.3 + subs[1] * 0.3 + subs[2] * 0.2 + subs[3] * 0.2, 1)
+        phase = rng.choice([1, 2, 3])
+        results.append({
+            "task": {
+                "name": f"{rng.choice(_VERBS)} {rng.choice(_OBJECTS)} #{i + 1}",
+                "description": "Pull the latest figures from the shared drive, cross-check "
+                               "them against last period and flag anything that moved by more "
+                               "than 10% for the owner to review.",
+                "frequency": rng.choice(_FREQUENCIES),
+                "time_per_task": rng.choice([15, 30, 45, 60, 90]),
+                "category": rng.choice(_CATEGORIES),
+                "complexity": rng.choice(["low", "medium", "high"]),
+            },
+            "ai_readiness_score": score,
+            "score_repeatability": round(subs[0], 1),
+            "score_data_availability": round(subs[1], 1),
+            "score_error_tolerance": round(subs[2], 1),
+            "score_integration": round(subs[3], 1),
+            "time_saved_percentage": round(rng.uniform(20, 80), 1),
+            "recommendation": _REC,
+            "difficulty": rng.choice(_DIFFICULTIES),
+            "estimated_hours_saved": round(rng.uniform(5, 120), 1),
+            "risk_level": rng.choice(_RISK),
+            "risk_flag": "Customer data leaves the CRM — keep a human approval step.",
+            "score_confidence": rng.choice(["high", "medium", "low"]),
+            "agent_phase": phase,
+            "agent_label": {1: "Phase 1: Human-in-Loop", 2: "Phase 2: Supervised",
+                            3: "Phase 3: Full Delegation"}[phase],
+            "agent_milestone": "Automate 50% of volume with <2% error rate for 4 weeks.",
+            "orchestration": rng.choice(["pipeline", "human-assist", "supervised"]),
+            "countdown_window": rng.choice(_WINDOWS),
+            "human_edge_score": round(rng.uniform(20, 90), 1),
+            "pivot_skills": json.dumps(rng.sample(_SKILLS, 4)),
+            "pivot_roles": json.dumps(_ROLES),
+        })
+    hours = round(sum(r["estimated_hours_saved"] for r in results), 2)
+    return {
+        "prepared_for": None,
+        "prepared_by": None,
+        "workflow": {
+            "id": seed + 1,
+            "name": f"Synthetic {context.title()} Workflow ({n_tasks} tasks)",
+            "description": "Benchmark fixture generated by benchmarks/fixtures.py.",
+            "source_text": "",
+            "input_mode": "manual",
+        },
+        "automation_score": round(sum(r["ai_readiness_score"] for r in results) / max(n_tasks, 1), 2),
+        "hours_saved": hours,
+        "annual_savings": round(hours * 50, 2),
+        "hourly_rate": 50,
+        "readiness_score": 62.5,
+        "readiness_data_quality": 58.0,
+        "readiness_process_docs": 71.0,
+        "readiness_tool_maturity": 55.0,
+        "readiness_team_skills": 66.0,
+        "analysis_context": context,
+        "results": results,
+    }
+
+
+def make_analyses_list(n_tasks: int = 30, context: str = "individual", n_workflows: int = 3) -> list:
+    """Return `n_workflows` analyses sharing `n_tasks` between them, as fed to the combined reports."""
+    per = [n_tasks // n_workflows + (1 if i < n_tasks % n_workflows else 0) for i in range(n_workflows)]
+    return [make_analysis_data(n, context, seed=i) for i, n in enumerate(per)]
+
+
+def load_job_profiles() -> list:
+    """JOB_PROFILES from scripts/list_jobs.py — (job title, [(task name, category), ...]).
+
+    Read with ast because the script prints its whole report at import time.
+    """
+    import ast
+    import os
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts", "list_jobs.py")
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and getattr(node.targets[0], "id", None) == "JOB_PROFILES":
+            return ast.literal_eval(node.value)
+    raise LookupError("JOB_PROFILES not found in scripts/list_jobs.py")
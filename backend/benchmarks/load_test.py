@@ -0,0 +1,310 @@
+"""
+End-to-end load test — the analyze, research and share flows under rising
+concurrency, with per-endpoint latency percentiles, error rates and
+throughput, a JSON baseline and a compare mode.
+
+Each virtual user loops over one journey until its stage ends:
+
+    POST /api/workflows → POST /api/analyze (JSON, or SSE on every other
+    journey) → GET /api/share/{code} → GET /api/reports/{id}/pdf →
+    POST /api/job-scan/research → POST /api/job-scan/analyze → POST /api/track
+
+By default the harness boots its own uvicorn with LLM_BACKEND=stub (the
+offline client in app/services/llm_client.py), on a throwaway SQLite file,
+with TAVILY_API_KEY and RESEND_API_KEY blanked: the scanner falls back to
+model knowledge and nothing is emailed, so no request leaves the machine.
+`--libsql http://127.0.0.1:8080` points it at a local libSQL server (sqld)
+instead; `--url` targets a server you started yourself.
+
+Run:
+    cd backend
+    python -m benchmarks.load_test --stages 1 4 16 --duration 20 --save benchmarks/load_baseline.json
+    python -m benchmarks.load_test --stages 1 4 16 --duration 20 --compare benchmarks/load_baseline.json
+    python -m benchmarks.load_test --stub-latency-ms 1500 --stub-tokens-per-second 80   # slower model
+
+Compare mode exits with status 1 when any (stage, endpoint) regresses by
+more than --threshold percent on p50/p95/p99 or throughput, or its error
+rate rises by more than --threshold percentage points.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+STAGES = [1, 4, 16]
+ADMIN_SECRET = "load-test"
+LATENCY_METRICS = ["p50_ms", "p95_ms", "p99_ms"]
+JOB_TITLES = ["Accountant", "Recruiter", "Marketing Manager", "Paralegal", "Data Analyst",
+              "Customer Support Agent", "Office Manager", "Sales Representative"]
+TASKS = [
+    {"name": "Reconcile vendor invoices", "description": "Match supplier invoices against purchase orders",
+     "frequency": "weekly", "time_per_task": 60, "category": "data_entry"},
+    {"name": "Draft client follow-up emails", "description": "Write follow-ups after every client call",
+     "frequency": "daily", "time_per_task": 20, "category": "communication"},
+    {"name": "Update CRM pipeline", "description": "Move deals between stages and log next steps",
+     "frequency": "daily", "time_per_task": 15, "category": "data_entry"},
+    {"name": "Compile monthly KPI report", "description": "Pull figures from three tools into one deck",
+     "frequency": "monthly", "time_per_task": 120, "category": "analysis"},
+    {"name": "Schedule team meetings", "description": "Find slots and send invites for recurring syncs",
+     "frequency": "weekly", "time_per_task": 30, "category": "administrative"},
+]
+
+
+# ---------------------------------------------------------------------------
+# STATS
+# ---------------------------------------------------------------------------
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile; 0.0 for no samples."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))   # ceil
+    return ordered[int(rank) - 1]
+
+
+def summarise(samples: List[tuple], elapsed_s: float) -> Dict[str, dict]:
+    """(endpoint, ok, ms) samples → per-endpoint count/error_rate/percentiles/throughput."""
+    by_endpoint: Dict[str, List[tuple]] = {}
+    for endpoint, ok, ms in samples:
+        by_endpoint.setdefault(endpoint, []).append((ok, ms))
+    out = {}
+    for endpoint, rows in sorted(by_endpoint.items()):
+        times = [ms for _, ms in rows]
+        errors = sum(1 for ok, _ in rows if not ok)
+        out[endpoint] = {
+            "count": len(rows),
+            "errors": errors,
+            "error_rate": round(errors / len(rows), 4),
+            "p50_ms": round(percentile(times, 50), 1),
+            "p95_ms": round(percentile(times, 95), 1),
+            "p99_ms": round(percentile(times, 99), 1),
+            "throughput_rps": round(len(rows) / elapsed_s, 2) if elapsed_s > 0 else 0.0,
+        }
+    return out
+
+
+def compare(current: dict, baseline: dict, threshold_pct: float) -> list:
+    """Return one dict per (case, metric) that got worse by more than threshold_pct."""
+    regressions = []
+    for key, cur in current["cases"].items():
+        base = baseline.get("cases", {}).get(key)
+        if not base:
+            continue
+        for metric in LATENCY_METRICS + ["throughput_rps"]:
+            old, new = base.get(metric), cur.get(metric)
+            if not old or new is None:
+                continue
+            delta = (new - old) / old * 100
+            if metric == "throughput_rps":
+                delta = -delta
+            if delta > threshold_pct:
+                regressions.append({"case": key, "metric": metric, "baseline": old,
+                                    "current": new, "delta_pct": round(delta, 1)})
+        old, new = base.get("error_rate", 0.0), cur.get("error_rate", 0.0)
+        if (new - old) * 100 > threshold_pct:
+            regressions.append({"case": key, "metric": "error_rate", "baseline": old,
+                                "current": new, "delta_pct": round((new - old) * 100, 1)})
+    return regressions
+
+
+# ---------------------------------------------------------------------------
+# JOURNEY
+# ---------------------------------------------------------------------------
+
+class _Recorder:
+    def __init__(self):
+        self.samples: List[tuple] = []
+        self._lock = threading.Lock()
+
+    def timed(self, endpoint: str, send: Callable[[], httpx.Response], expect=(200, 201)) -> Optional[httpx.Response]:
+        t0 = time.perf_counter()
+        try:
+            resp = send()
+            ok = resp.status_code in expect
+        except httpx.HTTPError as exc:
+            print(f"[load] {endpoint} failed: {exc}")
+            resp, ok = None, False
+        with self._lock:
+            self.samples.append((endpoint, ok, (time.perf_counter() - t0) * 1000))
+        return resp if ok else None
+
+
+def _analyze_sse(http: httpx.Client, workflow_id: int) -> httpx.Response:
+    """Stream the SSE analyze to its final event; a 200 whose last stage is not 'done' counts as an error."""
+    with http.stream("POST", "/api/analyze", json={"workflow_id": workflow_id},
+                     headers={"accept": "text/event-stream"}) as resp:
+        last = None
+        for line in resp.iter_lines():
+            if line.startswith("data: "):
+                last = json.loads(line[6:]).get("stage")
+        if resp.status_code == 200 and last != "done":
+            resp.status_code = 502
+        return resp
+
+
+def run_journey(http: httpx.Client, n: int, rec: _Recorder) -> None:
+    """One user: create → analyze → share → PDF → job scan → track."""
+    created = rec.timed("workflows.create", lambda: http.post("/api/workflows", json={
+        "name": f"Load test workflow {n}", "description": "Synthetic load-test workflow",
+        "analysis_context": "individual", "tasks": TASKS}))
+    if created is not None:
+        wf = created.json()
+        if n % 2:
+            analyzed = rec.timed("analyze.sse", lambda: _analyze_sse(http, wf["id"]))
+        else:
+            analyzed = rec.timed("analyze.json", lambda: http.post("/api/analyze", json={"workflow_id": wf["id"]}))
+        if analyzed is not None:
+            rec.timed("share", lambda: http.get(f"/api/share/{wf['share_code']}"))
+            rec.timed("reports.pdf", lambda: http.get(f"/api/reports/{wf['id']}/pdf"))
+
+    title = JOB_TITLES[n % len(JOB_TITLES)]
+    research = rec.timed("job_scan.research", lambda: http.post("/api/job-scan/research", json={"job_title": title}))
+    if research is not None:
+        rec.timed("job_scan.analyze", lambda: http.post("/api/job-scan/analyze", json={
+            "job_title": title, "tasks": research.json()["tasks"]}))
+
+    rec.timed("track", lambda: http.post("/api/track", json={"path": f"/report/{n}", "referrer": "load-test"}))
+
+
+def run_stage(client_factory: Callable[[], httpx.Client], concurrency: int, duration_s: float,
+              journeys: Optional[int] = None) -> dict:
+    """`concurrency` virtual users looping journeys for `duration_s` (or `journeys` each)."""
+    rec = _Recorder()
+    deadline = time.perf_counter() + duration_s
+    counter = iter(range(10 ** 9))
+    counter_lock = threading.Lock()
+
+    def _user():
+        with client_factory() as http:
+            done = 0
+            while time.perf_counter() < deadline and (journeys is None or done < journeys):
+                with counter_lock:
+                    n = next(counter)
+                run_journey(http, n, rec)
+                done += 1
+
+    started = time.perf_counter()
+    users = [threading.Thread(target=_user, name=f"load-user-{i}") for i in range(concurrency)]
+    for u in users:
+        u.start()
+    for u in users:
+        u.join()
+    return summarise(rec.samples, time.perf_counter() - started)
+
+
+# ---------------------------------------------------------------------------
+# SERVER
+# ---------------------------------------------------------------------------
+
+def start_server(port: int, workdir: str, libsql: Optional[str], latency_ms: float,
+                 tokens_per_second: float) -> subprocess.Popen:
+    """Boot uvicorn with every external backend stubbed or disabled."""
+    env = dict(os.environ,
+               LLM_BACKEND="stub",
+               LLM_STUB_LATENCY_MS=str(latency_ms),
+               LLM_STUB_TOKENS_PER_SECOND=str(tokens_per_second),
+               DATABASE_URL=f"sqlite:///{os.path.join(workdir, 'load.db')}",
+               TURSO_DATABASE_URL=libsql or "",
+               TURSO_AUTH_TOKEN="local" if libsql else "",
+               TAVILY_API_KEY="", RESEND_API_KEY="", RECAPTCHA_SECRET_KEY="",
+               ADMIN_SECRET=ADMIN_SECRET, DEBUG="false")
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=backend_dir, env=env, stdout=open(os.path.join(workdir, "server.log"), "w"),
+        stderr=subprocess.STDOUT)
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"server exited with {proc.returncode}; see {workdir}/server.log")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1.0).status_code == 200:
+                return proc
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    proc.terminate()
+    raise RuntimeError("server did not become healthy within 60s")
+
+
+def run(base_url: str, stages: List[int], duration_s: float, log=print) -> dict:
+    def factory():
+        # The admin secret lifts the 5/24h analysis quota for the synthetic users
+        return httpx.Client(base_url=base_url, timeout=300.0, headers={"x-admin-secret": ADMIN_SECRET})
+
+    cases = {}
+    for concurrency in stages:
+        log(f"[load] stage c={concurrency} for {duration_s:.0f}s")
+        for endpoint, row in run_stage(factory, concurrency, duration_s).items():
+            cases[f"c{concurrency}/{endpoint}"] = row
+            log(f"  {endpoint:<18} n={row['count']:<5} err={row['error_rate'] * 100:>5.1f}% "
+                f"p50={row['p50_ms']:>8.1f} p95={row['p95_ms']:>8.1f} p99={row['p99_ms']:>8.1f} ms "
+                f"{row['throughput_rps']:>7.2f} req/s")
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "duration_s": duration_s,
+        "cases": cases,
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--stages", type=int, nargs="+", default=STAGES, help="concurrency per ramp stage")
+    ap.add_argument("--duration", type=float, default=20.0, help="seconds per stage")
+    ap.add_argument("--url", help="target an already running server instead of booting one")
+    ap.add_argument("--libsql", metavar="URL", help="local libSQL server for the booted app, e.g. http://127.0.0.1:8080")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--stub-latency-ms", type=float, default=400.0)
+    ap.add_argument("--stub-tokens-per-second", type=float, default=150.0)
+    ap.add_argument("--save", metavar="PATH", help="write the results as a JSON baseline")
+    ap.add_argument("--compare", metavar="PATH", help="compare against a saved JSON baseline")
+    ap.add_argument("--threshold", type=float, default=15.0,
+                    help="percent worsening that counts as a regression (default 15)")
+    args = ap.parse_args()
+
+    proc = None
+    with tempfile.TemporaryDirectory(prefix="workscan-load-") as workdir:
+        base_url = args.url
+        if not base_url:
+            proc = start_server(args.port, workdir, args.libsql, args.stub_latency_ms, args.stub_tokens_per_second)
+            base_url = f"http://127.0.0.1:{args.port}"
+        try:
+            result = run(base_url, args.stages, args.duration)
+        finally:
+            if proc:
+                proc.terminate()
+                proc.wait(timeout=10)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(result, f, indent=2)
+        print(f"[load] baseline written to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(result, baseline, args.threshold)
+        if not regressions:
+            print(f"[load] no regressions over {args.threshold}% against {args.compare}")
+            return
+        print(f"[load] {len(regressions)} regression(s) over {args.threshold}%:")
+        for r in regressions:
+            print(f"  {r['case']:<30} {r['metric']:<15} {r['baseline']} → {r['current']} ({r['delta_pct']:+}%)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,8 @@ Auth for the rate-limit bypass (so this doesn't hit the public 5/24h cap):
   - If neither is available and quota is exhausted, /api/analyze returns 429.
 
 Run: set WSAI_ADMIN_SECRET=...  &&  backend/venv/Scripts/python.exe scripts/gen_vertical_samples_batch2.py
+     add --bulk to analyze all verticals as ONE Anthropic Message Batch via
+     /api/admin/bulk-analyze (needs the admin secret; slower to finish, cheaper)
 Output: prints share_code + numbers per vertical -> paste into VERTICALS in
 frontend/src/app/templates/verticals.ts.
 """
@@ -103,7 +105,19 @@ def _headers():
     return h
 
 
-def create_and_analyze(v):
+def _summary(v, wid, code, a):
+    return {
+        "key": v["key"],
+        "share_code": code,
+        "workflow_id": wid,
+        "score": round(a.get("automation_score", 0)),
+        "annualSavings": int(a.get("annual_savings", 0) or 0),
+        "hoursSaved": round(a.get("hours_saved", 0) or 0),
+        "tasks": len(a.get("results", [])),
+    }
+
+
+def create_workflow(v):
     payload = {
         "name": v["name"],
         "description": f"Pre-generated WorkScanAI sample: {v['name']}",
@@ -116,8 +130,11 @@ def create_and_analyze(v):
     r = requests.post(f"{BASE}/api/workflows", json=payload, headers=_headers(), timeout=120)
     r.raise_for_status()
     wf = r.json()
-    wid = wf["id"]
-    code = wf.get("share_code")
+    return wf["id"], wf.get("share_code")
+
+
+def create_and_analyze(v):
+    wid, code = create_workflow(v)
     ar = requests.post(
         f"{BASE}/api/analyze",
         json={"workflow_id": wid, "hourly_rate": HOURLY_RATE},
@@ -125,21 +142,43 @@ def create_and_analyze(v):
         timeout=300,
     )
     ar.raise_for_status()
-    a = ar.json()
-    return {
-        "key": v["key"],
-        "share_code": code,
-        "workflow_id": wid,
-        "score": round(a.get("automation_score", 0)),
-        "annualSavings": int(a.get("annual_savings", 0) or 0),
-        "hoursSaved": round(a.get("hours_saved", 0) or 0),
-        "tasks": len(a.get("results", [])),
-    }
+    return _summary(v, wid, code, ar.json())
+
+
+def bulk_create_and_analyze(verticals, poll_seconds=60):
+    """Create every workflow, submit them as one Message Batch, wait for the reports."""
+    created = []
+    for v in verticals:
+        wid, code = create_workflow(v)
+        print(f"[{v['key']}] created workflow {wid} ({code})", flush=True)
+        created.append((v, wid, code))
+    r = requests.post(f"{BASE}/api/admin/bulk-analyze", headers=_headers(), timeout=60,
+                      json={"workflow_ids": [wid for _, wid, _ in created], "hourly_rate": HOURLY_RATE})
+    r.raise_for_status()
+    print(f"bulk analysis queued for {r.json()['queued']} workflows — polling every {poll_seconds}s", flush=True)
+    results, pending = [], list(created)
+    while pending:
+        time.sleep(poll_seconds)
+        for item in list(pending):
+            v, wid, code = item
+            sr = requests.get(f"{BASE}/api/share/{code}", timeout=60)
+            if sr.ok:
+                results.append(_summary(v, wid, code, sr.json()))
+                pending.remove(item)
+                print(f"  [{v['key']}] done", flush=True)
+    return results
 
 
 if __name__ == "__main__":
     only = [x for x in sys.argv[1:] if not x.startswith("--")]
     print("admin-secret:", "set" if ADMIN_SECRET else "NOT set (relying on OWNER_IP)")
+    if "--bulk" in sys.argv:
+        if not ADMIN_SECRET:
+            sys.exit("--bulk needs WSAI_ADMIN_SECRET (the bulk endpoint is admin-only)")
+        results = bulk_create_and_analyze([v for v in VERTICALS if not only or v["key"] in only])
+        print("\n=== SUMMARY (paste into verticals.ts) ===")
+        print(json.dumps(results, indent=2))
+        sys.exit(0)
     results = []
     for v in VERTICALS:
         if only and v["key"] not in only:
@@ -0,0 +1,126 @@
+"""
+Offline stand-in for the Anthropic Message Batches API.
+
+Serves the three endpoints the SDK uses — create, retrieve and the JSONL
+results stream — on a local port, so the real Anthropic client can be
+pointed at it with ANTHROPIC_BASE_URL. A batch reports in_progress for the
+first `polls_until_ended` retrieves, then ended. Each request's reply text
+comes from `responder(custom_id, params)`; returning None makes that
+request come back as errored.
+"""
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_N_TASKS = re.compile(r"output EXACTLY (\d+) task blocks")
+
+
+def analysis_reply(custom_id, params):
+    """A well-formed analysis for every task in the prompt; scores vary by position."""
+    n = int(_N_TASKS.search(params["messages"][0]["content"]).group(1))
+    blocks = []
+    for i in range(1, n + 1):
+        blocks.append(
+            f"---TASK_{i}---\n"
+            f"SCORE_REPEATABILITY: {90 - i}\nSCORE_DATA: 80\nSCORE_ERROR: 70\nSCORE_INTEGRATION: 60\n"
+            f"COMPOSITE_SCORE: {80 - i}\nTIME_SAVED: 60\nDIFFICULTY: easy\nRISK_LEVEL: safe\n"
+            f"RISK_FLAG: None.\nRECOMMENDATION: Batch recommendation {custom_id}/{i}\n"
+        )
+    return "\n".join(blocks)
+
+
+class BatchStub:
+    def __init__(self, responder=analysis_reply, polls_until_ended=1):
+        self.responder = responder
+        self.polls_until_ended = polls_until_ended
+        self.batches = {}
+        self.created = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body, content_type="application/json"):
+                data = body if isinstance(body, bytes) else json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                if self.path.rstrip("/") == "/v1/messages/batches":
+                    return self._send(200, stub._create(payload["requests"]))
+                m = re.fullmatch(r"/v1/messages/batches/([\w-]+)/cancel", self.path)
+                if m and m.group(1) in stub.batches:
+                    stub.batches[m.group(1)]["status"] = "canceling"
+                    return self._send(200, stub._view(m.group(1)))
+                self._send(404, {"type": "error", "error": {"type": "not_found_error", "message": self.path}})
+
+            def do_GET(self):
+                m = re.fullmatch(r"/v1/messages/batches/([\w-]+)(/results)?", self.path.split("?")[0])
+                if not m or m.group(1) not in stub.batches:
+                    return self._send(404, {"type": "error", "error": {"type": "not_found_error", "message": self.path}})
+                if m.group(2):
+                    return self._send(200, stub._results(m.group(1)), "application/binary")
+                batch = stub.batches[m.group(1)]
+                batch["polls"] += 1
+                if batch["polls"] >= stub.polls_until_ended and batch["status"] == "in_progress":
+                    batch["status"] = "ended"
+                self._send(200, stub._view(m.group(1)))
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _create(self, requests):
+        batch_id = f"msgbatch_{len(self.batches) + 1:04d}"
+        self.batches[batch_id] = {"requests": requests, "status": "in_progress", "polls": 0}
+        self.created.append(batch_id)
+        return self._view(batch_id)
+
+    def _view(self, batch_id):
+        batch = self.batches[batch_id]
+        ended = batch["status"] == "ended"
+        n = len(batch["requests"])
+        return {
+            "id": batch_id,
+            "type": "message_batch",
+            "processing_status": batch["status"],
+            "request_counts": {"processing": 0 if ended else n, "succeeded": n if ended else 0,
+                               "errored": 0, "canceled": 0, "expired": 0},
+            "created_at": "2026-01-01T00:00:00Z",
+            "expires_at": "2026-01-02T00:00:00Z",
+            "ended_at": "2026-01-01T00:10:00Z" if ended else None,
+            "archived_at": None,
+            "cancel_initiated_at": None,
+            "results_url": f"{self.url}/v1/messages/batches/{batch_id}/results" if ended else None,
+        }
+
+    def _results(self, batch_id):
+        lines = []
+        for req in reversed(self.batches[batch_id]["requests"]):   # order is not guaranteed
+            text = self.responder(req["custom_id"], req["params"])
+            if text is None:
+                result = {"type": "errored", "error": {"type": "error", "error": {
+                    "type": "overloaded_error", "message": "stub"}}}
+            else:
+                result = {"type": "succeeded", "message": {
+                    "id": f"msg_{req['custom_id']}", "type": "message", "role": "assistant",
+                    "model": req["params"]["model"], "content": [{"type": "text", "text": text}],
+                    "stop_reason": "end_turn", "stop_sequence": None,
+                    "usage": {"input_tokens": 10, "output_tokens": 10}}}
+            lines.append(json.dumps({"custom_id": req["custom_id"], "result": result}))
+        return ("\n".join(lines) + "\n").encode()
@@ -0,0 +1,117 @@
+"""
+Tests for precomputed report snapshots — written at analysis time, served by
+/api/results and /api/share, never written by a read, built for legacy rows
+by the admin backfill.
+"""
+from app.core.turso_dbapi import _from_cell, _to_args
+from app.core.share_cache import share_cache
+from tests.test_analyze_streaming_integration import client, _create_workflow  # noqa: F401
+
+HEADERS = {"x-user-email": "test@example.com"}
+
+
+def _analyze(client):
+    workflow_id = _create_workflow(client, "Snapshot test")
+    resp = client.post(
+        "/api/analyze",
+        json={"workflow_id": workflow_id, "hourly_rate": 50.0, "recaptcha_token": ""},
+        headers={**HEADERS, "Accept": "application/json"},
+    )
+    assert resp.status_code == 200, resp.text
+    return resp.json()
+
+
+def _snapshot_count():
+    from app.core import database
+    from app.models.workflow import AnalysisSnapshot
+    db = database.SessionLocal()
+    try:
+        return db.query(AnalysisSnapshot).count()
+    finally:
+        db.close()
+
+
+def test_snapshot_written_at_analysis_time(client):
+    analysis = _analyze(client)
+    assert _snapshot_count() == 1
+
+    resp = client.get(f"/api/results/{analysis['workflow_id']}", headers=HEADERS)
+    assert resp.status_code == 200
+    assert resp.headers["content-encoding"] == "gzip"
+    body = resp.json()
+    assert body["id"] == analysis["id"]
+    assert body["automation_score"] == 80
+    assert body["results"][0]["task_id"] == analysis["results"][0]["task_id"]
+    assert body["workflow"]["tasks"][0]["name"] == "Test task A"
+    # the canvas and source text stay out of the report; the canvas has its own endpoint
+    assert "n8n_workflow_json" not in body["workflow"] and "source_text" not in body["workflow"]
+    assert client.get(f"/api/workflows/{analysis['workflow_id']}/n8n-canvas").status_code == 200
+
+
+def test_results_uncompressed_for_clients_without_gzip(client):
+    analysis = _analyze(client)
+    resp = client.get(f"/api/results/{analysis['workflow_id']}",
+                      headers={**HEADERS, "Accept-Encoding": "identity"})
+    assert resp.status_code == 200
+    assert "content-encoding" not in resp.headers
+    assert resp.json()["id"] == analysis["id"]
+
+
+def _drop_all_snapshots():
+    from app.core import database
+    from app.models.workflow import AnalysisSnapshot
+    db = database.SessionLocal()
+    db.query(AnalysisSnapshot).delete()
+    db.commit()
+    db.close()
+
+
+def test_legacy_row_is_served_live_and_backfilled_by_admin(client):
+    from app.api.routes import admin
+    from app.core import database
+    from app.core.auth import require_admin
+    from app.main import app
+
+    share_cache.clear()
+    analysis = _analyze(client)
+    _drop_all_snapshots()
+
+    code = analysis["workflow"]["share_code"]
+    resp = client.get(f"/api/share/{code}")
+    assert resp.status_code == 200
+    assert resp.json()["results"][0]["ai_readiness_score"] == 80
+    assert "n8n_workflow_json" not in resp.json()["workflow"]
+    assert _snapshot_count() == 0   # a read never writes
+
+    app.dependency_overrides[require_admin] = lambda: None
+    # admin.py may have bound get_db while an earlier test's fixture was active
+    app.dependency_overrides[admin.get_db] = database.get_db
+    try:
+        resp = client.post("/api/admin/backfill-snapshots")
+    finally:
+        app.dependency_overrides.pop(require_admin, None)
+        app.dependency_overrides.pop(admin.get_db, None)
+    assert resp.json() == {"ok": True, "stored": 1, "remaining": 0}
+    assert _snapshot_count() == 1
+
+
+def test_share_code_backfill_drops_stale_snapshots(client):
+    from sqlalchemy import text
+    from app.core import database
+    from app.services.analysis_snapshot import drop_snapshots
+
+    analysis = _analyze(client)
+    other = _analyze(client)
+    assert _snapshot_count() == 2
+    with database.engine.connect() as conn:
+        drop_snapshots(conn, [analysis["workflow_id"]])
+        conn.commit()
+        left = conn.execute(text("SELECT analysis_id FROM analysis_snapshots")).scalars().all()
+    assert left == [other["id"]]
+
+
+def test_turso_blob_round_trip():
+    raw = b"\x1f\x8b\x08\x00binary\xff"
+    arg = _to_args([raw])[0]
+    assert arg["type"] == "blob"
+    assert _from_cell(arg) == raw
@@ -0,0 +1,105 @@
+"""
+Tests for batch job scans — background fan-out, per-role SSE events,
+research/analysis cache reuse and quota checks.
+"""
+import json
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services.scan_cache import analysis_cache, research_cache
+from tests.test_analyze_streaming_integration import client  # noqa: F401
+
+ADMIN = {"x-admin-secret": "batch-secret"}
+RESULT = {"ai_readiness_score": 70, "time_saved_percentage": 50, "recommendation": "Automate",
+          "difficulty": "low", "estimated_hours_saved": 40, "risk_level": "safe", "risk_flag": None}
+
+
+@pytest.fixture
+def scanner(client, monkeypatch):
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "ADMIN_SECRET", "batch-secret")
+    research_cache.clear()
+    analysis_cache.clear()
+
+    calls = {"research": 0, "analyze": 0}
+
+    class FakeScanner:
+        def scan_job(self, job_title, industry=None, analysis_context="individual"):
+            calls["research"] += 1
+            time.sleep(0.05)   # keep duplicate roles in flight together
+            if job_title == "Nobody":
+                return {"tasks": []}
+            return {"tasks": [{"name": f"{job_title} weekly report"}, {"name": "Inbox triage"}],
+                    "search_used": False}
+
+    analyzer = MagicMock()
+    def _analyze(tasks):
+        calls["analyze"] += 1
+        return [dict(RESULT) for _ in tasks]
+    analyzer.analyze_tasks_batch.side_effect = _analyze
+    analyzer._defaults.return_value = {"ai_readiness_score": 50}
+    analyzer.calculate_roi.return_value = {"automation_score": 70, "hours_saved": 80, "annual_savings": 4000}
+
+    monkeypatch.setattr("app.api.routes.job_scan.JobScanner", FakeScanner)
+    monkeypatch.setattr("app.api.routes.job_scan.AIAnalyzer", lambda: analyzer)
+    return calls
+
+
+def _events(client, batch_id):
+    resp = client.get(f"/api/job-scan/batch/{batch_id}/events")
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    return [json.loads(line[6:]) for line in resp.text.splitlines() if line.startswith("data: ")]
+
+
+def test_batch_streams_every_role_and_reuses_caches(client, scanner):
+    resp = client.post("/api/job-scan/batch", headers=ADMIN, json={"items": [
+        {"job_title": "Accountant"},
+        {"job_title": "accountant "},   # same role → research + analysis cache hits
+        {"job_title": "Recruiter", "tasks": [{"name": "Screen CVs"}]},
+        {"job_title": "Nobody"},
+    ]})
+    assert resp.status_code == 202, resp.text
+    batch_id = resp.json()["batch_id"]
+
+    events = _events(client, batch_id)
+    assert [e["seq"] for e in events] == list(range(len(events)))
+    done = {e["index"]: e for e in events if e["stage"] == "item_done"}
+    errors = {e["index"]: e for e in events if e["stage"] == "item_error"}
+    assert sorted(done) == [0, 1, 2] and sorted(errors) == [3]
+    assert events[-1]["stage"] == "done" and events[-1]["counts"] == {"done": 3, "error": 1}
+    assert len({done[i]["workflow_id"] for i in done}) == 3
+
+    # Two distinct researched roles + one given task list, two distinct task lists
+    assert scanner == {"research": 2, "analyze": 2}
+
+    status = client.get(f"/api/job-scan/batch/{batch_id}").json()
+    assert status["status"] == "done" and status["items"][2]["result"]["tasks_found"] == 1
+    # replay from an offset
+    assert _events(client, batch_id)[0]["seq"] == 0
+    assert client.get(f"/api/job-scan/batch/{batch_id}/events", params={"after": len(events) - 1}).text.count("data:") == 1
+
+
+def test_batch_combined_report(client, scanner, monkeypatch):
+    from app.services.report_generator import ReportGenerator
+    rendered = {}
+    def _fake_pdf(analyses, output_path, loc="en", workers=1):
+        rendered["names"] = [a["workflow"]["name"] for a in analyses]
+        with open(output_path, "wb") as f:
+            f.write(b"%PDF-1.4 batch")
+    monkeypatch.setattr(ReportGenerator, "generate_combined_pdf_report", staticmethod(_fake_pdf))
+
+    resp = client.post("/api/job-scan/batch", headers=ADMIN, json={
+        "items": [{"job_title": "Analyst"}, {"job_title": "Designer"}], "combined_report": True})
+    batch_id = resp.json()["batch_id"]
+    events = _events(client, batch_id)
+    assert any(e["stage"] == "report" for e in events)
+    assert sorted(rendered["names"]) == ["Analyst – Job Scanner", "Designer – Job Scanner"]
+    assert client.get(f"/api/job-scan/batch/{batch_id}/report").content == b"%PDF-1.4 batch"
+
+
+def test_batch_counts_against_quota(client, scanner):
+    items = [{"job_title": f"Role {i}"} for i in range(6)]
+    assert client.post("/api/job-scan/batch", json={"items": items}).status_code == 429
+    assert client.get("/api/job-scan/batch/nope").status_code == 404
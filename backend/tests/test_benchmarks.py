@@ -0,0 +1,90 @@
+"""
+Tests for the benchmark helpers — fixture shape and baseline comparison.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_reports import compare
+from benchmarks.fixtures import make_analyses_list, make_analysis_data
+from tests.test_analyze_streaming_integration import client  # noqa: F401
+
+
+def test_fixture_is_deterministic():
+    assert make_analysis_data(7, "team") == make_analysis_data(7, "team")
+    assert len(make_analysis_data(7, "team")["results"]) == 7
+
+
+def test_analyses_list_splits_tasks_across_workflows():
+    analyses = make_analyses_list(20, "company", n_workflows=3)
+    assert [len(a["results"]) for a in analyses] == [7, 7, 6]
+    assert len({a["workflow"]["id"] for a in analyses}) == 3
+
+
+def test_compare_flags_only_growth_over_threshold():
+    base = {"cases": {"pdf/5/team/en": {"wall_ms": 100, "peak_rss_kib": 1000, "output_bytes": 500}}}
+    cur = {"cases": {"pdf/5/team/en": {"wall_ms": 125, "peak_rss_kib": 1050, "output_bytes": 400},
+                     "pdf/20/team/en": {"wall_ms": 999, "peak_rss_kib": 1, "output_bytes": 1}}}
+    regressions = compare(cur, base, threshold_pct=10)
+    assert [(r["case"], r["metric"], r["delta_pct"]) for r in regressions] == [("pdf/5/team/en", "wall_ms", 25.0)]
+
+
+def test_report_bench_runs_without_peak_rss(monkeypatch):
+    from benchmarks import bench_reports
+    monkeypatch.setattr(bench_reports, "_peak_rss_kib", lambda: None)   # as on Windows
+    case = bench_reports._run_case("pdf", 5, "team", "en", repeat=1)
+    assert case["peak_rss_kib"] is None and case["output_bytes"] > 0
+    assert bench_reports._format_case("pdf/5/team/en", case).split()[3:5] == ["n/a", "MiB"]
+    current = {"cases": {"pdf/5/team/en": case}}
+    assert compare(current, {"cases": {"pdf/5/team/en": {**case, "peak_rss_kib": 1000}}}, 10) == []
+
+
+def test_category_resolver_bench_reports_throughput_and_accuracy():
+    from benchmarks.bench_category_resolver import run
+    result = run(rounds=1)
+    assert result["texts"] > 200
+    assert result["guess_cold_per_s"] > 0 and result["resolve_per_s"] > 0
+    assert 0.5 <= result["guess_accuracy"] <= 1
+
+
+def test_load_summary_percentiles_and_compare():
+    from benchmarks.load_test import compare as load_compare, percentile, summarise
+    assert percentile(list(range(1, 101)), 95) == 95 and percentile([], 50) == 0.0
+
+    samples = [("share", True, float(ms)) for ms in range(1, 101)] + [("share", False, 500.0)]
+    row = summarise(samples, elapsed_s=10)["share"]
+    assert (row["count"], row["errors"], row["p50_ms"], row["throughput_rps"]) == (101, 1, 51.0, 10.1)
+
+    base = {"cases": {"c4/share": {"p50_ms": 100, "p95_ms": 200, "p99_ms": 300,
+                                   "throughput_rps": 10.0, "error_rate": 0.0}}}
+    cur = {"cases": {"c4/share": {"p50_ms": 105, "p95_ms": 260, "p99_ms": 300,
+                                  "throughput_rps": 7.0, "error_rate": 0.2}}}
+    assert [(r["metric"], r["delta_pct"]) for r in load_compare(cur, base, threshold_pct=10)] == [
+        ("p95_ms", 30.0), ("throughput_rps", 30.0), ("error_rate", 20.0)]
+
+
+def test_load_journey_hits_every_endpoint(client, monkeypatch):
+    from app.core.config import settings
+    from app.services import llm_client
+    from app.services.ai_analyzer import AIAnalyzer
+    from benchmarks.load_test import ADMIN_SECRET, run_stage
+
+    monkeypatch.setattr("app.api.routes.workflows.AIAnalyzer", AIAnalyzer)
+    monkeypatch.setattr(settings, "LLM_BACKEND", "stub")
+    monkeypatch.setattr(settings, "LLM_STUB_LATENCY_MS", 0.0)
+    monkeypatch.setattr(settings, "LLM_STUB_TOKENS_PER_SECOND", 0.0)
+    monkeypatch.setattr(settings, "ADMIN_SECRET", ADMIN_SECRET)
+    monkeypatch.setattr(llm_client, "_clients", {})
+    client.headers["x-admin-secret"] = ADMIN_SECRET
+
+    class _Shared:
+        def __enter__(self):
+            return client
+        def __exit__(self, *exc):
+            pass
+
+    stats = run_stage(_Shared, concurrency=1, duration_s=60, journeys=2)
+    assert sorted(stats) == ["analyze.json", "analyze.sse", "job_scan.analyze", "job_scan.research",
+                             "reports.pdf", "share", "track", "workflows.create"]
+    assert all(row["errors"] == 0 for row in stats.values()), stats
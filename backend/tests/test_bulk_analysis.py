@@ -0,0 +1,76 @@
+"""
+Tests for bulk analysis through the Message Batches API — run against the
+offline batch stub, end to end through the normal save path.
+"""
+import pytest
+
+from app.services.ai_analyzer import AIAnalyzer
+from tests.anthropic_batch_stub import BatchStub, analysis_reply
+from tests.test_analyze_streaming_integration import client, _create_workflow  # noqa: F401
+
+TASKS = [{"name": "Reconcile invoices", "frequency": "weekly", "time_per_task": 60},
+         {"name": "Send reminders", "frequency": "daily", "time_per_task": 10}]
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    with BatchStub(polls_until_ended=3) as server:
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        monkeypatch.setenv("ANTHROPIC_BASE_URL", server.url)
+        yield server
+
+
+def test_bulk_maps_results_back_by_custom_id(stub):
+    def responder(custom_id, params):
+        return None if custom_id == "broken" else analysis_reply(custom_id, params)
+    stub.responder = responder
+
+    out = AIAnalyzer().analyze_bulk({"a": TASKS, "b": TASKS[:1], "broken": TASKS, "empty": []},
+                                    poll_interval=0.01)
+
+    assert len(stub.created) == 1 and stub.batches[stub.created[0]]["polls"] >= 3
+    assert sorted(out) == ["a", "b", "broken"]
+    assert [r["ai_readiness_score"] for r in out["a"]] == [79, 78]
+    assert out["b"][0]["recommendation"] == "Batch recommendation b/1"
+    assert out["broken"] == [AIAnalyzer()._defaults()] * 2
+
+    # the bulk request is the same request the synchronous path sends
+    sent = {r["custom_id"]: r["params"] for r in stub.batches[stub.created[0]]["requests"]}
+    assert sent["a"] == AIAnalyzer()._request_params(TASKS)
+
+
+def test_bulk_times_out_and_cancels(stub):
+    stub.polls_until_ended = 10 ** 6
+    with pytest.raises(TimeoutError):
+        AIAnalyzer().analyze_bulk({"a": TASKS}, poll_interval=0.01, timeout=0.05)
+    assert stub.batches[stub.created[0]]["status"] == "canceling"
+
+
+def test_bulk_workflows_saved_through_normal_path(client, stub, monkeypatch):
+    from app.api.routes.workflows import bulk_analyze_workflows
+    from app.core import database
+
+    # no connection (and so no transaction) is held while the batch runs
+    checked_out = []
+
+    class _Analyzer(AIAnalyzer):
+        def analyze_bulk(self, *args, **kwargs):
+            checked_out.append(database.engine.pool.checkedout())
+            return super().analyze_bulk(*args, **kwargs)
+    monkeypatch.setattr("app.api.routes.workflows.AIAnalyzer", _Analyzer)
+
+    first, second = _create_workflow(client, "Bulk A"), _create_workflow(client, "Bulk B")
+    out = bulk_analyze_workflows([first, second, 999999], hourly_rate=50.0, poll_interval=0.01)
+    assert checked_out == [0]
+
+    assert isinstance(out[first], int) and isinstance(out[second], int)
+    assert out[999999] == "not found"
+    assert len(stub.batches[stub.created[0]]["requests"]) == 2
+
+    resp = client.get(f"/api/results/{first}", headers={"x-user-email": "test@example.com"})
+    assert resp.status_code == 200
+    assert resp.json()["results"][0]["recommendation"] == f"Batch recommendation wf-{first}/1"
+
+    # already-analyzed workflows are not resubmitted
+    assert bulk_analyze_workflows([first], hourly_rate=50.0, poll_interval=0.01) == {first: "already analyzed"}
+    assert len(stub.created) == 1
@@ -0,0 +1,86 @@
+"""
+Tests for content-addressed n8n canvas storage — dedupe, legacy fallback,
+the streaming canvas endpoints and canvas-free workflow lists.
+"""
+import gzip
+import json
+
+from app.services.canvas_store import iter_decompressed, pack_canvas, save_canvas
+from app.services.n8n_template_client import build_canvas
+from tests.test_analyze_streaming_integration import client, _create_workflow  # noqa: F401
+
+HEADERS = {"x-user-email": "test@example.com"}
+TASKS = [{"name": "Weekly KPI report", "category": "reporting"},
+         {"name": "Chase stalled deals", "category": "sales"}]
+
+
+def _canvas_rows():
+    from app.core import database
+    from app.models.workflow import N8nCanvas
+    db = database.SessionLocal()
+    try:
+        return db.query(N8nCanvas).count()
+    finally:
+        db.close()
+
+
+def test_identical_canvases_are_stored_once(client):
+    canvas = json.dumps(build_canvas("Analyst", TASKS))
+    assert json.dumps(build_canvas("Analyst", TASKS)) == canvas  # IDs are derived from the input
+    a = _create_workflow(client, "Canvas A")
+    b = _create_workflow(client, "Canvas B")
+    assert save_canvas(a, canvas) == save_canvas(b, canvas)
+    assert _canvas_rows() == 1
+
+    resp = client.get(f"/api/workflows/{b}")
+    assert json.loads(resp.json()["n8n_workflow_json"])["meta"]["taskCount"] == 2
+
+
+def test_canvas_endpoint_sends_gzip_or_streams_plain(client):
+    canvas = json.dumps(build_canvas("Analyst", TASKS))
+    wf = _create_workflow(client, "Canvas stream")
+    save_canvas(wf, canvas)
+
+    gz = client.get(f"/api/workflows/{wf}/n8n-canvas")
+    assert gz.headers["content-encoding"] == "gzip"
+    assert gz.text == canvas
+
+    plain = client.get(f"/api/workflows/{wf}/n8n-canvas", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.text == canvas
+
+    code = client.get(f"/api/workflows/{wf}").json()["share_code"]
+    assert client.get(f"/api/share/{code}/n8n-canvas").text == canvas
+    assert client.get("/api/share/nope00/n8n-canvas").status_code == 404
+
+
+def test_legacy_inline_canvas_still_served(client):
+    from sqlalchemy import text
+    from app.core import database
+    wf = _create_workflow(client, "Legacy canvas")
+    with database.engine.connect() as conn:
+        conn.execute(text("UPDATE workflows SET n8n_workflow_json = :j WHERE id = :i"), {"j": '{"nodes": []}', "i": wf})
+        conn.commit()
+
+    assert client.get(f"/api/workflows/{wf}/n8n-canvas").text == '{"nodes": []}'
+    assert client.get(f"/api/workflows/{wf}").json()["n8n_workflow_json"] == '{"nodes": []}'
+
+
+def test_workflow_without_canvas_is_404(client):
+    wf = _create_workflow(client, "No canvas")
+    assert client.get(f"/api/workflows/{wf}/n8n-canvas").status_code == 404
+
+
+def test_list_omits_canvas(client):
+    wf = _create_workflow(client, "Listed")
+    save_canvas(wf, json.dumps(build_canvas("Analyst", TASKS)))
+    listed = client.get("/api/workflows", headers=HEADERS).json()
+    assert listed and all("n8n_workflow_json" not in w for w in listed)
+
+
+def test_chunked_inflate_round_trips():
+    canvas = json.dumps(build_canvas("Analyst", TASKS * 10))
+    _, body, raw_size = pack_canvas(canvas)
+    assert len(body) < raw_size / 5
+    assert b"".join(iter_decompressed(body, chunk_size=1024)) == canvas.encode()
+    assert gzip.decompress(body).decode() == canvas
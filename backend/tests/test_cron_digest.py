@@ -0,0 +1,107 @@
+"""
+Tests for the quick-win digest cron against a stub Resend server — batched
+sends with per-email fallback, constant query count, one commit of stamps.
+"""
+import json
+from datetime import datetime, timedelta, timezone
+
+import httpx
+from sqlalchemy import event
+
+from app.api.routes import cron
+from app.core import http_clients
+from app.core.config import settings
+from tests.test_analyze_streaming_integration import client, _create_workflow  # noqa: F401
+
+
+class StubResend:
+    """In-process Resend: /emails/batch is all-or-nothing, like the real API;
+    any address containing "bounce" is rejected with a 422."""
+
+    def __init__(self):
+        self.batches, self.singles = [], []
+
+    def handler(self, request):
+        body = json.loads(request.content)
+        if request.url.path == "/emails/batch":
+            self.batches.append([e["to"][0] for e in body])
+            if any("bounce" in e["to"][0] for e in body):
+                return httpx.Response(422, json={"message": "invalid `to` field"})
+            return httpx.Response(200, json={"data": [{"id": f"b{i}"} for i in range(len(body))]})
+        self.singles.append(body["to"][0])
+        if "bounce" in body["to"][0]:
+            return httpx.Response(422, json={"message": "invalid `to` field"})
+        return httpx.Response(200, json={"id": "s"})
+
+
+
+def _analyzed_workflow(client, name):
+    wid = _create_workflow(client, name)
+    assert client.post("/api/analyze", json={"workflow_id": wid}).status_code == 200
+    return wid, client.get(f"/api/workflows/{wid}").json()["share_code"]
+
+
+def test_digest_batches_sends_and_stamps_in_one_commit(client, monkeypatch):
+    from app.core import database
+    from app.core.auth import require_admin
+    from app.main import app
+    from app.models.workflow import ReportLead
+
+    stub = StubResend()
+    monkeypatch.setattr(cron, "RESEND_API_KEY", "re_test")
+    http_clients.set_transport("resend", httpx.MockTransport(stub.handler))
+    monkeypatch.setattr(settings, "DIGEST_BATCH_SIZE", 2)
+    monkeypatch.delenv("RESEND_TEST_EMAIL", raising=False)
+
+    w1, _ = _analyzed_workflow(client, "Ops")
+    w2, code2 = _analyzed_workflow(client, "Finance")
+    w3, code3 = _analyzed_workflow(client, "Sales")
+    w4 = _create_workflow(client, "Never analyzed")
+    due = datetime.now(timezone.utc) - timedelta(days=3, hours=12)
+
+    db = database.SessionLocal()
+    db.add_all([
+        ReportLead(email="a@x.com", workflow_id=w1, created_at=due),
+        ReportLead(email="b@x.com", share_code=code2, created_at=due),           # share_code only
+        ReportLead(email="a@x.com", workflow_id=w2, created_at=due),             # same email: skipped
+        ReportLead(email="bounce@x.com", workflow_id=w3, created_at=due),
+        ReportLead(email="c@x.com", share_code=code3, created_at=due),
+        ReportLead(email="d@x.com", workflow_id=w4, created_at=due),             # no analysis
+        ReportLead(email="e@x.com", workflow_id=w1, created_at=datetime.now(timezone.utc)),  # too recent
+    ])
+    db.commit()
+    db.close()
+
+    statements = []
+    listener = lambda conn, cur, stmt, params, ctx, many: statements.append(stmt)
+    event.listen(database.engine, "before_cursor_execute", listener)
+    app.dependency_overrides[require_admin] = lambda: None
+    try:
+        preview = client.post("/api/cron/quick-win-digest?dry_run=true").json()
+        assert preview["candidates"] == 4 and stub.batches == []
+        statements.clear()
+        resp = client.post("/api/cron/quick-win-digest")
+    finally:
+        app.dependency_overrides.pop(require_admin, None)
+        event.remove(database.engine, "before_cursor_execute", listener)
+        http_clients.set_transport("resend", None)
+
+    assert resp.json() == {"sent": 3, "skipped": 3, "considered": 6}
+    # 2 batch calls of 2; the one holding the bounce falls back to single sends
+    assert sorted(map(sorted, stub.batches)) == [["a@x.com", "b@x.com"], ["bounce@x.com", "c@x.com"]]
+    assert sorted(stub.singles) == ["bounce@x.com", "c@x.com"]
+    # one SELECT for the leads and everything under them, one UPDATE for the
+    # stamps (the rest is the job lease and its job_runs row)
+    digest_sql = [s.lstrip().upper() for s in statements if "scheduler_leases" not in s and "job_runs" not in s]
+    assert sum(s.startswith("SELECT") for s in digest_sql) == 1
+    assert sum(s.startswith("UPDATE") for s in digest_sql) == 1
+
+    db = database.SessionLocal()
+    stamped = {(l.email, l.workflow_id, l.share_code): l.digest_sent_at is not None
+               for l in db.query(ReportLead).all()}
+    db.close()
+    assert stamped == {
+        ("a@x.com", w1, None): True, ("b@x.com", None, code2): True, ("a@x.com", w2, None): False,
+        ("bounce@x.com", w3, None): True, ("c@x.com", None, code3): True,
+        ("d@x.com", w4, None): False, ("e@x.com", w1, None): False,
+    }
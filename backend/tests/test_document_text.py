@@ -0,0 +1,160 @@
+"""
+Tests for bounded document extraction — the text budget, streamed uploads
+with a size cap, page-parallel PDF parsing and image preparation for OCR.
+"""
+import io
+import os
+
+from fastapi.testclient import TestClient
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen import canvas
+
+from app.api.routes.extraction import extract_text_from_file
+from app.core import process_pools
+from app.core.config import settings
+from app.services import document_text
+from app.services.document_text import TextBuilder
+
+
+def _pdf(path, pages):
+    c = canvas.Canvas(str(path), pagesize=A4)
+    for i in range(pages):
+        c.drawString(72, 760, f"Page {i + 1}: reconcile invoices and update the ledger")
+        c.showPage()
+    c.save()
+    return str(path)
+
+
+def test_text_builder_stops_at_budget():
+    out = TextBuilder(max_chars=12)
+    assert out.line("hello") and not out.line("world, again")
+    assert not out.add("more")
+    assert out.text() == "hello\nworld,\n\n[Document truncated after 12 characters]"
+    assert TextBuilder(max_chars=100).text() == ""
+
+
+def test_pdf_pages_in_order_sequential_and_parallel(tmp_path, monkeypatch):
+    path = _pdf(tmp_path / "doc.pdf", 30)
+    monkeypatch.setattr(settings, "PDF_PARALLEL_MIN_PAGES", 8)
+    monkeypatch.setattr(document_text.os, "cpu_count", lambda: 4)   # CI boxes may report 1
+
+    serial = document_text.pdf_text(path, TextBuilder(max_chars=10**6)).text()
+    assert process_pools.active() == {}   # in-process by default
+    try:
+        parallel = document_text.pdf_text(path, TextBuilder(max_chars=10**6), workers=2).text()
+        assert parallel == serial and ("pdf", 2) in process_pools.active()
+        assert [line.split(":")[0] for line in serial.splitlines() if line] == [f"Page {i}" for i in range(1, 31)]
+
+        capped = document_text.pdf_text(path, TextBuilder(max_chars=10**6), max_pages=5, workers=2).text()
+        assert "Page 5:" in capped and "Page 6:" not in capped and "truncated" in capped
+
+        early = document_text.pdf_text(path, TextBuilder(max_chars=150), workers=2)
+        assert early.full and early.text().startswith("Page 1:") and "Page 4:" not in early.text()
+    finally:
+        process_pools.shutdown_all()
+    assert process_pools.active() == {}
+
+
+def test_spreadsheet_rows_are_bounded(tmp_path, monkeypatch):
+    import openpyxl
+    wb = openpyxl.Workbook()
+    for s in range(3):
+        ws = wb.active if s == 0 else wb.create_sheet()
+        ws.title = f"S{s}"
+        for r in range(2000):
+            ws.append([f"task {s}-{r}", r, None])
+    wb.save(tmp_path / "book.xlsx")
+    monkeypatch.setattr(settings, "EXTRACT_MAX_CHARS", 2000)
+
+    text = extract_text_from_file(str(tmp_path / "book.xlsx"), "book.xlsx")
+    assert text.startswith("=== Sheet: S0 ===\ntask 0-0 | 0 | ")
+    assert "S1" not in text and text.endswith("[Document truncated after 2,000 characters]")
+
+
+def test_upload_streams_to_disk_with_a_size_cap(tmp_path, monkeypatch):
+    from app.main import app
+    from app.services.extract_cache import extract_cache
+    monkeypatch.setattr(extract_cache, "directory", str(tmp_path / "cache"))
+    monkeypatch.setattr(settings, "UPLOAD_CHUNK_BYTES", 1024)
+    monkeypatch.setattr(settings, "UPLOAD_MAX_BYTES", 64 * 1024)
+    http = TestClient(app)
+
+    ok = http.post("/api/extract-tasks", files={"file": ("notes.txt", io.BytesIO(b"Approve expenses\n" * 100))})
+    assert ok.status_code == 200 and ok.json()["text"].startswith("Approve expenses")
+
+    big = http.post("/api/extract-tasks", files={"file": ("big.txt", io.BytesIO(b"x" * (65 * 1024)))})
+    assert big.status_code == 413
+
+
+class _FakeVision:
+    """Stands in for the LLM client: records each image it is sent."""
+
+    def __init__(self):
+        self.images = []
+        self.messages = self
+
+    def create(self, **kw):
+        import base64
+        from types import SimpleNamespace
+        source = kw["messages"][0]["content"][0]["source"]
+        self.images.append((base64.b64decode(source["data"]), source["media_type"]))
+        return SimpleNamespace(content=[SimpleNamespace(text=f"text of image {len(self.images)}")])
+
+
+def _vision(monkeypatch):
+    from app.api.routes import extraction
+    fake = _FakeVision()
+    monkeypatch.setattr(extraction, "get_llm_client", lambda: fake)
+    return fake
+
+
+def test_photo_is_cropped_downscaled_and_jpeg(tmp_path, monkeypatch):
+    from PIL import Image, ImageDraw
+    fake = _vision(monkeypatch)
+    # 12 MP phone photo of a whiteboard (sensor noise), writing in the top-left quarter
+    photo = Image.frombytes("RGB", (4000, 3000), os.urandom(4000 * 3000 * 3)).point(lambda p: 190 + p // 16)
+    draw = ImageDraw.Draw(photo)
+    for y in range(200, 1300, 100):
+        draw.rectangle((300, y, 1700, y + 40), fill="black")
+    photo.save(tmp_path / "board.jpg", quality=95)
+
+    assert extract_text_from_file(str(tmp_path / "board.jpg"), "board.jpg") == "text of image 1"
+    data, media_type = fake.images[0]
+    sent = Image.open(io.BytesIO(data))
+    assert media_type == "image/jpeg" and sent.format == "JPEG"
+    assert max(sent.size) <= settings.IMAGE_OCR_MAX_EDGE
+    assert sent.width < 2000 and sent.height < 1500          # cropped to the writing
+    assert len(data) < (tmp_path / "board.jpg").stat().st_size // 10
+
+
+def test_small_screenshot_is_sent_as_uploaded(tmp_path, monkeypatch):
+    from PIL import Image, ImageDraw
+    fake = _vision(monkeypatch)
+    shot = Image.new("RGB", (400, 300), "white")
+    ImageDraw.Draw(shot).text((20, 20), "Approve expenses", fill="black")
+    shot.save(tmp_path / "shot.png", optimize=True)
+
+    extract_text_from_file(str(tmp_path / "shot.png"), "shot.png")
+    data, media_type = fake.images[0]
+    assert media_type == "image/png" and len(data) <= (tmp_path / "shot.png").stat().st_size
+
+
+def test_multi_page_tiff_pages_in_order(tmp_path, monkeypatch):
+    from PIL import Image, ImageDraw
+    fake = _vision(monkeypatch)
+    pages = []
+    for i in range(3):
+        page = Image.new("L", (800, 1000), 255)
+        ImageDraw.Draw(page).rectangle((100, 100 + i * 200, 700, 160 + i * 200), fill=0)
+        pages.append(page)
+    pages[0].save(tmp_path / "scan.tiff", save_all=True, append_images=pages[1:])
+
+    text = extract_text_from_file(str(tmp_path / "scan.tiff"), "scan.tiff")
+    assert len(fake.images) == 3
+    assert [line for line in text.splitlines() if line.startswith("===")] == \
+        ["=== Page 1 ===", "=== Page 2 ===", "=== Page 3 ==="]
+    assert all(media_type == "image/png" for _, media_type in fake.images)
+
+    monkeypatch.setattr(settings, "IMAGE_OCR_MAX_PAGES", 2)
+    text = extract_text_from_file(str(tmp_path / "scan.tiff"), "scan.tiff")
+    assert "=== Page 3 ===" not in text and text.endswith("[Document truncated after 60,000 characters]")
@@ -0,0 +1,90 @@
+"""
+Tests for the extracted-text cache — LRU eviction by size on disk, and
+repeat uploads served from it by /api/extract-tasks.
+"""
+import hashlib
+import io
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.routes import extraction
+from app.core.config import settings
+from app.services.extract_cache import DiskLRU, cache_key, extract_cache
+
+
+def test_disk_lru_evicts_least_recently_used(tmp_path):
+    cache = DiskLRU(str(tmp_path), max_bytes=250)
+    for key in "abc":
+        cache.put(key, key * 100)
+        os.utime(tmp_path / f"{key}.txt", ns=(0, {"a": 1, "b": 2, "c": 3}[key] * 10**9))
+
+    # c pushed the total to 300 bytes: a, the oldest, went
+    assert cache.get("a") is None and cache.stats()["entries"] == 2
+    assert cache.get("b") == "b" * 100   # b is now the most recent
+    cache.put("d", "d" * 100)
+    assert cache.get("c") is None
+    assert cache.get("b") and cache.get("d")
+    assert cache.stats()["hits"] == 3 and cache.stats()["misses"] == 2
+
+    DiskLRU(str(tmp_path), max_bytes=0).put("e", "e")   # disabled
+    assert not (tmp_path / "e.txt").exists()
+
+
+def test_cache_key_follows_extension_and_limits(monkeypatch):
+    digest = hashlib.sha256(b"x").hexdigest()
+    assert cache_key(digest, "a.PDF") == cache_key(digest, "other-name.pdf")
+    assert cache_key(digest, "a.pdf") != cache_key(digest, "a.txt")
+    key = cache_key(digest, "a.pdf")
+    monkeypatch.setattr(settings, "EXTRACT_MAX_CHARS", 10)
+    assert cache_key(digest, "a.pdf") != key
+
+
+@pytest.mark.parametrize("name, value", [
+    ("IMAGE_OCR_MODEL", "another-model"), ("IMAGE_OCR_MAX_EDGE", 800),
+    ("IMAGE_OCR_JPEG_QUALITY", 60), ("IMAGE_OCR_CROP", False), ("IMAGE_OCR_MAX_PAGES", 2),
+])
+def test_cache_key_follows_ocr_settings(monkeypatch, name, value):
+    digest = hashlib.sha256(b"x").hexdigest()
+    key = cache_key(digest, "scan.png")
+    monkeypatch.setattr(settings, name, value)
+    assert cache_key(digest, "scan.png") != key
+
+
+def test_cache_key_follows_extractor_version(monkeypatch):
+    from app.services import extract_cache as module
+    digest = hashlib.sha256(b"x").hexdigest()
+    key = cache_key(digest, "a.pdf")
+    monkeypatch.setattr(module, "EXTRACTOR_VERSION", module.EXTRACTOR_VERSION + 1)
+    assert cache_key(digest, "a.pdf") != key
+
+
+def test_repeat_upload_is_served_from_cache(tmp_path, monkeypatch):
+    from app.main import app
+    monkeypatch.setattr(extract_cache, "directory", str(tmp_path))
+    calls = []
+    real = extraction.extract_text_from_file
+    monkeypatch.setattr(extraction, "extract_text_from_file",
+                        lambda path, name: calls.append(name) or real(path, name))
+    http = TestClient(app)
+    body = b"Reconcile invoices weekly\nApprove expenses\n"
+
+    first = http.post("/api/extract-tasks", files={"file": ("jd.txt", io.BytesIO(body))})
+    again = http.post("/api/extract-tasks", files={"file": ("renamed.txt", io.BytesIO(body))})
+    other = http.post("/api/extract-tasks", files={"file": ("jd.txt", io.BytesIO(body + b"More\n"))})
+
+    assert first.json() == {"text": "Reconcile invoices weekly\nApprove expenses", "cached": False}
+    assert again.json() == {**first.json(), "cached": True}
+    assert other.json()["cached"] is False
+    assert calls == ["jd.txt", "jd.txt"]
+
+
+def test_failed_extraction_is_not_cached(tmp_path, monkeypatch):
+    from app.main import app
+    monkeypatch.setattr(extract_cache, "directory", str(tmp_path))
+    http = TestClient(app)
+    for _ in range(2):
+        r = http.post("/api/extract-tasks", files={"file": ("bad.json", io.BytesIO(b"{not json"))})
+        assert r.status_code == 400
+    assert extract_cache._entries() == []
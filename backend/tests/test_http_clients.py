@@ -0,0 +1,111 @@
+"""
+Tests for the shared outbound HTTP clients — pooling, jittered retries,
+the circuit breaker, and their series on /api/metrics.
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.core import http_clients, metrics
+
+
+@pytest.fixture(autouse=True)
+def _fresh(monkeypatch):
+    monkeypatch.setattr(http_clients, "_BACKOFF_BASE_SECONDS", 0.001)
+    metrics.reset()
+    yield
+    for name in list(http_clients.SERVICES):
+        http_clients.set_transport(name, None)
+    metrics.reset()
+
+
+def _route(name, responses):
+    """Serve `responses` in order (an Exception instance is raised instead); record calls."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        item = responses[min(len(calls), len(responses)) - 1]
+        if isinstance(item, Exception):
+            raise item
+        return httpx.Response(item, json={})
+    http_clients.set_transport(name, httpx.MockTransport(handler))
+    return calls
+
+
+def test_retries_connect_errors_and_reuses_one_pool():
+    calls = _route("tavily", [httpx.ConnectError("reset"), 503, 200])
+    client = http_clients.get("tavily")
+    assert client.post("https://api.tavily.com/search", json={}).status_code == 200
+    assert len(calls) == 3
+    assert http_clients.get("tavily") is client and client.sync_client is client.sync_client
+    text = metrics.render()
+    assert 'workscan_http_client_retries_total{service="tavily"} 2' in text
+    assert 'workscan_http_client_requests_total{outcome="ok",service="tavily"} 1' in text
+
+
+def test_non_idempotent_sends_are_not_retried_on_5xx():
+    calls = _route("resend", [500, 200])
+
+    async def send():
+        return await http_clients.get("resend").apost("https://api.resend.com/emails", json={})
+    assert asyncio.run(send()).status_code == 500
+    assert len(calls) == 1
+
+    calls = _route("resend", [429, 200])
+    assert asyncio.run(send()).status_code == 200 and len(calls) == 2   # 429: never processed
+
+
+def test_breaker_opens_fails_fast_and_recovers(monkeypatch):
+    calls = _route("ipapi", [httpx.ConnectTimeout("slow")] * 3 + [200])
+    client = http_clients.get("ipapi")
+    for _ in range(3):
+        with pytest.raises(httpx.ConnectTimeout):
+            client.get("https://ipapi.co/1.2.3.4/json/")
+    with pytest.raises(http_clients.CircuitOpen):
+        client.get("https://ipapi.co/1.2.3.4/json/")
+    assert len(calls) == 3 and client.breaker.state == "open"
+    assert 'workscan_http_client_circuit_state{service="ipapi"} 2' in metrics.render()
+
+    client.breaker.opened_at -= client.breaker.reset_seconds   # reset window elapsed
+    assert client.breaker.state == "half_open"
+    assert client.get("https://ipapi.co/1.2.3.4/json/").status_code == 200
+    assert client.breaker.state == "closed" and client.breaker.times_opened == 1
+    assert 'workscan_http_client_circuit_state{service="ipapi"} 0' in metrics.render()
+
+
+def test_async_clients_are_per_event_loop():
+    _route("recaptcha", [200])
+    client = http_clients.get("recaptcha")
+
+    async def verify():
+        await client.apost("https://www.google.com/recaptcha/api/siteverify", data={})
+        return client.async_client
+    first, second = asyncio.run(verify()), asyncio.run(verify())
+    assert first is not second
+
+
+def test_trial_that_raises_a_non_http_error_ends_the_trial():
+    calls = _route("ipapi", [200])
+    client = http_clients.get("ipapi")
+    client.breaker.opened_at = 0.0   # open, with the reset window long elapsed
+    assert client.breaker.state == "half_open"
+    with pytest.raises(TypeError):
+        client.post("https://ipapi.co/1.2.3.4/json/", json={"x": object()})
+    assert calls == [] and not client.breaker.trial_in_flight
+    assert client.get("https://ipapi.co/1.2.3.4/json/").status_code == 200
+    assert client.breaker.state == "closed"
+
+
+def test_loop_clients_are_closed_before_the_loop_ends():
+    from app.services.scheduler import Job
+    _route("recaptcha", [200])
+    client = http_clients.get("recaptcha")
+    opened = []
+
+    async def verify():
+        await client.apost("https://www.google.com/recaptcha/api/siteverify", data={})
+        opened.append(client.async_client)
+    Job("verify", verify, interval_seconds=60, timeout_seconds=5)()
+    assert opened[0].is_closed and len(client._async) == 0
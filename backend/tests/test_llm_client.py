@@ -0,0 +1,91 @@
+"""
+Tests for the shared LLM client — the offline stub backend answers every
+prompt shape in a form the real parsers accept, deterministically and at
+the configured speed.
+"""
+import json
+import time
+
+import pytest
+
+from app.core.config import settings
+from app.services import llm_client
+from app.services.ai_analyzer import AIAnalyzer
+from app.services.job_scanner import JobScanner
+from app.services.llm_client import StubLLM, get_llm_client
+from tests.test_analyze_streaming_integration import client  # noqa: F401
+
+TASKS = [{"name": "Reconcile invoices", "frequency": "weekly", "time_per_task": 60, "category": "data_entry"},
+         {"name": "Send reminders | follow-ups", "frequency": "daily", "time_per_task": 10},
+         {"name": "Board deck", "description": "Quarterly strategy slides"}]
+
+
+@pytest.fixture
+def stub_backend(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_BACKEND", "stub")
+    monkeypatch.setattr(settings, "LLM_STUB_LATENCY_MS", 0.0)
+    monkeypatch.setattr(settings, "LLM_STUB_TOKENS_PER_SECOND", 0.0)
+    monkeypatch.setattr(llm_client, "_clients", {})
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+
+
+def test_backend_selection_and_reuse(monkeypatch):
+    monkeypatch.setattr(llm_client, "_clients", {})
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    with pytest.raises(ValueError, match="ANTHROPIC_API_KEY"):
+        get_llm_client()
+
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    assert get_llm_client() is get_llm_client()
+    assert type(get_llm_client().backend).__name__ == "Anthropic"
+
+    monkeypatch.setattr(settings, "LLM_BACKEND", "stub")
+    assert isinstance(get_llm_client().backend, StubLLM)
+
+
+def test_stub_analysis_parses_into_full_results(stub_backend):
+    analyzer = AIAnalyzer()
+    results = analyzer.analyze_tasks_batch(TASKS)
+
+    assert len(results) == 3
+    assert results != [analyzer._defaults()] * 3
+    for r in results:
+        assert 0 <= r["ai_readiness_score"] <= 100
+        assert r["recommendation"].startswith("Option 1")
+        assert r["agent_phase"] in (1, 2, 3) and len(json.loads(r["pivot_skills"])) == 4
+    # deterministic for the same prompt
+    assert AIAnalyzer().analyze_tasks_batch(TASKS) == results
+
+
+def test_stub_bulk_and_job_scanner(stub_backend):
+    out = AIAnalyzer().analyze_bulk({"a": TASKS, "b": TASKS[:1]}, poll_interval=0)
+    assert [len(out["a"]), len(out["b"])] == [3, 1]
+
+    tasks = JobScanner()._extract_tasks("Payroll Specialist", "research notes", "individual")
+    assert len(tasks) == 6
+    assert all(t["name"] and t["frequency"] in ("daily", "weekly", "monthly") for t in tasks)
+
+
+def test_stub_parse_tasks_endpoint(client, stub_backend):
+    resp = client.post("/api/parse-tasks", json={
+        "text": "I reconcile invoices every Monday. I draft the weekly client newsletter."})
+    assert resp.status_code == 200, resp.text
+    assert [t["description"] for t in resp.json()["tasks"]] == [
+        "I reconcile invoices every Monday", "I draft the weekly client newsletter"]
+
+
+def test_stub_latency_and_token_rate():
+    stub = StubLLM(latency_ms=50, tokens_per_second=2000, seed=1)
+    params = {"model": "m", "max_tokens": 4000,
+              "messages": [{"role": "user", "content": "output EXACTLY 4 task blocks\n---TASK_[N]---"}]}
+    started = time.perf_counter()
+    message = stub.messages.create(**params, timeout=5.0)
+    elapsed = time.perf_counter() - started
+
+    expected = 0.05 + message.usage.output_tokens / 2000
+    assert expected - 0.01 <= elapsed < expected + 0.5
+    assert message.content[0].text.count("---TASK_") == 4
+
+    # a budget smaller than the reply truncates it like the API does
+    short = stub.messages.create(**{**params, "max_tokens": 20})
+    assert short.stop_reason == "max_tokens" and short.usage.output_tokens == 20
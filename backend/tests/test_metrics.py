@@ -0,0 +1,124 @@
+"""
+Tests for the Prometheus endpoint — exposition format, and that the HTTP,
+Turso, LLM, cache, stage and event-loop instrumentation each land in it.
+"""
+import asyncio
+import json
+import re
+import threading
+import time
+
+import httpx
+import pytest
+
+from app.core import metrics, timing
+from app.core.config import settings
+from app.services import llm_client
+from app.services.ai_analyzer import AIAnalyzer
+from tests.test_analyze_streaming_integration import client, _create_workflow  # noqa: F401
+
+
+@pytest.fixture(autouse=True)
+def _fresh_registry():
+    metrics.reset()
+    timing.reset()
+    yield
+    metrics.reset()
+    timing.reset()
+
+
+def _sample(text, series):
+    """Value of one exact `name{labels}` series, or None."""
+    m = re.search(rf"^{re.escape(series)} (\S+)$", text, re.MULTILINE)
+    return float(m.group(1)) if m else None
+
+
+def _scrape(client):
+    from app.core.auth import require_admin
+    from app.main import app
+    app.dependency_overrides[require_admin] = lambda: None
+    try:
+        resp = client.get("/api/metrics")
+    finally:
+        app.dependency_overrides.pop(require_admin, None)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    return resp.text
+
+
+def test_metrics_cover_requests_llm_stages_and_caches(client, monkeypatch):
+    monkeypatch.setattr("app.api.routes.workflows.AIAnalyzer", AIAnalyzer)
+    monkeypatch.setattr(settings, "LLM_BACKEND", "stub")
+    monkeypatch.setattr(settings, "LLM_STUB_LATENCY_MS", 0.0)
+    monkeypatch.setattr(settings, "LLM_STUB_TOKENS_PER_SECOND", 0.0)
+    monkeypatch.setattr(llm_client, "_clients", {})
+
+    wid = _create_workflow(client)
+    resp = client.post("/api/analyze", json={"workflow_id": wid}, headers={"accept": "text/event-stream"})
+    assert '"stage": "done"' in resp.text
+    share_code = client.get(f"/api/workflows/{wid}").json()["share_code"]
+    client.get(f"/api/share/{share_code}")
+    client.get(f"/api/share/{share_code}")
+    assert client.get(f"/api/reports/{wid}/pdf").status_code == 200
+    assert client.get("/api/metrics").status_code == 401
+
+    text = _scrape(client)
+    assert "# TYPE workscan_http_request_duration_seconds histogram" in text
+    assert _sample(text, 'workscan_http_request_duration_seconds_count'
+                         '{method="POST",route="/api/workflows",status="201"}') == 1
+    assert _sample(text, 'workscan_http_request_duration_seconds_count'
+                         '{method="GET",route="/api/share/{share_code}",status="200"}') == 2
+    assert _sample(text, 'workscan_http_request_duration_seconds_bucket'
+                         '{method="POST",route="/api/analyze",status="200",le="+Inf"}') == 1
+    assert _sample(text, 'workscan_http_requests_in_flight') == 1   # the scrape itself
+
+    model = AIAnalyzer()._request_params([{"name": "x"}])["model"]
+    assert _sample(text, f'workscan_llm_request_duration_seconds_count{{model="{model}",outcome="ok"}}') == 1
+    assert _sample(text, f'workscan_llm_tokens_total{{direction="output",model="{model}"}}') > 0
+
+    assert _sample(text, 'workscan_stage_duration_seconds_count{stage="report.pdf"}') == 1
+    assert _sample(text, 'workscan_stage_duration_seconds_count{stage="persist"}') == 1
+    assert _sample(text, 'workscan_cache_hits_total{cache="share"}') >= 1
+    assert _sample(text, 'workscan_cache_hit_ratio{cache="share"}') > 0
+
+
+def test_turso_round_trips_are_counted(monkeypatch):
+    from app.core import turso_dbapi
+
+    def handler(request):
+        n = len(json.loads(request.content)["requests"])
+        if "fail" in request.content.decode():
+            return httpx.Response(500, text="boom")
+        return httpx.Response(200, json={"results": [
+            {"type": "ok", "response": {"type": "execute", "result": {"cols": [], "rows": []}}}] * n})
+
+    conn = turso_dbapi.connect("libsql://db.example", "token")
+    conn._client = httpx.Client(transport=httpx.MockTransport(handler))
+    conn._send_one("SELECT 1")
+    conn._send_batch([("INSERT INTO t VALUES (?)", (1,)), ("INSERT INTO t VALUES (?)", (2,))])
+    with pytest.raises(turso_dbapi.OperationalError):
+        conn._send_one("SELECT fail")
+
+    text = metrics.render()
+    assert _sample(text, 'workscan_turso_request_duration_seconds_count{op="execute"}') == 2
+    assert _sample(text, 'workscan_turso_statements_total{op="batch"}') == 2
+    assert _sample(text, 'workscan_turso_errors_total{op="execute"}') == 1
+
+
+def test_event_loop_lag_is_measured():
+    loop = asyncio.new_event_loop()
+    runner = threading.Thread(target=loop.run_forever, daemon=True)
+    runner.start()
+    probe = metrics.watch_event_loop(loop, interval=0.01)
+    loop.call_soon_threadsafe(time.sleep, 0.2)   # block the loop
+    time.sleep(0.4)
+    loop.call_soon_threadsafe(loop.stop)
+    runner.join()
+    loop.close()
+    probe.join(timeout=1)
+
+    text = metrics.render()
+    assert not probe.is_alive()
+    assert _sample(text, "workscan_event_loop_lag_seconds_count") >= 2
+    assert _sample(text, 'workscan_event_loop_lag_seconds_bucket{le="0.1"}') < \
+        _sample(text, 'workscan_event_loop_lag_seconds_bucket{le="+Inf"}')
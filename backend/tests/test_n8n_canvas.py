@@ -1,11 +1,90 @@
 """
 Tests for the n8n canvas generator — no API key, no DB required.
 """
-import sys, os, json, pytest
+import sys, os, re, json, pytest
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 os.environ.setdefault("ANTHROPIC_API_KEY", "test-key-placeholder")
 
-from app.services.n8n_template_client import build_canvas, _resolve_category
+from app.services.n8n_template_client import (
+    build_canvas, canvas_builder, CanvasBuilder, _resolve_category, _guess_cat, _instantiate,
+    _ALIASES, _BUILDERS, N8nTemplateClient,
+)
+from benchmarks.fixtures import load_job_profiles
+
+PROFILE_CATEGORIES = sorted({category for _, tasks in load_job_profiles() for _, category in tasks})
+
+# Task names from the job profiles and the category _guess_cat should give
+# them, a few per category
+GUESS_CASES = [
+    ("Research latest AI papers",                  "academic"),
+    ("Flag at-risk accounts",                      "account_management"),
+    ("A/B test results analysis",                  "analysis"),
+    ("Monitor cloud costs",                        "cloud_infra"),
+    ("Monitor compliance and regulatory deadlines", "compliance"),
+    ("Schedule and publish posts",                 "content"),
+    ("Route customer support tickets",             "customer_support"),
+    ("Monitor ETL pipeline health",                "data_engineering"),
+    ("Track Figma design comments",                "design"),
+    ("Monitor GitHub PRs",                         "devops"),
+    ("Update component documentation",             "documentation"),
+    ("Process new orders",                         "ecommerce"),
+    ("Analyse email open rates",                   "email_marketing"),
+    ("Daily executive brief",                      "executive"),
+    ("Detect expense anomalies",                   "finance"),
+    ("Send appointment reminders and schedule",    "healthcare_admin"),
+    ("Track investor pipeline",                    "investor_relations"),
+    ("Monitor contract expiry deadlines",          "legal"),
+    ("Track shipment exceptions",                  "logistics"),
+    ("Review product backlog",                     "management"),
+    ("Track campaign ROI",                         "marketing"),
+    ("Onboard new hires",                          "onboarding"),
+    ("Monitor brand media mentions",               "pr_comms"),
+    ("Route procurement approvals",                "procurement"),
+    ("Log customer feedback to product board",     "product"),
+    ("Analyse user funnel drop-offs",              "product_analytics"),
+    ("Track candidate pipeline stages",            "recruiting"),
+    ("Monthly accounting report",                  "reporting"),
+    ("Research AI market trends",                  "research"),
+    ("Chase stalled deals in HubSpot",             "sales"),
+    ("Weekly quota and forecast report",           "sales_ops"),
+    ("Schedule client meetings",                   "scheduling"),
+    ("Scan security access logs",                  "security"),
+    ("Monitor SEO keyword rankings",               "seo"),
+    ("Monitor social media engagement",            "social_media"),
+]
+
+# Categories whose curated template text (relevance reason + description)
+# names them clearly enough for _guess_cat to map it back
+REASON_CATEGORIES = [
+    "academic", "account_management", "cloud_infra", "communication", "compliance",
+    "customer_support", "data_entry", "design", "devops", "ecommerce", "finance", "legal",
+    "logistics", "management", "marketing", "onboarding", "pr_comms", "product",
+    "product_analytics", "recruiting", "sales", "security", "seo",
+]
+
+
+def _suggestion_reasons():
+    client = N8nTemplateClient()
+    cats = sorted(_BUILDERS)
+    out = {}
+    for i in range(0, len(cats), 6):
+        tasks = [{"name": c, "category": c} for c in cats[i:i + 6]]
+        out.update((s["category"], s["relevance_reason"] + " " + s["description"])
+                   for s in client.get_curated_templates("Role", tasks))
+    return out
+
+
+def _linear_resolve(category):
+    """_resolve_category as the original linear scan had it (blank input aside)."""
+    c = (category or "general").lower().strip().replace(" ", "_").replace("-", "_")
+    if c in _BUILDERS:
+        return c
+    if c in _ALIASES:
+        return _ALIASES[c]
+    for key in _BUILDERS:
+        if key in c or c in key:
+            return key
+    return "general"
 
 
 SAMPLE_TASKS = [
@@ -128,3 +207,158 @@ class TestResolveCategory:
 
     def test_none_returns_general(self):
         assert _resolve_category(None) == "general"
+
+    def test_whitespace_returns_general(self):
+        assert _resolve_category("   ") == "general"
+
+    @pytest.mark.parametrize("category", PROFILE_CATEGORIES)
+    def test_profile_categories_resolve_to_themselves(self, category):
+        assert _resolve_category(category) == category
+
+    def test_fuzzy_match_prefers_first_builder_key(self):
+        assert _resolve_category("Sales Ops team") == "sales"
+        assert _resolve_category("content_marketing") == "marketing"
+        assert _resolve_category("ops") == "management"      # alias beats fuzzy
+        assert _resolve_category("analy") == "analysis"      # value inside a key
+
+    def test_overlapping_keys_are_all_found(self):
+        # the first key in _BUILDERS order wins, even when it overlaps a
+        # later one in the text
+        assert _resolve_category("cloud_infranalysis") == "analysis"
+        assert _resolve_category("compliancecommerce") == "ecommerce"
+
+    def test_resolves_like_the_linear_scan(self):
+        keys = list(_BUILDERS) + list(_ALIASES)
+        inputs = {a + b for a in keys for b in keys}
+        inputs |= {a + b[k:] for a in keys for b in keys
+                   for k in range(1, min(len(a), len(b))) if a[-k:] == b[:k]}
+        inputs |= {key[i:] for key in keys for i in range(1, len(key))}
+        assert {c: _resolve_category(c) for c in inputs} == {c: _linear_resolve(c) for c in inputs}
+
+
+_SUGGESTION_REASONS = _suggestion_reasons()
+
+
+class TestGuessCategory:
+
+    @pytest.mark.parametrize("name,category", GUESS_CASES)
+    def test_job_profile_task(self, name, category):
+        assert _guess_cat(name) == category
+
+    @pytest.mark.parametrize("category", REASON_CATEGORIES)
+    def test_suggestion_reason_maps_back_to_its_category(self, category):
+        assert _guess_cat(_SUGGESTION_REASONS[category]) == category
+
+    @pytest.mark.parametrize("name,category", [
+        ("Review audit log for security incidents", "security"),
+        ("Daily log of patient appointments",       "healthcare_admin"),
+        ("Plan email campaign",                     "marketing"),
+        ("Track customer retention cohorts",        "product_analytics"),
+        ("Fill in intake form",                     "data_entry"),
+        ("Weekly summary to team",                  "reporting"),
+    ])
+    def test_rule_order_and_keywords_are_the_original_ones(self, name, category):
+        assert _guess_cat(name) == category
+
+    def test_keywords_match_at_word_starts_only(self):
+        assert _guess_cat("Refresh the sales dashboard") != "investor_relations"
+        assert _guess_cat("Review GitHub product roadmap") != "devops"
+        assert _guess_cat("Review GitHub PRs") == _guess_cat("Review GitHub PR") == "devops"
+        assert _guess_cat("Update the docs") == "documentation"
+        assert _guess_cat("Scan access logs") == "security"
+
+    def test_conjunctions_need_every_keyword(self):
+        # used to read `"compliance" in t or "deadline" in t and "regul" in t`
+        assert _guess_cat("Track regulatory filing deadlines") == "compliance"
+        assert _guess_cat("Track filing deadlines") == "general"
+        assert _guess_cat("Review vendor contract") == "legal"
+        assert _guess_cat("Alert on expiring legal holds") == "legal"
+        assert _guess_cat("Alert on expiring policies") == "general"
+        assert _guess_cat("Monitor ETL pipeline runs") == "data_engineering"
+        assert _guess_cat("Monitor ETL runs") == "general"
+
+    def test_separators_are_interchangeable(self):
+        assert _guess_cat("Monitor funnel drop-offs") == _guess_cat("Monitor funnel drop offs") == "product_analytics"
+
+    def test_empty_text_is_general(self):
+        assert _guess_cat("") == "general"
+
+
+class TestCanvasBuilder:
+
+    def test_to_json_matches_dict(self):
+        canvas = canvas_builder("Product Manager", SAMPLE_TASKS)
+        assert json.loads(canvas.to_json()) == canvas.to_dict()
+        assert json.loads(CanvasBuilder("Empty").to_json())["meta"]["taskCount"] == 0
+
+    def test_connections_reference_prefixed_nodes_of_their_row(self):
+        canvas = build_canvas("Product Manager", SAMPLE_TASKS)
+        names = {n["name"] for n in canvas["nodes"]}
+        for src, data in canvas["connections"].items():
+            row = src.split(":")[0]
+            assert src in names
+            for edge in data["main"][0]:
+                assert edge["node"] in names and edge["node"].startswith(row + ":")
+
+    def test_template_and_chain_rows_lay_out_identically(self):
+        client = N8nTemplateClient()
+        suggested = client.get_curated_templates("PM", SAMPLE_TASKS)
+        from_chains = client.build_merged_canvas("PM", suggested)
+        from_templates = build_canvas("PM", [{"name": s["task_name"], "category": s["category"]} for s in suggested])
+        strip = lambda c: [(n["name"], n["position"]) for n in c["nodes"]]
+        assert strip(from_chains) == strip(from_templates)
+        assert from_chains["connections"] == from_templates["connections"]
+
+
+class TestCompiledTemplates:
+
+    @staticmethod
+    def _strip_ids(value):
+        text = json.dumps(value)
+        for node in value[0]:
+            text = text.replace(node["id"], "ID")
+        return re.sub(r"[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}", "ID", text)
+
+    @pytest.mark.parametrize("cat", sorted(_BUILDERS))
+    def test_instance_matches_builder(self, cat):
+        name = 'Review "Q3" contracts \\ ünïcode'
+        assert self._strip_ids(_instantiate(cat, name)) == self._strip_ids(_BUILDERS[cat](name, 0))
+
+    def test_instances_get_fresh_ids_and_nodes(self):
+        a, _ = _instantiate("reporting", "A")
+        b, _ = _instantiate("reporting", "A")
+        assert {n["id"] for n in a}.isdisjoint({n["id"] for n in b})
+        a[0]["position"][0] += 100
+        assert b[0]["position"][0] != a[0]["position"][0]
+
+    def test_instances_share_no_mutable_state(self):
+        a_nodes, a_conns = _instantiate("reporting", "A")
+        b_nodes, b_conns = _instantiate("reporting", "A")
+        before = json.dumps([b_nodes, b_conns])
+        for node in a_nodes:
+            node["parameters"]["mutated"] = True
+        for data in a_conns.values():
+            data["main"][0].clear()
+        assert json.dumps([b_nodes, b_conns]) == before
+        assert json.dumps(_instantiate("reporting", "A", seed="s")) == json.dumps(_instantiate("reporting", "A", seed="s"))
+
+        suggested = N8nTemplateClient().get_curated_templates("PM", SAMPLE_TASKS[:1] * 2)
+        first, second = (s["workflow_json"]["connections"] for s in suggested)
+        first.clear()
+        assert second
+
+    def test_merged_canvas_reuses_suggestion_nodes_unchanged(self):
+        client = N8nTemplateClient()
+        suggested = client.get_curated_templates("Product Manager", SAMPLE_TASKS)
+        before = json.dumps(suggested)
+        canvas = client.build_merged_canvas("Product Manager", suggested)
+        assert json.dumps(suggested) == before  # layout must not mutate the suggestions
+        canvas_ids = {n["id"] for n in canvas["nodes"]}
+        for s in suggested:
+            assert {n["id"] for n in s["workflow_json"]["nodes"]} <= canvas_ids
+        assert canvas["meta"]["categories"] and set(canvas["meta"]["categories"]) == {s["category"] for s in suggested}
+
+    def test_merged_canvas_accepts_legacy_suggestions(self):
+        legacy = [{"task_name": "Chase stalled deals", "description": "HubSpot deals stalled 14d"}]
+        canvas = N8nTemplateClient().build_merged_canvas("AE", legacy)
+        assert canvas["meta"]["categories"] == ["sales"]
@@ -0,0 +1,76 @@
+"""
+Tests for the analytics dispatcher — batching to the file sink, drop-oldest
+on overflow, and that capture_event never waits on the network.
+"""
+import json
+import threading
+import time
+
+from app.core import metrics, posthog_client
+
+
+def _dispatcher(tmp_path, **overrides):
+    opts = dict(api_key="", host="", file_sink=str(tmp_path / "events.jsonl"),
+                max_queue=100, batch_size=10, flush_interval=60.0)
+    opts.update(overrides)
+    return posthog_client._Dispatcher(**opts)
+
+
+def _sunk(tmp_path):
+    return [json.loads(line) for line in (tmp_path / "events.jsonl").read_text().splitlines()]
+
+
+def test_file_sink_receives_batched_events(tmp_path, monkeypatch):
+    d = _dispatcher(tmp_path, batch_size=3)
+    monkeypatch.setattr(posthog_client, "_dispatcher", d)
+    batches = []
+    real_send = d._send
+    monkeypatch.setattr(d, "_send", lambda batch: (batches.append(len(batch)), real_send(batch)))
+
+    for i in range(7):
+        posthog_client.capture_event(f"user{i}", "workflow_created", {"workflow_id": i})
+    assert posthog_client.flush(timeout=5)
+
+    events = _sunk(tmp_path)
+    assert [e["properties"]["workflow_id"] for e in events] == list(range(7))
+    assert events[0]["event"] == "workflow_created" and events[0]["distinct_id"] == "user0"
+    assert max(batches) == 3 and sum(batches) == 7
+    assert posthog_client.stats() == {"queued": 0, "sent": 7, "dropped": 0, "failed": 0}
+
+
+def test_overflow_drops_oldest_and_counts(tmp_path):
+    metrics.reset()
+    d = _dispatcher(tmp_path, max_queue=5, batch_size=100)
+    d._thread = threading.Thread()   # hold the real thread back until the queue has overflowed
+    for i in range(8):
+        d.enqueue({"event": "e", "n": i})
+    assert d.stats()["dropped"] == 3
+    assert 'workscan_analytics_events_total{outcome="dropped"} 3' in metrics.render()
+
+    d._thread = None
+    d.enqueue({"event": "e", "n": 8})   # starts the thread; evicts one more
+    assert d.flush(timeout=5)
+    assert [e["n"] for e in _sunk(tmp_path)] == [4, 5, 6, 7, 8]
+    assert d.stats()["dropped"] == 4
+    metrics.reset()
+
+
+def test_capture_never_blocks_on_a_slow_backend(tmp_path, monkeypatch):
+    d = _dispatcher(tmp_path, batch_size=1, flush_interval=0.01)
+    release = threading.Event()
+
+    def slow_send(batch):
+        release.wait(5)
+        raise ConnectionError("posthog down")
+    monkeypatch.setattr(d, "_send", slow_send)
+    monkeypatch.setattr(posthog_client, "_dispatcher", d)
+
+    t0 = time.perf_counter()
+    for i in range(50):
+        posthog_client.capture_event("u", "analysis_completed", {"i": i})
+    assert time.perf_counter() - t0 < 0.5
+
+    release.set()
+    assert d.flush(timeout=5)
+    stats = d.stats()
+    assert stats["failed"] == 50 and stats["sent"] == 0
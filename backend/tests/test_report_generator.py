@@ -0,0 +1,106 @@
+"""
+Tests for the PDF/DOCX report generator — shared style registry and
+smoke renders across every context and locale.
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services import report_generator as rg
+from benchmarks.fixtures import make_analysis_data
+
+
+class TestStyleRegistry:
+    def test_same_parameters_return_same_style(self):
+        a = rg.pdf_style('x', fontSize=9, textColor=rg.BLUE)
+        b = rg.pdf_style('x', textColor=rg.BLUE, fontSize=9)
+        assert a is b
+
+    def test_different_parameters_return_different_styles(self):
+        assert rg.pdf_style('x', fontSize=9) is not rg.pdf_style('x', fontSize=10)
+        assert rg.pdf_style('x', parent='Normal') is not rg.pdf_style('x', parent='Heading1')
+
+    def test_name_is_part_of_the_key(self):
+        assert rg.pdf_style('x', fontSize=9).name == 'x'
+        assert rg.pdf_style('y', fontSize=9).name == 'y'
+
+    def test_table_style_is_cached(self):
+        cmds = [('VALIGN', (0, 0), (-1, -1), 'TOP'), ('BACKGROUND', (0, 0), (-1, 0), rg.BLUE)]
+        assert rg.pdf_table_style(cmds) is rg.pdf_table_style(list(cmds))
+
+    def test_stylesheet_is_built_once(self):
+        assert rg.pdf_stylesheet() is rg.pdf_stylesheet()
+
+
+@pytest.mark.parametrize("context", ["individual", "team", "company"])
+@pytest.mark.parametrize("loc", ["en", "de"])
+def test_pdf_render_smoke(tmp_path, context, loc):
+    out = tmp_path / "report.pdf"
+    rg.ReportGenerator.generate_pdf_report(make_analysis_data(5, context), str(out), loc=loc)
+    assert out.read_bytes().startswith(b"%PDF")
+
+
+def test_repeated_renders_do_not_grow_style_registry(tmp_path):
+    data = make_analysis_data(5)
+    out = str(tmp_path / "report.pdf")
+    rg.ReportGenerator.generate_pdf_report(data, out)
+    size = len(rg._PARA_STYLES)
+    rg.ReportGenerator.generate_pdf_report(data, out)
+    assert len(rg._PARA_STYLES) == size
+
+
+def test_combined_pdf_numbers_pages_across_sections(tmp_path):
+    import pypdf
+    from benchmarks.fixtures import make_analyses_list
+
+    out = tmp_path / "combined.pdf"
+    rg.ReportGenerator.generate_combined_pdf_report(make_analyses_list(6, "team"), str(out), loc="de")
+    pages = pypdf.PdfReader(str(out)).pages
+    assert f"Seite 1 von {len(pages)}" in pages[0].extract_text()
+    assert f"Seite {len(pages)} von {len(pages)}" in pages[-1].extract_text()
+
+
+def test_combined_docx_includes_every_workflow(tmp_path):
+    from docx import Document
+    from benchmarks.fixtures import make_analyses_list
+
+    out = tmp_path / "combined.docx"
+    rg.ReportGenerator.generate_combined_docx_report(make_analyses_list(6, "company"), str(out))
+    text = "\n".join(p.text for p in Document(str(out)).paragraphs)
+    assert "WORKFLOW 3 OF 3" in text
+
+
+def test_combined_docx_renders_sections_in_worker_processes(tmp_path, monkeypatch):
+    from docx import Document
+    from app.core import process_pools
+    from benchmarks.fixtures import make_analyses_list
+
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+    analyses = make_analyses_list(4, "team")
+    serial, parallel = tmp_path / "serial.docx", tmp_path / "parallel.docx"
+    rg.ReportGenerator.generate_combined_docx_report(analyses, str(serial), workers=1)
+    try:
+        rg.ReportGenerator.generate_combined_docx_report(analyses, str(parallel), workers=2)
+        assert ("reports", 2) in process_pools.active()
+    finally:
+        process_pools.shutdown_all()
+    assert process_pools.active() == {}
+
+    def text(path):
+        return [p.text for p in Document(str(path)).paragraphs]
+    assert text(parallel) == text(serial)
+
+
+def test_combined_report_rejects_too_many_workflows(monkeypatch):
+    from fastapi import HTTPException
+    from app.api.routes import reports
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "COMBINED_REPORT_MAX_WORKFLOWS", 3)
+    with pytest.raises(HTTPException) as exc:
+        reports._load_combined_analyses(None, [1, 2, 3, 4])
+    assert exc.value.status_code == 422
+    assert "at most 3 workflows" in exc.value.detail
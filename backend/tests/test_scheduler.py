@@ -0,0 +1,150 @@
+"""
+Tests for the in-process scheduler — lease-based leader election, due/jitter
+bookkeeping from job_runs, per-job timeouts, and the manual cron trigger
+sharing the job's lease.
+"""
+import asyncio
+import os
+import tempfile
+import threading
+import time
+
+from app.core import database
+from app.services import scheduler
+from tests.test_analyze_streaming_integration import client, _create_workflow  # noqa: F401
+
+
+def _runs():
+    db = database.SessionLocal()
+    try:
+        from app.models.workflow import JobRun
+        return [(r.job, r.trigger, r.status, r.detail) for r in db.query(JobRun).order_by(JobRun.id).all()]
+    finally:
+        db.close()
+
+
+def _wait_idle(s, timeout=5.0):
+    deadline = time.time() + timeout
+    while s._running and time.time() < deadline:
+        time.sleep(0.01)
+    assert not s._running
+
+
+def test_lease_has_one_holder_until_it_lapses(client):
+    assert scheduler.acquire_lease("scheduler", "a", 0.2)
+    assert not scheduler.acquire_lease("scheduler", "b", 0.2)
+    assert scheduler.acquire_lease("scheduler", "a", 0.2)   # renewal
+    time.sleep(0.25)
+    assert scheduler.acquire_lease("scheduler", "b", 10)
+    scheduler.release_lease("scheduler", "b")
+    assert scheduler.acquire_lease("scheduler", "a", 10)
+
+
+def test_leader_runs_due_jobs_and_records_history(client):
+    calls = []
+    release = threading.Event()
+
+    async def digest():
+        calls.append("digest")
+        return {"sent": 2}
+
+    def slow():
+        release.wait(5)
+
+    def broken():
+        raise RuntimeError("boom")
+
+    jobs = {}
+    for name, fn, timeout in (("digest", digest, 5), ("slow", slow, 0.1), ("broken", broken, 5)):
+        jobs[name] = scheduler.Job(name, fn, interval_seconds=3600, timeout_seconds=timeout)
+    leader = scheduler.Scheduler(jobs, tick_seconds=60, lease_seconds=30, jitter=0.1, holder="leader")
+    follower = scheduler.Scheduler(jobs, tick_seconds=60, lease_seconds=30, jitter=0.1, holder="follower")
+
+    assert sorted(leader.tick()) == ["broken", "digest", "slow"]
+    assert follower.tick() == [] and not follower.is_leader
+    time.sleep(0.3)
+    assert leader.tick() == []            # slow still running; others not due for an hour
+    release.set()
+    _wait_idle(leader)
+    assert leader.tick() == []            # slow timed out but started < interval ago
+
+    assert sorted(_runs()) == [
+        ("broken", "schedule", "error", "RuntimeError('boom')"),
+        ("digest", "schedule", "ok", "{'sent': 2}"),
+        ("slow", "schedule", "timeout", "exceeded 0.1s"),
+    ]
+    assert calls == ["digest"]
+    leader.stop()
+    assert follower.tick() == [] and follower.is_leader   # lease released → follower takes over
+
+
+def test_timed_out_sync_job_keeps_its_lease_until_it_ends(client):
+    release = threading.Event()
+    jobs = {"slow": scheduler.Job("slow", lambda: release.wait(5), interval_seconds=3600, timeout_seconds=0.05)}
+    s = scheduler.Scheduler(jobs, tick_seconds=60, lease_seconds=0.2, jitter=0, holder="leader")
+
+    assert s.tick() == ["slow"]
+    time.sleep(0.6)   # well past timeout + lease, the TTL it started with
+    assert _runs() == [("slow", "schedule", "timeout", "exceeded 0.05s")]
+    assert not scheduler.acquire_lease("job:slow", "manual", 10)
+    release.set()
+    _wait_idle(s)
+    assert scheduler.acquire_lease("job:slow", "manual", 10)
+    s.stop()
+
+
+def test_manual_cron_run_shares_the_job_lease(client):
+    from app.core.auth import require_admin
+    from app.main import app
+
+    app.dependency_overrides[require_admin] = lambda: None
+    try:
+        assert scheduler.acquire_lease("job:quick_win_digest", "someone-else", 60)
+        assert client.post("/api/cron/quick-win-digest").status_code == 409
+        scheduler.release_lease("job:quick_win_digest", "someone-else")
+        resp = client.post("/api/cron/quick-win-digest")
+    finally:
+        app.dependency_overrides.pop(require_admin, None)
+    assert resp.json() == {"sent": 0, "skipped": 0, "considered": 0}
+    assert _runs() == [("quick_win_digest", "http", "ok", None)]
+
+
+def test_temp_file_cleanup_job(client, monkeypatch):
+    from app.services import scheduled_jobs
+
+    old = os.path.join(tempfile.gettempdir(), "workscan_test_old.pdf")
+    fresh = os.path.join(tempfile.gettempdir(), "workscan_test_fresh.pdf")
+    for path in (old, fresh):
+        with open(path, "w") as fh:
+            fh.write("x")
+    os.utime(old, (time.time() - 7200, time.time() - 7200))
+    monkeypatch.setattr(scheduled_jobs.settings, "TEMP_FILE_MAX_AGE_SECONDS", 3600)
+    try:
+        result = scheduled_jobs.temp_file_cleanup()
+        assert result["files_removed"] >= 1
+        assert not os.path.exists(old) and os.path.exists(fresh)
+    finally:
+        for path in (old, fresh):
+            if os.path.exists(path):
+                os.remove(path)
+    assert asyncio.iscoroutinefunction(scheduler.JOBS["quick_win_digest"].fn)
+    assert set(scheduler.JOBS) >= {"quick_win_digest", "share_cache_warmup", "temp_file_cleanup"}
+
+
+def test_share_cache_warmup_prerenders_viewed_reports(client):
+    from app.core.share_cache import share_cache
+    from app.models.workflow import PageView
+    from app.services import scheduled_jobs
+
+    wid = _create_workflow(client, "Warm me")
+    assert client.post("/api/analyze", json={"workflow_id": wid}).status_code == 200
+    code = client.get(f"/api/workflows/{wid}").json()["share_code"]
+    db = database.SessionLocal()
+    db.add_all([PageView(path=f"/report/{code}"), PageView(path=f"/report/{code}"), PageView(path="/report/nope00")])
+    db.commit()
+    db.close()
+
+    share_cache.clear()
+    assert scheduled_jobs.share_cache_warmup() == {"candidates": 2, "warmed": 1}
+    assert ("analysis", code) in share_cache
+    assert scheduled_jobs.share_cache_warmup()["warmed"] == 0
@@ -0,0 +1,72 @@
+"""
+Tests for the public share-code response cache — the LRU itself and the
+ETag / invalidation behaviour of /api/share/{code}.
+"""
+import time
+
+from app.core.share_cache import LRUCache, share_cache, invalidate_share
+from tests.test_analyze_streaming_integration import client, _create_workflow  # noqa: F401
+
+
+class TestLRUCache:
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(max_entries=2, ttl_seconds=60)
+        cache.put(("a",), b"1")
+        cache.put(("b",), b"2")
+        cache.get(("a",))
+        cache.put(("c",), b"3")
+        assert cache.get(("b",)) is None
+        assert cache.get(("a",))[0] == b"1"
+
+    def test_entries_expire(self, monkeypatch):
+        cache = LRUCache(max_entries=4, ttl_seconds=10)
+        cache.put(("a",), b"1")
+        real = time.monotonic()
+        monkeypatch.setattr("app.core.share_cache.time.monotonic", lambda: real + 11)
+        assert cache.get(("a",)) is None
+
+    def test_etag_tracks_body(self):
+        cache = LRUCache(max_entries=4, ttl_seconds=60)
+        assert cache.put(("a",), b"1") == cache.put(("b",), b"1")
+        assert cache.put(("a",), b"1") != cache.put(("a",), b"2")
+
+
+def _analyzed_share_code(client):
+    workflow_id = _create_workflow(client, "Share cache test")
+    resp = client.post(
+        "/api/analyze",
+        json={"workflow_id": workflow_id, "hourly_rate": 50.0, "recaptcha_token": ""},
+        headers={"x-user-email": "test@example.com", "Accept": "application/json"},
+    )
+    assert resp.status_code == 200, resp.text
+    return resp.json()["workflow"]["share_code"]
+
+
+def test_share_endpoint_serves_etag_and_304(client):
+    share_cache.clear()
+    code = _analyzed_share_code(client)
+
+    first = client.get(f"/api/share/{code}")
+    assert first.status_code == 200
+    assert first.json()["workflow"]["share_code"] == code
+    assert len(first.json()["results"]) == 1
+    assert "max-age" in first.headers["cache-control"]
+
+    again = client.get(f"/api/share/{code}", headers={"If-None-Match": first.headers["etag"]})
+    assert again.status_code == 304
+
+    wf = client.get(f"/api/share/{code}/workflow")
+    assert wf.status_code == 200
+    assert wf.json()["tasks"][0]["name"] == "Test task A"
+
+
+def test_invalidate_share_drops_cached_views(client):
+    share_cache.clear()
+    code = _analyzed_share_code(client)
+    client.get(f"/api/share/{code}")
+    client.get(f"/api/share/{code}/workflow")
+    assert share_cache.get(("analysis", code)) and share_cache.get(("workflow", code))
+
+    invalidate_share(code)
+    assert share_cache.get(("analysis", code)) is None
+    assert share_cache.get(("workflow", code)) is None
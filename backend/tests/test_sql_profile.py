@@ -0,0 +1,82 @@
+"""
+Tests for the Turso SQL profiler — statement normalization, per-request
+aggregation through the middleware, and N+1 flagging.
+"""
+import json
+
+import httpx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core import sql_profile, turso_dbapi
+from app.core.config import settings
+
+
+def _turso():
+    def handler(request):
+        n = len(json.loads(request.content)["requests"]) - 1
+        return httpx.Response(200, json={"results": [
+            {"type": "ok", "response": {"type": "execute", "result": {"cols": [], "rows": []}}}] * n
+            + [{"type": "ok", "response": {"type": "close"}}]})
+
+    conn = turso_dbapi.connect("libsql://db.example", "token")
+    conn._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return conn
+
+
+def test_normalize_collapses_literals_and_lists():
+    assert sql_profile.normalize("SELECT *  FROM t\n WHERE id = 42 AND name = 'o''brien'") == \
+        "SELECT * FROM t WHERE id = ? AND name = ?"
+    assert sql_profile.normalize("SELECT x FROM t WHERE id IN (?, ?, ?)") == \
+        sql_profile.normalize("SELECT x FROM t WHERE id IN (?)")
+
+
+def test_profile_records_statements_and_flags_n_plus_one(monkeypatch, capsys):
+    monkeypatch.setattr(settings, "SQL_PROFILE_N_PLUS_ONE_THRESHOLD", 3)
+    conn = _turso()
+    with sql_profile.profile("cron.digest") as p:
+        conn._send_one("SELECT * FROM workflows WHERE user_email = ?", ("a@b.c",))
+        for task_id in range(5):
+            conn._send_one("SELECT * FROM tasks WHERE workflow_id = ?", (task_id,))
+        conn._send_batch([("INSERT INTO t VALUES (?, ?)", (1, 2)), ("INSERT INTO t VALUES (?, ?)", (3, 4))])
+    conn._send_one("SELECT 1")   # after the block — not recorded
+
+    summary = p.summary()
+    assert (summary["statements"], summary["round_trips"]) == (8, 7)
+    assert summary["bytes_out"] > 0 and summary["bytes_in"] > 0
+    assert p.statements[0]["params"] == 1 and p.statements[-1]["op"] == "batch"
+    assert summary["n_plus_one"] == [{"sql": "SELECT * FROM tasks WHERE workflow_id = ?", "count": 5}]
+    out = capsys.readouterr().out
+    assert '[sql] {"profile": "cron.digest"' in out and "N+1 suspected on cron.digest: 5x" in out
+
+
+def test_middleware_profiles_each_request(monkeypatch, capsys):
+    from app.core.sql_profile import SQLProfileMiddleware
+
+    conn = _turso()
+    app = FastAPI()
+    app.add_middleware(SQLProfileMiddleware)
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int):   # sync: runs in the threadpool
+        for _ in range(item_id):
+            conn._send_one("SELECT * FROM tasks WHERE id = ?", (item_id,))
+        return {"ok": True}
+
+    http = TestClient(app)
+    monkeypatch.setattr(settings, "SQL_PROFILE", False)
+    assert "x-sql-profile" not in http.get("/items/2").headers
+    assert "[sql]" not in capsys.readouterr().out
+
+    monkeypatch.setattr(settings, "SQL_PROFILE", True)
+    monkeypatch.setattr(settings, "DEBUG", True)
+    monkeypatch.setattr(settings, "SQL_PROFILE_N_PLUS_ONE_THRESHOLD", 5)
+    resp = http.get("/items/7")
+    header = resp.headers["x-sql-profile"]
+    assert header.startswith("statements=7; round_trips=7; db_ms=") and header.endswith("; n_plus_one=7x")
+    line = next(l for l in capsys.readouterr().out.splitlines() if l.startswith("[sql] {"))
+    summary = json.loads(line[6:])
+    assert summary["route"] == "GET /items/{item_id}" and summary["statements"] == 7
+
+    monkeypatch.setattr(settings, "DEBUG", False)
+    assert "x-sql-profile" not in http.get("/items/1").headers
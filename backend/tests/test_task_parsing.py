@@ -0,0 +1,145 @@
+"""
+Tests for map-reduce task parsing — structural chunking, re-splitting dense
+chunks, the local near-duplicate merge, and /api/parse-tasks on long input.
+"""
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.services import llm_client
+from app.services.task_parsing import merge_tasks, parse_tasks, split_text
+from tests.test_analyze_streaming_integration import client  # noqa: F401
+
+SECTIONS = ["## Finance\n\n" + "I reconcile invoices every Monday. I approve expense claims.\n" * 3,
+            "## People\n\nI run onboarding sessions for new hires. I update the org chart monthly.\n",
+            "## Reporting\n\n" + "I compile the weekly KPI dashboard for leadership.\n" * 2]
+
+
+class _LineLLM:
+    """One task per input line; replies past `dense` input chars are cut off at max_tokens."""
+
+    def __init__(self, dense: int = 10**9):
+        self.dense = dense
+        self.inputs = []
+        self.messages = self
+
+    def create(self, **kw):
+        text = llm_client._USER_INPUT.search(kw["messages"][0]["content"])[1]
+        self.inputs.append(text)
+        if len(text) > self.dense:
+            return SimpleNamespace(stop_reason="max_tokens", content=[SimpleNamespace(text='{"tasks": [')])
+        tasks = [{"name": line, "description": line, "frequency": "weekly", "time_per_task": 15,
+                  "category": "general", "complexity": "low"} for line in text.splitlines() if line.strip()]
+        reply = {"workflow_name": f"Workflow {len(self.inputs)}", "workflow_description": "d", "tasks": tasks}
+        return SimpleNamespace(stop_reason="end_turn", content=[SimpleNamespace(text=json.dumps(reply))])
+
+
+def test_split_text_cuts_at_the_coarsest_boundary():
+    text = "".join(SECTIONS)
+    chunks = split_text(text, max_chars=200)
+    assert all(len(c) <= 200 for c in chunks)
+    assert [c.split("\n")[0] for c in chunks] == ["## Finance", "## People", "## Reporting"]
+    assert split_text(text, max_chars=10**6) == [text.strip()]
+
+    # a single paragraph falls back to sentences, then hard cuts
+    para = "Collect timesheets. Chase approvals. " * 20
+    assert all(c.endswith(".") for c in split_text(para, max_chars=100))
+    assert split_text("x" * 250, max_chars=100) == ["x" * 100, "x" * 100, "x" * 50]
+
+
+def test_merge_tasks_folds_near_duplicates():
+    tasks = [{"name": "Reconcile invoices", "description": "short"},
+             {"name": "Send invoice reminders", "description": "x"},
+             {"name": "Reconcile the invoices", "description": "the longer description"},
+             {"name": "Reconcile invoice", "description": "s"},
+             {"name": "Reconcile vendor statements", "description": "y"}]
+    merged = merge_tasks(tasks, threshold=0.8)
+    assert [t["name"] for t in merged] == ["Reconcile invoices", "Send invoice reminders",
+                                           "Reconcile vendor statements"]
+    assert merged[0]["description"] == "the longer description"
+
+
+def test_dense_chunks_are_split_again(monkeypatch):
+    monkeypatch.setattr(settings, "PARSE_CHUNK_CHARS", 400)
+    monkeypatch.setattr(settings, "PARSE_MIN_CHUNK_CHARS", 50)
+    llm = _LineLLM(dense=150)
+    text = "".join(f"Task number {i} happens weekly\n" for i in range(30))
+
+    parsed = asyncio.run(parse_tasks(llm, text))
+    assert [t["name"] for t in parsed["tasks"]] == [f"Task number {i} happens weekly" for i in range(30)]
+    assert parsed["workflow_name"].startswith("Workflow")
+    assert any(len(t) > 150 for t in llm.inputs) and len(llm.inputs) > len(split_text(text))
+
+    monkeypatch.setattr(settings, "PARSE_MIN_CHUNK_CHARS", 1000)
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(parse_tasks(_LineLLM(dense=150), text))
+    assert exc.value.status_code == 422
+
+
+def test_oversized_input_is_refused_before_any_llm_call(client, monkeypatch):
+    monkeypatch.setattr(settings, "PARSE_MAX_CHARS", 300)
+    llm = _LineLLM()
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(parse_tasks(llm, "x" * 301))
+    assert exc.value.status_code == 413 and llm.inputs == []
+
+    monkeypatch.setattr(settings, "LLM_BACKEND", "stub")
+    monkeypatch.setattr(llm_client, "_clients", {})
+    resp = client.post("/api/parse-tasks", json={"text": "I file reports. " * 50})
+    assert resp.status_code == 413
+
+
+@pytest.mark.parametrize("section", [
+    lambda i: f"## Section {i}\n\n" + f"I review supplier contract number {i} every week. " * 86,
+    lambda i: f"=== Page {i} ===\n" + f"Approve purchase order {i} and file it. " * 110,
+])
+def test_extract_tasks_output_at_the_cap_parses(tmp_path, section):
+    from app.api.routes.extraction import extract_text_from_file
+
+    # sections just over half a chunk: greedy packing leaves one per chunk
+    path = tmp_path / "long.txt"
+    path.write_text("\n\n".join(section(i) for i in range(40)))
+    text = extract_text_from_file(str(path), "long.txt")
+    assert len(text) >= settings.EXTRACT_MAX_CHARS and "truncated" in text
+
+    llm = _LineLLM()
+    parsed = asyncio.run(parse_tasks(llm, text))
+    assert len(llm.inputs) == len(split_text(text)) > 8
+    assert parsed["tasks"]
+
+
+def test_re_splits_count_against_the_call_budget(monkeypatch):
+    monkeypatch.setattr(settings, "PARSE_CHUNK_CHARS", 400)
+    monkeypatch.setattr(settings, "PARSE_MIN_CHUNK_CHARS", 50)
+    monkeypatch.setattr(settings, "PARSE_MAX_CALLS", 5)
+    llm = _LineLLM(dense=150)
+    text = "".join(f"Task number {i} happens weekly\n" for i in range(30))
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(parse_tasks(llm, text))
+    assert exc.value.status_code == 422 and len(llm.inputs) <= 5
+
+
+def test_long_document_endpoint_parses_chunks_concurrently(client, monkeypatch):
+    monkeypatch.setattr(settings, "LLM_BACKEND", "stub")
+    monkeypatch.setattr(settings, "LLM_STUB_LATENCY_MS", 300.0)
+    monkeypatch.setattr(settings, "LLM_STUB_TOKENS_PER_SECOND", 0.0)
+    monkeypatch.setattr(settings, "PARSE_CHUNK_CHARS", 300)
+    monkeypatch.setattr(llm_client, "_clients", {})
+    # 4 sections of a heading and 12 sentences — more than the stub's 20
+    # tasks per reply — with the same closing sentence in every section
+    text = "".join(f"## Team {s}\n\n" + "".join(f"Team {s} handles item {i}. " for i in range(11))
+                   + "Everyone files the weekly report.\n\n" for s in range(4))
+
+    started = time.perf_counter()
+    resp = client.post("/api/parse-tasks", json={"text": text})
+    elapsed = time.perf_counter() - started
+
+    assert resp.status_code == 200, resp.text
+    names = [t["name"] for t in resp.json()["tasks"]]
+    assert len(names) == 4 * 12 + 1 and names.count("Everyone files the weekly report") == 1
+    assert elapsed < 4 * 0.3   # the chunks' calls overlapped
@@ -0,0 +1,92 @@
+"""
+Tests for stage timing — spans and histograms, the per-stage `timing`
+metadata on the analyze SSE stream, and the admin metrics endpoint.
+"""
+import json
+
+import pytest
+
+from app.core import timing
+from app.core.config import settings
+from app.services import llm_client
+from app.services.ai_analyzer import AIAnalyzer
+from tests.test_analyze_streaming_integration import client, _create_workflow  # noqa: F401
+
+
+@pytest.fixture(autouse=True)
+def _fresh_histograms():
+    timing.reset()
+    yield
+    timing.reset()
+
+
+def test_trace_collects_nested_spans_and_histograms():
+    trace = timing.Trace("demo", workflow_id=7)
+    with trace.span("load"):
+        pass
+    assert list(trace.since_last()) == ["load"]
+
+    with trace.active():
+        with timing.span("llm", model="m") as sp:
+            sp.update(input_tokens=120, output_tokens=30)
+            with timing.span("cache.lookup"):
+                timing.note(cache="hit")
+    with pytest.raises(KeyError):
+        with trace.span("parse"):
+            raise KeyError("x")
+    assert trace.since_last().keys() == {"cache.lookup", "llm", "parse"}
+    assert trace.since_last() == {}
+
+    record = trace.finish()
+    assert record["workflow_id"] == 7 and record["total_ms"] >= 0
+    assert [s["name"] for s in record["spans"]] == ["load", "cache.lookup", "llm", "parse"]
+    assert record["spans"][-1]["error"] == "KeyError"
+
+    # a span outside any trace is still a histogram observation
+    with timing.span("bare"):
+        timing.note(cache="miss")
+
+    snap = timing.snapshot()
+    assert set(snap["histograms"]) == {"bare", "cache.lookup", "demo.total", "llm", "load", "parse"}
+    assert snap["histograms"]["llm"]["count"] == 1 and snap["histograms"]["llm"]["p50_ms"] == 5.0
+    assert snap["counters"] == {"bare.cache_miss": 1, "cache.lookup.cache_hit": 1,
+                                "llm.input_tokens": 120, "llm.output_tokens": 30}
+
+
+def test_histogram_quantiles_use_bucket_bounds():
+    for ms in [1] * 90 + [300] * 9 + [120000]:
+        timing.observe("x", ms)
+    h = timing.snapshot()["histograms"]["x"]
+    assert (h["p50_ms"], h["p95_ms"], h["p99_ms"], h["max_ms"]) == (5.0, 500.0, 500.0, 120000.0)
+    assert h["buckets"][0] == 90 and h["buckets"][-1] == 1
+
+
+def test_sse_stages_carry_timing_and_metrics_endpoint(client, monkeypatch):
+    from app.core.auth import require_admin
+    from app.main import app
+
+    monkeypatch.setattr("app.api.routes.workflows.AIAnalyzer", AIAnalyzer)
+    monkeypatch.setattr(settings, "LLM_BACKEND", "stub")
+    monkeypatch.setattr(settings, "LLM_STUB_LATENCY_MS", 0.0)
+    monkeypatch.setattr(settings, "LLM_STUB_TOKENS_PER_SECOND", 0.0)
+    monkeypatch.setattr(llm_client, "_clients", {})
+
+    wid = _create_workflow(client)
+    resp = client.post("/api/analyze", json={"workflow_id": wid}, headers={"accept": "text/event-stream"})
+    events = {e["stage"]: e for e in
+              (json.loads(line[6:]) for line in resp.text.splitlines() if line.startswith("data: "))}
+
+    assert list(events["analyzing"]["timing"]) == ["db.load"]
+    assert set(events["roi"]["timing"]) == {"llm", "parse"}
+    assert set(events["n8n"]["timing"]) == {"roi", "persist"}
+    assert {"canvas.generate", "canvas.update", "refresh", "snapshot"} <= set(events["done"]["timing"])
+    assert events["done"]["total_ms"] >= sum(events["roi"]["timing"].values())
+
+    app.dependency_overrides[require_admin] = lambda: None
+    try:
+        snap = client.get("/api/admin/metrics").json()
+    finally:
+        app.dependency_overrides.pop(require_admin, None)
+    assert snap["histograms"]["analyze.total"]["count"] == 1
+    assert snap["counters"]["llm.output_tokens"] > 0
+    assert client.get("/api/admin/metrics").status_code in (401, 403)
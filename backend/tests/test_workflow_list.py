@@ -0,0 +1,104 @@
+"""
+Tests for paginated, projection-only workflow lists — keyset cursors, deferred
+source_text and the admin workflow table.
+"""
+from tests.test_analyze_streaming_integration import client, _create_workflow  # noqa: F401
+
+HEADERS = {"x-user-email": "test@example.com"}
+
+
+def _set_created(rows):
+    """Overwrite created_at with raw stored strings: {workflow_id: text}."""
+    from sqlalchemy import text
+    from app.core import database
+    with database.engine.connect() as conn:
+        for wf, created in rows.items():
+            conn.execute(text("UPDATE workflows SET created_at = :c WHERE id = :i"), {"c": created, "i": wf})
+        conn.commit()
+
+
+def _walk(client, url, limit):
+    ids, cursor, pages = [], None, 0
+    while True:
+        resp = client.get(url, params={"limit": limit, **({"cursor": cursor} if cursor else {})}, headers=HEADERS)
+        assert resp.status_code == 200, resp.text
+        ids += [w["id"] for w in resp.json()]
+        pages += 1
+        cursor = resp.headers.get("x-next-cursor")
+        if not cursor:
+            return ids, pages
+
+
+def test_keyset_pages_cover_every_row_newest_first(client):
+    wfs = [_create_workflow(client, f"Paged {i}") for i in range(7)]
+    # Same-second ties, both stored formats (server default vs ORM) and a NULL
+    _set_created({
+        wfs[0]: "2026-01-01 09:00:00",
+        wfs[1]: "2026-01-02 09:00:00",
+        wfs[2]: "2026-01-02 09:00:00.000000",
+        wfs[3]: "2026-01-02 09:00:00",
+        wfs[4]: "2026-01-03 09:00:00.250000",
+        wfs[5]: None,
+        wfs[6]: "2026-01-02 09:00:00",
+    })
+    ids, pages = _walk(client, "/api/workflows", limit=2)
+    assert pages == 4
+    assert ids == [wfs[4], wfs[2], wfs[6], wfs[3], wfs[1], wfs[0], wfs[5]]
+
+
+def test_list_is_a_projection(client):
+    wf = _create_workflow(client, "Projected")
+    listed = client.get("/api/workflows", headers=HEADERS).json()
+    assert listed == [{
+        **{k: listed[0][k] for k in ("share_code", "created_at", "updated_at")},
+        "id": wf, "name": "Projected", "description": "Test workflow for SSE integration",
+        "input_mode": "manual", "analysis_context": "individual", "team_size": None,
+        "industry": None, "task_count": 1,
+    }]
+    assert "x-next-cursor" not in client.get("/api/workflows", headers=HEADERS).headers
+
+
+def test_bad_cursor_is_400(client):
+    assert client.get("/api/workflows", params={"cursor": "!!"}, headers=HEADERS).status_code == 400
+
+
+def test_source_text_deferred_until_detail(client):
+    from app.core import database
+    from app.models.workflow import Workflow
+    resp = client.post("/api/workflows", headers=HEADERS, json={
+        "name": "Upload", "source_text": "x" * 5000, "tasks": [{"name": "Read"}]})
+    wf = resp.json()["id"]
+
+    db = database.SessionLocal()
+    try:
+        row = db.query(Workflow).filter(Workflow.id == wf).one()
+        assert "source_text" not in row.__dict__
+    finally:
+        db.close()
+    assert client.get(f"/api/workflows/{wf}").json()["source_text"] == "x" * 5000
+
+
+def test_admin_workflow_table_pages(client, monkeypatch):
+    from app.api.routes import admin
+    from app.core import database
+    from app.core.auth import require_admin
+    from app.core.config import settings
+    from app.main import app
+    app.dependency_overrides[require_admin] = lambda: None
+    # admin.py may have bound get_db while an earlier test's fixture was active
+    app.dependency_overrides[admin.get_db] = database.get_db
+    monkeypatch.setattr(settings, "WORKFLOW_PAGE_MAX", 2)
+    try:
+        wfs = [_create_workflow(client, f"Admin {i}") for i in range(5)]
+        stats = client.get("/api/admin/stats").json()
+        assert stats["users"][0]["workflows"] == 5
+        rows, cursor = stats["workflows"], stats["workflows_next_cursor"]
+        while cursor:
+            page = client.get("/api/admin/workflows", params={"cursor": cursor}).json()
+            rows += page["workflows"]
+            cursor = page["next_cursor"]
+        assert sorted(w["id"] for w in rows) == sorted(wfs)
+        assert rows[0]["task_names"] == ["Test task A"] and rows[0]["automation_score"] is None
+    finally:
+        app.dependency_overrides.pop(require_admin, None)
+        app.dependency_overrides.pop(admin.get_db, None)
@@ -46,6 +46,7 @@ interface AdminStats {
     hours_saved: number | null; share_code: string | null
     result_url: string | null; share_url: string | null
   }>
+  workflows_next_cursor: string | null
 }
 
 interface GeoData {
@@ -63,6 +64,7 @@ export default function AdminPage() {
   const [showPw, setShowPw] = useState(false)
   const [stats, setStats] = useState<AdminStats | null>(null)
   const [loading, setLoading] = useState(false)
+  const [loadingMore, setLoadingMore] = useState(false)
   const [error, setError] = useState('')
   const [expandedWf, setExpandedWf] = useState<number | null>(null)
   const [filter, setFilter] = useState('')
@@ -93,6 +95,8 @@ export default function AdminPage() {
       if (r.status === 401) { setError('Wrong password.'); setLoading(false); return }
       if (!r.ok) throw new Error(`HTTP ${r.status}`)
       const d = await r.json()
+      // The stats payload carries the newest page of workflows; older pages
+      // are fetched on "Load more" (loadMoreWorkflows).
       setStats(d); setSecret(s)
       // Seed the geo section from the all-time data already in the stats payload.
       if (d.traffic) {
@@ -110,6 +114,24 @@ export default function AdminPage() {
     finally { setLoading(false) }
   }
 
+  const loadMoreWorkflows = async () => {
+    const cursor = stats?.workflows_next_cursor
+    if (!cursor || loadingMore) return
+    setLoadingMore(true)
+    try {
+      const r = await fetch(`${BACKEND}/api/admin/workflows?cursor=${encodeURIComponent(cursor)}`,
+        { headers: { 'x-admin-secret': secret } })
+      if (!r.ok) throw new Error(`HTTP ${r.status}`)
+      const page = await r.json()
+      setStats(prev => prev && {
+        ...prev,
+        workflows: [...prev.workflows, ...page.workflows],
+        workflows_next_cursor: page.next_cursor,
+      })
+    } catch (e: any) { setError(e.message || 'Failed to load more') }
+    finally { setLoadingMore(false) }
+  }
+
   if (!secret) return (
     <div className="min-h-screen bg-[#1d1d1f] flex items-center justify-center px-4">
       <div className="bg-white rounded-[24px] p-[32px] sm:p-[48px] w-full max-w-[400px] shadow-2xl">
@@ -648,6 +670,17 @@ export default function AdminPage() {
               </div>
             ))}
           </div>
+          {stats.workflows_next_cursor && (
+            <div className="px-[16px] sm:px-[24px] py-[16px] border-t border-[#e8e8ed] flex justify-center">
+              <button
+                onClick={loadMoreWorkflows}
+                disabled={loadingMore}
+                className="px-[20px] py-[8px] bg-[#f5f5f7] border border-[#d2d2d7] rounded-[10px] text-[13px] font-medium hover:bg-[#e8e8ed] transition-colors disabled:opacity-60"
+              >
+                {loadingMore ? 'Loading…' : `Load more (${stats.workflows.length} of ${stats.totals.workflows} loaded)`}
+              </button>
+            </div>
+          )}
         </div>
 
       </div>
@@ -1,4 +1,5 @@
 import { NextRequest, NextResponse } from 'next/server'
+import { proxyResponseHeaders } from '@/lib/proxy-headers.mjs'
 
 const API_URL = (process.env.API_URL || 'http://localhost:8000').replace(/\/$/, '')
 
@@ -67,16 +68,9 @@ async function handler(
     // Always use arrayBuffer — text() corrupts binary files (docx, pdf)
     const responseBuffer = await upstream.arrayBuffer()
 
-    const responseHeaders: Record<string, string> = {
-      'content-type': upstream.headers.get('content-type') || 'application/json',
-      'access-control-allow-origin': '*',
-    }
-    const disposition = upstream.headers.get('content-disposition')
-    if (disposition) responseHeaders['content-disposition'] = disposition
-
     return new NextResponse(responseBuffer, {
       status: upstream.status,
-      headers: responseHeaders,
+      headers: proxyResponseHeaders(upstream.headers),
     })
   } catch (err) {
     console.error('[API proxy error]', err)
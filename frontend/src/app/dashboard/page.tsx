@@ -185,6 +185,30 @@ export default function DashboardPage() {
   const [refreshingId, setRefreshingId] = useState<number | null>(null)
   const [downloadingCombined, setDownloadingCombined] = useState<'docx' | 'pdf' | null>(null)
 
+  // Keyset pagination: only the newest page is fetched on load; "Load more"
+  // follows X-Next-Cursor one page at a time.
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
+  const [loadingMore, setLoadingMore] = useState(false)
+
+  const byNewest = (a: WorkflowSummary, b: WorkflowSummary) =>
+    new Date(b.created_at).getTime() - new Date(a.created_at).getTime()
+
+  // One page of the account's workflow IDs, plus the cursor of the next one.
+  const fetchPage = async (cursor: string | null): Promise<{ ids: number[]; next: string | null } | null> => {
+    const res: Response = await fetchWithWake(
+      cursor ? `/api/workflows?cursor=${encodeURIComponent(cursor)}` : '/api/workflows',
+      { headers: { 'x-user-email': email! }, onWarming: setWarming },
+    )
+    if (!res.ok) return null
+    try {
+      const page: Array<{ id: number }> = await res.json()
+      return { ids: page.map(w => w.id), next: res.headers.get('x-next-cursor') }
+    } catch { return null /* non-JSON response — skip */ }
+  }
+
+  const enrichAll = async (ids: number[]) =>
+    (await Promise.all(ids.map((id) => enrichWorkflow(id, email, setWarming)))).filter(Boolean) as WorkflowSummary[]
+
   useEffect(() => {
     if (!isLoaded) return  // wait for auth to hydrate from localStorage
 
@@ -196,27 +220,26 @@ export default function DashboardPage() {
         await wakeBackend().catch(() => {})
 
         let ids: number[] = []
+        let next: string | null = null
 
         if (email) {
-          // ── Primary: fetch all workflows from the account via email ──────
-          const accountRes = await fetchWithWake('/api/workflows', {
-            headers: { 'x-user-email': email },
-            onWarming: setWarming,
-          })
-          if (accountRes.ok) {
-            try {
-              const accountWorkflows: Array<{ id: number }> = await accountRes.json()
-              ids = accountWorkflows.map(w => w.id)
-              // Sync back to localStorage so it stays up to date
-              ids.forEach(id => saveMyWorkflowId(id))
-            } catch { /* non-JSON response — skip */ }
+          // ── Primary: the newest page of the account's workflows ──────────
+          const page = await fetchPage(null)
+          if (page) {
+            ids = page.ids
+            next = page.next
           }
+          // Sync back to localStorage so it stays up to date
+          ids.forEach(id => saveMyWorkflowId(id))
         }
 
         // ── Fallback / merge: also include any IDs in localStorage ─────────
-        // (covers analyses submitted before sign-in on this device)
-        const localIds = getLocalWorkflowIds()
+        // (covers analyses submitted before sign-in on this device). While
+        // more account pages remain they are merged in by loadMore instead,
+        // so the first load stays one page.
+        const localIds = next ? [] : getLocalWorkflowIds()
         const mergedIds = Array.from(new Set([...ids, ...localIds]))
+        setNextCursor(next)
 
         if (mergedIds.length === 0) {
           setWorkflows([])
@@ -225,11 +248,8 @@ export default function DashboardPage() {
         }
 
         // Enrich each ID with analysis data (shared classifier)
-        const enriched: WorkflowSummary[] = (
-          await Promise.all(mergedIds.map((id) => enrichWorkflow(id, email, setWarming)))
-        ).filter(Boolean) as WorkflowSummary[]
-
-        enriched.sort((a, b) => new Date(b.created_at).getTime() - new Date(a.created_at).getTime())
+        const enriched = await enrichAll(mergedIds)
+        enriched.sort(byNewest)
         setWorkflows(enriched)
       } catch (err) {
         console.error('Dashboard fetch error:', err)
@@ -241,6 +261,29 @@ export default function DashboardPage() {
     fetchWorkflows()
   }, [email, isLoaded])
 
+  const loadMore = async () => {
+    if (!nextCursor || loadingMore) return
+    setLoadingMore(true)
+    try {
+      const page = await fetchPage(nextCursor)
+      if (!page) return
+      page.ids.forEach(id => saveMyWorkflowId(id))
+      const seen = new Set(workflows.map(w => w.id))
+      // Last page: pick up this device's pre-sign-in analyses too
+      const candidates = page.next ? page.ids : [...page.ids, ...getLocalWorkflowIds()]
+      const fresh = await enrichAll(Array.from(new Set(candidates)).filter(id => !seen.has(id)))
+      setWorkflows(prev => {
+        const have = new Set(prev.map(w => w.id))
+        return [...prev, ...fresh.filter(w => !have.has(w.id))].sort(byNewest)
+      })
+      setNextCursor(page.next)
+    } catch (err) {
+      console.error('Dashboard load-more error:', err)
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
   // Re-fetch a single card that couldn't load its analysis (cold backend,
   // ownership blip, transient 5xx). Wakes the box first, then re-classifies.
   const refreshCard = async (id: number) => {
@@ -622,6 +665,19 @@ export default function DashboardPage() {
                   </div>
                 )
               })}
+              {nextCursor && (
+                <div className="flex justify-center pt-[8px]">
+                  <button
+                    onClick={loadMore}
+                    disabled={loadingMore}
+                    className="inline-flex items-center gap-[8px] border border-[#d2d2d7] hover:border-[#b8b8bd] text-[#1d1d1f] px-[24px] py-[12px] rounded-full text-[15px] font-medium transition-all disabled:opacity-60"
+                  >
+                    {loadingMore
+                      ? <><Loader2 className="h-[16px] w-[16px] animate-spin" /> {t('loadingMore')}</>
+                      : t('loadMore')}
+                  </button>
+                </div>
+              )}
             </div>
           )}
         </div>
@@ -104,6 +104,11 @@ export default function ResultsPage() {
  data.results = (data.results || []).map((r: TaskResult) => ({
  ...r, task: taskMap[r.task_id] || { id: r.task_id, name: `Task ${r.task_id}`, description: '' }
  }))
+ // The stored n8n canvas is not part of the results payload — it has its own endpoint
+ if (data.workflow) {
+   const canvas = await fetch(`/api/workflows/${data.workflow_id}/n8n-canvas`, { signal: controller.signal }).catch(() => null)
+   if (canvas?.ok) data.workflow.n8n_workflow_json = await canvas.text()
+ }
  setAnalysisData(data)
  // Load n8n templates for ALL analysis types (not just job scan)
  if (data.workflow?.n8n_workflow_json && !data.workflow?.input_mode?.includes('job_scan')) {
@@ -73,6 +73,11 @@ async function getAnalysisByCode(code: string): Promise<AnalysisData | null> {
     data.results = (data.results || []).map((r: TaskResult) => ({
       ...r, task: taskMap[r.task_id] || { id: r.task_id, name: `Task ${r.task_id}`, description: '' }
     }))
+    // The stored n8n canvas is served separately from the analysis payload
+    if (data.workflow) {
+      const canvas = await fetchWithRetry(`${BACKEND_BASE}/api/share/${code}/n8n-canvas`, { next: { revalidate: 3600 } })
+      if (canvas?.ok) data.workflow.n8n_workflow_json = await canvas.text()
+    }
     return data
   } catch { return null }
 }
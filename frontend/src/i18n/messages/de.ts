@@ -518,6 +518,8 @@ export const de: Messages = {
     clickRefresh: "Zum Aktualisieren klicken – diese Analyse lädt möglicherweise noch",
     automationReady: "automatisierungsbereit",
     viewArrow: "Ansehen →",
+    loadMore: "Mehr laden",
+    loadingMore: "Wird geladen…",
     alertReportFail: "Bericht konnte nicht erstellt werden",
     alertCombinedFail: "Kombinierter Bericht konnte nicht erstellt werden. Bitte versuchen Sie es erneut.",
   },
@@ -516,6 +516,8 @@ export const en = {
     clickRefresh: "Click to refresh — this analysis may still be loading",
     automationReady: "automation ready",
     viewArrow: "View →",
+    loadMore: "Load more",
+    loadingMore: "Loading…",
     alertReportFail: "Failed to generate report",
     alertCombinedFail: "Failed to generate combined report. Please try again.",
   },
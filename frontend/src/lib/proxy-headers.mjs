@@ -0,0 +1,25 @@
+// Response headers the /api/[...path] proxy copies from the backend to the
+// browser. Plain JS (not TS) so `npm test` runs it under bare Node.
+
+/** Backend headers the browser reads, besides content-type. */
+export const FORWARDED_RESPONSE_HEADERS = [
+  'content-disposition',   // report downloads
+  'x-next-cursor',         // keyset pagination of /api/workflows
+]
+
+/**
+ * Headers for the proxied response, built from the upstream's.
+ * @param {Headers} upstream
+ * @returns {Record<string, string>}
+ */
+export function proxyResponseHeaders(upstream) {
+  const headers = {
+    'content-type': upstream.get('content-type') || 'application/json',
+    'access-control-allow-origin': '*',
+  }
+  for (const name of FORWARDED_RESPONSE_HEADERS) {
+    const value = upstream.get(name)
+    if (value) headers[name] = value
+  }
+  return headers
+}
@@ -0,0 +1,27 @@
+import assert from 'node:assert/strict'
+import { test } from 'node:test'
+
+import { proxyResponseHeaders } from './proxy-headers.mjs'
+
+// The dashboard follows X-Next-Cursor through the proxy; without it "Load
+// more" never appears and older workflows are unreachable.
+test('the workflow list cursor survives the proxy', async () => {
+  const upstream = new Response(JSON.stringify([{ id: 3 }]), {
+    headers: { 'content-type': 'application/json', 'x-next-cursor': 'abc.123' },
+  })
+  const proxied = new Response(await upstream.arrayBuffer(), { headers: proxyResponseHeaders(upstream.headers) })
+  assert.equal(proxied.headers.get('x-next-cursor'), 'abc.123')
+  assert.deepEqual(await proxied.json(), [{ id: 3 }])
+})
+
+test('only known headers are forwarded', () => {
+  const headers = proxyResponseHeaders(new Headers({
+    'content-disposition': 'attachment; filename="r.pdf"', 'set-cookie': 'a=b', 'content-type': 'application/pdf',
+  }))
+  assert.deepEqual(headers, {
+    'content-type': 'application/pdf',
+    'access-control-allow-origin': '*',
+    'content-disposition': 'attachment; filename="r.pdf"',
+  })
+  assert.equal(proxyResponseHeaders(new Headers())['content-type'], 'application/json')
+})
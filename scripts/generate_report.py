@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
 from reportlab.lib.units import mm
@@ -44,10 +46,15 @@ sCenter   = S('center', alignment=TA_CENTER, fontSize=10, leading=14, textColor=
 sRight    = S('right',  alignment=TA_RIGHT,  fontSize=9,  leading=12, textColor=MGRAY)
 
 # ── Helper: coloured pill ─────────────────────────────────────────────────────
+@lru_cache(maxsize=None)
+def _pill_style(bg, fg, fs):
+    # One style per colour/size combination rather than one per pill label
+    return S(f'pill_{fs}_{bg.hexval()}_{fg.hexval()}', fontName='Helvetica-Bold',
+             fontSize=fs, leading=fs+3, textColor=fg, backColor=bg,
+             borderPadding=(2,5,2,5))
+
 def pill(text, bg, fg=colors.white, fs=7):
-    st = S(f'pill_{text}', fontName='Helvetica-Bold', fontSize=fs, leading=fs+3,
-           textColor=fg, backColor=bg, borderPadding=(2,5,2,5))
-    return Paragraph(f'<b>{text}</b>', st)
+    return Paragraph(f'<b>{text}</b>', _pill_style(bg, fg, fs))
 
 def score_color(v):
     if v >= 70: return GREEN